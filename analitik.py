@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+Surec havuzunda calistirilabilen analitik hesaplar.
+
+Bu moduldeki fonksiyonlar yalnizca aldiklari veri cercevelerine bagimlidir (nesne
+durumu, Qt veya veritabani kullanmaz) ve modul seviyesinde tanimlidir; boylece
+ProcessOffload tarafindan ayri bir surece gonderilebilirler. Modul hafif tutulur:
+alt surecler yalnizca pandas ve numpy yukler.
+"""
+
+from typing import Dict, Any, Optional
+import pandas as pd
+
+
+def kohort_hesapla(satislar_df: pd.DataFrame, baslangic_tarihi: Optional[str] = None,
+                   bitis_tarihi: Optional[str] = None) -> Dict[str, Any]:
+    """
+    Satislardan kohort tutma orani, ortalama siparis degeri ve toplam satis pivotlarini hesaplar.
+
+    Args:
+        satislar_df: En az 'Ay' (AA-YYYY), 'Ana Musteri' ve 'Satis Miktari' sutunlarini iceren satislar
+        baslangic_tarihi: Filtre baslangici (verilirse bitis_tarihi ile birlikte)
+        bitis_tarihi: Filtre bitisi
+
+    Returns:
+        Dict[str, Any]: kohort_musteri_oran, kohort_aov_pivot ve kohort_satis_pivot cerceveleri
+    """
+    df = satislar_df.copy()
+
+    # Tarih sutununu olustur
+    df['Tarih'] = pd.to_datetime(df['Ay'], format='%m-%Y', errors='coerce')
+
+    # Tarih filtreleme
+    if baslangic_tarihi and bitis_tarihi:
+        baslangic = pd.to_datetime(baslangic_tarihi)
+        bitis = pd.to_datetime(bitis_tarihi)
+        df = df[(df['Tarih'] >= baslangic) & (df['Tarih'] <= bitis)]
+
+    # Kohort analizi icin gerekli sutunlari olustur
+    df['Kohort Ay'] = df['Tarih'].dt.to_period('M')
+    df['Ay Indeksi'] = (df['Tarih'].dt.year - df['Kohort Ay'].dt.year) * 12 + (df['Tarih'].dt.month - df['Kohort Ay'].dt.month)
+
+    # Musteri bazinda kohort analizi
+    kohort_musteri = df.groupby(['Kohort Ay', 'Ay Indeksi'])['Ana Musteri'].nunique().reset_index()
+    kohort_musteri_pivot = kohort_musteri.pivot(index='Kohort Ay', columns='Ay Indeksi', values='Ana Musteri')
+
+    # Ilk ay musteri sayilari ve tutma orani
+    ilk_ay_musteriler = kohort_musteri_pivot[0]
+    kohort_musteri_oran = kohort_musteri_pivot.divide(ilk_ay_musteriler, axis=0)
+
+    # Ortalama siparis degeri (AOV) analizi
+    kohort_aov = df.groupby(['Kohort Ay', 'Ay Indeksi'])['Satis Miktari'].mean().reset_index()
+    kohort_aov_pivot = kohort_aov.pivot(index='Kohort Ay', columns='Ay Indeksi', values='Satis Miktari')
+
+    # Toplam satis analizi
+    kohort_satis = df.groupby(['Kohort Ay', 'Ay Indeksi'])['Satis Miktari'].sum().reset_index()
+    kohort_satis_pivot = kohort_satis.pivot(index='Kohort Ay', columns='Ay Indeksi', values='Satis Miktari')
+
+    return {
+        "kohort_musteri_oran": kohort_musteri_oran,
+        "kohort_aov_pivot": kohort_aov_pivot,
+        "kohort_satis_pivot": kohort_satis_pivot
+    }
+
+
+def bom_maliyetleri_hesapla(urun_bom_df: pd.DataFrame) -> pd.Series:
+    """
+    Her urunun toplam maliyetini hammadde satirlarinin 'Toplam Maliyet' toplami olarak hesaplar.
+
+    Returns:
+        pd.Series: Urun Kodu -> toplam maliyet (bos maliyetler toplama katilmaz)
+    """
+    if "Toplam Maliyet" not in urun_bom_df.columns:
+        maliyetler = pd.Series(0.0, index=urun_bom_df.index)
+    else:
+        maliyetler = pd.to_numeric(urun_bom_df["Toplam Maliyet"], errors="coerce").fillna(0.0)
+    return maliyetler.groupby(urun_bom_df["Urun Kodu"]).sum().rename("Urun Maliyeti")
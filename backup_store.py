@@ -0,0 +1,240 @@
+# -*- coding: utf-8 -*-
+"""
+Tekillestirmeli (icerik adresli) yedek deposu.
+
+Her zamanlanmis yedek tam kopya oldugunda 30 gunluk 2 GB'lik yedek 60 GB yer kaplar.
+DedupBackupStore veritabani goruntusunu icerik tanimli parcalara boler ve her benzersiz
+parcayi bir kez saklar. Parca adresi parcanin anahtarli HMAC ozetidir. Parcalar
+sikistirilip sifrelenir. Her yedek icin sifreli bir manifest, parca adreslerini sirasiyla
+tutar.
+
+SQLite dosyalari sayfa yapili oldugundan parca sinirlari sayfa sinirlarinda aranir.
+Bir sayfanin ozeti belirli bir bit desenine uyuyorsa parca orada biter (en az/en cok
+sayfa sinirlariyla). Sinirlar konuma degil icerige bagli oldugu icin sayfalar kaysa
+(VACUUM, buyuyen tablolar) bile degismeyen bolgeler ayni parcalari uretir.
+
+Dizin yapisi:
+    <kok>/parcalar/<ilk iki karakter>/<adres>
+    <kok>/manifestler/<yedek adi>.manifest
+"""
+
+import os
+import hmac
+import json
+import zlib
+import time
+import hashlib
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterator, Tuple
+
+HATA_KODLARI = {
+    "DEPO_001": "Yedek manifesti bulunamadi",
+    "DEPO_002": "Yedek parcasi eksik veya bozuk"
+}
+
+MANIFEST_EK = ".manifest"
+SAYFA_BOYUTU = 4096
+EN_AZ_SAYFA = 16
+EN_COK_SAYFA = 256
+SINIR_MASKESI = 0x3F  # Ortalama ~64 sayfalik parcalar
+COP_TOPLAMA_SURESI = 3600  # Bu sureden yeni sahipsiz parcalar silinmez (devam eden yedekler icin)
+
+
+def sayfa_boyutu_oku(dosya_yolu: str) -> int:
+    """SQLite dosya basligindan sayfa boyutunu okur; SQLite dosyasi degilse varsayilani dondurur"""
+    with open(dosya_yolu, "rb") as f:
+        baslik = f.read(100)
+    if baslik[:16] != b"SQLite format 3\x00":
+        return SAYFA_BOYUTU
+    boyut = int.from_bytes(baslik[16:18], "big")
+    return 65536 if boyut == 1 else boyut
+
+
+class DedupBackupStore:
+    """Veritabani goruntulerini tekillestirilmis, sikistirilmis ve sifreli parcalar olarak saklayan sinif"""
+
+    def __init__(self, kok_dizin: str, fernet, ozet_anahtari: bytes, loglayici: Optional[logging.Logger] = None):
+        """
+        Args:
+            kok_dizin: Deponun kok dizini
+            fernet: Parca ve manifest sifrelemesi icin encrypt/decrypt saglayan nesne
+            ozet_anahtari: Parca adreslerinin HMAC anahtarini turetmek icin kullanilan anahtar
+            loglayici: Loglama islemleri icin logger nesnesi
+        """
+        self.kok_dizin = kok_dizin
+        self.fernet = fernet
+        # Adresler anahtarli oldugundan depoya erisen biri parca iceriklerini tahmin edip dogrulayamaz
+        self._ozet_anahtari = hmac.new(ozet_anahtari, b"crm-yedek-parca-v1", hashlib.sha256).digest()
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self._kilit = threading.Lock()
+        self.parca_dizini = os.path.join(kok_dizin, "parcalar")
+        self.manifest_dizini = os.path.join(kok_dizin, "manifestler")
+        os.makedirs(self.parca_dizini, exist_ok=True)
+        os.makedirs(self.manifest_dizini, exist_ok=True)
+
+    def _adres(self, veri: bytes) -> str:
+        return hmac.new(self._ozet_anahtari, veri, hashlib.sha256).hexdigest()
+
+    def _parca_yolu(self, adres: str) -> str:
+        return os.path.join(self.parca_dizini, adres[:2], adres)
+
+    def _manifest_yolu(self, ad: str) -> str:
+        return os.path.join(self.manifest_dizini, f"{ad}{MANIFEST_EK}")
+
+    @staticmethod
+    def _atomik_yaz(yol: str, veri: bytes) -> None:
+        gecici = f"{yol}.tmp"
+        with open(gecici, "wb") as f:
+            f.write(veri)
+        os.replace(gecici, yol)
+
+    def parcalara_bol(self, dosya_yolu: str) -> Iterator[bytes]:
+        """Dosyayi sayfa sinirlarinda, icerige bagli sinirlarla parcalara boler"""
+        sayfa = sayfa_boyutu_oku(dosya_yolu)
+        with open(dosya_yolu, "rb") as f:
+            parca: List[bytes] = []
+            while True:
+                veri = f.read(sayfa)
+                if not veri:
+                    break
+                parca.append(veri)
+                sinir = hashlib.blake2b(veri, digest_size=8).digest()[-1] & SINIR_MASKESI == 0
+                if (sinir and len(parca) >= EN_AZ_SAYFA) or len(parca) >= EN_COK_SAYFA:
+                    yield b"".join(parca)
+                    parca = []
+            if parca:
+                yield b"".join(parca)
+
+    def yedekle(self, goruntu_yolu: str, ad: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Tutarli bir veritabani goruntusunu depoya ekler; yalnizca yeni parcalar yazilir.
+
+        Args:
+            goruntu_yolu: Yedeklenecek (kopya sirasinda degismeyen) veritabani dosyasi
+            ad: Yedek adi; verilmezse zaman damgasi kullanilir
+
+        Returns:
+            Dict[str, Any]: Yedek adi, manifest yolu ve yazilan/tekrar kullanilan parca istatistikleri
+        """
+        ad = ad or datetime.now().strftime("backup_%Y%m%d_%H%M%S")
+        adresler: List[str] = []
+        yeni, tekrar, yazilan_bayt, toplam_bayt = 0, 0, 0, 0
+        for parca in self.parcalara_bol(goruntu_yolu):
+            adres = self._adres(parca)
+            adresler.append(adres)
+            toplam_bayt += len(parca)
+            yol = self._parca_yolu(adres)
+            if os.path.exists(yol):
+                tekrar += 1
+                os.utime(yol)  # Cop toplayicinin devam eden yedegin parcasini silmemesi icin
+                continue
+            os.makedirs(os.path.dirname(yol), exist_ok=True)
+            sifreli = self.fernet.encrypt(zlib.compress(parca, 6))
+            self._atomik_yaz(yol, sifreli)
+            yeni += 1
+            yazilan_bayt += len(sifreli)
+
+        manifest = {
+            "ad": ad,
+            "olusturma": datetime.now().isoformat(),
+            "boyut": toplam_bayt,
+            "parcalar": adresler
+        }
+        manifest_yolu = self._manifest_yolu(ad)
+        self._atomik_yaz(manifest_yolu, self.fernet.encrypt(json.dumps(manifest).encode("utf-8")))
+        sonuc = {"ad": ad, "manifest": manifest_yolu, "parca_sayisi": len(adresler), "yeni_parca": yeni,
+                 "tekrar_kullanilan": tekrar, "yazilan_bayt": yazilan_bayt, "toplam_bayt": toplam_bayt}
+        self.loglayici.info(f"Tekillestirmeli yedek olusturuldu: {sonuc}")
+        return sonuc
+
+    def manifest_oku(self, ad: str) -> Dict[str, Any]:
+        yol = self._manifest_yolu(ad)
+        if not os.path.exists(yol):
+            raise FileNotFoundError(f"{HATA_KODLARI['DEPO_001']}: {ad}")
+        with open(yol, "rb") as f:
+            return json.loads(self.fernet.decrypt(f.read()).decode("utf-8"))
+
+    def listele(self) -> List[Dict[str, Any]]:
+        """Depodaki yedekleri eskiden yeniye (ad, olusturma, boyut, parca sayisi) olarak dondurur"""
+        yedekler = []
+        for dosya in os.listdir(self.manifest_dizini):
+            if dosya.endswith(MANIFEST_EK):
+                manifest = self.manifest_oku(dosya[:-len(MANIFEST_EK)])
+                yedekler.append({"ad": manifest["ad"], "olusturma": manifest["olusturma"],
+                                 "boyut": manifest["boyut"], "parca_sayisi": len(manifest["parcalar"])})
+        return sorted(yedekler, key=lambda yedek: yedek["olusturma"])
+
+    def geri_yukle(self, ad: str, hedef_yolu: str) -> int:
+        """
+        Yedegi parcalarindan sirayla birlestirip hedef dosyaya yazar (sabit bellekle).
+
+        Returns:
+            int: Yazilan bayt sayisi
+
+        Raises:
+            ValueError: Parca eksik veya icerigi adresiyle uyusmuyorsa
+        """
+        manifest = self.manifest_oku(ad)
+        gecici = f"{hedef_yolu}.tmp"
+        yazilan = 0
+        try:
+            with open(gecici, "wb") as hedef:
+                for adres in manifest["parcalar"]:
+                    try:
+                        with open(self._parca_yolu(adres), "rb") as f:
+                            parca = zlib.decompress(self.fernet.decrypt(f.read()))
+                    except (OSError, zlib.error) as e:
+                        raise ValueError(f"{HATA_KODLARI['DEPO_002']}: {adres}") from e
+                    if not hmac.compare_digest(self._adres(parca), adres):
+                        raise ValueError(f"{HATA_KODLARI['DEPO_002']}: {adres}")
+                    hedef.write(parca)
+                    yazilan += len(parca)
+            os.replace(gecici, hedef_yolu)
+        finally:
+            if os.path.exists(gecici):
+                os.remove(gecici)
+        return yazilan
+
+    def sil(self, ad: str) -> None:
+        """Yedegin manifestini siler; parcalar cop toplamada temizlenir"""
+        yol = self._manifest_yolu(ad)
+        if os.path.exists(yol):
+            os.remove(yol)
+
+    def eski_yedekleri_sil(self, saklanacak: int) -> List[str]:
+        """En yeni 'saklanacak' yedek disindakilerin manifestlerini siler"""
+        silinecekler = [yedek["ad"] for yedek in self.listele()][:-saklanacak] if saklanacak > 0 else []
+        for ad in silinecekler:
+            self.sil(ad)
+        return silinecekler
+
+    def cop_topla(self) -> Tuple[int, int]:
+        """
+        Hicbir manifestin basvurmadigi parcalari siler.
+
+        Son COP_TOPLAMA_SURESI icinde yazilan veya yeniden kullanilan parcalar, manifesti
+        henuz yazilmamis bir yedege ait olabilecegi icin silinmez.
+
+        Returns:
+            Tuple[int, int]: (silinen parca sayisi, bosaltilan bayt)
+        """
+        with self._kilit:
+            kullanilan = set()
+            for dosya in os.listdir(self.manifest_dizini):
+                if dosya.endswith(MANIFEST_EK):
+                    kullanilan.update(self.manifest_oku(dosya[:-len(MANIFEST_EK)])["parcalar"])
+            sinir = time.time() - COP_TOPLAMA_SURESI
+            silinen, bosaltilan = 0, 0
+            for alt_dizin in os.listdir(self.parca_dizini):
+                dizin = os.path.join(self.parca_dizini, alt_dizin)
+                for adres in os.listdir(dizin):
+                    yol = os.path.join(dizin, adres)
+                    if adres in kullanilan or adres.endswith(".tmp") or os.path.getmtime(yol) > sinir:
+                        continue
+                    bosaltilan += os.path.getsize(yol)
+                    os.remove(yol)
+                    silinen += 1
+        self.loglayici.info(f"Yedek deposu cop toplama: {silinen} parca, {bosaltilan} bayt silindi")
+        return silinen, bosaltilan
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""
+Akisli yedek sifreleme modulu.
+
+Eski yedek sifreleme tum dosyayi bellege okuyup tek bir Fernet jetonu uretiyordu; cok
+GB'lik veritabanlarinda bellek kullanimi dosya boyutunun birkac katina cikiyordu.
+BackupStreamCipher dosyayi sabit boyutlu parcalar halinde okur, her parcayi zlib ile
+sikistirir ve ayri bir Fernet jetonuyla (dogrulamali) sifreler. Parca sira numarasi ve
+son parca isareti sifreli icerigin icindedir; parcalarin yer degistirmesi, tekrar
+edilmesi veya dosyanin kesilmesi geri yuklemede algilanir. Bellek kullanimi dosya
+boyutundan bagimsizdir.
+
+Dosya bicimi: BASLIK | (4 bayt uzunluk | jeton)*
+Jeton icerigi: 8 bayt sira no | 1 bayt son parca isareti | sikistirilmis veri
+"""
+
+import os
+import zlib
+import struct
+import logging
+from typing import Optional, Callable, BinaryIO
+
+HATA_KODLARI = {
+    "YEDEK_AKIS_001": "Yedek dosyasi bicimi taninmadi",
+    "YEDEK_AKIS_002": "Yedek parca sirasi bozuk veya dosya eksik"
+}
+
+BASLIK = b"CRMYEDEK\x01"
+PARCA_BOYUTU = 4 * 1024 * 1024
+SIKISTIRMA_SEVIYESI = 6
+_UZUNLUK = struct.Struct(">I")
+_PARCA_BASI = struct.Struct(">QB")
+
+
+class BackupStreamCipher:
+    """Yedek dosyalarini parca parca sikistirip sifreleyen / cozen sinif"""
+
+    def __init__(self, fernet, loglayici: Optional[logging.Logger] = None, parca_boyutu: int = PARCA_BOYUTU):
+        """
+        Args:
+            fernet: encrypt/decrypt saglayan nesne (Fernet veya AnahtarHalkasi)
+            loglayici: Loglama islemleri icin logger nesnesi
+            parca_boyutu: Tek seferde okunan ham veri boyutu (bayt)
+        """
+        self.fernet = fernet
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.parca_boyutu = parca_boyutu
+
+    @staticmethod
+    def akisli_mi(dosya_yolu: str) -> bool:
+        """Dosyanin bu modulun bicimiyle yazilip yazilmadigini dondurur"""
+        with open(dosya_yolu, "rb") as f:
+            return f.read(len(BASLIK)) == BASLIK
+
+    def sifrele(self, kaynak_yolu: str, hedef_yolu: str,
+                ilerleme: Optional[Callable[[int, int], None]] = None) -> int:
+        """
+        Kaynak dosyayi sikistirip sifreleyerek hedefe yazar.
+
+        Args:
+            kaynak_yolu: Acik yedek dosyasi
+            hedef_yolu: Sifreli yedek dosyasi (gecici dosyaya yazilip yerine tasinir)
+            ilerleme: (islenen bayt, toplam bayt) ile cagrilan fonksiyon
+
+        Returns:
+            int: Yazilan sifreli dosyanin boyutu (bayt)
+        """
+        toplam = os.path.getsize(kaynak_yolu)
+        gecici = f"{hedef_yolu}.tmp"
+        try:
+            with open(kaynak_yolu, "rb") as kaynak, open(gecici, "wb") as hedef:
+                hedef.write(BASLIK)
+                self._parcalari_yaz(kaynak, hedef, toplam, ilerleme)
+            os.replace(gecici, hedef_yolu)
+        finally:
+            if os.path.exists(gecici):
+                os.remove(gecici)
+        boyut = os.path.getsize(hedef_yolu)
+        self.loglayici.info(f"Yedek akisli sifrelendi: {toplam} -> {boyut} bayt")
+        return boyut
+
+    def _parcalari_yaz(self, kaynak: BinaryIO, hedef: BinaryIO, toplam: int,
+                       ilerleme: Optional[Callable[[int, int], None]]) -> None:
+        sira, islenen = 0, 0
+        parca = kaynak.read(self.parca_boyutu)
+        while True:
+            # Son parcayi isaretleyebilmek icin bir sonraki parca onceden okunur
+            sonraki = kaynak.read(self.parca_boyutu) if parca else b""
+            son = not sonraki
+            acik = _PARCA_BASI.pack(sira, int(son)) + zlib.compress(parca, SIKISTIRMA_SEVIYESI)
+            jeton = self.fernet.encrypt(acik)
+            hedef.write(_UZUNLUK.pack(len(jeton)))
+            hedef.write(jeton)
+            islenen += len(parca)
+            if ilerleme:
+                ilerleme(islenen, toplam)
+            if son:
+                return
+            parca, sira = sonraki, sira + 1
+
+    def coz(self, kaynak_yolu: str, hedef_yolu: str,
+            ilerleme: Optional[Callable[[int, int], None]] = None) -> None:
+        """
+        Akisli sifreli yedegi parca parca cozup hedefe yazar.
+
+        Raises:
+            ValueError: Dosya bicimi taninmazsa veya parcalar eksik/bozuksa
+        """
+        toplam = os.path.getsize(kaynak_yolu)
+        gecici = f"{hedef_yolu}.tmp"
+        try:
+            with open(kaynak_yolu, "rb") as kaynak, open(gecici, "wb") as hedef:
+                if kaynak.read(len(BASLIK)) != BASLIK:
+                    raise ValueError(HATA_KODLARI["YEDEK_AKIS_001"])
+                beklenen, son = 0, False
+                while not son:
+                    uzunluk = kaynak.read(_UZUNLUK.size)
+                    if len(uzunluk) < _UZUNLUK.size:
+                        raise ValueError(HATA_KODLARI["YEDEK_AKIS_002"])
+                    jeton_boyu = _UZUNLUK.unpack(uzunluk)[0]
+                    jeton = kaynak.read(jeton_boyu)
+                    if len(jeton) < jeton_boyu:
+                        raise ValueError(HATA_KODLARI["YEDEK_AKIS_002"])
+                    acik = self.fernet.decrypt(jeton)
+                    sira, son = _PARCA_BASI.unpack_from(acik)
+                    if sira != beklenen:
+                        raise ValueError(HATA_KODLARI["YEDEK_AKIS_002"])
+                    hedef.write(zlib.decompress(acik[_PARCA_BASI.size:]))
+                    beklenen += 1
+                    if ilerleme:
+                        ilerleme(kaynak.tell(), toplam)
+                if kaynak.read(1):
+                    raise ValueError(HATA_KODLARI["YEDEK_AKIS_002"])
+            os.replace(gecici, hedef_yolu)
+        finally:
+            if os.path.exists(gecici):
+                os.remove(gecici)
@@ -0,0 +1,303 @@
+# -*- coding: utf-8 -*-
+"""
+Toplu sifreleme motoru.
+
+veri_cercevesi_sifrele/sifre_coz eskiden her hucre icin sirayla Fernet cagiriyordu.
+BatchCryptoEngine hassas sutunlari parcalara bolup tum sutunlarin parcalarini ayni
+is parcacigi havuzunda isler (AES/HMAC ilkel islemleri GIL'i birakir). Her kayitta
+satirin icerik ozeti onceki kayitla karsilastirilir; degismeyen satirlarin sifreli
+hucreleri yeniden sifrelenmeden kullanilir. Cozulen degerler sifreli metin anahtariyla
+sinirli bir onbellekte tutulur.
+
+Yuklemede hassas hucreler SifreliMetin nesnesi olarak birakilabilir; sifre yalnizca
+hucre metni istendiginde (gosterim, disa aktarim) cozulur. Hassas alanlara hic
+dokunmayan analizler sifre cozme maliyeti odemez.
+"""
+
+import os
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Callable, Iterable
+import numpy as np
+import pandas as pd
+
+PARCA_BOYUTU = 1000
+COZUM_ONBELLEK_LIMITI = 200000
+
+
+def _bos_mu(deger: Any) -> bool:
+    return deger is None or (isinstance(deger, float) and deger != deger)
+
+
+class SifreliMetin:
+    """
+    Sifreli hucre icin tembel metin nesnesi.
+
+    Sifre ilk kez metin istendiginde cozulur. Cozulen deger hem nesnede hem de motorun
+    sifreli metin anahtarli onbelleginde tutulur; her kayit yeni sifreli metin urettigi
+    icin onbellek surum bazinda calisir. Tekrar kaydedilirken sifreli metin oldugu gibi
+    yazilir.
+    """
+
+    __slots__ = ("sifreli", "_motor", "_metin")
+
+    def __init__(self, sifreli: str, motor: "BatchCryptoEngine"):
+        self.sifreli = sifreli
+        self._motor = motor
+        self._metin: Optional[str] = None
+
+    @property
+    def metin(self) -> str:
+        if self._metin is None:
+            self._metin = self._motor.coz(self.sifreli)
+        return self._metin
+
+    def __str__(self) -> str:
+        return self.metin
+
+    def __repr__(self) -> str:
+        return repr(self.metin)
+
+    def __len__(self) -> int:
+        return len(self.metin)
+
+    def __eq__(self, diger) -> bool:
+        if isinstance(diger, SifreliMetin):
+            return self.sifreli == diger.sifreli or self.metin == diger.metin
+        return self.metin == diger
+
+    def __lt__(self, diger) -> bool:
+        return self.metin < str(diger)
+
+    def __hash__(self) -> int:
+        return hash(self.metin)
+
+
+class BatchCryptoEngine:
+    """
+    Fernet ile sutun bazinda paralel sifreleme/cozme yapan sinif.
+
+    Attributes:
+        isci_sayisi: Havuzdaki is parcacigi sayisi
+    """
+
+    def __init__(self, fernet, loglayici: Optional[logging.Logger] = None, isci_sayisi: Optional[int] = None,
+                 anahtar_sutunlari: Optional[Dict[str, Iterable[str]]] = None):
+        """
+        Args:
+            fernet: Fernet (veya ayni arayuze sahip) nesne
+            loglayici: Loglama islemleri icin logger nesnesi
+            isci_sayisi: Havuz boyutu; verilmezse CPU sayisi
+            anahtar_sutunlari: Tablo -> satiri tanimlayan sutunlar; satir ozeti bu sutunlar ve
+                hassas alanlar uzerinden hesaplanir (yoksa tum sutunlar kullanilir)
+        """
+        self.fernet = fernet
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.isci_sayisi = isci_sayisi or min(8, os.cpu_count() or 4)
+        self.anahtar_sutunlari = anahtar_sutunlari or {}
+        self._havuz: Optional[ThreadPoolExecutor] = None
+        self._kilit = threading.Lock()
+        self._sifre_onbellegi: Dict[str, Dict[int, Dict[str, str]]] = {}  # tablo -> satir ozeti -> alan -> sifreli
+        self._cozum_onbellegi: "OrderedDict[str, str]" = OrderedDict()  # sifreli -> acik
+
+    def _havuz_al(self) -> ThreadPoolExecutor:
+        with self._kilit:
+            if self._havuz is None:
+                self._havuz = ThreadPoolExecutor(max_workers=self.isci_sayisi, thread_name_prefix="Sifreleme")
+            return self._havuz
+
+    def kapat(self) -> None:
+        with self._kilit:
+            if self._havuz is not None:
+                self._havuz.shutdown(wait=True)
+                self._havuz = None
+
+    def _guncel_mi(self, sifreli: str) -> bool:
+        """Sifreli metin aktif anahtarla mi uretilmis (anahtar halkasi yoksa her zaman dogru)"""
+        guncel_mi = getattr(self.fernet, "guncel_mi", None)
+        return guncel_mi is None or guncel_mi(sifreli)
+
+    def _sifrele_parca(self, degerler: List[str]) -> List[str]:
+        return [self.fernet.encrypt(deger.encode()).decode() for deger in degerler]
+
+    def _coz_parca(self, degerler: List[str]) -> List[str]:
+        return [self.fernet.decrypt(deger.encode()).decode() for deger in degerler]
+
+    def _paralel(self, isler: List[List[str]], islem: Callable[[List[str]], List[str]]) -> List[List[str]]:
+        """Is listelerini parcalara bolup havuzda isler; sonuclari ayni sirayla dondurur"""
+        parcalar, sinirlar = [], []
+        for degerler in isler:
+            baslangic = len(parcalar)
+            parcalar.extend(degerler[i:i + PARCA_BOYUTU] for i in range(0, len(degerler), PARCA_BOYUTU))
+            sinirlar.append((baslangic, len(parcalar)))
+        if not parcalar:
+            return [[] for _ in isler]
+        if len(parcalar) == 1:
+            sonuclar = [islem(parcalar[0])]
+        else:
+            sonuclar = list(self._havuz_al().map(islem, parcalar))
+        return [[deger for parca in sonuclar[bas:son] for deger in parca] for bas, son in sinirlar]
+
+    def _satir_ozetleri(self, df: pd.DataFrame, tablo_adi: str, alanlar: List[str]) -> np.ndarray:
+        anahtarlar = [sutun for sutun in self.anahtar_sutunlari.get(tablo_adi, ()) if sutun in df.columns]
+        sutunlar = anahtarlar + [alan for alan in alanlar if alan not in anahtarlar] if anahtarlar else list(df.columns)
+        ozet_df = df[sutunlar].copy()
+        for sutun in sutunlar:
+            # Tembel hucreler ozet icin cozulmez, sifreli metinleriyle temsil edilir
+            if ozet_df[sutun].dtype == object:
+                ozet_df[sutun] = [deger.sifreli if isinstance(deger, SifreliMetin) else deger for deger in ozet_df[sutun]]
+        return pd.util.hash_pandas_object(ozet_df, index=False).to_numpy()
+
+    def coz(self, sifreli: str) -> str:
+        """Tek bir sifreli metni onbellek uzerinden cozer"""
+        with self._kilit:
+            acik = self._cozum_onbellegi.get(sifreli)
+            if acik is not None:
+                self._cozum_onbellegi.move_to_end(sifreli)
+                return acik
+        acik = self.fernet.decrypt(sifreli.encode()).decode()
+        self._cozum_onbellege_ekle([(sifreli, acik)])
+        return acik
+
+    def _cozum_onbellege_ekle(self, eslesmeler: Iterable[tuple]) -> None:
+        with self._kilit:
+            for sifreli, acik in eslesmeler:
+                self._cozum_onbellegi[sifreli] = acik
+            while len(self._cozum_onbellegi) > COZUM_ONBELLEK_LIMITI:
+                self._cozum_onbellegi.popitem(last=False)
+
+    def cerceve_sifrele(self, df: pd.DataFrame, tablo_adi: str, alanlar: List[str]) -> pd.DataFrame:
+        """
+        Hassas sutunlari sifreler; onceki kayittan bu yana degismeyen satirlar atlanir.
+
+        Args:
+            df: Sifrelenecek veri cercevesi (yerinde degistirilir)
+            tablo_adi: Tablo adi (degismeyen satir onbellegi tablo bazindadir)
+            alanlar: Sifrelenecek sutunlar
+
+        Returns:
+            pd.DataFrame: Sifrelenmis veri cercevesi
+        """
+        ozetler = self._satir_ozetleri(df, tablo_adi, alanlar)
+        onceki = self._sifre_onbellegi.get(tablo_adi, {})
+        sutun_degerleri, isler, is_konumlari = {}, [], []
+        atlanan = 0
+        for alan in alanlar:
+            degerler = df[alan].tolist()
+            eksik = []
+            for i, (ozet, deger) in enumerate(zip(ozetler, degerler)):
+                if _bos_mu(deger):
+                    continue
+                if isinstance(deger, SifreliMetin) and self._guncel_mi(deger.sifreli):
+                    degerler[i] = deger.sifreli  # Yuklemeden beri degismedi
+                    atlanan += 1
+                    continue
+                sifreli = onceki.get(ozet, {}).get(alan)
+                if sifreli is not None and self._guncel_mi(sifreli):
+                    degerler[i] = sifreli
+                    atlanan += 1
+                else:
+                    eksik.append(i)
+            sutun_degerleri[alan] = degerler
+            isler.append([str(degerler[i]) for i in eksik])
+            is_konumlari.append((alan, eksik))
+
+        for (alan, eksik), sifreliler, aciklar in zip(is_konumlari, self._paralel(isler, self._sifrele_parca), isler):
+            degerler = sutun_degerleri[alan]
+            for i, sifreli in zip(eksik, sifreliler):
+                degerler[i] = sifreli
+            self._cozum_onbellege_ekle(zip(sifreliler, aciklar))
+
+        yeni_onbellek: Dict[int, Dict[str, str]] = {}
+        for alan, degerler in sutun_degerleri.items():
+            df[alan] = degerler
+            for ozet, deger in zip(ozetler, degerler):
+                if not _bos_mu(deger):
+                    yeni_onbellek.setdefault(ozet, {})[alan] = deger
+        self._sifre_onbellegi[tablo_adi] = yeni_onbellek
+        self.loglayici.debug(f"{tablo_adi}: {sum(len(i) for i in isler)} hucre sifrelendi, {atlanan} degismeyen hucre atlandi")
+        return df
+
+    def cerceve_sifre_coz(self, df: pd.DataFrame, tablo_adi: str, alanlar: List[str]) -> pd.DataFrame:
+        """
+        Hassas sutunlarin sifresini cozer; onbellekte olanlar yeniden cozulmez.
+
+        Cozulen satirlarin sifreli halleri, ayni cercevenin tekrar kaydinda
+        yeniden sifreleme yapilmamasi icin sifreleme onbellegine eklenir.
+        """
+        sifreli_sutunlar, isler, is_konumlari = {}, [], []
+        for alan in alanlar:
+            degerler = [deger.sifreli if isinstance(deger, SifreliMetin) else deger for deger in df[alan]]
+            sifreli_sutunlar[alan] = list(degerler)
+            eksik = []
+            with self._kilit:
+                for i, deger in enumerate(degerler):
+                    if _bos_mu(deger):
+                        continue
+                    acik = self._cozum_onbellegi.get(str(deger))
+                    if acik is not None:
+                        degerler[i] = acik
+                    else:
+                        eksik.append(i)
+            isler.append([str(degerler[i]) for i in eksik])
+            is_konumlari.append((alan, eksik, degerler))
+
+        for (alan, eksik, degerler), aciklar, sifreliler in zip(is_konumlari, self._paralel(isler, self._coz_parca), isler):
+            for i, acik in zip(eksik, aciklar):
+                degerler[i] = acik
+            self._cozum_onbellege_ekle(zip(sifreliler, aciklar))
+            df[alan] = degerler
+
+        ozetler = self._satir_ozetleri(df, tablo_adi, alanlar)
+        onbellek = self._sifre_onbellegi.setdefault(tablo_adi, {})
+        for alan, sifreliler in sifreli_sutunlar.items():
+            for ozet, sifreli in zip(ozetler, sifreliler):
+                if not _bos_mu(sifreli):
+                    onbellek.setdefault(ozet, {})[alan] = str(sifreli)
+        return df
+
+    def cerceve_tembel_coz(self, df: pd.DataFrame, alanlar: List[str]) -> pd.DataFrame:
+        """Hassas hucreleri SifreliMetin nesnelerine cevirir (sifre cozme yapilmaz)"""
+        for alan in alanlar:
+            df[alan] = [deger if _bos_mu(deger) or isinstance(deger, SifreliMetin) else SifreliMetin(str(deger), self)
+                        for deger in df[alan]]
+        return df
+
+    def tembel_hucreleri_ac(self, df: pd.DataFrame, alanlar: List[str]) -> pd.DataFrame:
+        """
+        SifreliMetin hucrelerini tek tek yerine toplu ve paralel cozulmus bir kopya dondurur.
+
+        Girdi cercevesi ve icindeki SifreliMetin nesneleri degistirilmez.
+
+        Args:
+            df: Tembel hucreler iceren veri cercevesi
+            alanlar: Cozulecek sutunlar
+
+        Returns:
+            pd.DataFrame: Hassas sutunlari acik metin olan sig kopya
+        """
+        acik_df = df.copy(deep=False)
+        sutunlar = {alan: df[alan].tolist() for alan in alanlar}
+        bekleyen = {}
+        with self._kilit:
+            for degerler in sutunlar.values():
+                for i, deger in enumerate(degerler):
+                    if not isinstance(deger, SifreliMetin):
+                        continue
+                    acik = deger._metin if deger._metin is not None else self._cozum_onbellegi.get(deger.sifreli)
+                    if acik is not None:
+                        degerler[i] = acik
+                    else:
+                        bekleyen.setdefault(deger.sifreli, []).append((degerler, i))
+        if bekleyen:
+            sifreliler = list(bekleyen)
+            aciklar = self._paralel([sifreliler], self._coz_parca)[0]
+            for sifreli, acik in zip(sifreliler, aciklar):
+                for degerler, i in bekleyen[sifreli]:
+                    degerler[i] = acik
+            self._cozum_onbellege_ekle(zip(sifreliler, aciklar))
+        for alan, degerler in sutunlar.items():
+            acik_df[alan] = degerler
+        return acik_df
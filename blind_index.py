@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+Sifreli alanlar icin kor indeks modulu.
+
+Fernet rastgele IV kullandigi icin ayni deger her seferinde farkli sifreli metin uretir;
+bu yuzden sifreli sutunda esitlik aramasi tum sutunun cozulmesini gerektirir. Kor indeks,
+normallestirilmis acik degerin anahtarli HMAC ozetini sifreli metnin yanindaki
+"<alan>_kor" sutununda saklar. Bu sutun SQLite'ta indekslenir; e-posta/telefon aramalari
+ve tekrar kontrolleri sifre cozmeden indeksli sorgu olarak calisir.
+"""
+
+import hmac
+import hashlib
+import sqlite3
+import logging
+from typing import Optional, Any, List, Iterable
+import pandas as pd
+
+KOR_EK = "_kor"
+OZET_UZUNLUGU = 32  # Hex karakter (128 bit); cakisma olasiligi ihmal edilebilir
+
+
+def kor_sutun(alan: str) -> str:
+    """Hassas alanin kor indeks sutununun adini dondurur"""
+    return f"{alan}{KOR_EK}"
+
+
+def normallestir(deger: Any) -> str:
+    """Aramalarin buyuk/kucuk harf ve bosluk farklarindan etkilenmemesi icin degeri normallestirir"""
+    return " ".join(str(deger).split()).casefold()
+
+
+class BlindIndex:
+    """Hassas alanlar icin anahtarli HMAC kor indeksleri ureten sinif"""
+
+    def __init__(self, anahtar: bytes, loglayici: Optional[logging.Logger] = None):
+        """
+        Args:
+            anahtar: Sifreleme ana anahtari; indeks anahtari bundan ayri olarak turetilir
+            loglayici: Loglama islemleri icin logger nesnesi
+        """
+        # Sifreleme anahtarini dogrudan kullanmamak icin alan ayrimli alt anahtar turetilir
+        self._anahtar = hmac.new(anahtar, b"crm-kor-indeks-v1", hashlib.sha256).digest()
+        self.loglayici = loglayici or logging.getLogger(__name__)
+
+    def ozet(self, deger: Any) -> Optional[str]:
+        """Degerin kor indeks ozetini dondurur; bos degerler icin None"""
+        if deger is None or (isinstance(deger, float) and deger != deger):
+            return None
+        return hmac.new(self._anahtar, normallestir(deger).encode("utf-8"), hashlib.sha256).hexdigest()[:OZET_UZUNLUGU]
+
+    def cerceve_indeksle(self, df: pd.DataFrame, alanlar: List[str]) -> pd.DataFrame:
+        """
+        Hassas alanlarin acik degerlerinden kor indeks sutunlarini ekler (sifrelemeden once).
+
+        Returns:
+            pd.DataFrame: Kor indeks sutunlari eklenmis veri cercevesi (yerinde degistirilir)
+        """
+        for alan in alanlar:
+            df[kor_sutun(alan)] = [self.ozet(deger) for deger in df[alan]]
+        return df
+
+    @staticmethod
+    def sutunlari_ayikla(df: pd.DataFrame) -> pd.DataFrame:
+        """Okunan cerceveden kor indeks sutunlarini cikarir; uygulama bu sutunlari gormez"""
+        kor_sutunlar = [sutun for sutun in df.columns if str(sutun).endswith(KOR_EK)]
+        return df.drop(columns=kor_sutunlar) if kor_sutunlar else df
+
+    def indeksleri_olustur(self, conn: sqlite3.Connection, fiziksel_tablo: str, alanlar: Iterable[str]) -> None:
+        """Kor indeks sutunlari icin SQLite indekslerini olusturur"""
+        mevcut = {satir[1] for satir in conn.execute(f'PRAGMA table_info("{fiziksel_tablo}")')}
+        for alan in alanlar:
+            sutun = kor_sutun(alan)
+            if sutun in mevcut:
+                indeks = f"idx_{fiziksel_tablo}_{sutun}".replace(" ", "_")
+                conn.execute(f'CREATE INDEX IF NOT EXISTS "{indeks}" ON "{fiziksel_tablo}"("{sutun}")')
@@ -0,0 +1,512 @@
+# -*- coding: utf-8 -*-
+"""
+Degisiklik yakalama (CDC) modulu.
+
+Repository her tabloyu tam veri cercevesi olarak yeniden yazar. ChangeCapture yazma
+yolunda yeni cerceveyi son bilinen satir ozetleriyle karsilastirir ve yalnizca eklenen,
+guncellenen ve silinen satirlari cdc_log tablosuna (tablo, anahtar, islem, surum, veri)
+yazar. Senkronizasyon motoru subeler arasinda tam Excel dosyasi yerine bu kayitlari tasir.
+"""
+
+import json
+import uuid
+import hashlib
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from datetime import datetime, date
+from typing import Optional, Dict, Any, List, Callable, Tuple
+import pandas as pd
+from row_history import SONSUZ
+
+HATA_KODLARI = {
+    "CDC_001": "Degisiklik kaydi yazilamadi",
+    "CDC_002": "Degisiklik durumu okunamadi"
+}
+
+# Tablo -> dogal anahtar sutunlari. Sutunlar eksikse satir icerigi anahtar olarak kullanilir.
+KAYIT_ANAHTARLARI = {
+    "customers": ("Musteri Adi",),
+    "sales_reps": ("Isim",),
+    "monthly_targets": ("Ay",),
+    "sales": ("Ana Musteri", "Alt Musteri", "Urun Kodu", "Ay"),
+    "visits": ("Musteri Adi", "Satis Temsilcisi", "Ziyaret Tarihi"),
+    "complaints": ("Musteri Adi", "Siparis No", "Tarih"),
+    "pipeline": ("Musteri Adi", "Satis Temsilcisi"),
+    "hammadde": ("Hammadde Kodu", "Ay"),
+    "urun_bom": ("Urun Kodu", "Hammadde Kodu")
+}
+
+ISLEM_EKLE = "insert"
+ISLEM_GUNCELLE = "update"
+ISLEM_SIL = "delete"
+
+
+def deger_normallestir(deger: Any) -> Any:
+    """Degerleri JSON degerlerine cevirir; float'lar (tam sayi degerli olsalar da) float kalir"""
+    if deger is None or deger is pd.NaT:
+        return None
+    if hasattr(deger, "item") and not isinstance(deger, (str, bytes)):
+        deger = deger.item()  # numpy skalerleri
+    if isinstance(deger, float):
+        if deger != deger:  # NaN
+            return None
+        return deger
+    if isinstance(deger, (pd.Timestamp, datetime, date)):
+        return deger.isoformat()
+    if isinstance(deger, (str, int, bool)):
+        return deger
+    return str(deger)
+
+
+def _ozet_degeri(deger: Any) -> Any:
+    """Ozet ve anahtar hesabinda 3.0 ile 3 ayni sayilir (int/float farki sube semasina baglidir)"""
+    if isinstance(deger, float) and deger.is_integer():
+        return int(deger)
+    return deger
+
+
+def sayisal_turleri_uygula(df: pd.DataFrame, turler: Dict[str, str]) -> pd.DataFrame:
+    """
+    JSON verisinden kurulan cercevenin sayisal sutunlarini load() turlerine dondurur.
+
+    Eski surumlu subeler tam sayi degerli float'lari int olarak gonderir; bos hucreler
+    None gelir. REAL sutunlar float64'e, INTEGER sutunlar sayiya cevrilir.
+
+    Args:
+        df: Cerceve (yerinde degistirilir)
+        turler: Sutun -> SQLite tur bildirimi ("REAL", "INTEGER"; digerleri atlanir)
+    """
+    for sutun, tur in turler.items():
+        if sutun in df.columns and tur in ("REAL", "INTEGER"):
+            df[sutun] = pd.to_numeric(df[sutun], errors="coerce")
+            if tur == "REAL":
+                df[sutun] = df[sutun].astype("float64")
+    return df
+
+
+def cerceve_turleri(df: pd.DataFrame) -> Dict[str, str]:
+    """Cercevenin sayisal sutunlarini sayisal_turleri_uygula'nin bekledigi SQLite turleriyle dondurur"""
+    turler = {}
+    for sutun, dtype in df.dtypes.items():
+        if pd.api.types.is_float_dtype(dtype):
+            turler[str(sutun)] = "REAL"
+        elif pd.api.types.is_integer_dtype(dtype) and not pd.api.types.is_bool_dtype(dtype):
+            turler[str(sutun)] = "INTEGER"
+    return turler
+
+
+def _temel_anahtar(anahtar: str) -> str:
+    """Tekrar eki ("#...") tasiyan anahtarin dogal anahtar kismini dondurur"""
+    # Dogal anahtarlar JSON listesidir (']' ile biter), icerik anahtarlari SHA-1'dir ('#' icermez)
+    if anahtar.endswith("]") or "#" not in anahtar:
+        return anahtar
+    return anahtar[:anahtar.rindex("#")]
+
+
+def satirlari_hazirla(df: pd.DataFrame, tablo_adi: str,
+                      onceki: Optional[Dict[str, str]] = None) -> List[Tuple[str, str, Dict[str, Any]]]:
+    """
+    Veri cercevesinin her satiri icin (anahtar, ozet, veri) uclusunu dondurur.
+
+    Ozet, sutun sirasindan ve int/float farkindan bagimsiz kanonik JSON'un SHA-1 degeridir;
+    veri ise float'lari koruyarak tasinir.
+    Dogal anahtari ayni olan satirlar satir sirasindan bagimsiz anahtarlanir: onceki
+    durumda ayni icerikle kayitli satir anahtarini korur, degisen satirlar bosta kalan
+    anahtarlari (once eki olmayani) alir, yeni satirlar icerik ozetinden turetilen "#..."
+    ekiyle ayrilir. Siralama degisikligi veya bir tekrarin silinmesi boylece diger
+    satirlarin anahtarini degistirmez.
+
+    Args:
+        df: Tablo icerigi
+        tablo_adi: Tablo adi
+        onceki: Tablonun bilinen anahtar -> ozet eslesmesi (bkz. ChangeCapture.yerel_ozetler)
+    """
+    anahtar_sutunlari = KAYIT_ANAHTARLARI.get(tablo_adi, ())
+    anahtar_var = bool(anahtar_sutunlari) and all(sutun in df.columns for sutun in anahtar_sutunlari)
+    sutunlar = [str(sutun) for sutun in df.columns]
+
+    satirlar = []
+    gruplar: Dict[str, List[int]] = {}
+    for degerler in df.itertuples(index=False, name=None):
+        veri = {sutun: deger_normallestir(deger) for sutun, deger in zip(sutunlar, degerler)}
+        ozet_verisi = {sutun: _ozet_degeri(deger) for sutun, deger in veri.items()}
+        kanonik = json.dumps(ozet_verisi, sort_keys=True, ensure_ascii=False)
+        ozet = hashlib.sha1(kanonik.encode("utf-8")).hexdigest()
+        if anahtar_var:
+            temel = json.dumps([ozet_verisi[sutun] for sutun in anahtar_sutunlari], ensure_ascii=False)
+        else:
+            temel = ozet
+        gruplar.setdefault(temel, []).append(len(satirlar))
+        satirlar.append([temel, ozet, veri])
+
+    onceki_gruplar: Dict[str, Dict[str, str]] = {}
+    for anahtar, ozet in (onceki or {}).items():
+        onceki_gruplar.setdefault(_temel_anahtar(anahtar), {})[anahtar] = ozet
+
+    for temel, sira_nolari in gruplar.items():
+        bos = onceki_gruplar.get(temel, {})
+        if len(sira_nolari) == 1 and set(bos) <= {temel}:
+            continue  # Tek satir, anahtari dogal anahtarin kendisi
+        bos = dict(bos)
+        atanmamis, kullanilan = [], set()
+        for sira in sira_nolari:
+            ozet = satirlar[sira][1]
+            eslesen = next((anahtar for anahtar, onceki_ozet in bos.items() if onceki_ozet == ozet), None)
+            if eslesen is None:
+                atanmamis.append(sira)
+            else:
+                satirlar[sira][0] = eslesen
+                kullanilan.add(eslesen)
+                del bos[eslesen]
+        # Degisen satirlar bosta kalan anahtarlari alir (guncelleme), kalanlar yeni anahtar alir
+        bosta = sorted(bos, key=lambda anahtar: (anahtar != temel, anahtar))
+        for sira in atanmamis:
+            if bosta:
+                anahtar = bosta.pop(0)
+            elif temel not in kullanilan:
+                anahtar = temel
+            else:
+                anahtar = f"{temel}#{satirlar[sira][1][:12]}"
+                tekrar = 1
+                while anahtar in kullanilan:
+                    tekrar += 1
+                    anahtar = f"{temel}#{satirlar[sira][1][:12]}.{tekrar}"
+            kullanilan.add(anahtar)
+            satirlar[sira][0] = anahtar
+    return [tuple(satir) for satir in satirlar]
+
+
+class ChangeCapture:
+    """
+    Yazma yolundaki satir degisikliklerini cdc_log tablosuna kaydeden sinif.
+
+    Attributes:
+        dugum_id: Bu veritabani kopyasinin (sube) kalici kimligi
+    """
+
+    def __init__(self, baglanti_al: Callable[[], sqlite3.Connection], baglanti_birak: Callable[[sqlite3.Connection], None],
+                 sifreleme=None, loglayici: Optional[logging.Logger] = None, gecmis=None):
+        """
+        Args:
+            baglanti_al: Repository baglanti havuzundan baglanti alan fonksiyon
+            baglanti_birak: Baglantiyi havuza geri veren fonksiyon
+            sifreleme: Hassas alanlari veri yukunde sifrelemek icin SifrelemeYoneticisi
+            loglayici: Loglama islemleri icin logger nesnesi
+            gecmis: Secili tablolarin satir surumlerini tutan RowHistory (istege bagli)
+        """
+        self._baglanti_al = baglanti_al
+        self._baglanti_birak = baglanti_birak
+        self.sifreleme = sifreleme
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self._durum_onbellegi: Dict[str, Dict[str, Tuple[str, int]]] = {}
+        self._kilit = threading.Lock()
+        self._yerel = threading.local()
+        self.dugum_id: Optional[str] = None
+        self.gecmis = gecmis
+
+    def semayi_olustur(self, cursor: sqlite3.Cursor) -> None:
+        """CDC tablolarini olusturur ve dugum kimligini yukler"""
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cdc_log (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tablo TEXT NOT NULL,
+                anahtar TEXT NOT NULL,
+                islem TEXT NOT NULL CHECK(islem IN ('insert', 'update', 'delete')),
+                surum INTEGER NOT NULL,
+                onceki_ozet TEXT,
+                ozet TEXT,
+                veri TEXT,
+                kaynak TEXT NOT NULL,
+                zaman TEXT NOT NULL
+            )''')
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cdc_log_kaynak ON cdc_log(kaynak, id)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_cdc_log_anahtar ON cdc_log(tablo, anahtar, ozet)")
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cdc_durum (
+                tablo TEXT NOT NULL,
+                anahtar TEXT NOT NULL,
+                ozet TEXT NOT NULL,
+                surum INTEGER NOT NULL,
+                PRIMARY KEY (tablo, anahtar)
+            ) WITHOUT ROWID''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cdc_ayarlar (
+                ad TEXT PRIMARY KEY,
+                deger TEXT
+            )''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cdc_uygulanan (
+                paket_id TEXT PRIMARY KEY,
+                kaynak TEXT NOT NULL,
+                zaman TEXT NOT NULL
+            )''')
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS cdc_cakismalar (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tablo TEXT NOT NULL,
+                anahtar TEXT NOT NULL,
+                yerel_ozet TEXT,
+                uzak_degisiklik TEXT NOT NULL,
+                kaynak TEXT NOT NULL,
+                zaman TEXT NOT NULL,
+                cozuldu INTEGER DEFAULT 0
+            )''')
+        if self.gecmis is not None:
+            self.gecmis.semayi_olustur(cursor)
+        cursor.execute("SELECT deger FROM cdc_ayarlar WHERE ad = 'dugum_id'")
+        satir = cursor.fetchone()
+        if satir:
+            self.dugum_id = satir[0]
+        else:
+            self.dugum_id = uuid.uuid4().hex
+            cursor.execute("INSERT INTO cdc_ayarlar (ad, deger) VALUES ('dugum_id', ?)", (self.dugum_id,))
+
+    def izleniyor_mu(self, tablo_adi: str) -> bool:
+        return tablo_adi in KAYIT_ANAHTARLARI
+
+    @contextmanager
+    def uzak_kaynak(self, kaynak: str):
+        """Bu blokta yakalanan degisiklikler uzak dugume ait isaretlenir (tekrar disa aktarilmaz)"""
+        onceki = getattr(self._yerel, "kaynak", None)
+        self._yerel.kaynak = kaynak
+        try:
+            yield
+        finally:
+            self._yerel.kaynak = onceki
+
+    def _durum(self, conn: sqlite3.Connection, tablo_adi: str) -> Dict[str, Tuple[str, int]]:
+        if tablo_adi not in self._durum_onbellegi:
+            satirlar = conn.execute("SELECT anahtar, ozet, surum FROM cdc_durum WHERE tablo = ?", (tablo_adi,)).fetchall()
+            self._durum_onbellegi[tablo_adi] = {anahtar: (ozet, surum) for anahtar, ozet, surum in satirlar}
+        return self._durum_onbellegi[tablo_adi]
+
+    def durumu_unut(self, tablo_adi: str) -> None:
+        """Tablonun durum onbellegini atar; bir sonraki kayit farki veritabanindaki durumdan hesaplar"""
+        with self._kilit:
+            self._durum_onbellegi.pop(tablo_adi, None)
+
+    def yerel_ozetler(self, tablo_adi: str) -> Dict[str, str]:
+        """Tablonun bilinen anahtar -> ozet eslesmesini dondurur"""
+        conn = self._baglanti_al()
+        try:
+            with self._kilit:
+                return {anahtar: ozet for anahtar, (ozet, _) in self._durum(conn, tablo_adi).items()}
+        finally:
+            self._baglanti_birak(conn)
+
+    def _veri_yuku(self, veri: Dict[str, Any], tablo_adi: str) -> str:
+        """Veri yukunu JSON'a cevirir; hassas alanlar depodaki gibi sifrelenir"""
+        if self.sifreleme is not None:
+            for alan in self.sifreleme.HASSAS_ALANLAR.get(tablo_adi, []):
+                if veri.get(alan) is not None:
+                    veri = dict(veri, **{alan: self.sifreleme.sifrele(str(veri[alan]))})
+        return json.dumps(veri, ensure_ascii=False)
+
+    def duz_veri_yuklerini_sifrele(self, conn: sqlite3.Connection, tablo_adi: str) -> int:
+        """
+        Tablonun cdc_log veri yuklerinde duz metin kalmis hassas alanlari sifreler; commit cagirana aittir.
+
+        Bir alan HASSAS_ALANLAR'a sonradan eklendiginde eski kayitlar duz metin tasir ve
+        veri_yukunu_coz bunlari cozemez.
+
+        Returns:
+            int: Guncellenen kayit sayisi
+        """
+        if self.sifreleme is None or not self.sifreleme.HASSAS_ALANLAR.get(tablo_adi):
+            return 0
+        alanlar = self.sifreleme.HASSAS_ALANLAR[tablo_adi]
+        guncellemeler = []
+        for kayit_id, veri_json in conn.execute(
+                "SELECT id, veri FROM cdc_log WHERE tablo = ? AND veri IS NOT NULL", (tablo_adi,)).fetchall():
+            veri = json.loads(veri_json)
+            duzler = [alan for alan in alanlar
+                      if veri.get(alan) is not None and not self.sifreleme.sifreli_mi(veri[alan])]
+            if duzler:
+                veri.update({alan: self.sifreleme.sifrele(str(veri[alan])) for alan in duzler})
+                guncellemeler.append((json.dumps(veri, ensure_ascii=False), kayit_id))
+        conn.executemany("UPDATE cdc_log SET veri = ? WHERE id = ?", guncellemeler)
+        return len(guncellemeler)
+
+    def veri_yukunu_coz(self, veri_json: Optional[str], tablo_adi: str) -> Optional[Dict[str, Any]]:
+        """cdc_log veri alanini sifreleri cozulmus sozluge cevirir"""
+        if veri_json is None:
+            return None
+        veri = json.loads(veri_json)
+        if self.sifreleme is not None:
+            for alan in self.sifreleme.HASSAS_ALANLAR.get(tablo_adi, []):
+                if veri.get(alan) is not None:
+                    veri[alan] = self.sifreleme.sifre_coz(veri[alan])
+        return veri
+
+    def yakala(self, conn: sqlite3.Connection, df: pd.DataFrame, tablo_adi: str) -> int:
+        """
+        Yeni tablo icerigini son durumla karsilastirip farklari cdc_log'a yazar.
+
+        Kayit, tablonun yeniden yazildigi islemin icinde yapilmalidir (bkz.
+        IslemBaglantisi.tek_islem); islem geri alinirsa durumu_unut cagrilmalidir.
+
+        Args:
+            conn: Veritabani baglantisi
+            df: Tablonun yeni (sifrelenmemis) icerigi
+            tablo_adi: Tablo adi
+
+        Returns:
+            int: Kaydedilen degisiklik sayisi
+        """
+        if not self.izleniyor_mu(tablo_adi):
+            return 0
+        kaynak = getattr(self._yerel, "kaynak", None) or self.dugum_id
+        zaman = datetime.now().isoformat()
+
+        with self._kilit:
+            durum = self._durum(conn, tablo_adi)
+            yeni_durum: Dict[str, Tuple[str, int]] = {}
+            kayitlar, durum_yaz = [], []
+            onceki_ozetler = {anahtar: ozet for anahtar, (ozet, _) in durum.items()}
+            for anahtar, ozet, veri in satirlari_hazirla(df, tablo_adi, onceki_ozetler):
+                onceki = durum.get(anahtar)
+                if onceki is None:
+                    kayitlar.append((tablo_adi, anahtar, ISLEM_EKLE, 1, None, ozet, self._veri_yuku(veri, tablo_adi), kaynak, zaman))
+                    yeni_durum[anahtar] = (ozet, 1)
+                    durum_yaz.append((tablo_adi, anahtar, ozet, 1))
+                elif onceki[0] != ozet:
+                    surum = onceki[1] + 1
+                    kayitlar.append((tablo_adi, anahtar, ISLEM_GUNCELLE, surum, onceki[0], ozet,
+                                     self._veri_yuku(veri, tablo_adi), kaynak, zaman))
+                    yeni_durum[anahtar] = (ozet, surum)
+                    durum_yaz.append((tablo_adi, anahtar, ozet, surum))
+                else:
+                    yeni_durum[anahtar] = onceki
+            silinenler = [anahtar for anahtar in durum if anahtar not in yeni_durum]
+            for anahtar in silinenler:
+                ozet, surum = durum[anahtar]
+                kayitlar.append((tablo_adi, anahtar, ISLEM_SIL, surum + 1, ozet, None, None, kaynak, zaman))
+
+            if not kayitlar:
+                return 0
+            try:
+                conn.executemany(
+                    "INSERT INTO cdc_log (tablo, anahtar, islem, surum, onceki_ozet, ozet, veri, kaynak, zaman) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", kayitlar)
+                conn.executemany("INSERT OR REPLACE INTO cdc_durum (tablo, anahtar, ozet, surum) VALUES (?, ?, ?, ?)", durum_yaz)
+                conn.executemany("DELETE FROM cdc_durum WHERE tablo = ? AND anahtar = ?",
+                                 [(tablo_adi, anahtar) for anahtar in silinenler])
+                if self.gecmis is not None and self.gecmis.izleniyor_mu(tablo_adi):
+                    self.gecmis.isle(conn, tablo_adi, kayitlar, zaman)
+                conn.commit()
+            except sqlite3.Error as e:
+                conn.rollback()
+                # Durum onbellegi atilir; bir sonraki kayit farki veritabanindaki durumdan yeniden hesaplar
+                self._durum_onbellegi.pop(tablo_adi, None)
+                self.loglayici.error(f"Degisiklik kaydi yazilamadi: {str(e)} Hata Kodu: CDC_001")
+                raise
+            self._durum_onbellegi[tablo_adi] = yeni_durum
+        self.loglayici.debug(f"{tablo_adi}: {len(kayitlar)} degisiklik kaydedildi ({kaynak})")
+        return len(kayitlar)
+
+    def gecmisi_baslat(self, conn: sqlite3.Connection, df: pd.DataFrame, tablo_adi: str) -> None:
+        """
+        Satir gecmisi henuz olmayan tablo icin mevcut icerigi acik surumler olarak ekler.
+
+        Once bekleyen farklar normal yoldan islenir; ardindan acik surumu olmayan
+        (daha once yakalanmis ama gecmisi tutulmamis) satirlar gecmise eklenir.
+        """
+        if self.gecmis is None or not self.gecmis.izleniyor_mu(tablo_adi) or not self.gecmis.bos_mu(conn, tablo_adi):
+            return
+        self.yakala(conn, df, tablo_adi)
+        with self._kilit:
+            acik = {satir[0] for satir in conn.execute(
+                "SELECT anahtar FROM satir_gecmisi WHERE tablo = ? AND valid_to = ?", (tablo_adi, SONSUZ))}
+            onceki_ozetler = {anahtar: ozet for anahtar, (ozet, _) in self._durum(conn, tablo_adi).items()}
+            eksik = [(anahtar, self._veri_yuku(veri, tablo_adi))
+                     for anahtar, _, veri in satirlari_hazirla(df, tablo_adi, onceki_ozetler) if anahtar not in acik]
+            if eksik:
+                self.gecmis.baslat(conn, tablo_adi, eksik, datetime.now().isoformat())
+                conn.commit()
+
+    def degisiklikleri_getir(self, son_id: int = 0, kaynak: Optional[str] = None, limit: int = 5000) -> List[Dict[str, Any]]:
+        """
+        son_id'den sonraki degisiklikleri sirali olarak dondurur.
+
+        Args:
+            son_id: Bu kimlikten buyuk kayitlar dondurulur
+            kaynak: Verilirse yalnizca bu dugumun degisiklikleri
+            limit: En fazla kayit sayisi
+        """
+        sorgu = "SELECT id, tablo, anahtar, islem, surum, onceki_ozet, ozet, veri, kaynak, zaman FROM cdc_log WHERE id > ?"
+        parametreler: List[Any] = [son_id]
+        if kaynak is not None:
+            sorgu += " AND kaynak = ?"
+            parametreler.append(kaynak)
+        sorgu += " ORDER BY id LIMIT ?"
+        parametreler.append(limit)
+        conn = self._baglanti_al()
+        try:
+            satirlar = conn.execute(sorgu, parametreler).fetchall()
+        finally:
+            self._baglanti_birak(conn)
+        alanlar = ("id", "tablo", "anahtar", "islem", "surum", "onceki_ozet", "ozet", "veri", "kaynak", "zaman")
+        return [dict(zip(alanlar, tuple(satir))) for satir in satirlar]
+
+    def gecmiste_var_mi(self, tablo_adi: str, anahtar: str, ozet: Optional[str]) -> bool:
+        """Satirin bu icerikle daha once yerelde bulunup bulunmadigini dondurur (eskimis uzak degisiklik tespiti)"""
+        conn = self._baglanti_al()
+        try:
+            return conn.execute(
+                "SELECT 1 FROM cdc_log WHERE tablo = ? AND anahtar = ? AND ozet IS ? LIMIT 1",
+                (tablo_adi, anahtar, ozet)
+            ).fetchone() is not None
+        finally:
+            self._baglanti_birak(conn)
+
+    def ayar_al(self, ad: str, varsayilan: Optional[str] = None) -> Optional[str]:
+        conn = self._baglanti_al()
+        try:
+            satir = conn.execute("SELECT deger FROM cdc_ayarlar WHERE ad = ?", (ad,)).fetchone()
+        finally:
+            self._baglanti_birak(conn)
+        return satir[0] if satir else varsayilan
+
+    def ayar_yaz(self, ad: str, deger: str) -> None:
+        conn = self._baglanti_al()
+        try:
+            conn.execute("INSERT OR REPLACE INTO cdc_ayarlar (ad, deger) VALUES (?, ?)", (ad, deger))
+            conn.commit()
+        finally:
+            self._baglanti_birak(conn)
+
+    def paket_uygulandi_mi(self, paket_id: str) -> bool:
+        conn = self._baglanti_al()
+        try:
+            return conn.execute("SELECT 1 FROM cdc_uygulanan WHERE paket_id = ?", (paket_id,)).fetchone() is not None
+        finally:
+            self._baglanti_birak(conn)
+
+    def paket_uygulandi(self, paket_id: str, kaynak: str, cakismalar: List[Dict[str, Any]]) -> None:
+        """Paketi uygulanmis isaretler ve cakismalari kaydeder"""
+        zaman = datetime.now().isoformat()
+        conn = self._baglanti_al()
+        try:
+            conn.executemany(
+                "INSERT INTO cdc_cakismalar (tablo, anahtar, yerel_ozet, uzak_degisiklik, kaynak, zaman) VALUES (?, ?, ?, ?, ?, ?)",
+                [(c["tablo"], c["anahtar"], c.get("yerel_ozet"), json.dumps(c["degisiklik"], ensure_ascii=False), kaynak, zaman)
+                 for c in cakismalar])
+            conn.execute("INSERT OR IGNORE INTO cdc_uygulanan (paket_id, kaynak, zaman) VALUES (?, ?, ?)", (paket_id, kaynak, zaman))
+            conn.commit()
+        finally:
+            self._baglanti_birak(conn)
+
+    def cakismalari_getir(self, cozulmemis: bool = True) -> List[Dict[str, Any]]:
+        """Kaydedilmis senkronizasyon cakismalarini dondurur"""
+        sorgu = "SELECT id, tablo, anahtar, yerel_ozet, uzak_degisiklik, kaynak, zaman, cozuldu FROM cdc_cakismalar"
+        if cozulmemis:
+            sorgu += " WHERE cozuldu = 0"
+        conn = self._baglanti_al()
+        try:
+            satirlar = conn.execute(sorgu + " ORDER BY id").fetchall()
+        finally:
+            self._baglanti_birak(conn)
+        alanlar = ("id", "tablo", "anahtar", "yerel_ozet", "uzak_degisiklik", "kaynak", "zaman", "cozuldu")
+        return [dict(zip(alanlar, tuple(satir))) for satir in satirlar]
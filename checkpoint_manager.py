@@ -0,0 +1,223 @@
+# -*- coding: utf-8 -*-
+"""
+WAL checkpoint yonetimi modulu.
+
+SQLite WAL modunda yazilan sayfalar once -wal dosyasina eklenir ve ancak bir
+checkpoint ile ana veritabani dosyasina aktarilir. Buyuk iceri aktarimlardan sonra
+-wal dosyasi kontrolsuz buyur ve okuyucular her sorguda bu dosyayi dolasmak
+zorunda kalir. CheckpointManager WAL boyutunu izler, uygulama bostayken PASSIVE
+checkpoint calistirir ve esikler asildiginda RESTART/TRUNCATE moduna yukselir.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+import logging
+from collections import deque
+from typing import Optional, Dict, Any
+from events import Event, EVENT_ERROR_OCCURRED
+
+HATA_KODLARI = {
+    "CHECKPOINT_001": "WAL checkpoint calistirma hatasi",
+    "CHECKPOINT_002": "Gecersiz checkpoint modu"
+}
+
+CHECKPOINT_MODLARI = ("PASSIVE", "FULL", "RESTART", "TRUNCATE")
+
+
+class CheckpointManager:
+    """
+    WAL dosyasini izleyip arka planda checkpoint calistiran sinif.
+
+    Attributes:
+        kontrol_araligi: WAL boyutunun kontrol edilme sikligi (saniye)
+        bosta_suresi: Son yazmadan sonra uygulamanin bosta sayilmasi icin gecmesi gereken sure (saniye)
+        restart_esigi: Bu boyutun uzerindeki WAL icin bosta iken RESTART calistirilir (bayt)
+        truncate_esigi: Bu boyutun uzerindeki WAL icin yazma devam etse bile TRUNCATE calistirilir (bayt)
+    """
+
+    def __init__(self, db_path: str, loglayici: Optional[logging.Logger] = None, event_manager=None,
+                 kontrol_araligi: float = 5.0, bosta_suresi: float = 2.0,
+                 restart_esigi_mb: float = 64, truncate_esigi_mb: float = 256):
+        """
+        Args:
+            db_path: Izlenecek veritabani dosyasinin yolu
+            loglayici: Loglama islemleri icin logger nesnesi
+            event_manager: Hata olaylarini yayinlamak icin EventManager nesnesi
+            kontrol_araligi: WAL kontrol araligi (saniye)
+            bosta_suresi: Bosta sayilma suresi (saniye)
+            restart_esigi_mb: RESTART checkpoint esigi (MB)
+            truncate_esigi_mb: TRUNCATE checkpoint esigi (MB)
+        """
+        self.db_path = db_path
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.event_manager = event_manager
+        self.kontrol_araligi = kontrol_araligi
+        self.bosta_suresi = bosta_suresi
+        self.restart_esigi = int(restart_esigi_mb * 1024 * 1024)
+        self.truncate_esigi = int(truncate_esigi_mb * 1024 * 1024)
+
+        self.stop_flag = threading.Event()
+        self.thread = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._kilit = threading.Lock()
+        self._son_yazma = time.monotonic()
+        self._bekleyen_yazma = False
+
+        self._gecikmeler = deque(maxlen=100)  # Son checkpoint gecikmeleri (ms)
+        self._metrikler: Dict[str, Any] = {
+            "checkpoint_sayisi": {mod: 0 for mod in CHECKPOINT_MODLARI},
+            "basarisiz_checkpoint": 0,
+            "son_checkpoint": None
+        }
+
+    def baslat(self) -> None:
+        """Izleme thread'ini baslatir"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_flag.clear()
+        self.thread = threading.Thread(target=self._izleme_dongusu, name="WalCheckpoint", daemon=True)
+        self.thread.start()
+
+    def durdur(self, son_checkpoint: bool = True) -> None:
+        """
+        Izleme thread'ini durdurur.
+
+        Args:
+            son_checkpoint: True ise kapanista WAL dosyasi TRUNCATE ile sifirlanir
+        """
+        self.stop_flag.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=5)
+        if son_checkpoint and self.wal_boyutu() > 0:
+            self.checkpoint("TRUNCATE")
+        with self._kilit:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+        self.loglayici.info("WAL checkpoint yoneticisi durduruldu.")
+
+    def yazma_bildir(self) -> None:
+        """Repository her yazmadan sonra cagirir; bosta algilamasi icin kullanilir"""
+        self._son_yazma = time.monotonic()
+        self._bekleyen_yazma = True
+
+    def wal_boyutu(self) -> int:
+        """-wal dosyasinin bayt cinsinden boyutunu dondurur"""
+        try:
+            return os.path.getsize(f"{self.db_path}-wal")
+        except OSError:
+            return 0
+
+    def bosta_mi(self) -> bool:
+        """Son yazmadan bu yana bosta_suresi gecip gecmedigini dondurur"""
+        return time.monotonic() - self._son_yazma >= self.bosta_suresi
+
+    def _baglanti(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.db_path, timeout=10, check_same_thread=False)
+        return self._conn
+
+    def checkpoint(self, mod: str = "PASSIVE") -> Dict[str, Any]:
+        """
+        Belirtilen modda checkpoint calistirir ve sonucu metriklere ekler.
+
+        Args:
+            mod: PASSIVE, FULL, RESTART veya TRUNCATE
+
+        Returns:
+            Dict[str, Any]: busy bayragi, WAL ve aktarilan sayfa sayilari ile gecikme (ms)
+        """
+        mod = mod.upper()
+        if mod not in CHECKPOINT_MODLARI:
+            raise ValueError(f"{HATA_KODLARI['CHECKPOINT_002']}: {mod}")
+
+        onceki_boyut = self.wal_boyutu()
+        baslangic = time.perf_counter()
+        try:
+            with self._kilit:
+                busy, log_sayfa, aktarilan = self._baglanti().execute(f"PRAGMA wal_checkpoint({mod})").fetchone()
+        except sqlite3.Error as e:
+            self._metrikler["basarisiz_checkpoint"] += 1
+            hata_mesaji = f"WAL checkpoint hatasi ({mod}): {str(e)} Hata Kodu: CHECKPOINT_001"
+            self.loglayici.error(hata_mesaji)
+            if self.event_manager:
+                self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": "CHECKPOINT_001", "message": hata_mesaji}))
+            return {"mod": mod, "basarili": False, "hata": str(e)}
+        gecikme_ms = (time.perf_counter() - baslangic) * 1000
+
+        sonuc = {
+            "mod": mod,
+            "basarili": busy == 0,
+            "busy": busy,
+            "log_sayfa": log_sayfa,
+            "aktarilan_sayfa": aktarilan,
+            "gecikme_ms": round(gecikme_ms, 2),
+            "onceki_wal_boyutu": onceki_boyut,
+            "sonraki_wal_boyutu": self.wal_boyutu(),
+            "zaman": time.time()
+        }
+        self._gecikmeler.append(gecikme_ms)
+        self._metrikler["checkpoint_sayisi"][mod] += 1
+        self._metrikler["son_checkpoint"] = sonuc
+        if busy == 0 and aktarilan >= log_sayfa:
+            self._bekleyen_yazma = False
+        self.loglayici.debug(f"WAL checkpoint ({mod}): {aktarilan}/{log_sayfa} sayfa, {gecikme_ms:.1f} ms")
+        return sonuc
+
+    def _mod_sec(self, wal_boyutu: int) -> Optional[str]:
+        """WAL boyutu ve bosta durumuna gore calistirilacak checkpoint modunu secer"""
+        if wal_boyutu <= 0:
+            return None
+        if wal_boyutu >= self.truncate_esigi:
+            # Sert esik: WAL'in sinirsiz buyumesini engellemek icin yazmalar suruyor olsa bile calistir
+            return "TRUNCATE"
+        if not self.bosta_mi():
+            return None
+        if wal_boyutu >= self.restart_esigi:
+            return "RESTART"
+        if self._bekleyen_yazma:
+            return "PASSIVE"
+        return None
+
+    def _izleme_dongusu(self) -> None:
+        hata_sayaci = 0
+        while not self.stop_flag.wait(self.kontrol_araligi):
+            try:
+                mod = self._mod_sec(self.wal_boyutu())
+                if mod:
+                    sonuc = self.checkpoint(mod)
+                    # PASSIVE okuyucular yuzunden tamamlanamadiysa ve WAL buyukse bir ust moda gec
+                    if (mod == "PASSIVE" and sonuc.get("busy") and self.bosta_mi()
+                            and self.wal_boyutu() >= self.restart_esigi):
+                        self.checkpoint("RESTART")
+                hata_sayaci = 0
+            except Exception as e:
+                hata_sayaci += 1
+                self.loglayici.error(f"WAL izleme hatasi: {str(e)} Hata Kodu: CHECKPOINT_001, Hata Sayaci: {hata_sayaci}")
+                if hata_sayaci > 5:
+                    self.loglayici.critical("WAL izleme tekrarlanan hatalar nedeniyle durduruluyor.")
+                    break
+
+    def metrikler(self) -> Dict[str, Any]:
+        """
+        WAL boyutu ve checkpoint gecikme metriklerini dondurur.
+
+        Returns:
+            Dict[str, Any]: Anlik WAL boyutu, mod bazinda checkpoint sayilari ve gecikme istatistikleri
+        """
+        gecikmeler = list(self._gecikmeler)
+        return {
+            "wal_boyutu_bayt": self.wal_boyutu(),
+            "wal_boyutu_mb": round(self.wal_boyutu() / (1024 * 1024), 2),
+            "bosta": self.bosta_mi(),
+            "checkpoint_sayisi": dict(self._metrikler["checkpoint_sayisi"]),
+            "basarisiz_checkpoint": self._metrikler["basarisiz_checkpoint"],
+            "son_checkpoint": self._metrikler["son_checkpoint"],
+            "gecikme_ms": {
+                "ortalama": round(sum(gecikmeler) / len(gecikmeler), 2) if gecikmeler else None,
+                "en_yuksek": round(max(gecikmeler), 2) if gecikmeler else None,
+                "son": round(gecikmeler[-1], 2) if gecikmeler else None
+            }
+        }
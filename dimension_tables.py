@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+"""
+Boyut tablolari (normalizasyon) modulu.
+
+Musteri, temsilci, urun ve hammadde adlari sales, visits, complaints, pipeline ve
+urun_bom tablolarinda serbest metin olarak tekrarlanir. Bu modul bu degerleri tamsayi
+anahtarli boyut tablolarina tasir; fiziksel veri "<tablo>_veri" tablosunda "<sutun>_id"
+olarak tutulur ve eski tablo adinda ayni sutunlari donduren bir uyumluluk gorunumu
+(VIEW) olusturulur. Boylece okuma yapan tum kodlar degismeden calisir, join ve
+gruplamalar tamsayi uzerinden yapilir ve bir musteri adi tek satir guncellenerek degistirilir.
+"""
+
+import sqlite3
+import logging
+import pandas as pd
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+HATA_KODLARI = {
+    "BOYUT_001": "Bilinmeyen boyut",
+    "BOYUT_002": "Yeniden adlandirilacak deger bulunamadi"
+}
+
+# Boyut adi -> boyut tablosu
+BOYUTLAR = {
+    "musteri": "dim_musteri",
+    "temsilci": "dim_temsilci",
+    "urun": "dim_urun",
+    "hammadde": "dim_hammadde"
+}
+
+# Tablo -> {sutun: boyut}
+NORMALIZE_TABLOLAR = {
+    "customers": {"Musteri Adi": "musteri", "Ana Musteri": "musteri"},
+    "sales_reps": {"Isim": "temsilci"},
+    "sales": {"Ana Musteri": "musteri", "Alt Musteri": "musteri", "Satis Temsilcisi": "temsilci", "Urun Kodu": "urun"},
+    "visits": {"Musteri Adi": "musteri", "Satis Temsilcisi": "temsilci"},
+    "complaints": {"Musteri Adi": "musteri"},
+    "pipeline": {"Musteri Adi": "musteri", "Satis Temsilcisi": "temsilci"},
+    "hammadde": {"Hammadde Kodu": "hammadde"},
+    "urun_bom": {"Urun Kodu": "urun", "Hammadde Kodu": "hammadde"}
+}
+
+FIZIKSEL_EK = "_veri"
+ANAHTAR_EK = "_id"
+
+
+def fiziksel_tablo(tablo_adi: str) -> str:
+    """Uyumluluk gorunumunun arkasindaki fiziksel tablo adini dondurur"""
+    return f"{tablo_adi}{FIZIKSEL_EK}"
+
+
+class DimensionManager:
+    """
+    Boyut tablolarini ve normalize edilmis tablolarin gorunum katmanini yoneten sinif.
+
+    Boyut tablolarinda "ad" sutunu tur yakinligi olmadan tanimlanir; sayisal urun
+    kodlari geri okundugunda sayi olarak kalir.
+    """
+
+    def __init__(self, loglayici: Optional[logging.Logger] = None):
+        """
+        Args:
+            loglayici: Loglama islemleri icin logger nesnesi
+        """
+        self.loglayici = loglayici or logging.getLogger(__name__)
+
+    def semayi_olustur(self, cursor: sqlite3.Cursor) -> None:
+        """Boyut tablolarini olusturur (UNIQUE kisit ad uzerinde indeks de saglar)"""
+        for boyut_tablosu in BOYUTLAR.values():
+            cursor.execute(f'''
+                CREATE TABLE IF NOT EXISTS {boyut_tablosu} (
+                    id INTEGER PRIMARY KEY,
+                    ad NOT NULL UNIQUE
+                )''')
+
+    def _nesne_turu(self, conn: sqlite3.Connection, ad: str) -> Optional[str]:
+        satir = conn.execute("SELECT type FROM sqlite_master WHERE name = ?", (ad,)).fetchone()
+        return satir[0] if satir else None
+
+    def normalize_mi(self, conn: sqlite3.Connection, tablo_adi: str) -> bool:
+        """Tablonun fiziksel veri tablosu + gorunum olarak saklanip saklanmadigini dondurur"""
+        return tablo_adi in NORMALIZE_TABLOLAR and self._nesne_turu(conn, fiziksel_tablo(tablo_adi)) == "table"
+
+    def _normalize_sutunlar(self, tablo_adi: str, sutunlar: Iterable[str], haric: Iterable[str] = ()) -> Dict[str, str]:
+        haric = set(haric)
+        return {
+            sutun: boyut for sutun, boyut in NORMALIZE_TABLOLAR.get(tablo_adi, {}).items()
+            if sutun in sutunlar and sutun not in haric
+        }
+
+    def _idleri_al(self, conn: sqlite3.Connection, boyut: str, seri: pd.Series) -> pd.Series:
+        """Serideki degerleri boyut tablosuna ekler ve tamsayi anahtar serisini dondurur"""
+        boyut_tablosu = BOYUTLAR[boyut]
+        degerler = [deger for deger in seri.dropna().unique().tolist() if deger is not None]
+        if degerler:
+            conn.executemany(f"INSERT OR IGNORE INTO {boyut_tablosu} (ad) VALUES (?)", [(d,) for d in degerler])
+        eslesme = dict(conn.execute(f"SELECT ad, id FROM {boyut_tablosu}").fetchall())
+        return seri.map(eslesme).astype("Int64")
+
+    def id_al(self, conn: sqlite3.Connection, boyut: str, deger: Any) -> Optional[int]:
+        """Tek bir deger icin boyut anahtarini dondurur, yoksa ekler"""
+        if deger is None or (not isinstance(deger, str) and pd.isna(deger)):
+            return None
+        boyut_tablosu = BOYUTLAR[boyut]
+        conn.execute(f"INSERT OR IGNORE INTO {boyut_tablosu} (ad) VALUES (?)", (deger,))
+        return conn.execute(f"SELECT id FROM {boyut_tablosu} WHERE ad = ?", (deger,)).fetchone()[0]
+
+    def _fiziksel_sutunlar(self, conn: sqlite3.Connection, tablo_adi: str) -> List[str]:
+        return [satir[1] for satir in conn.execute(f'PRAGMA table_info("{fiziksel_tablo(tablo_adi)}")').fetchall()]
+
+    def gorunum_sorgusu(self, conn: sqlite3.Connection, tablo_adi: str, satir_kimligi: bool = False) -> str:
+        """
+        Fiziksel tablodan eski sutun adlari ve sirasiyla okuyan SELECT sorgusunu uretir.
+
+        Args:
+            tablo_adi: Uyumluluk tablosunun adi
+            satir_kimligi: True ise fiziksel satirin rowid degeri "_satir" olarak eklenir
+        """
+        eslesme = NORMALIZE_TABLOLAR[tablo_adi]
+        secimler = ['f.rowid AS "_satir"'] if satir_kimligi else []
+        birlesimler = []
+        for sira, sutun in enumerate(self._fiziksel_sutunlar(conn, tablo_adi)):
+            kaynak = sutun[:-len(ANAHTAR_EK)] if sutun.endswith(ANAHTAR_EK) else None
+            if kaynak in eslesme:
+                takma_ad = f"d{sira}"
+                secimler.append(f'{takma_ad}.ad AS "{kaynak}"')
+                birlesimler.append(f'LEFT JOIN {BOYUTLAR[eslesme[kaynak]]} {takma_ad} ON {takma_ad}.id = f."{sutun}"')
+            else:
+                secimler.append(f'f."{sutun}"')
+        return (f'SELECT {", ".join(secimler)} FROM "{fiziksel_tablo(tablo_adi)}" f '
+                + " ".join(birlesimler)).strip()
+
+    def _gorunumu_olustur(self, conn: sqlite3.Connection, tablo_adi: str) -> None:
+        """Eski tablo adinda uyumluluk gorunumunu (yeniden) olusturur"""
+        if self._nesne_turu(conn, tablo_adi) == "table":
+            conn.execute(f'DROP TABLE "{tablo_adi}"')
+        conn.execute(f'DROP VIEW IF EXISTS "{tablo_adi}"')
+        conn.execute(f'CREATE VIEW "{tablo_adi}" AS {self.gorunum_sorgusu(conn, tablo_adi)}')
+
+    def _indeksleri_olustur(self, conn: sqlite3.Connection, tablo_adi: str, sutunlar: Iterable[str]) -> None:
+        fiziksel = fiziksel_tablo(tablo_adi)
+        for sutun in sutunlar:
+            indeks_adi = f"idx_{fiziksel}_{sutun.lower().replace(' ', '_')}{ANAHTAR_EK}"
+            conn.execute(f'CREATE INDEX IF NOT EXISTS "{indeks_adi}" ON "{fiziksel}"("{sutun}{ANAHTAR_EK}")')
+
+    def kaydet(self, conn: sqlite3.Connection, df: pd.DataFrame, tablo_adi: str,
+               batch_size: int = 1000, haric: Iterable[str] = ()) -> None:
+        """
+        Veri cercevesini normalize ederek kaydeder.
+
+        Eslenen sutunlar boyut anahtarlarina cevrilir, fiziksel tablo yeniden yazilir,
+        yabanci anahtar indeksleri ve uyumluluk gorunumu olusturulur.
+
+        Args:
+            conn: Veritabani baglantisi
+            df: Kaydedilecek veri cercevesi (eski sutun adlariyla)
+            tablo_adi: Uyumluluk tablosunun adi
+            batch_size: to_sql parca boyutu
+            haric: Normalize edilmeyecek sutunlar (or. sifrelenmis alanlar)
+        """
+        sutunlar = self._normalize_sutunlar(tablo_adi, df.columns, haric)
+        veri = df.copy()
+        tur_tanimlari = {}
+        for sutun, boyut in sutunlar.items():
+            veri[sutun] = self._idleri_al(conn, boyut, veri[sutun])
+            tur_tanimlari[f"{sutun}{ANAHTAR_EK}"] = f"INTEGER REFERENCES {BOYUTLAR[boyut]}(id)"
+        veri = veri.rename(columns={sutun: f"{sutun}{ANAHTAR_EK}" for sutun in sutunlar})
+
+        veri.to_sql(fiziksel_tablo(tablo_adi), conn, if_exists='replace', index=False,
+                    chunksize=batch_size, dtype=tur_tanimlari or None)
+        try:
+            self._indeksleri_olustur(conn, tablo_adi, sutunlar)
+            self._gorunumu_olustur(conn, tablo_adi)
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+
+    def tasi(self, conn: sqlite3.Connection, tablo_adi: str, haric: Iterable[str] = ()) -> bool:
+        """
+        Eski duz tabloyu normalize edilmis yapiya tasir.
+
+        Returns:
+            bool: Tasima yapildiysa True
+        """
+        if tablo_adi not in NORMALIZE_TABLOLAR or self._nesne_turu(conn, tablo_adi) != "table":
+            return False
+        df = pd.read_sql_query(f'SELECT * FROM "{tablo_adi}"', conn)
+        self.kaydet(conn, df, tablo_adi, haric=haric)
+        self.loglayici.info(f"{tablo_adi} tablosu boyut tablolarina tasindi ({len(df)} satir)")
+        return True
+
+    def guncelleme_sorgusu(self, conn: sqlite3.Connection, tablo_adi: str, guncellemeler: Dict[str, Any],
+                           kosul: str) -> Tuple[str, List[Any]]:
+        """
+        Uyumluluk sutun adlariyla verilen guncellemeyi fiziksel tablo uzerinde calisan sorguya cevirir.
+
+        Kosul eski sutun adlarini kullanabilir; gorunum sorgusu uzerinden rowid'lere cozulur.
+
+        Returns:
+            Tuple[str, List[Any]]: UPDATE sorgusu ve SET degerleri (kosul parametreleri eklenmeli)
+        """
+        eslesme = NORMALIZE_TABLOLAR[tablo_adi]
+        fiziksel_sutunlar = set(self._fiziksel_sutunlar(conn, tablo_adi))
+        atamalar, degerler = [], []
+        for sutun, deger in guncellemeler.items():
+            if sutun in eslesme and f"{sutun}{ANAHTAR_EK}" in fiziksel_sutunlar:
+                atamalar.append(f'"{sutun}{ANAHTAR_EK}" = ?')
+                degerler.append(self.id_al(conn, eslesme[sutun], deger))
+            else:
+                atamalar.append(f'"{sutun}" = ?')
+                degerler.append(deger)
+        sorgu = (f'UPDATE "{fiziksel_tablo(tablo_adi)}" SET {", ".join(atamalar)} '
+                 f'WHERE rowid IN (SELECT "_satir" FROM ({self.gorunum_sorgusu(conn, tablo_adi, satir_kimligi=True)}) '
+                 f'WHERE {kosul})')
+        return sorgu, degerler
+
+    def yeniden_adlandir(self, conn: sqlite3.Connection, boyut: str, eski: Any, yeni: Any) -> int:
+        """
+        Boyut degerini tum tablolarda tek seferde yeniden adlandirir.
+
+        Yeni ad zaten varsa iki kayit birlestirilir: fiziksel tablolardaki anahtarlar
+        mevcut kayda yonlendirilir ve eski kayit silinir.
+
+        Returns:
+            int: Guncellenen fiziksel satir sayisi (yalnizca birlestirmede 0'dan buyuk)
+        """
+        if boyut not in BOYUTLAR:
+            raise ValueError(f"{HATA_KODLARI['BOYUT_001']}: {boyut}")
+        boyut_tablosu = BOYUTLAR[boyut]
+        eski_satir = conn.execute(f"SELECT id FROM {boyut_tablosu} WHERE ad = ?", (eski,)).fetchone()
+        if eski_satir is None:
+            raise KeyError(f"{HATA_KODLARI['BOYUT_002']}: {eski}")
+        yeni_satir = conn.execute(f"SELECT id FROM {boyut_tablosu} WHERE ad = ?", (yeni,)).fetchone()
+
+        guncellenen = 0
+        try:
+            if yeni_satir is None:
+                conn.execute(f"UPDATE {boyut_tablosu} SET ad = ? WHERE id = ?", (yeni, eski_satir[0]))
+            else:
+                for tablo_adi, eslesme in NORMALIZE_TABLOLAR.items():
+                    if not self.normalize_mi(conn, tablo_adi):
+                        continue
+                    fiziksel_sutunlar = set(self._fiziksel_sutunlar(conn, tablo_adi))
+                    for sutun, sutun_boyutu in eslesme.items():
+                        if sutun_boyutu == boyut and f"{sutun}{ANAHTAR_EK}" in fiziksel_sutunlar:
+                            guncellenen += conn.execute(
+                                f'UPDATE "{fiziksel_tablo(tablo_adi)}" SET "{sutun}{ANAHTAR_EK}" = ? '
+                                f'WHERE "{sutun}{ANAHTAR_EK}" = ?', (yeni_satir[0], eski_satir[0])
+                            ).rowcount
+                conn.execute(f"DELETE FROM {boyut_tablosu} WHERE id = ?", (eski_satir[0],))
+            conn.commit()
+        except sqlite3.Error:
+            conn.rollback()
+            raise
+        return guncellenen
@@ -0,0 +1,169 @@
+# -*- coding: utf-8 -*-
+"""
+Olay yolu olcum modulu.
+
+Kayit sonrasi arayuz takildiginda hangi dinleyicinin yavas oldugunu bulmak icin
+EventManager her yayini ve her dinleyici cagrisini EventBusMetrics'e bildirir. Olay
+turu bazinda yayin/teslim sayilari ve dagilim (fan-out), dinleyici bazinda cagri
+sayisi, hata sayisi, sure histogrami ve en yuksek kuyruk derinligi tutulur. Esigi
+asan dinleyiciler loglanir. Metrikler calisma sirasinda sorgulanabilir ve JSON
+olarak dosyaya yazilabilir.
+"""
+
+import json
+import time
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any
+
+HISTOGRAM_SINIRLARI_MS = (1, 5, 10, 25, 50, 100, 250, 500, 1000)
+YAVAS_DINLEYICI_ESIGI = 0.1  # saniye
+UYARI_ARALIGI = 10.0  # Ayni dinleyici icin yavaslik uyarilari arasindaki en kisa sure (saniye)
+
+
+def _histogram_etiketleri() -> list:
+    etiketler = [f"<={sinir}ms" for sinir in HISTOGRAM_SINIRLARI_MS]
+    etiketler.append(f">{HISTOGRAM_SINIRLARI_MS[-1]}ms")
+    return etiketler
+
+
+class EventBusMetrics:
+    """
+    Olay yolu sayaclarini ve dinleyici sure histogramlarini tutan sinif.
+
+    Attributes:
+        yavas_esik: Bu sureyi asan dinleyici cagrilari icin uyari loglanir (saniye)
+    """
+
+    def __init__(self, loglayici: Optional[logging.Logger] = None, yavas_esik: float = YAVAS_DINLEYICI_ESIGI):
+        """
+        Args:
+            loglayici: Loglama islemleri icin logger nesnesi
+            yavas_esik: Yavas dinleyici uyari esigi (saniye)
+        """
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.yavas_esik = yavas_esik
+        self._kilit = threading.Lock()
+        self.sifirla()
+
+    def sifirla(self) -> None:
+        """Tum sayaclari sifirlar"""
+        with self._kilit:
+            self._baslangic = time.time()
+            self._olaylar: Dict[str, Dict[str, Any]] = {}
+            self._dinleyiciler: Dict[str, Dict[str, Any]] = {}
+            self._son_uyari: Dict[str, float] = {}
+
+    def _olay(self, event_name: str) -> Dict[str, Any]:
+        olay = self._olaylar.get(event_name)
+        if olay is None:
+            olay = self._olaylar[event_name] = {"yayinlanan": 0, "teslim_edilen": 0, "dinleyici_cagrisi": 0,
+                                                "en_cok_dinleyici": 0}
+        return olay
+
+    def _dinleyici(self, ad: str) -> Dict[str, Any]:
+        dinleyici = self._dinleyiciler.get(ad)
+        if dinleyici is None:
+            dinleyici = self._dinleyiciler[ad] = {"cagri": 0, "hata": 0, "toplam_sure": 0.0, "en_uzun_sure": 0.0,
+                                                  "yavas": 0, "en_cok_kuyruk": 0,
+                                                  "histogram": [0] * (len(HISTOGRAM_SINIRLARI_MS) + 1)}
+        return dinleyici
+
+    def yayin_kaydet(self, event_name: str) -> None:
+        """emit() cagrisini sayar (birlestirilen olaylar dahil)"""
+        with self._kilit:
+            self._olay(event_name)["yayinlanan"] += 1
+
+    def teslim_kaydet(self, event_name: str, dinleyici_sayisi: int) -> None:
+        """Olayin dinleyicilere dagitilmasini ve dagilim genisligini kaydeder"""
+        with self._kilit:
+            olay = self._olay(event_name)
+            olay["teslim_edilen"] += 1
+            olay["dinleyici_cagrisi"] += dinleyici_sayisi
+            olay["en_cok_dinleyici"] = max(olay["en_cok_dinleyici"], dinleyici_sayisi)
+
+    def kuyruk_kaydet(self, ad: str, derinlik: int) -> None:
+        """Asenkron dinleyici kuyrugunun olay eklendikten sonraki derinligini kaydeder"""
+        with self._kilit:
+            dinleyici = self._dinleyici(ad)
+            dinleyici["en_cok_kuyruk"] = max(dinleyici["en_cok_kuyruk"], derinlik)
+
+    def cagri_kaydet(self, ad: str, event_name: str, sure: float, hata: bool = False) -> None:
+        """
+        Dinleyici cagrisinin suresini histograma ekler; esigi asarsa uyari loglar.
+
+        Args:
+            ad: Dinleyici adi
+            event_name: Teslim edilen olay ismi
+            sure: Cagri suresi (saniye)
+            hata: Dinleyici istisna firlattiysa True
+        """
+        sure_ms = sure * 1000
+        kova = next((i for i, sinir in enumerate(HISTOGRAM_SINIRLARI_MS) if sure_ms <= sinir),
+                    len(HISTOGRAM_SINIRLARI_MS))
+        uyar = False
+        with self._kilit:
+            dinleyici = self._dinleyici(ad)
+            dinleyici["cagri"] += 1
+            dinleyici["hata"] += int(hata)
+            dinleyici["toplam_sure"] += sure
+            dinleyici["en_uzun_sure"] = max(dinleyici["en_uzun_sure"], sure)
+            dinleyici["histogram"][kova] += 1
+            if sure >= self.yavas_esik:
+                dinleyici["yavas"] += 1
+                simdi = time.monotonic()
+                if simdi - self._son_uyari.get(ad, float("-inf")) >= UYARI_ARALIGI:
+                    self._son_uyari[ad] = simdi
+                    uyar = True
+        if uyar:
+            self.loglayici.warning(f"Yavas olay dinleyicisi: {ad} ({event_name}) {sure_ms:.1f} ms")
+
+    def metrikler(self) -> Dict[str, Any]:
+        """
+        Olay ve dinleyici metriklerini dondurur.
+
+        Returns:
+            Dict[str, Any]: Olay turu bazinda sayaclar ve dinleyici bazinda sure/histogram/kuyruk bilgileri
+        """
+        etiketler = _histogram_etiketleri()
+        with self._kilit:
+            dinleyiciler = {}
+            for ad, dinleyici in self._dinleyiciler.items():
+                cagri = dinleyici["cagri"]
+                dinleyiciler[ad] = {
+                    "cagri": cagri,
+                    "hata": dinleyici["hata"],
+                    "yavas": dinleyici["yavas"],
+                    "ortalama_ms": round(dinleyici["toplam_sure"] * 1000 / cagri, 3) if cagri else 0.0,
+                    "en_uzun_ms": round(dinleyici["en_uzun_sure"] * 1000, 3),
+                    "toplam_ms": round(dinleyici["toplam_sure"] * 1000, 3),
+                    "en_cok_kuyruk": dinleyici["en_cok_kuyruk"],
+                    "histogram": dict(zip(etiketler, dinleyici["histogram"]))
+                }
+            return {
+                "baslangic": datetime.fromtimestamp(self._baslangic).isoformat(),
+                "sure": round(time.time() - self._baslangic, 3),
+                "yavas_esik_ms": self.yavas_esik * 1000,
+                "olaylar": {ad: dict(olay) for ad, olay in self._olaylar.items()},
+                "dinleyiciler": dinleyiciler
+            }
+
+    def dosyaya_yaz(self, dosya_yolu: str, ek: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Metrikleri JSON olarak dosyaya yazar.
+
+        Args:
+            dosya_yolu: Hedef dosya
+            ek: Metriklere eklenecek ek alanlar (ornegin anlik kuyruk derinlikleri)
+
+        Returns:
+            str: Yazilan dosyanin yolu
+        """
+        veri = self.metrikler()
+        if ek:
+            veri.update(ek)
+        with open(dosya_yolu, "w", encoding="utf-8") as f:
+            json.dump(veri, f, ensure_ascii=False, indent=2)
+        self.loglayici.info(f"Olay yolu metrikleri yazildi: {dosya_yolu}")
+        return dosya_yolu
@@ -14,10 +14,19 @@ Olay tipleri:
     - EVENT_LOADING_COMPLETED: Veri yukleme tamamlanma olayi
     - EVENT_LOADING_ERROR: Veri yukleme hatasi olayi
     - EVENT_BACKUP_COMPLETED: Yedekleme tamamlanma olayi
+    - EVENT_BACKUP_PROGRESS: Yedekleme ilerleme olayi
+    - EVENT_BACKUP_CANCELLED: Yedekleme iptal olayi
 """
 
-from typing import Callable, Dict, List, Any
+from typing import Callable, Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
 import logging
+import threading
+import time
+from event_metrics import EventBusMetrics
+from main_thread import QT_KULLANILABILIR, ana_thread_gonder
 
 EVENT_DATA_UPDATED = "data_updated"
 EVENT_UI_UPDATED = "ui_updated"
@@ -26,6 +35,14 @@ EVENT_LOADING_PROGRESS = "loading_progress"  # Veri yukleme ilerleme durumu
 EVENT_LOADING_COMPLETED = "loading_completed"  # Veri yukleme tamamlandi
 EVENT_LOADING_ERROR = "loading_error"  # Veri yukleme hatasi
 
+# Dinleyici teslimat turleri
+TESLIMAT_SENKRON = "senkron"  # Emit eden thread'de, emit donmeden
+TESLIMAT_ANA_THREAD = "ana_thread"  # Qt ana thread'inde (arayuz guncellemeleri icin)
+TESLIMAT_HAVUZ = "havuz"  # Olay dagitim havuzunda
+TESLIMAT_TURLERI = (TESLIMAT_SENKRON, TESLIMAT_ANA_THREAD, TESLIMAT_HAVUZ)
+
+VARSAYILAN_BIRLESTIRME_SURESI = 0.25  # saniye
+
 class Event:
     """
     Olay sinifi.
@@ -47,6 +64,81 @@ class Event:
         self.name = name
         self.data = data
 
+def olay_verilerini_birlestir(veriler: List[Any]) -> Dict[str, Any]:
+    """
+    Bir birlestirme penceresinde biriken olay verilerini tek veride toplar.
+
+    Son olayin anahtarlari korunur; "table"/"tables" degerleri "tables", "key"/"keys"
+    degerleri "keys" ve "source" degerleri "sources" altinda birlestirilir. "coalesced"
+    pencerede birlestirilen olay sayisidir.
+
+    Args:
+        veriler: Pencerede yayinlanan olaylarin verileri (yayin sirasiyla)
+
+    Returns:
+        Dict[str, Any]: Birlestirilmis olay verisi
+    """
+    birlesik: Dict[str, Any] = {}
+    tablolar: List[Any] = []
+    anahtarlar: List[Any] = []
+    kaynaklar: List[Any] = []
+
+    def ekle(liste: List[Any], deger: Any) -> None:
+        degerler = deger if isinstance(deger, (list, tuple, set)) else [deger]
+        liste.extend(d for d in degerler if d not in liste)
+
+    for veri in veriler:
+        if not isinstance(veri, dict):
+            continue
+        birlesik.update(veri)
+        for anahtar, hedef in (("table", tablolar), ("tables", tablolar), ("key", anahtarlar),
+                               ("keys", anahtarlar), ("source", kaynaklar)):
+            if veri.get(anahtar) is not None:
+                ekle(hedef, veri[anahtar])
+    if tablolar:
+        birlesik["tables"] = tablolar
+    if anahtarlar:
+        birlesik["keys"] = anahtarlar
+    if kaynaklar:
+        birlesik["sources"] = kaynaklar
+    birlesik["coalesced"] = len(veriler)
+    return birlesik
+
+
+class _BirlestirmePenceresi:
+    """Bir olay turu icin acik birlestirme penceresinin durumu"""
+
+    __slots__ = ("sure", "birlestirici", "veriler", "oncelik", "zamanlayici")
+
+    def __init__(self, sure: float, birlestirici: Callable[[List[Any]], Any]):
+        self.sure = sure
+        self.birlestirici = birlestirici
+        self.veriler: List[Any] = []
+        self.oncelik = 0
+        self.zamanlayici: Optional[threading.Timer] = None
+
+
+class _Abone:
+    """
+    Tek bir dinleyici kaydi.
+
+    Asenkron teslimatta her abonenin kendi kuyrugu vardir; kuyruk ayni anda yalnizca bir
+    yerde bosaltilir, boylece bir abone olaylari yayinlanma (ve oncelik) sirasiyla alir.
+    """
+
+    __slots__ = ("callback", "ad", "teslimat", "oncelik", "kuyruk", "planlandi", "kilit")
+
+    def __init__(self, callback: Callable, teslimat: str, oncelik: int):
+        self.callback = callback
+        # Metriklerde dinleyiciyi tanimak icin: modul.Sinif.metot
+        self.ad = f"{getattr(callback, '__module__', None) or '?'}.{getattr(callback, '__qualname__', repr(callback))}"
+        self.teslimat = teslimat
+        self.oncelik = oncelik
+        self.kuyruk: List[tuple] = []  # heap: (-olay onceligi, sira, olay)
+        self.planlandi = False
+        self.kilit = threading.Lock()
+
+
 class EventManager:
     """
     Olay yonetim sinifi.
@@ -54,33 +146,68 @@ class EventManager:
     Uygulamadaki olaylari yonetir. Olaylarin dinleyicilere dagitilmasi,
     dinleyicilerin kaydedilmesi ve silinmesi islemlerini gerceklestirir.
     
+    Dinleyiciler kayit sirasinda teslimat yerini belirtir:
+        - TESLIMAT_SENKRON: emit eden thread'de, emit donmeden cagrilir (varsayilan;
+          birlestirilen olaylar haric)
+        - TESLIMAT_ANA_THREAD: Qt ana thread'inde kuyruklu sinyal ile cagrilir
+        - TESLIMAT_HAVUZ: olay dagitim havuzundaki bir is parcaciginda cagrilir
+    Asenkron dinleyiciler icin emit beklemez; olay dinleyicinin kuyruguna eklenir.
+    
+    birlestir() ile bir olay turu icin birlestirme penceresi tanimlanabilir. Pencere ilk
+    olayla acilir; pencere boyunca gelen olaylarin verileri birlestirilir ve pencere
+    sonunda dinleyicilere tek bir olay olarak teslim edilir. Birlestirilen olayin tek bir
+    emit eden thread'i olmadigindan TESLIMAT_SENKRON dinleyicileri bu olayi dagitim
+    havuzunda (TESLIMAT_HAVUZ gibi) alir; pencere zamanlayicisinin thread'inde cagrilmazlar.
+    
     Methods:
         subscribe(): Olay dinleyici kaydeder
         unsubscribe(): Olay dinleyici kaydini siler
         unsubscribe_all(): Tum dinleyicileri siler
         emit(): Olayi yayinlar
+        metrikler(): Olay sayaclari, dinleyici sureleri ve kuyruk derinliklerini dondurur
+        metrikleri_kaydet(): Metrikleri JSON dosyasina yazar
+        birlestir(): Olay turu icin birlestirme penceresi tanimlar
+        bekleyenleri_gonder(): Acik birlestirme pencerelerini hemen teslim eder
+        kapat(): Dagitim havuzunu durdurur
     """
     
-    def __init__(self, logger: logging.Logger = None):
+    def __init__(self, logger: logging.Logger = None, havuz_boyutu: int = 4):
         """
         Args:
             logger: Loglama islemleri icin logger nesnesi
+            havuz_boyutu: TESLIMAT_HAVUZ dinleyicileri icin is parcacigi sayisi
         """
-        self._subscribers: Dict[str, List[Callable]] = {}
+        self._subscribers: Dict[str, List[_Abone]] = {}
         self.logger = logger or logging.getLogger(__name__)
+        self._kilit = threading.RLock()
+        self._sira = itertools.count()
+        self._havuz_boyutu = havuz_boyutu
+        self._havuz: Optional[ThreadPoolExecutor] = None
+        self._pencereler: Dict[str, _BirlestirmePenceresi] = {}
+        self.olcum = EventBusMetrics(self.logger)
         
-    def subscribe(self, event_name: str, callback: Callable) -> None:
+    def subscribe(self, event_name: str, callback: Callable, teslimat: str = TESLIMAT_SENKRON,
+                  oncelik: int = 0) -> None:
         """
         Belirtilen olaya dinleyici ekler.
         
         Args:
             event_name: Dinlenecek olay ismi
             callback: Olay gerceklestiginde cagrilacak fonksiyon
+            teslimat: Dinleyicinin cagrilacagi yer (TESLIMAT_SENKRON, TESLIMAT_ANA_THREAD, TESLIMAT_HAVUZ)
+            oncelik: Yuksek oncelikli dinleyiciler ayni olayi once alir
         """
-        if event_name not in self._subscribers:
-            self._subscribers[event_name] = []
-        if callback not in self._subscribers[event_name]:
-            self._subscribers[event_name].append(callback)
+        if teslimat not in TESLIMAT_TURLERI:
+            raise ValueError(f"Gecersiz teslimat turu: {teslimat}")
+        if teslimat == TESLIMAT_ANA_THREAD and not QT_KULLANILABILIR:
+            teslimat = TESLIMAT_HAVUZ  # Qt yoksa ana thread kavrami da yoktur
+        with self._kilit:
+            aboneler = self._subscribers.setdefault(event_name, [])
+            if any(abone.callback == callback for abone in aboneler):
+                return
+            # Liste oncelige gore sirali tutulur; ayni oncelikte kayit sirasi korunur
+            aboneler.append(_Abone(callback, teslimat, oncelik))
+            aboneler.sort(key=lambda abone: -abone.oncelik)
             
     def unsubscribe(self, event_name: str, callback: Callable) -> None:
         """
@@ -90,27 +217,174 @@ class EventManager:
             event_name: Dinleyicinin kaldirilacagi olay ismi
             callback: Kaldirilacak dinleyici fonksiyon
         """
-        if event_name in self._subscribers and callback in self._subscribers[event_name]:
-            self._subscribers[event_name].remove(callback)
+        with self._kilit:
+            if event_name in self._subscribers:
+                self._subscribers[event_name] = [
+                    abone for abone in self._subscribers[event_name] if abone.callback != callback]
             
     def unsubscribe_all(self) -> None:
         """Tum olay dinleyicilerini kaldirir."""
-        self._subscribers.clear()
+        with self._kilit:
+            self._subscribers.clear()
         
-    def emit(self, event: Event) -> None:
+    def emit(self, event: Event, oncelik: int = 0) -> None:
         """
         Olayi tum dinleyicilere yayinlar.
         
         Args:
             event: Yayinlanacak olay nesnesi
+            oncelik: Asenkron kuyruklarda yuksek oncelikli olaylar once teslim edilir
+        """
+        self.olcum.yayin_kaydet(event.name)
+        with self._kilit:
+            pencere = self._pencereler.get(event.name)
+            if pencere is not None:
+                pencere.veriler.append(event.data)
+                pencere.oncelik = max(pencere.oncelik, oncelik)
+                if pencere.zamanlayici is None:
+                    pencere.zamanlayici = threading.Timer(pencere.sure, self._pencereyi_kapat, (event.name,))
+                    pencere.zamanlayici.daemon = True
+                    pencere.zamanlayici.start()
+                return
+        self._dagit(event, oncelik)
+    
+    def _dagit(self, event: Event, oncelik: int, birlesik: bool = False) -> None:
+        with self._kilit:
+            aboneler = list(self._subscribers.get(event.name, ()))
+        self.olcum.teslim_kaydet(event.name, len(aboneler))
+        for abone in aboneler:
+            if abone.teslimat == TESLIMAT_SENKRON and not birlesik:
+                self._cagir(abone, event)
+            else:
+                self._kuyruga_ekle(abone, event, oncelik)
+    
+    def birlestir(self, event_name: str, sure: float = VARSAYILAN_BIRLESTIRME_SURESI,
+                  birlestirici: Callable[[List[Any]], Any] = olay_verilerini_birlestir) -> None:
+        """
+        Olay turu icin birlestirme penceresi tanimlar; sure=0 birlestirmeyi kaldirir.
+        
+        Bu olay turunun TESLIMAT_SENKRON dinleyicileri birlestirilen olayi dagitim
+        havuzunda alir (bkz. sinif aciklamasi).
+        
+        Args:
+            event_name: Birlestirilecek olay ismi
+            sure: Pencere suresi (saniye)
+            birlestirici: Pencere verilerini (liste) tek olay verisine donusturen fonksiyon
+        """
+        if sure <= 0:
+            with self._kilit:
+                kapanacak = event_name in self._pencereler
+            if kapanacak:
+                self._pencereyi_kapat(event_name, kaldir=True)
+            return
+        with self._kilit:
+            pencere = self._pencereler.get(event_name)
+            if pencere is None:
+                self._pencereler[event_name] = _BirlestirmePenceresi(sure, birlestirici)
+            else:
+                pencere.sure, pencere.birlestirici = sure, birlestirici
+    
+    def _pencereyi_kapat(self, event_name: str, kaldir: bool = False) -> None:
+        """Penceredeki olaylari birlestirip tek olay olarak dagitir"""
+        with self._kilit:
+            pencere = self._pencereler.pop(event_name, None) if kaldir else self._pencereler.get(event_name)
+            if pencere is None:
+                return
+            if pencere.zamanlayici is not None:
+                pencere.zamanlayici.cancel()
+                pencere.zamanlayici = None
+            veriler, oncelik = pencere.veriler, pencere.oncelik
+            pencere.veriler, pencere.oncelik = [], 0
+        if not veriler:
+            return
+        try:
+            veri = pencere.birlestirici(veriler)
+        except Exception as e:
+            self.logger.error(f"Olay birlestirme hatasi ({event_name}): {str(e)}")
+            veri = veriler[-1]
+        # Senkron dinleyiciler de havuza gider; zamanlayici veya bekleyenleri_gonder cagiran thread'de calismazlar
+        self._dagit(Event(event_name, veri), oncelik, birlesik=True)
+    
+    def bekleyenleri_gonder(self) -> None:
+        """Acik birlestirme pencerelerini sure dolmasini beklemeden teslim eder"""
+        with self._kilit:
+            olaylar = list(self._pencereler)
+        for event_name in olaylar:
+            self._pencereyi_kapat(event_name)
+    
+    def _cagir(self, abone: _Abone, event: Event) -> None:
+        hata = False
+        baslangic = time.perf_counter()
+        try:
+            abone.callback(event)
+        except Exception as e:
+            hata = True
+            if self.logger:
+                self.logger.error(f"Event isleme hatasi: {str(e)}")
+        finally:
+            self.olcum.cagri_kaydet(abone.ad, event.name, time.perf_counter() - baslangic, hata)
+    
+    def _kuyruga_ekle(self, abone: _Abone, event: Event, oncelik: int) -> None:
+        with abone.kilit:
+            heapq.heappush(abone.kuyruk, (-oncelik, next(self._sira), event))
+            self.olcum.kuyruk_kaydet(abone.ad, len(abone.kuyruk))
+            if abone.planlandi:
+                return  # Kuyruk zaten bosaltilmak uzere planlandi
+            abone.planlandi = True
+        if abone.teslimat == TESLIMAT_ANA_THREAD:
+            ana_thread_gonder(self._kuyrugu_bosalt, abone)
+        else:
+            self._havuz_al().submit(self._kuyrugu_bosalt, abone)
+    
+    def _kuyrugu_bosalt(self, abone: _Abone) -> None:
+        """Abonenin kuyrugundaki olaylari oncelik ve yayin sirasiyla teslim eder"""
+        while True:
+            with abone.kilit:
+                if not abone.kuyruk:
+                    abone.planlandi = False
+                    return
+                _, _, event = heapq.heappop(abone.kuyruk)
+            self._cagir(abone, event)
+    
+    def _havuz_al(self) -> ThreadPoolExecutor:
+        with self._kilit:
+            if self._havuz is None:
+                self._havuz = ThreadPoolExecutor(max_workers=self._havuz_boyutu, thread_name_prefix="OlayDagitim")
+            return self._havuz
+    
+    def kuyruk_derinlikleri(self) -> Dict[str, int]:
+        """Asenkron dinleyicilerin anlik kuyruk derinliklerini dondurur"""
+        with self._kilit:
+            aboneler = {abone.ad: abone for liste in self._subscribers.values() for abone in liste
+                        if abone.teslimat != TESLIMAT_SENKRON or abone.kuyruk}
+        return {ad: len(abone.kuyruk) for ad, abone in aboneler.items()}
+    
+    def metrikler(self) -> Dict[str, Any]:
+        """
+        Olay yolu metriklerini dondurur.
+        
+        Returns:
+            Dict[str, Any]: Olay turu bazinda yayin/teslim sayilari, dinleyici bazinda sure
+            histogramlari ve anlik kuyruk derinlikleri
         """
-        if event.name in self._subscribers:
-            for callback in self._subscribers[event.name]:
-                try:
-                    callback(event)
-                except Exception as e:
-                    if self.logger:
-                        self.logger.error(f"Event isleme hatasi: {str(e)}")
+        metrikler = self.olcum.metrikler()
+        metrikler["kuyruk_derinligi"] = self.kuyruk_derinlikleri()
+        return metrikler
+    
+    def metrikleri_kaydet(self, dosya_yolu: str) -> str:
+        """Olay yolu metriklerini JSON olarak dosyaya yazar ve dosya yolunu dondurur"""
+        return self.olcum.dosyaya_yaz(dosya_yolu, {"kuyruk_derinligi": self.kuyruk_derinlikleri()})
+    
+    def kapat(self, bekle: bool = True) -> None:
+        """Olay dagitim havuzunu durdurur; bekle=True ise bekleyen ve kuyruktaki olaylar teslim edilir"""
+        if bekle:
+            self.bekleyenleri_gonder()
+        with self._kilit:
+            havuz, self._havuz = self._havuz, None
+        if havuz is not None:
+            havuz.shutdown(wait=bekle)
 
 # Olay turleri (ornek, genisletilebilir)
 EVENT_BACKUP_COMPLETED = "BackupCompleted"  # Yedekleme tamamlandiginda
+EVENT_BACKUP_PROGRESS = "BackupProgress"  # Adimli yedekleme ilerledikce
+EVENT_BACKUP_CANCELLED = "BackupCancelled"  # Yedekleme iptal edildiginde
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Cerceve goruntuleri modulu.
+
+Gosterge paneli ve raporlar VeriYoneticisi cercevelerini her yenilemede tam kopyaliyordu;
+kopyalamayan okuyucular ise bir isci cerceveye concat ederken yarim yazilmis veriyi
+gorebiliyordu. Bu modul cerceve atamalarini yayin olarak ele alir: her atama cercevenin
+ve yoneticinin surumunu artirir. Okuyucular goruntu_al() ile tum cercevelerin ayni anda
+alinmis, degistirilemez ve surumlu bir goruntusunu alir.
+
+Goruntuler pandas'in yazarken-kopyala (copy-on-write) ozelligine dayanir: cerceveler
+sig kopyalanir, veri bloklari canli cerceveyle paylasilir ve ancak taraflardan biri
+yazdiginda kopyalanir. Boylece goruntu almak sutun sayisi kadar is yapar, veri
+kopyalanmaz ve canli cercevede sonradan yapilan degisiklikler goruntuye yansimaz.
+"""
+
+from types import MappingProxyType
+from typing import Optional, Dict, Any
+import pandas as pd
+
+
+def _yazarken_kopyala_etkinlestir() -> bool:
+    """pandas 3'te her zaman acik olan copy-on-write'i pandas 2'de acar; daha eskisinde False dondurur"""
+    ana_surum = int(pd.__version__.split(".")[0])
+    if ana_surum >= 3:
+        return True
+    if ana_surum == 2:
+        pd.set_option("mode.copy_on_write", True)
+        return True
+    return False
+
+
+COW_ACIK = _yazarken_kopyala_etkinlestir()
+
+
+def paylasimli_kopya(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """
+    Cercevenin veri bloklarini paylasan bagimsiz bir kopyasini dondurur.
+
+    Copy-on-write yoksa (pandas < 2) bagimsizlik ancak tam kopya ile saglanir.
+    """
+    if df is None:
+        return None
+    return df.copy(deep=not COW_ACIK)
+
+
+class YayinlananCerceve:
+    """
+    Atandiginda cerceveyi yayinlayan tanimlayici.
+
+    Sahip nesnede kilit (rw_lock.ReadWriteLock), _cerceve_surumleri ve _yayin_surumu
+    bulunmalidir. Atama yazma kilidi altinda yapilir, boylece goruntu_al() hicbir zaman
+    yarim kalmis bir yayin gormez.
+    """
+
+    def __set_name__(self, sahip, ad):
+        self.ad = ad
+
+    def __get__(self, nesne, sahip=None):
+        if nesne is None:
+            return self
+        return nesne.__dict__.get(self.ad)
+
+    def __set__(self, nesne, deger):
+        with nesne.kilit.yazma(self.ad):
+            nesne.__dict__[self.ad] = deger
+            nesne._yayin_surumu += 1
+            nesne._cerceve_surumleri[self.ad] = nesne._yayin_surumu
+
+
+class FrameSnapshot:
+    """
+    Cercevelerin ayni anda alinmis degistirilemez goruntusu.
+
+    Cercevelere canli nesnedeki adlariyla erisilir (goruntu.satislar_df). Her erisim
+    yeni bir sig kopya dondurur; okuyucunun kopyaya yazmasi ne canli cerceveyi ne de
+    ayni goruntuyu kullanan diger okuyuculari etkiler.
+    """
+
+    __slots__ = ("_cerceveler", "surum", "surumler")
+
+    def __init__(self, cerceveler: Dict[str, Optional[pd.DataFrame]], surum: int, surumler: Dict[str, int]):
+        object.__setattr__(self, "_cerceveler", MappingProxyType(dict(cerceveler)))
+        object.__setattr__(self, "surum", surum)
+        object.__setattr__(self, "surumler", MappingProxyType(dict(surumler)))
+
+    def __getattr__(self, ad: str) -> Optional[pd.DataFrame]:
+        try:
+            df = self._cerceveler[ad]
+        except KeyError:
+            raise AttributeError(ad) from None
+        return paylasimli_kopya(df)
+
+    def __setattr__(self, ad: str, deger: Any) -> None:
+        raise AttributeError("Cerceve goruntusu degistirilemez")
+
+    def cerceve(self, ad: str) -> pd.DataFrame:
+        """Cercevenin kopyasini, cerceve yoksa bos bir DataFrame dondurur"""
+        df = getattr(self, ad)
+        return df if df is not None else pd.DataFrame()
+
+    def __repr__(self) -> str:
+        return f"FrameSnapshot(surum={self.surum}, cerceveler={list(self._cerceveler)})"
@@ -0,0 +1,274 @@
+# -*- coding: utf-8 -*-
+"""
+Sifreleme anahtari dondurme modulu.
+
+Anahtarlar surumlu bir anahtar halkasinda tutulur ve her sifreli metnin basina
+anahtar kimligi eklenir ("k<id>:<fernet token>"). Kimliksiz eski metinler ilk anahtara
+aittir. Yeni anahtar aktif yapildiginda yeni yazmalar hemen onunla sifrelenir; eski
+metinler KeyRotationJob tarafindan arka planda, rowid sirali (keyset) partiler halinde
+yeniden sifrelenir. Her partiden sonra islem suresiyle orantili beklenir ve ilerleme
+veritabanina yazilir; uygulama yeniden basladiginda is kaldigi yerden devam eder.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple, Callable
+from cryptography.fernet import Fernet
+from events import Event, EVENT_ERROR_OCCURRED
+
+HATA_KODLARI = {
+    "ANAHTAR_001": "Sifreli metnin anahtari anahtar halkasinda yok",
+    "ANAHTAR_002": "Anahtar dondurme isi basarisiz"
+}
+
+EVENT_KEY_ROTATION_PROGRESS = "key_rotation_progress"
+EVENT_KEY_ROTATION_COMPLETED = "key_rotation_completed"
+
+ESKI_ANAHTAR_KIMLIGI = 1  # Kimlik oneki olmayan metinler bu anahtarla sifrelenmistir
+
+
+class AnahtarHalkasi:
+    """
+    Surumlu Fernet anahtarlarini tutan ve Fernet ile ayni arayuzu sunan sinif.
+
+    encrypt/decrypt bayt alir ve dondurur; bu sayede mevcut Fernet kullanan kod
+    (toplu sifreleme, yedek sifreleme) degismeden calisir.
+    """
+
+    def __init__(self, dosya_yolu: str, eski_anahtar: bytes, loglayici: Optional[logging.Logger] = None):
+        """
+        Args:
+            dosya_yolu: Anahtar halkasinin saklandigi JSON dosyasi
+            eski_anahtar: Halka yoksa ilk anahtar olarak kullanilacak mevcut anahtar
+            loglayici: Loglama islemleri icin logger nesnesi
+        """
+        self.dosya_yolu = dosya_yolu
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self._kilit = threading.Lock()
+        self._anahtarlar: Dict[int, bytes] = {}
+        self.aktif = ESKI_ANAHTAR_KIMLIGI
+
+        if os.path.exists(dosya_yolu):
+            with open(dosya_yolu, "r", encoding="utf-8") as f:
+                veri = json.load(f)
+            self._anahtarlar = {int(kimlik): anahtar.encode("ascii") for kimlik, anahtar in veri["anahtarlar"].items()}
+            self.aktif = int(veri["aktif"])
+        else:
+            self._anahtarlar = {ESKI_ANAHTAR_KIMLIGI: eski_anahtar}
+            self._kaydet()
+        self._fernetler = {kimlik: Fernet(anahtar) for kimlik, anahtar in self._anahtarlar.items()}
+
+    @property
+    def ilk_anahtar(self) -> bytes:
+        """Halkadaki en eski anahtar; dondurmeden etkilenmemesi gereken turetmeler icin kullanilir"""
+        return self._anahtarlar[min(self._anahtarlar)]
+
+    def _kaydet(self) -> None:
+        gecici = f"{self.dosya_yolu}.tmp"
+        with open(gecici, "w", encoding="utf-8") as f:
+            json.dump({"aktif": self.aktif,
+                       "anahtarlar": {str(k): v.decode("ascii") for k, v in self._anahtarlar.items()}}, f)
+        os.replace(gecici, self.dosya_yolu)
+
+    def yeni_anahtar(self) -> int:
+        """Yeni anahtar uretir, aktif yapar ve halkayi kaydeder; eski anahtarlar okuma icin saklanir"""
+        with self._kilit:
+            kimlik = max(self._anahtarlar) + 1
+            anahtar = Fernet.generate_key()
+            self._anahtarlar[kimlik] = anahtar
+            self._fernetler[kimlik] = Fernet(anahtar)
+            self.aktif = kimlik
+            self._kaydet()
+        self.loglayici.info(f"Yeni sifreleme anahtari aktif: k{kimlik}")
+        return kimlik
+
+    @staticmethod
+    def anahtar_kimligi(token: bytes) -> int:
+        """Sifreli metnin hangi anahtarla uretildigini dondurur"""
+        if token[:1] == b"k":
+            ayrac = token.find(b":")
+            if ayrac > 1:
+                return int(token[1:ayrac])
+        return ESKI_ANAHTAR_KIMLIGI
+
+    def guncel_mi(self, sifreli: str) -> bool:
+        """Sifreli metnin aktif anahtarla uretilip uretilmedigini dondurur"""
+        return self.anahtar_kimligi(sifreli.encode()) == self.aktif
+
+    def encrypt(self, veri: bytes) -> bytes:
+        kimlik = self.aktif
+        return b"k%d:" % kimlik + self._fernetler[kimlik].encrypt(veri)
+
+    def decrypt(self, token: bytes) -> bytes:
+        kimlik = self.anahtar_kimligi(token)
+        if kimlik not in self._fernetler:
+            raise ValueError(f"{HATA_KODLARI['ANAHTAR_001']}: k{kimlik}")
+        if token[:1] == b"k":
+            token = token[token.find(b":") + 1:]
+        return self._fernetler[kimlik].decrypt(token)
+
+
+class KeyRotationJob:
+    """
+    Eski anahtarla sifrelenmis hucreleri arka planda aktif anahtara tasiyan is.
+
+    Attributes:
+        parti_boyutu: Bir partide okunan satir sayisi
+        bekleme_orani: Parti suresinin bu kati kadar beklenir (1.0 => en fazla %50 doluluk)
+    """
+
+    def __init__(self, baglanti_al: Callable[[], sqlite3.Connection], baglanti_birak: Callable[[sqlite3.Connection], None],
+                 sifreleme, hedefler: Callable[[sqlite3.Connection], List[Tuple[str, str, List[str]]]],
+                 loglayici: Optional[logging.Logger] = None, event_manager=None,
+                 parti_boyutu: int = 500, bekleme_orani: float = 1.0, en_az_bekleme: float = 0.05):
+        """
+        Args:
+            baglanti_al: Repository baglanti alma fonksiyonu
+            baglanti_birak: Repository baglanti birakma fonksiyonu
+            sifreleme: SifrelemeYoneticisi nesnesi
+            hedefler: Baglantiyi alip (tablo, fiziksel tablo, sifreli alanlar) listesi donduren fonksiyon
+            loglayici: Loglama islemleri icin logger nesnesi
+            event_manager: Ilerleme olaylarini yayinlamak icin EventManager nesnesi
+            parti_boyutu: Parti basina satir sayisi
+            bekleme_orani: Partiler arasi bekleme / parti suresi orani
+            en_az_bekleme: Partiler arasi en kisa bekleme (saniye)
+        """
+        self._baglanti_al = baglanti_al
+        self._baglanti_birak = baglanti_birak
+        self.sifreleme = sifreleme
+        self._hedefler = hedefler
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.event_manager = event_manager
+        self.parti_boyutu = parti_boyutu
+        self.bekleme_orani = bekleme_orani
+        self.en_az_bekleme = en_az_bekleme
+        self.stop_flag = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def semayi_olustur(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS anahtar_dondurme_durumu (
+                tablo TEXT PRIMARY KEY,
+                hedef_anahtar INTEGER NOT NULL,
+                son_rowid INTEGER NOT NULL,
+                tasinan INTEGER NOT NULL DEFAULT 0,
+                tamamlandi INTEGER NOT NULL DEFAULT 0,
+                guncelleme TEXT NOT NULL
+            )''')
+
+    def bekleyen_var_mi(self, conn: sqlite3.Connection) -> bool:
+        """Aktif anahtar icin yeniden sifrelemesi tamamlanmamis tablo olup olmadigini dondurur"""
+        hedef = self.sifreleme.anahtarlik.aktif
+        if hedef == ESKI_ANAHTAR_KIMLIGI:
+            return False  # Hic dondurme yapilmadi
+        bitenler = {satir[0] for satir in conn.execute(
+            "SELECT tablo FROM anahtar_dondurme_durumu WHERE hedef_anahtar = ? AND tamamlandi = 1", (hedef,))}
+        return any(tablo not in bitenler for tablo, _, _ in self._hedefler(conn))
+
+    def baslat(self) -> None:
+        """Yeniden sifreleme thread'ini baslatir (calisiyorsa bir sey yapmaz)"""
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_flag.clear()
+        self.thread = threading.Thread(target=self._calis, name="AnahtarDondurme", daemon=True)
+        self.thread.start()
+
+    def durdur(self, bekle: float = 5.0) -> None:
+        """Isi durdurur; ilerleme kayitli oldugu icin sonraki baslatmada devam edilir"""
+        self.stop_flag.set()
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=bekle)
+
+    def ilerleme(self) -> List[Dict[str, Any]]:
+        """Tablo bazinda ilerleme kayitlarini dondurur"""
+        conn = self._baglanti_al()
+        try:
+            return [dict(zip(("tablo", "hedef_anahtar", "son_rowid", "tasinan", "tamamlandi", "guncelleme"), satir))
+                    for satir in conn.execute(
+                        "SELECT tablo, hedef_anahtar, son_rowid, tasinan, tamamlandi, guncelleme "
+                        "FROM anahtar_dondurme_durumu ORDER BY tablo")]
+        finally:
+            self._baglanti_birak(conn)
+
+    def _durum_al(self, conn: sqlite3.Connection, tablo: str, hedef: int) -> Tuple[int, int, bool]:
+        satir = conn.execute(
+            "SELECT hedef_anahtar, son_rowid, tasinan, tamamlandi FROM anahtar_dondurme_durumu WHERE tablo = ?",
+            (tablo,)).fetchone()
+        if satir is None or satir[0] != hedef:
+            return 0, 0, False  # Yeni bir anahtar icin bastan baslanir
+        return satir[1], satir[2], bool(satir[3])
+
+    def _durum_yaz(self, conn: sqlite3.Connection, tablo: str, hedef: int, son_rowid: int, tasinan: int, tamamlandi: bool) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO anahtar_dondurme_durumu "
+            "(tablo, hedef_anahtar, son_rowid, tasinan, tamamlandi, guncelleme) VALUES (?, ?, ?, ?, ?, ?)",
+            (tablo, hedef, son_rowid, tasinan, int(tamamlandi), datetime.now().isoformat()))
+
+    def _parti_isle(self, conn: sqlite3.Connection, fiziksel: str, alanlar: List[str], son_rowid: int) -> Tuple[int, int, int]:
+        """
+        son_rowid'den sonraki bir partiyi yeniden sifreler; commit cagirana aittir.
+
+        Returns:
+            Tuple[int, int, int]: (okunan satir, tasinan hucre, partinin son rowid degeri)
+        """
+        anahtarlik = self.sifreleme.anahtarlik
+        secim = ", ".join(f'"{alan}"' for alan in alanlar)
+        satirlar = conn.execute(
+            f'SELECT rowid, {secim} FROM "{fiziksel}" WHERE rowid > ? ORDER BY rowid LIMIT ?',
+            (son_rowid, self.parti_boyutu)).fetchall()
+        if not satirlar:
+            return 0, 0, son_rowid
+        tasinan = 0
+        for sira, alan in enumerate(alanlar, start=1):
+            guncellemeler = []
+            for satir in satirlar:
+                deger = satir[sira]
+                if isinstance(deger, str) and not anahtarlik.guncel_mi(deger):
+                    yeni = anahtarlik.encrypt(anahtarlik.decrypt(deger.encode())).decode()
+                    guncellemeler.append((yeni, satir[0], deger))
+            # Ayni anda kaydedilmis bir hucrenin ustune yazmamak icin eski deger kosulu eklenir
+            conn.executemany(f'UPDATE "{fiziksel}" SET "{alan}" = ? WHERE rowid = ? AND "{alan}" = ?', guncellemeler)
+            tasinan += len(guncellemeler)
+        return len(satirlar), tasinan, satirlar[-1][0]
+
+    def _calis(self) -> None:
+        conn = self._baglanti_al()
+        try:
+            hedef = self.sifreleme.anahtarlik.aktif
+            for tablo, fiziksel, alanlar in self._hedefler(conn):
+                son_rowid, toplam, tamamlandi = self._durum_al(conn, tablo, hedef)
+                while not tamamlandi and not self.stop_flag.is_set():
+                    baslangic = time.monotonic()
+                    okunan, tasinan, son_rowid = self._parti_isle(conn, fiziksel, alanlar, son_rowid)
+                    toplam += tasinan
+                    tamamlandi = okunan < self.parti_boyutu
+                    self._durum_yaz(conn, tablo, hedef, son_rowid, toplam, tamamlandi)
+                    conn.commit()
+                    if self.event_manager:
+                        self.event_manager.emit(Event(EVENT_KEY_ROTATION_PROGRESS, {
+                            "table": tablo, "last_rowid": son_rowid, "reencrypted": toplam, "completed": tamamlandi
+                        }))
+                    # Okuyucu/yazicilara yer birakmak icin parti suresiyle orantili bekle
+                    self.stop_flag.wait(max(self.en_az_bekleme, (time.monotonic() - baslangic) * self.bekleme_orani))
+                if self.stop_flag.is_set():
+                    self.loglayici.info(f"Anahtar dondurme durduruldu, {tablo} rowid {son_rowid} noktasindan devam edilecek")
+                    return
+                self.loglayici.info(f"{tablo} anahtar k{hedef} ile yeniden sifrelendi ({toplam} hucre)")
+
+            if self.event_manager:
+                self.event_manager.emit(Event(EVENT_KEY_ROTATION_COMPLETED, {"key_id": hedef}))
+        except Exception as e:
+            conn.rollback()
+            self.loglayici.error(f"{HATA_KODLARI['ANAHTAR_002']}: {str(e)}")
+            if self.event_manager:
+                self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {
+                    "error": "ANAHTAR_002",
+                    "message": f"{HATA_KODLARI['ANAHTAR_002']}: {str(e)}"
+                }))
+        finally:
+            self._baglanti_birak(conn)
@@ -6,7 +6,7 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTa
                              QGroupBox, QSizePolicy, QGridLayout, QScrollArea, QPushButton, QDialog,
                              QDialogButtonBox, QAbstractItemView, QFrame, QButtonGroup, QStackedWidget,
                              QApplication)
-from PyQt6.QtCore import Qt, QDate, QTimer, QUrl, QThreadPool, pyqtSignal
+from PyQt6.QtCore import Qt, QDate, QTimer, QUrl, pyqtSignal
 from PyQt6.QtGui import QIcon, QAction  # QAction sinifi buraya tasindi
 from veri_yoneticisi import VeriYoneticisi
 from gorsellestirici import Gorsellestirici  
@@ -22,7 +22,7 @@ import json  # Yeni eklenen kutuphane
 from PyQt6.QtCore import QThread, pyqtSignal  # Thread icin eklendi
 from typing import Optional, List  # Type hints icin
 from repository import RepositoryInterface  # Yeni import
-from events import Event, EventManager, EVENT_DATA_UPDATED, EVENT_UI_UPDATED, EVENT_ERROR_OCCURRED
+from events import Event, EventManager, EVENT_DATA_UPDATED, EVENT_UI_UPDATED, EVENT_ERROR_OCCURRED, TESLIMAT_ANA_THREAD
 from PyQt6.QtCore import pyqtSignal 
 import os
 import sys
@@ -30,6 +30,8 @@ from internet_baglantisi import InternetBaglantisi
 from ui_satis import AnaPencere as SatisAnaPencere
 from ui_hammadde_bom import AnaPencere as HammaddeAnaPencere
 from veri_yukleme_worker import VeriYuklemeWorker
+from task_scheduler import gorev_zamanlayici
+from main_thread import ana_thread_gonder
 from ui_interface import UIInterface
 import re
 from raporlama import Raporlama
@@ -102,9 +104,8 @@ class AnaPencere(QMainWindow, UIInterface):
         self.event_manager = event_manager
         self.gorsellestirici = Gorsellestirici(self.loglayici, self.event_manager, self.services)
         
-        # Thread pool olustur
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(4)  # Maksimum 4 thread
+        # Arka plan isleri paylasilan oncelikli gorev zamanlayicisinda calisir
+        self.thread_pool = gorev_zamanlayici()
 
         # Internet baglantisi kontrolu ekle
         self.internet_baglantisi = InternetBaglantisi(loglayici, event_manager)
@@ -133,10 +134,10 @@ class AnaPencere(QMainWindow, UIInterface):
         
         # Event dinleyicileri ekle
         if self.event_manager:
-            self.event_manager.subscribe("InternetBaglanti", self._on_internet_status_changed)
-            self.event_manager.subscribe(EVENT_DATA_UPDATED, self._on_data_updated)
-            self.event_manager.subscribe(EVENT_UI_UPDATED, self._on_ui_updated)
-            self.event_manager.subscribe(EVENT_ERROR_OCCURRED, self._on_error_occurred)
+            self.event_manager.subscribe("InternetBaglanti", self._on_internet_status_changed, teslimat=TESLIMAT_ANA_THREAD)
+            self.event_manager.subscribe(EVENT_DATA_UPDATED, self._on_data_updated, teslimat=TESLIMAT_ANA_THREAD)
+            self.event_manager.subscribe(EVENT_UI_UPDATED, self._on_ui_updated, teslimat=TESLIMAT_ANA_THREAD)
+            self.event_manager.subscribe(EVENT_ERROR_OCCURRED, self._on_error_occurred, teslimat=TESLIMAT_ANA_THREAD)
 
      # Container'lar ve UI olusturma (degismedi, ayni kaliyor)
         self.satis_performans_container = QWidget()
@@ -1302,11 +1303,14 @@ class AnaPencere(QMainWindow, UIInterface):
         """
         Gosterge panelindeki secili sayfadaki grafikleri gunceller.
         
-        Bu metod, ana is parcaciginda calisir ve secili sayfadaki grafikleri guncellemek icin
-        QTimer.singleShot kullanarak asenkron olarak calisir. Her grafik icin:
-        1. Gorsellestirici'den HTML icerik alinir (html_only=True)
+        Bu metod ana is parcaciginda filtreleri ve cerceve goruntusunu alir; grafikler ve ozet
+        bilgiler gorev zamanlayicisinin yenileme seridinde hesaplanir. Her grafik icin:
+        1. Gorsellestirici'den HTML icerik alinir (html_only=True, SERIT_YENILEME)
         2. HTML icerik, ana is parcaciginda QWebEngineView'a donusturulur
         3. Olusturulan QWebEngineView, ilgili container'a eklenir
+
+        Her grafik "gosterge_paneli:<grafik>" anahtariyla gonderilir; filtre degisiklikleri
+        art arda geldiginde bekleyen hesaplama tekrarlanmaz, en son filtrelerle bir kez yapilir.
         """
         try:
             self.loglayici.debug(f"gosterge_paneli_guncelle çağrıldı, iş parçacığı: {QThread.currentThread()}")
@@ -1343,11 +1347,12 @@ class AnaPencere(QMainWindow, UIInterface):
             chart_type = self.chart_type_combo.currentText().lower()
             theme = self.theme_combo.currentText()
 
-            # Veri çerçevelerini kopyala
-            satislar_df = self.services.data_manager.satislar_df.copy() if self.services.data_manager.satislar_df is not None else pd.DataFrame()
-            pipeline_df = self.services.data_manager.pipeline_df.copy() if self.services.data_manager.pipeline_df is not None else pd.DataFrame()
-            musteriler_df = self.services.data_manager.customers_df.copy() if self.services.data_manager.customers_df is not None else pd.DataFrame()
-            hedefler_df = self.services.data_manager.targets_df.copy() if self.services.data_manager.targets_df is not None else pd.DataFrame()
+            # Veri çerçevelerinin tutarlı görüntüsünü al (veri kopyalanmaz, bkz. VeriYoneticisi.goruntu_al)
+            goruntu = self.services.data_manager.goruntu_al()
+            satislar_df = goruntu.cerceve("satislar_df")
+            pipeline_df = goruntu.cerceve("pipeline_df")
+            musteriler_df = goruntu.cerceve("musteriler_df")
+            hedefler_df = goruntu.cerceve("hedefler_df")
 
             # Veri yoksa uyarı göster ve çık
             if all(df.empty for df in [satislar_df, pipeline_df, musteriler_df, hedefler_df]):
@@ -1428,259 +1433,157 @@ class AnaPencere(QMainWindow, UIInterface):
             # Secili sayfayi belirle
             secili_sayfa_index = self.sayfa_icerik_container.currentIndex()
             
+            def grafik_yenile(ad, container, olustur):
+                """Grafik HTML'ini yenileme seridinde uretir, web gorunumunu ana thread'de yerlestirir."""
+                def uygula(html_content):
+                    self._temizle_ve_ekle_widget(container, create_web_view_from_html(html_content))
+                    self.loglayici.debug(f"{ad} grafigi guncellendi")
+
+                def hata(mesaj):
+                    self.loglayici.error(f"{ad} grafigi olusturulurken hata: {mesaj}")
+                    self._temizle_ve_ekle_widget(container, self.gorsellestirici._create_empty_web_view())
+
+                self.thread_pool.yenile(f"gosterge_paneli:{ad}", olustur, uygula, hata)
+
             # Genel Rapor Sayfası (index 0)
             if secili_sayfa_index == 0:
-                def update_ozet_bilgiler():
+                def ozet_bilgileri_hesapla():
+                    """Özet bilgi değerlerini hesaplar. Yenileme şeridinde çalışır; Qt nesnelerine dokunmaz."""
+                    # Eğer satışlar veri çerçevesi boşsa, bilgi kutuları varsayılan değerlerle doldurulur
+                    if satislar_df is None or satislar_df.empty:
+                        self.loglayici.warning("Satışlar veri çerçevesi boş. Özet bilgiler gösterilemiyor.")
+                        return None
+
+                    # Filtreleri uygula
+                    filtered_df = goruntu.cerceve("satislar_df")
+                    
+                    # Tarih filtresi uygula
+                    if 'Ay' in filtered_df.columns:
+                        try:
+                            filtered_df['Tarih'] = filtered_df['Ay'].apply(lambda x: pd.to_datetime(f"01-{x}", format="%d-%m-%Y", errors='coerce'))
+                            baslangic = pd.to_datetime(filtreler['baslangic_tarihi'])
+                            bitis = pd.to_datetime(filtreler['bitis_tarihi'])
+                            filtered_df = filtered_df[(filtered_df['Tarih'] >= baslangic) & (filtered_df['Tarih'] <= bitis)]
+                        except Exception as e:
+                            self.loglayici.error(f"Tarih filtresi uygulanırken hata: {str(e)}")
+                    
+                    # Diğer filtreleri uygula
+                    if filtreler.get('satisci') and 'Satis Temsilcisi' in filtered_df.columns:
+                        filtered_df = filtered_df[filtered_df['Satis Temsilcisi'] == filtreler['satisci']]
+                    
+                    if filtreler.get('bolge') and 'Bolge' in filtered_df.columns:
+                        filtered_df = filtered_df[filtered_df['Bolge'] == filtreler['bolge']]
+                    
+                    if filtreler.get('sektor') and 'Sektor' in filtered_df.columns:
+                        filtered_df = filtered_df[filtered_df['Sektor'] == filtreler['sektor']]
+                    
+                    if filtreler.get('musteri_adi') and 'Ana Musteri' in filtered_df.columns:
+                        filtered_df = filtered_df[filtered_df['Ana Musteri'].str.contains(filtreler['musteri_adi'], case=False, na=False)]
+                    
+                    # Toplam satış hesapla
+                    toplam_satis = 0
+                    if 'Satis Miktari' in filtered_df.columns:
+                        toplam_satis = filtered_df['Satis Miktari'].sum()
+                    
+                    # Toplam maliyet hesapla
+                    maliyet_sonuc = self.services.data_manager.toplam_maliyet_hesapla(
+                        baslangic_tarihi=filtreler['baslangic_tarihi'],
+                        bitis_tarihi=filtreler['bitis_tarihi']
+                    )
+                    toplam_maliyet = maliyet_sonuc['toplam_maliyet']
+
+                    # Ortalama AV hesapla
+                    ortalama_av = 0
+                    if toplam_satis > 0:
+                        ortalama_av = 1 - (toplam_maliyet / toplam_satis)
+                    
+                    # Toplam ağırlık hesapla
+                    agirlik_sonuc = self.services.data_manager.toplam_agirlik_hesapla(
+                        baslangic_tarihi=filtreler['baslangic_tarihi'],
+                        bitis_tarihi=filtreler['bitis_tarihi']
+                    )
+                    toplam_agirlik = agirlik_sonuc['toplam_agirlik']
+                    return toplam_satis, toplam_maliyet, ortalama_av, toplam_agirlik
+
+                def ozet_bilgileri_uygula(degerler):
                     """Özet bilgi kutularını günceller. Ana iş parçacığında çalışır."""
-                    try:
-                        self.loglayici.debug(f"update_ozet_bilgiler çağrıldı, iş parçacığı: {QThread.currentThread()}")
-                        
-                        # Veri çerçevelerinin durumunu logla
-                        satislar_satir_sayisi = len(satislar_df) if satislar_df is not None else 0
-                        self.loglayici.debug(f"Özet bilgiler için veri durumu: Satışlar={satislar_satir_sayisi} satır")
-                        
-                        # Eğer satışlar veri çerçevesi boşsa, bilgi kutularını varsayılan değerlerle doldur
-                        if satislar_df is None or satislar_df.empty:
-                            self.loglayici.warning("Satışlar veri çerçevesi boş. Özet bilgiler gösterilemiyor.")
-                            self.toplam_satis_deger.setText("Veri yok")
-                            self.toplam_maliyet_deger.setText("Veri yok")
-                            self.ortalama_av_deger.setText("Veri yok")
-                            self.toplam_agirlik_deger.setText("Veri yok")
-                            return
-                        
-                        # Filtreleri uygula
-                        filtered_df = satislar_df.copy()
-                        
-                        # Tarih filtresi uygula
-                        if 'Ay' in filtered_df.columns:
-                            try:
-                                filtered_df['Tarih'] = filtered_df['Ay'].apply(lambda x: pd.to_datetime(f"01-{x}", format="%d-%m-%Y", errors='coerce'))
-                                baslangic = pd.to_datetime(filtreler['baslangic_tarihi'])
-                                bitis = pd.to_datetime(filtreler['bitis_tarihi'])
-                                filtered_df = filtered_df[(filtered_df['Tarih'] >= baslangic) & (filtered_df['Tarih'] <= bitis)]
-                            except Exception as e:
-                                self.loglayici.error(f"Tarih filtresi uygulanırken hata: {str(e)}")
-                        
-                        # Diğer filtreleri uygula
-                        if filtreler.get('satisci') and 'Satis Temsilcisi' in filtered_df.columns:
-                            filtered_df = filtered_df[filtered_df['Satis Temsilcisi'] == filtreler['satisci']]
-                        
-                        if filtreler.get('bolge') and 'Bolge' in filtered_df.columns:
-                            filtered_df = filtered_df[filtered_df['Bolge'] == filtreler['bolge']]
-                        
-                        if filtreler.get('sektor') and 'Sektor' in filtered_df.columns:
-                            filtered_df = filtered_df[filtered_df['Sektor'] == filtreler['sektor']]
-                        
-                        if filtreler.get('musteri_adi') and 'Ana Musteri' in filtered_df.columns:
-                            filtered_df = filtered_df[filtered_df['Ana Musteri'].str.contains(filtreler['musteri_adi'], case=False, na=False)]
-                        
-                        # Toplam satış hesapla
-                        toplam_satis = 0
-                        if 'Satis Miktari' in filtered_df.columns:
-                            toplam_satis = filtered_df['Satis Miktari'].sum()
-                        
-                        # Toplam maliyet hesapla
-                        maliyet_sonuc = self.services.data_manager.toplam_maliyet_hesapla(
-                            baslangic_tarihi=filtreler['baslangic_tarihi'],
-                            bitis_tarihi=filtreler['bitis_tarihi']
-                        )
-                        toplam_maliyet = maliyet_sonuc['toplam_maliyet']
-
-                        # Ortalama AV hesapla
-                        ortalama_av = 0
-                        if toplam_satis > 0:
-                            ortalama_av = 1 - (toplam_maliyet / toplam_satis)
-                        
-                        # Toplam ağırlık hesapla
-                        agirlik_sonuc = self.services.data_manager.toplam_agirlik_hesapla(
-                            baslangic_tarihi=filtreler['baslangic_tarihi'],
-                            bitis_tarihi=filtreler['bitis_tarihi']
-                        )
-                        toplam_agirlik = agirlik_sonuc['toplam_agirlik']
-                        
-                        # Bilgi kutularını güncelle
-                        self.toplam_satis_deger.setText(f"{toplam_satis:,.2f} TL")
-                        self.toplam_maliyet_deger.setText(f"{toplam_maliyet:,.2f} TL")
-                        self.ortalama_av_deger.setText(f"%{ortalama_av*100:.2f}")
-                        self.toplam_agirlik_deger.setText(f"{toplam_agirlik:,.2f} kg")
-                        
-                        self.loglayici.debug("Özet bilgiler güncellendi")
-                    except Exception as e:
-                        self.loglayici.error(f"Özet bilgiler güncellenirken hata: {str(e)}")
-                        import traceback
-                        self.loglayici.debug(f"Hata ayrıntıları:\n{traceback.format_exc()}")
-                        # Hata durumunda bilgi kutularını varsayılan değerlerle doldur
-                        self.toplam_satis_deger.setText("Hata")
-                        self.toplam_maliyet_deger.setText("Hata")
-                        self.ortalama_av_deger.setText("Hata")
-                        self.toplam_agirlik_deger.setText("Hata")
-                
-                # Özet bilgileri güncelle
-                QTimer.singleShot(0, update_ozet_bilgiler)
+                    if degerler is None:
+                        for etiket in (self.toplam_satis_deger, self.toplam_maliyet_deger,
+                                       self.ortalama_av_deger, self.toplam_agirlik_deger):
+                            etiket.setText("Veri yok")
+                        return
+                    toplam_satis, toplam_maliyet, ortalama_av, toplam_agirlik = degerler
+                    self.toplam_satis_deger.setText(f"{toplam_satis:,.2f} TL")
+                    self.toplam_maliyet_deger.setText(f"{toplam_maliyet:,.2f} TL")
+                    self.ortalama_av_deger.setText(f"%{ortalama_av*100:.2f}")
+                    self.toplam_agirlik_deger.setText(f"{toplam_agirlik:,.2f} kg")
+                    self.loglayici.debug("Özet bilgiler güncellendi")
+
+                def ozet_bilgileri_hatasi(mesaj):
+                    self.loglayici.error(f"Özet bilgiler güncellenirken hata: {mesaj}")
+                    # Hata durumunda bilgi kutularını varsayılan değerlerle doldur
+                    for etiket in (self.toplam_satis_deger, self.toplam_maliyet_deger,
+                                   self.ortalama_av_deger, self.toplam_agirlik_deger):
+                        etiket.setText("Hata")
 
-                # Pasta grafikleri için güncelleme
-                def update_pasta_grafikler():
-                    try:
-                        # Eski pasta grafikleri yerine birlesik genel rapor grafigini olustur
-                        birlesik_grafik = self.gorsellestirici.birlesik_genel_rapor_grafigi_olustur(
-                            satislar_df, chart_type=chart_type, theme=theme, html_only=True
-                        )
-                        web_view_birlesik = create_web_view_from_html(birlesik_grafik)
-                        self._temizle_ve_ekle_widget(self.birlesik_genel_rapor_container, web_view_birlesik)
-
-                        self.loglayici.debug("Birlesik genel rapor grafigi guncellendi")
-                    except Exception as e:
-                        self.loglayici.error(f"Birlesik genel rapor grafigi guncellenirken hata: {str(e)}")
-                        import traceback
-                        self.loglayici.debug(f"Hata ayrıntıları:\n{traceback.format_exc()}")
-                        # Hata durumunda container'ı temizle
-                        self._temizle_ve_ekle_widget(self.birlesik_genel_rapor_container, self.gorsellestirici._create_empty_web_view())
+                # Özet bilgileri güncelle
+                self.thread_pool.yenile("gosterge_paneli:ozet", ozet_bilgileri_hesapla,
+                                        ozet_bilgileri_uygula, ozet_bilgileri_hatasi)
 
-                # Pasta grafikleri güncelle
-                QTimer.singleShot(0, update_pasta_grafikler)
-                
-                # Genel Rapor sayfasi icin bos bir container olustur
-                # Yeni icerik icin hazirlandi
+                # Genel Rapor sayfasi icin bos bir container olustur; grafik hazir oldugunda yerlestirilir
                 try:
                     # Eski container'lar yerine yeni container'i kullan
                     if hasattr(self, 'birlesik_genel_rapor_container'):
                         self._temizle_ve_ekle_widget(self.birlesik_genel_rapor_container, self.gorsellestirici._create_empty_web_view())
                 except Exception as e:
                     self.loglayici.error(f"Genel rapor container'i guncellenirken hata: {str(e)}")
+
+                # Eski pasta grafikleri yerine birlesik genel rapor grafigini olustur
+                grafik_yenile("birlesik_genel_rapor", self.birlesik_genel_rapor_container,
+                              lambda: self.gorsellestirici.birlesik_genel_rapor_grafigi_olustur(
+                                  satislar_df, chart_type=chart_type, theme=theme, html_only=True))
                 
             # Satis Performansi Sayfasi (index 1)
             elif secili_sayfa_index == 1:
-                # Satis performansi grafigini guncelle
-                def update_satis_grafik():
-                    """Satis performansi grafigini gunceller. Ana is parcaciginda calisir."""
-                    try:
-                        self.loglayici.debug(f"update_satis_grafik çağrıldı, iş parçacığı: {QThread.currentThread()}")
-                        
-                        # Veri cercevelerinin durumunu logla
-                        hedefler_satir_sayisi = len(hedefler_df) if hedefler_df is not None else 0
-                        satislar_satir_sayisi = len(satislar_df) if satislar_df is not None else 0
-                        self.loglayici.debug(f"Satis grafigi icin veri durumu: Hedefler={hedefler_satir_sayisi} satir, Satislar={satislar_satir_sayisi} satir")
-                        
-                        # Eger hedefler veri cercevesi bossa, kullaniciya bilgi ver
-                        if hedefler_df is None or hedefler_df.empty:
-                            self.loglayici.warning("Hedefler veri cercevesi bos. Lutfen once satis hedefleri ekleyin.")
-                        
-                        html_content = self.gorsellestirici.satis_performansi_grafigi_olustur(
-                            hedefler_df, satislar_df, filtreler, chart_type, theme, html_only=True
-                        )
-                        web_view = create_web_view_from_html(html_content)
-                        self._temizle_ve_ekle_widget(self.satis_performans_container, web_view)
-                        self.loglayici.debug("Satis performansi grafigi guncellendi")
-                    except Exception as e:
-                        self.loglayici.error(f"Satis performansi grafigi olusturulurken hata: {str(e)}")
-                        import traceback
-                        self.loglayici.debug(f"Hata ayrintilari:\n{traceback.format_exc()}")
-                        self._temizle_ve_ekle_widget(self.satis_performans_container, self.gorsellestirici._create_empty_web_view())
-                
-                QTimer.singleShot(0, update_satis_grafik)
-                
-                # Satis temsilcisi performans grafigini guncelle
-                def update_temsilci_grafik():
-                    try:
-                        self.loglayici.debug(f"update_temsilci_grafik çağrıldı, iş parçacığı: {QThread.currentThread()}")
-                        html_content = self.gorsellestirici.satis_temsilcisi_performansi_grafigi_olustur(
-                            satislar_df, chart_type, theme, html_only=True
-                        )
-                        web_view = create_web_view_from_html(html_content)
-                        self._temizle_ve_ekle_widget(self.satis_temsilcisi_performans_container, web_view)
-                        self.loglayici.debug("Satis temsilcisi performans grafigi guncellendi")
-                    except Exception as e:
-                        self.loglayici.error(f"Satis temsilcisi performansi grafigi olusturulurken hata: {str(e)}")
-                        import traceback
-                        self.loglayici.debug(f"Hata ayrintilari:\n{traceback.format_exc()}")
-                        self._temizle_ve_ekle_widget(self.satis_temsilcisi_performans_container, self.gorsellestirici._create_empty_web_view())
-                
-                QTimer.singleShot(0, update_temsilci_grafik)
+                # Eger hedefler veri cercevesi bossa, kullaniciya bilgi ver
+                if hedefler_df is None or hedefler_df.empty:
+                    self.loglayici.warning("Hedefler veri cercevesi bos. Lutfen once satis hedefleri ekleyin.")
+
+                grafik_yenile("satis_performansi", self.satis_performans_container,
+                              lambda: self.gorsellestirici.satis_performansi_grafigi_olustur(
+                                  hedefler_df, satislar_df, filtreler, chart_type, theme, html_only=True))
+
+                grafik_yenile("satis_temsilcisi_performansi", self.satis_temsilcisi_performans_container,
+                              lambda: self.gorsellestirici.satis_temsilcisi_performansi_grafigi_olustur(
+                                  satislar_df, chart_type, theme, html_only=True))
                 
             # Musteri Analizi Sayfasi (index 2)
             elif secili_sayfa_index == 2:
-                # Musteri segmentasyon grafigini guncelle
-                def update_segmentasyon_grafik():
-                    try:
-                        self.loglayici.debug(f"update_segmentasyon_grafik çağrıldı, iş parçacığı: {QThread.currentThread()}")
-                        html_content = self.gorsellestirici.musteri_sektor_grafigi_olustur(
-                            musteriler_df, 
-                            chart_type if chart_type in ['pie', 'bar', 'treemap'] else 'pie',
-                            theme,
-                            html_only=True
-                        )
-                        web_view = create_web_view_from_html(html_content)
-                        self._temizle_ve_ekle_widget(self.musteri_segmentasyon_container, web_view)
-                        self.loglayici.debug("Musteri segmentasyon grafigi guncellendi")
-                    except Exception as e:
-                        self.loglayici.error(f"Musteri sektor grafigi olusturulurken hata: {str(e)}")
-                        import traceback
-                        self.loglayici.debug(f"Hata ayrintilari:\n{traceback.format_exc()}")
-                        self._temizle_ve_ekle_widget(self.musteri_segmentasyon_container, self.gorsellestirici._create_empty_web_view())
-                
-                QTimer.singleShot(0, update_segmentasyon_grafik)
-                
-                # Aylik potansiyel gelir grafigini guncelle
-                def update_potansiyel_grafik():
-                    try:
-                        self.loglayici.debug(f"update_potansiyel_grafik çağrıldı, iş parçacığı: {QThread.currentThread()}")
-                        html_content = self.gorsellestirici.aylik_potansiyel_gelir_grafigi_olustur(
-                            pipeline_df, filtreler, chart_type, theme, html_only=True
-                        )
-                        web_view = create_web_view_from_html(html_content)
-                        self.loglayici.debug(f"Aylik potansiyel gelir widget olusturuldu mu: {web_view is not None}")
-                        self._temizle_ve_ekle_widget(self.aylik_potansiyel_gelir_container, web_view)
-                        self.loglayici.debug("Aylik potansiyel gelir grafigi guncellendi")
-                    except Exception as e:
-                        self.loglayici.error(f"Aylik potansiyel gelir grafigi olusturulurken hata: {str(e)}")
-                        import traceback
-                        self.loglayici.debug(f"Hata ayrintilari:\n{traceback.format_exc()}")
-                        self._temizle_ve_ekle_widget(self.aylik_potansiyel_gelir_container, self.gorsellestirici._create_empty_web_view())
-                
-                QTimer.singleShot(0, update_potansiyel_grafik)
+                grafik_yenile("musteri_segmentasyon", self.musteri_segmentasyon_container,
+                              lambda: self.gorsellestirici.musteri_sektor_grafigi_olustur(
+                                  musteriler_df,
+                                  chart_type if chart_type in ['pie', 'bar', 'treemap'] else 'pie',
+                                  theme,
+                                  html_only=True))
+
+                grafik_yenile("aylik_potansiyel_gelir", self.aylik_potansiyel_gelir_container,
+                              lambda: self.gorsellestirici.aylik_potansiyel_gelir_grafigi_olustur(
+                                  pipeline_df, filtreler, chart_type, theme, html_only=True))
                 
             # Bolgesel Analiz Sayfasi (index 2)
             elif secili_sayfa_index == 2:
-                # Harita grafigini guncelle
-                def update_harita_grafik():
-                    try:
-                        self.loglayici.debug(f"update_harita_grafik çağrıldı, iş parçacığı: {QThread.currentThread()}")
-                        html_content = self.gorsellestirici.musteri_bolge_dagilimi_grafigi_olustur(
-                            musteriler_df, chart_type='choropleth', theme=theme, html_only=True
-                        )
-                        web_view = create_web_view_from_html(html_content)
-                        self._temizle_ve_ekle_widget(self.musteri_bolge_dagilim_container, web_view)
-                        self.loglayici.debug("Harita grafigi guncellendi")
-                    except Exception as e:
-                        self.loglayici.error(f"Harita grafigi olusturulurken hata: {str(e)}")
-                        import traceback
-                        self.loglayici.debug(f"Hata ayrintilari:\n{traceback.format_exc()}")
-                        self._temizle_ve_ekle_widget(self.musteri_bolge_dagilim_container, self.gorsellestirici._create_empty_web_view())
-                
-                QTimer.singleShot(0, update_harita_grafik)
+                grafik_yenile("musteri_bolge_dagilimi", self.musteri_bolge_dagilim_container,
+                              lambda: self.gorsellestirici.musteri_bolge_dagilimi_grafigi_olustur(
+                                  musteriler_df, chart_type='choropleth', theme=theme, html_only=True))
                 
             # Pipeline Analizi Sayfasi (index 3)
             elif secili_sayfa_index == 3:
-                # Pipeline grafigini guncelle
-                def update_pipeline_grafik():
-                    try:
-                        self.loglayici.debug(f"update_pipeline_grafik çağrıldı, iş parçacığı: {QThread.currentThread()}")
-                        html_content = self.gorsellestirici.pipeline_grafigi_olustur(
-                            pipeline_df, 
-                            chart_type if chart_type in ['pie', 'bar', 'funnel'] else 'pie', 
-                            theme, 
-                            html_only=True
-                        )
-                        web_view = create_web_view_from_html(html_content)
-                        self._temizle_ve_ekle_widget(self.pipeline_container, web_view)
-                        self.loglayici.debug("Pipeline grafigi guncellendi")
-                    except Exception as e:
-                        self.loglayici.error(f"Pipeline grafigi olusturulurken hata: {str(e)}")
-                        import traceback
-                        self.loglayici.debug(f"Hata ayrintilari:\n{traceback.format_exc()}")
-                        self._temizle_ve_ekle_widget(self.pipeline_container, self.gorsellestirici._create_empty_web_view())
-                
-                QTimer.singleShot(0, update_pipeline_grafik)
+                grafik_yenile("pipeline", self.pipeline_container,
+                              lambda: self.gorsellestirici.pipeline_grafigi_olustur(
+                                  pipeline_df,
+                                  chart_type if chart_type in ['pie', 'bar', 'funnel'] else 'pie',
+                                  theme,
+                                  html_only=True))
 
             self.loglayici.info(f"Secili sayfa {secili_sayfa_index} icin grafiklerin guncellenmesi baslatildi")
 
@@ -1753,8 +1656,8 @@ class AnaPencere(QMainWindow, UIInterface):
             if hasattr(self, 'worker') and self.worker is not None:
                 try:
                     if self.worker.isRunning():
-                        self.loglayici.warning("Onceki worker hala calisiyor, sonlandiriliyor.")
-                        self.worker.terminate()
+                        self.loglayici.warning("Onceki worker hala calisiyor, iptal ediliyor.")
+                        self.worker.iptal_et()
                         self.worker.wait(1000)  # 1 saniye bekle
                     self.worker = None
                 except Exception as e:
@@ -1942,7 +1845,7 @@ class AnaPencere(QMainWindow, UIInterface):
                 try:
                     if self.worker.isRunning():
                         self.loglayici.info("Worker thread sonlandiriliyor...")
-                        self.worker.terminate()
+                        self.worker.iptal_et()
                         self.worker.wait(2000)  # 2 saniye bekle
                         if self.worker.isRunning():
                             self.loglayici.warning("Worker thread 2 saniye icinde sonlanmadi, zorla kapatiliyor.")
@@ -2106,14 +2009,24 @@ class AnaPencere(QMainWindow, UIInterface):
             QMessageBox.critical(self, "Hata", f"Kohort analizi raporu olusturulurken hata: {str(e)}")
     
     def _kohort_analizi_olustur(self, baslangic_tarihi, bitis_tarihi, ilerleme_dialog):
-        """Kohort analizi raporunu olusturur ve gosterir"""
+        """Kohort analizi raporunu beklemeden baslatir; sonuc ana thread'de gosterilir"""
         try:
-            # Kohort analizi raporu olustur
-            sonuc = self.services.generate_kohort_report(
+            # Hesap arka planda (buyuk veride ayri surecte) yapilir, olay dongusu bloklanmaz
+            gelecek = self.services.submit_kohort_report(
                 baslangic_tarihi=baslangic_tarihi,
                 bitis_tarihi=bitis_tarihi
             )
+            gelecek.add_done_callback(
+                lambda f: ana_thread_gonder(self._kohort_analizi_tamamlandi, f.result(), ilerleme_dialog))
             
+        except Exception as e:
+            self.loglayici.error(f"Kohort analizi olusturulurken hata: {str(e)}")
+            ilerleme_dialog.accept()
+            QMessageBox.critical(self, "Hata", f"Kohort analizi olusturulurken hata: {str(e)}")
+
+    def _kohort_analizi_tamamlandi(self, sonuc, ilerleme_dialog):
+        """Kohort analizi sonucunu gosterir (ana thread'de calisir)"""
+        try:
             # Ilerleme dialogunu kapat
             ilerleme_dialog.accept()
             
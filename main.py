@@ -20,12 +20,15 @@ import logging
 from PyQt6.QtWidgets import QApplication, QGroupBox
 from PyQt6.QtCore import QCoreApplication
 from kullanici_arayuzu import AnaPencere
-from veritabani import SQLiteRepository, BackupManager
+from veritabani import BackupManager
+from memory_repository import repository_olustur
+from sync_engine import SyncEngine, SharedFolderTransport
 from zamanlayici import Zamanlayici
 from gunlukleyici import loglayici_olustur
 from veri_yoneticisi import VeriYoneticisi
 from services import CRMServices
 from events import EventManager, Event, EVENT_DATA_UPDATED, EVENT_ERROR_OCCURRED
+from task_scheduler import gorev_zamanlayici
 from asset_manager import AssetManager
 from error_manager import ErrorManager
 from sifreleme import SifrelemeYoneticisi
@@ -65,36 +68,64 @@ def main() -> int:
         
         # Olay yoneticisi olustur
         event_manager = EventManager(loglayici)
+        # Toplu ice aktarma ve duzenlemelerde art arda gelen veri guncellemeleri tek yenilemede toplanir
+        event_manager.birlestir(EVENT_DATA_UPDATED, float(os.getenv("OLAY_BIRLESTIRME_SURESI", "0.25")))
+        
+        # Tum arka plan islerinin calistigi paylasilan gorev zamanlayicisi
+        gorev_zamanlayici(loglayici)
         
         # Asset Manager olustur ve asset'leri kontrol et
         asset_manager = AssetManager(loglayici, event_manager)
         asset_manager.check_and_download_assets()
         
-        # Sifreleme yoneticisi olustur
+        # Sifreleme yoneticisi olustur (repository ve yedekleme ayni anahtar halkasini kullanir)
         sifreleme = SifrelemeYoneticisi(loglayici, event_manager)
         
-        # Veritabani baglantisi olustur
-        repository = SQLiteRepository(
+        # Veritabani baglantisi olustur (REPOSITORY_MODU=bellek ile bellek ici calisir)
+        repository = repository_olustur(
+            mod=os.getenv("REPOSITORY_MODU", "disk"),
             db_path=os.getenv("DATABASE_PATH", "crm_database.db"),
-            event_manager=event_manager
+            event_manager=event_manager,
+            backup_dir=os.getenv("BACKUP_DIR", "backups"),
+            sifreleme_yoneticisi=sifreleme
         )
         
         # Yedekleme yoneticisi olustur
         backup_manager = BackupManager(
             backup_dir=os.getenv("BACKUP_DIR", "backups"),
             event_manager=event_manager,
-            sifreleme_yoneticisi=sifreleme
+            sifreleme_yoneticisi=sifreleme,
+            tekillestirme=os.getenv("YEDEK_TEKILLESTIRME", "0") == "1",
+            saklanacak_yedek=int(os.getenv("YEDEK_SAKLAMA_SAYISI", "30"))
         )
         
         # Veri yoneticisi olustur
         veri_yoneticisi = VeriYoneticisi(repository, loglayici, event_manager)
         
         # Zamanlayici olustur
-        zamanlayici = Zamanlayici(loglayici, event_manager)
+        zamanlayici = Zamanlayici(loglayici, event_manager,
+                                  durum_dosyasi=os.getenv("ZAMANLAYICI_DURUM_DOSYASI", "zamanlayici_durum.json"))
         
-        # Otomatik yedeklemeyi ayarla
+        # Otomatik yedeklemeyi ayarla (BACKUP_CRON verilirse saat araligi yerine cron ifadesi kullanilir)
         yedekleme_suresi = int(os.getenv("BACKUP_INTERVAL_HOURS", "24"))
-        zamanlayici.yedekleme_zamanla(backup_manager, repository.db_path, yedekleme_suresi)
+        zamanlayici.yedekleme_zamanla(backup_manager, repository.db_path, yedekleme_suresi,
+                                      cron=os.getenv("BACKUP_CRON") or None,
+                                      zaman_asimi=int(os.getenv("BACKUP_ZAMAN_ASIMI_DAKIKA", "60")) * 60)
+
+        # Subeler arasi senkronizasyon (ortak klasor tanimliysa)
+        sync_klasoru = os.getenv("SYNC_KLASORU")
+        if sync_klasoru:
+            sync_engine = SyncEngine(
+                repository,
+                SharedFolderTransport(sync_klasoru),
+                loglayici=loglayici,
+                event_manager=event_manager,
+                cakisma_politikasi=os.getenv("SYNC_CAKISMA_POLITIKASI", "yerel_kazanir"),
+                veri_yoneticisi=veri_yoneticisi
+            )
+            zamanlayici.is_ekle(sync_engine.senkronize_et, int(os.getenv("SYNC_ARALIGI_DAKIKA", "15")) * 60,
+                                ad="senkronizasyon",
+                                zaman_asimi=int(os.getenv("SYNC_ZAMAN_ASIMI_DAKIKA", "10")) * 60)
         
         # Qt uygulamasini baslat
         uygulama = QApplication(sys.argv)
@@ -116,16 +147,28 @@ def main() -> int:
         loglayici.error(f"Uygulama baslatma hatasi: {str(e)}")
         return 1
     finally:
-        if 'repository' in locals() and repository is not None:
-            try:
-                repository.close()
-            except Exception as e:
-                event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"message": f"Veritabani kapatilirken hata: {str(e)}"}))
+        # Zamanlanmis isler once durdurulur ki kapanan gorev zamanlayicisina yeni is gondermesin
         if 'zamanlayici' in locals() and zamanlayici is not None:
             try:
                 zamanlayici.durdur()
             except Exception as e:
                 event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"message": f"Zamanlayici durdurulurken hata: {str(e)}"}))
+        # Bekleyen arka plan isleri iptal edilir, calisan kayitlar veritabani kapanmadan tamamlanir
+        gorev_zamanlayici().kapat()
+        if 'veri_yoneticisi' in locals():
+            veri_yoneticisi.analitik.kapat()
+        if 'repository' in locals() and repository is not None:
+            try:
+                repository.close()
+            except Exception as e:
+                event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"message": f"Veritabani kapatilirken hata: {str(e)}"}))
+        if 'event_manager' in locals():
+            event_manager.kapat(bekle=False)
+            if os.getenv("OLAY_METRIK_DOSYASI"):
+                try:
+                    event_manager.metrikleri_kaydet(os.getenv("OLAY_METRIK_DOSYASI"))
+                except OSError as e:
+                    loglayici.error(f"Olay metrikleri yazilamadi: {str(e)}")
 
 if __name__ == "__main__":
     sys.exit(main())
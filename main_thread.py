@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Ana thread cagri modulu.
+
+Qt arayuz nesnelerine yalnizca ana thread'den dokunulabilir. Arka plan thread'leri
+ana thread'de is calistirmak icin eskiden QTimer.singleShot ile is birakip sonucu
+10 ms'de bir yoklayan bir QEventLoop donduruyor ya da QObject olmayan siniflar
+uzerinde QMetaObject.invokeMethod deniyordu. Bu modul isi, ana thread'de yasayan bir
+nesnenin kuyruklu sinyaline birakir ve sonucu bir concurrent.futures.Future ile
+dondurur: bekleyen thread yoklama yapmadan uyur, sonuc veya istisna dogrudan iletilir.
+
+Qt uygulamasi yoksa (servisler, betikler) ayri bir ana thread olay dongusu da yoktur;
+bu durumda is cagiran thread'de calistirilir.
+"""
+
+import threading
+from concurrent.futures import Future
+from typing import Optional, Callable, Any
+
+try:
+    from PyQt6.QtCore import QObject, QCoreApplication, QThread, Qt, pyqtSignal, pyqtSlot
+except ImportError:
+    QObject = None
+
+QT_KULLANILABILIR = QObject is not None
+
+
+if QT_KULLANILABILIR:
+    class _AnaThreadKoprusu(QObject):
+        """Kuyruklu sinyal ile gelen isleri ana thread'de calistiran nesne"""
+
+        _is_sinyali = pyqtSignal(object)
+
+        def __init__(self):
+            super().__init__()
+            self._is_sinyali.connect(self._calistir, Qt.ConnectionType.QueuedConnection)
+
+        @pyqtSlot(object)
+        def _calistir(self, is_: Callable) -> None:
+            # Gercek slot: Python vekil nesnesi olusmaz, cagri nesnenin yasadigi (ana) thread'e gider
+            is_()
+
+        def gonder(self, is_: Callable) -> None:
+            self._is_sinyali.emit(is_)
+
+
+_kopru = None
+_kopru_kilit = threading.Lock()
+
+
+def _uygulama():
+    return QCoreApplication.instance() if QT_KULLANILABILIR else None
+
+
+def ana_thread_mi() -> bool:
+    """Cagiran thread Qt ana thread'i ise (Qt uygulamasi yoksa her zaman) True dondurur"""
+    uygulama = _uygulama()
+    return uygulama is None or QThread.currentThread() == uygulama.thread()
+
+
+def olay_dongusu_thread_mi() -> bool:
+    """Cagiran thread calisan bir Qt uygulamasinin (olay dongusunun) ana thread'i ise True dondurur"""
+    uygulama = _uygulama()
+    return uygulama is not None and QThread.currentThread() == uygulama.thread()
+
+
+def _kopru_al():
+    global _kopru
+    with _kopru_kilit:
+        if _kopru is None:
+            kopru = _AnaThreadKoprusu()
+            uygulama_thread = _uygulama().thread()
+            if kopru.thread() != uygulama_thread:
+                # Nesne arka plan thread'inde olusturulduysa ana thread'e itilir
+                kopru.moveToThread(uygulama_thread)
+            _kopru = kopru
+        return _kopru
+
+
+def _future_ile_calistir(future: Future, islev: Callable, args: tuple, kwargs: dict) -> None:
+    if not future.set_running_or_notify_cancel():
+        return  # Bekleyen taraf zaman asimiyla vazgecti
+    try:
+        future.set_result(islev(*args, **kwargs))
+    except BaseException as e:
+        future.set_exception(e)
+
+
+def ana_thread_gonder(islev: Callable, *args, **kwargs) -> Future:
+    """
+    Islevi ana thread'in olay kuyruguna birakir ve beklemeden doner.
+
+    Ana thread'den cagrilsa bile is hemen degil, olay dongusunun bir sonraki turunda
+    calisir. Qt uygulamasi yoksa is cagiran thread'de hemen calistirilir.
+
+    Returns:
+        Future: Islevin sonucunu veya firlattigi istisnayi tasiyan Future
+    """
+    future: Future = Future()
+    if _uygulama() is None:
+        _future_ile_calistir(future, islev, args, kwargs)
+    else:
+        _kopru_al().gonder(lambda: _future_ile_calistir(future, islev, args, kwargs))
+    return future
+
+
+def ana_thread_cagir(islev: Callable, *args, zaman_asimi: Optional[float] = None, **kwargs) -> Any:
+    """
+    Islevi ana thread'de calistirir ve sonucunu dondurur.
+
+    Ana thread'den cagrilirsa islev dogrudan calisir. Arka plan thread'inden cagrilirsa
+    is ana thread'e birakilir ve cagiran thread sonuc gelene kadar yoklamadan bekler.
+
+    Args:
+        islev: Calistirilacak fonksiyon
+        zaman_asimi: En fazla bekleme suresi (saniye); None ise suresiz
+
+    Returns:
+        Any: Islevin donus degeri
+
+    Raises:
+        TimeoutError: Is zaman asimi icinde tamamlanmazsa (henuz baslamadiysa hic calismaz)
+        Exception: Islevin ana thread'de firlattigi istisna
+    """
+    if ana_thread_mi():
+        return islev(*args, **kwargs)
+    future = ana_thread_gonder(islev, *args, **kwargs)
+    try:
+        return future.result(timeout=zaman_asimi)
+    except TimeoutError:
+        future.cancel()
+        raise
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""
+Bellek ici SQLite repository modulu.
+
+Demo, egitim ve pilde calisan dizustu senaryolari icin veritabani bellekte (tmpfs
+uzerindeki WAL modlu bir dosyada) tutulur. Baslangicta disk dosyasi SQLite backup API
+ile bellege kopyalanir. Zamanlayici ve kapanis, bellek veritabani son yazimdan beri
+degistiyse veritabaninin tamamini backup API ile sayfa gruplari halinde diske kopyalar.
+Sinif SQLiteRepository'den turedigi icin RepositoryInterface kullanan tum servisler
+degismeden calisir.
+"""
+
+import os
+import uuid
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import closing
+from typing import Optional, Dict, Any
+from events import Event, EVENT_ERROR_OCCURRED
+from veritabani import SQLiteRepository, IslemBaglantisi
+
+HATA_KODLARI = {
+    "BELLEK_001": "Bellek veritabani yuklenemedi",
+    "BELLEK_002": "Bellek veritabani diske yazilamadi",
+    "BELLEK_003": "Gecersiz repository modu"
+}
+
+REPOSITORY_MODLARI = ("disk", "bellek")
+
+# Linux'ta RAM uzerindeki dosya sistemi; yoksa sistemin gecici dizini kullanilir
+TMPFS_DIZINI = "/dev/shm"
+
+
+def bellek_dizini() -> str:
+    """Bellek veritabani dosyasinin tutulacagi dizini dondurur"""
+    if os.path.isdir(TMPFS_DIZINI) and os.access(TMPFS_DIZINI, os.W_OK):
+        return TMPFS_DIZINI
+    return tempfile.gettempdir()
+
+
+class InMemorySQLiteRepository(SQLiteRepository):
+    """
+    tmpfs uzerindeki WAL modlu veritabani dosyasinda calisan SQLiteRepository.
+
+    Paylasimli onbellekli (cache=shared) bellek veritabani tablo duzeyinde kilitler ve
+    SQLITE_LOCKED_SHAREDCACHE hatasi icin busy_timeout beklemez; bu nedenle thread
+    havuzlari RAM'deki normal bir dosyaya baglanir. WAL modu disk moduyla ayni eszamanlilik
+    kurallarini (bir yazar, kilitsiz okuyucular, busy_timeout ile bekleme) saglar.
+    Dosya repository kapanirken silinir.
+
+    Attributes:
+        flush_araligi: Degisiklik varsa diske yazma sikligi (saniye)
+        flush_sayfa: Backup API'nin her adimda kopyalayacagi sayfa sayisi
+    """
+
+    def __init__(self, db_path: str = "crm_database.db", event_manager=None, max_connections: int = 5,
+                 backup_dir: str = "backups", flush_araligi: float = 30.0, flush_sayfa: int = 256,
+                 sifreleme_yoneticisi=None):
+        """
+        Args:
+            db_path: Bellege yuklenecek ve degisikliklerin yazilacagi disk dosyasi
+            event_manager: Olay yoneticisi
+            max_connections: Thread basina en fazla baglanti sayisi
+            backup_dir: Yedekleme dizini
+            flush_araligi: Diske yazma araligi (saniye)
+            flush_sayfa: Her backup adiminda kopyalanacak sayfa sayisi
+            sifreleme_yoneticisi: Yedekleme yoneticisiyle paylasilan SifrelemeYoneticisi
+        """
+        self.flush_araligi = flush_araligi
+        self.flush_sayfa = flush_sayfa
+        self.bellek_yolu = os.path.join(bellek_dizini(), f"crm_bellek_{uuid.uuid4().hex}.db")
+        self._flush_kilidi = threading.Lock()
+        self._son_flush: Optional[float] = None
+        self._flush_metrikleri: Dict[str, Any] = {"flush_sayisi": 0, "basarisiz_flush": 0, "son_sure_ms": None}
+        self._durdur = threading.Event()
+        self._flush_thread = None
+
+        self._diskten_yukle(db_path)
+
+        # Yalnizca flush icin kullanilan okuma baglantisi; PRAGMA data_version diger
+        # baglantilarin yaptigi her commit'te degisir, boylece degismemis veritabani kopyalanmaz
+        self._flush_baglantisi = sqlite3.connect(self.bellek_yolu, timeout=10, check_same_thread=False)
+        self._flush_baglantisi.execute("PRAGMA journal_mode=WAL")
+        self._yazilan_surum = self._veri_surumu()
+
+        # tmpfs'teki WAL icin SQLite'in otomatik checkpoint'i yeterlidir
+        super().__init__(db_path=db_path, event_manager=event_manager, max_connections=max_connections,
+                         backup_dir=backup_dir, checkpoint_yonetimi=False, sifreleme_yoneticisi=sifreleme_yoneticisi)
+
+        self._flush_thread = threading.Thread(target=self._flush_dongusu, name="BellekFlush", daemon=True)
+        self._flush_thread.start()
+        self.loglayici.info(f"Bellek ici repository baslatildi: {self.db_path}")
+
+    def _diskten_yukle(self, db_path: str) -> None:
+        """Disk veritabanini backup API ile bellek veritabanina kopyalar"""
+        if not os.path.exists(db_path):
+            return
+        try:
+            with closing(sqlite3.connect(db_path, timeout=10)) as disk, \
+                    closing(sqlite3.connect(self.bellek_yolu)) as bellek:
+                disk.backup(bellek)
+        except sqlite3.Error as e:
+            self._bellek_dosyalarini_sil()
+            raise RuntimeError(f"{HATA_KODLARI['BELLEK_001']}: {str(e)}") from e
+
+    def _yeni_baglanti(self) -> sqlite3.Connection:
+        """Bellek veritabani dosyasina yeni bir baglanti acar"""
+        conn = sqlite3.connect(self.bellek_yolu, timeout=10, factory=IslemBaglantisi)
+        conn.row_factory = sqlite3.Row
+        self.pragma_ayarlayici.uygula(conn, self.pragma_profili)
+        return conn
+
+    def _veri_surumu(self) -> int:
+        """Flush baglantisinin gordugu PRAGMA data_version degerini dondurur"""
+        return self._flush_baglantisi.execute("PRAGMA data_version").fetchone()[0]
+
+    def _bellek_dosyalarini_sil(self) -> None:
+        """Bellek veritabani dosyasini ve WAL/SHM dosyalarini siler"""
+        for yol in (self.bellek_yolu, f"{self.bellek_yolu}-wal", f"{self.bellek_yolu}-shm"):
+            try:
+                os.remove(yol)
+            except FileNotFoundError:
+                pass
+
+    def diske_yaz(self, zorla: bool = False) -> bool:
+        """
+        Bellek veritabani son basarili yazimdan beri degistiyse disk dosyasina kopyalar.
+
+        Kopya artimli degildir: her flush veritabaninin tamamini backup API ile
+        flush_sayfa sayfalik adimlarla yazar. Adimlar arasinda diger baglantilar calismaya
+        devam edebilir; kaynak bu sirada degisirse SQLite kopyayi bastan alir.
+
+        Args:
+            zorla: True ise degisiklik olmasa da yazar
+
+        Returns:
+            bool: Yazma basarili ise (veya yazilacak degisiklik yoksa) True
+        """
+        with self._flush_kilidi:
+            if self._flush_baglantisi is None:
+                return False
+            surum = self._veri_surumu()
+            if surum == self._yazilan_surum and not zorla:
+                return True
+            baslangic = time.perf_counter()
+            try:
+                with closing(sqlite3.connect(self.db_path, timeout=10)) as disk:
+                    self._flush_baglantisi.backup(disk, pages=self.flush_sayfa, sleep=0.005)
+            except sqlite3.Error as e:
+                self._flush_metrikleri["basarisiz_flush"] += 1
+                hata_mesaji = f"Bellek veritabani diske yazilamadi: {str(e)} Hata Kodu: BELLEK_002"
+                self.loglayici.error(hata_mesaji)
+                if self.event_manager:
+                    self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": "BELLEK_002", "message": hata_mesaji}))
+                return False
+            sure_ms = (time.perf_counter() - baslangic) * 1000
+            # Kopya sirasinda gelen commit'ler kopyaya girmis olabilir de olmayabilir de;
+            # kopya oncesi surum saklanir ki bir sonraki flush bunlari tekrar yazsin
+            self._yazilan_surum = surum
+            self._son_flush = time.time()
+            self._flush_metrikleri["flush_sayisi"] += 1
+            self._flush_metrikleri["son_sure_ms"] = round(sure_ms, 2)
+            self.loglayici.debug(f"Bellek veritabani diske yazildi ({sure_ms:.1f} ms)")
+            return True
+
+    def _flush_dongusu(self) -> None:
+        while not self._durdur.wait(self.flush_araligi):
+            self.diske_yaz()
+
+    def flush_metrikleri(self) -> Dict[str, Any]:
+        """Diske yazma sayisi, suresi ve bekleyen degisiklik bilgisini dondurur"""
+        with self._flush_kilidi:
+            kirli = self._flush_baglantisi is not None and self._veri_surumu() != self._yazilan_surum
+        return dict(self._flush_metrikleri, kirli=kirli, son_flush=self._son_flush)
+
+    def wal_metrikleri(self) -> Dict[str, Any]:
+        """Bellek modunda WAL yerine diske yazma metrikleri dondurulur"""
+        return {"mod": "bellek", **self.flush_metrikleri()}
+
+    def close(self) -> None:
+        """Zamanlayiciyi durdurur, son degisiklikleri diske yazar ve baglantilari kapatir"""
+        self._durdur.set()
+        if self._flush_thread and self._flush_thread.is_alive():
+            self._flush_thread.join(timeout=10)
+        if self._flush_baglantisi is not None:
+            self.diske_yaz()
+        super().close()
+        with self._flush_kilidi:
+            if self._flush_baglantisi is not None:
+                self._flush_baglantisi.close()
+                self._flush_baglantisi = None
+                self._bellek_dosyalarini_sil()
+
+
+def repository_olustur(mod: Optional[str] = None, **kwargs) -> SQLiteRepository:
+    """
+    Istenen moda gore repository olusturur.
+
+    Args:
+        mod: "disk" veya "bellek"; verilmezse REPOSITORY_MODU ortam degiskeni kullanilir
+        **kwargs: Repository sinifina iletilecek parametreler
+
+    Returns:
+        SQLiteRepository: Disk veya bellek ici repository
+    """
+    mod = (mod or os.getenv("REPOSITORY_MODU", "disk")).lower()
+    if mod not in REPOSITORY_MODLARI:
+        raise ValueError(f"{HATA_KODLARI['BELLEK_003']}: {mod}")
+    if mod == "bellek":
+        flush_araligi = float(os.getenv("BELLEK_FLUSH_ARALIGI", "30"))
+        return InMemorySQLiteRepository(flush_araligi=flush_araligi, **kwargs)
+    return SQLiteRepository(**kwargs)
@@ -1,7 +1,8 @@
 ﻿# -*- coding: utf-8 -*-
 import pandas as pd
 from typing import Dict, Any
-from events import Event, EVENT_DATA_UPDATED
+from events import Event, EVENT_DATA_UPDATED, EVENT_ERROR_OCCURRED
+from frame_snapshots import paylasimli_kopya
 
 class MusteriYoneticisi:
     """
@@ -21,6 +22,9 @@ class MusteriYoneticisi:
         self.repository = veri_yoneticisi.repository
         self.loglayici = veri_yoneticisi.loglayici
         self.event_manager = veri_yoneticisi.event_manager
+        # Cerceveler yazma kilidi altinda degistirilir, kayit kilit disinda yapilir. Yerinde yazim
+        # (at/loc) cerceve surumunu artirmaz; kopya duzenlenip yeniden atanarak yayinlanir
+        self.kilit = veri_yoneticisi.kilit
     
     def musteri_ekle(self, yeni_musteri: Dict[str, Any]) -> None:
         """
@@ -30,11 +34,12 @@ class MusteriYoneticisi:
             yeni_musteri: Yeni musteri bilgilerini iceren sozluk
         """
         yeni_musteri_df = pd.DataFrame([yeni_musteri])
-        if self.veri_yoneticisi.musteriler_df is None or self.veri_yoneticisi.musteriler_df.empty:
-            self.veri_yoneticisi.musteriler_df = yeni_musteri_df
-        else:
-            self.veri_yoneticisi.musteriler_df = pd.concat([self.veri_yoneticisi.musteriler_df, yeni_musteri_df], ignore_index=True)
-        self.repository.save(self.veri_yoneticisi.musteriler_df, "customers")
+        with self.kilit.yazma("musteri_ekle"):
+            if self.veri_yoneticisi.musteriler_df is None or self.veri_yoneticisi.musteriler_df.empty:
+                self.veri_yoneticisi.musteriler_df = yeni_musteri_df
+            else:
+                self.veri_yoneticisi.musteriler_df = pd.concat([self.veri_yoneticisi.musteriler_df, yeni_musteri_df], ignore_index=True)
+        self.veri_yoneticisi.cerceveyi_kaydet("musteriler_df", "customers")
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "musteri_ekle"}))
@@ -49,20 +54,23 @@ class MusteriYoneticisi:
         """
         if index >= 0 and index < len(self.veri_yoneticisi.musteriler_df):
             try:
-                # Kategorik sütunları kontrol et ve gerekirse kategorileri güncelle
-                for col, value in guncellenmis_musteri.items():
-                    if col in self.veri_yoneticisi.musteriler_df.columns and hasattr(self.veri_yoneticisi.musteriler_df[col], 'cat'):
-                        # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
-                        if value not in self.veri_yoneticisi.musteriler_df[col].cat.categories:
-                            new_categories = self.veri_yoneticisi.musteriler_df[col].cat.categories.tolist()
-                            new_categories.append(value)
-                            self.veri_yoneticisi.musteriler_df[col] = self.veri_yoneticisi.musteriler_df[col].cat.set_categories(new_categories)
-                            self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
+                with self.kilit.yazma("musteri_duzenle"):
+                    musteriler_df = paylasimli_kopya(self.veri_yoneticisi.musteriler_df)
+                    # Kategorik sütunları kontrol et ve gerekirse kategorileri güncelle
+                    for col, value in guncellenmis_musteri.items():
+                        if col in musteriler_df.columns and hasattr(musteriler_df[col], 'cat'):
+                            # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
+                            if value not in musteriler_df[col].cat.categories:
+                                new_categories = musteriler_df[col].cat.categories.tolist()
+                                new_categories.append(value)
+                                musteriler_df[col] = musteriler_df[col].cat.set_categories(new_categories)
+                                self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
                 
-                # Şimdi güncellemeyi yap
-                for key, value in guncellenmis_musteri.items():
-                    self.veri_yoneticisi.musteriler_df.at[index, key] = value
-                self.repository.save(self.veri_yoneticisi.musteriler_df, "customers")
+                    # Şimdi güncellemeyi yap
+                    for key, value in guncellenmis_musteri.items():
+                        musteriler_df.at[index, key] = value
+                    self.veri_yoneticisi.musteriler_df = musteriler_df
+                self.veri_yoneticisi.cerceveyi_kaydet("musteriler_df", "customers")
                 
                 if self.event_manager:
                     self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "musteri_duzenle"}))
@@ -80,12 +88,31 @@ class MusteriYoneticisi:
             musteri_adi: Silinecek musterinin adi
         """
         if self.veri_yoneticisi.musteriler_df is not None and not self.veri_yoneticisi.musteriler_df.empty:
-            self.veri_yoneticisi.musteriler_df = self.veri_yoneticisi.musteriler_df[self.veri_yoneticisi.musteriler_df["Musteri Adi"] != musteri_adi]
-            self.repository.save(self.veri_yoneticisi.musteriler_df, "customers")
+            with self.kilit.yazma("musteri_sil"):
+                # Indeks sifirlanir; duzenleme indeksleri tablodaki satir sirasiyla eslesir
+                self.veri_yoneticisi.musteriler_df = self.veri_yoneticisi.musteriler_df[
+                    self.veri_yoneticisi.musteriler_df["Musteri Adi"] != musteri_adi].reset_index(drop=True)
+            self.veri_yoneticisi.cerceveyi_kaydet("musteriler_df", "customers")
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "musteri_sil"}))
     
+    def son_satin_alma_guncelle(self, musteri_adi: str, tarih: str) -> None:
+        """
+        Musterinin son satin alma tarihini gunceller.
+        
+        Args:
+            musteri_adi: Musterinin adi
+            tarih: Son satin alma tarihi (MM-YYYY)
+        """
+        if self.veri_yoneticisi.musteriler_df is None or self.veri_yoneticisi.musteriler_df.empty:
+            return
+        with self.kilit.yazma("son_satin_alma_guncelle"):
+            musteriler_df = paylasimli_kopya(self.veri_yoneticisi.musteriler_df)
+            musteriler_df.loc[musteriler_df["Musteri Adi"] == musteri_adi, "Son Satin Alma Tarihi"] = tarih
+            self.veri_yoneticisi.musteriler_df = musteriler_df
+        self.veri_yoneticisi.cerceveyi_kaydet("musteriler_df", "customers")
+    
     def ziyaret_ekle(self, yeni_ziyaret: Dict[str, Any]) -> None:
         """
         Yeni bir ziyaret ekler.
@@ -94,11 +121,9 @@ class MusteriYoneticisi:
             yeni_ziyaret: Yeni ziyaret bilgilerini iceren sozluk
         """
         yeni_ziyaret_df = pd.DataFrame([yeni_ziyaret])
-        if self.veri_yoneticisi.ziyaretler_df is None or self.veri_yoneticisi.ziyaretler_df.empty:
-            self.veri_yoneticisi.ziyaretler_df = yeni_ziyaret_df
-        else:
-            self.veri_yoneticisi.ziyaretler_df = pd.concat([self.veri_yoneticisi.ziyaretler_df, yeni_ziyaret_df], ignore_index=True)
-        self.repository.save(self.veri_yoneticisi.ziyaretler_df, "visits")
+        # Ziyaretler surumlu cercevedir; kopya uzerinde degistirilip yayinlanir (bkz. VeriYoneticisi.cerceve_guncelle)
+        self.veri_yoneticisi.cerceve_guncelle(
+            "visits", lambda df: yeni_ziyaret_df if df is None or df.empty else pd.concat([df, yeni_ziyaret_df], ignore_index=True))
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "ziyaret_ekle"}))
@@ -112,9 +137,12 @@ class MusteriYoneticisi:
             guncellenmis_ziyaret: Guncel ziyaret bilgilerini iceren sozluk
         """
         if index >= 0 and index < len(self.veri_yoneticisi.ziyaretler_df):
-            for key, value in guncellenmis_ziyaret.items():
-                self.veri_yoneticisi.ziyaretler_df.at[index, key] = value
-            self.repository.save(self.veri_yoneticisi.ziyaretler_df, "visits")
+            def duzenle(df: pd.DataFrame) -> pd.DataFrame:
+                for key, value in guncellenmis_ziyaret.items():
+                    df.at[index, key] = value
+                self.veri_yoneticisi.satir_surumleri.yenile(df, "visits", [index])
+                return df
+            self.veri_yoneticisi.cerceve_guncelle("visits", duzenle)
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "ziyaret_duzenle"}))
@@ -127,8 +155,7 @@ class MusteriYoneticisi:
             index: Silinecek ziyaretin indeksi
         """
         if self.veri_yoneticisi.ziyaretler_df is not None and not self.veri_yoneticisi.ziyaretler_df.empty and index >= 0 and index < len(self.veri_yoneticisi.ziyaretler_df):
-            self.veri_yoneticisi.ziyaretler_df = self.veri_yoneticisi.ziyaretler_df.drop(index).reset_index(drop=True)
-            self.repository.save(self.veri_yoneticisi.ziyaretler_df, "visits")
+            self.veri_yoneticisi.cerceve_guncelle("visits", lambda df: df.drop(index).reset_index(drop=True))
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "ziyaret_sil"}))
@@ -141,11 +168,12 @@ class MusteriYoneticisi:
             yeni_sikayet: Yeni sikayet bilgilerini iceren sozluk
         """
         yeni_sikayet_df = pd.DataFrame([yeni_sikayet])
-        if self.veri_yoneticisi.sikayetler_df is None or self.veri_yoneticisi.sikayetler_df.empty:
-            self.veri_yoneticisi.sikayetler_df = yeni_sikayet_df
-        else:
-            self.veri_yoneticisi.sikayetler_df = pd.concat([self.veri_yoneticisi.sikayetler_df, yeni_sikayet_df], ignore_index=True)
-        self.repository.save(self.veri_yoneticisi.sikayetler_df, "complaints")
+        with self.kilit.yazma("sikayet_ekle"):
+            if self.veri_yoneticisi.sikayetler_df is None or self.veri_yoneticisi.sikayetler_df.empty:
+                self.veri_yoneticisi.sikayetler_df = yeni_sikayet_df
+            else:
+                self.veri_yoneticisi.sikayetler_df = pd.concat([self.veri_yoneticisi.sikayetler_df, yeni_sikayet_df], ignore_index=True)
+        self.veri_yoneticisi.cerceveyi_kaydet("sikayetler_df", "complaints")
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "sikayet_ekle"}))
@@ -159,9 +187,12 @@ class MusteriYoneticisi:
             guncellenmis_sikayet: Guncel sikayet bilgilerini iceren sozluk
         """
         if index >= 0 and index < len(self.veri_yoneticisi.sikayetler_df):
-            for key, value in guncellenmis_sikayet.items():
-                self.veri_yoneticisi.sikayetler_df.at[index, key] = value
-            self.repository.save(self.veri_yoneticisi.sikayetler_df, "complaints")
+            with self.kilit.yazma("sikayet_duzenle"):
+                sikayetler_df = paylasimli_kopya(self.veri_yoneticisi.sikayetler_df)
+                for key, value in guncellenmis_sikayet.items():
+                    sikayetler_df.at[index, key] = value
+                self.veri_yoneticisi.sikayetler_df = sikayetler_df
+            self.veri_yoneticisi.cerceveyi_kaydet("sikayetler_df", "complaints")
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "sikayet_duzenle"}))
@@ -174,8 +205,9 @@ class MusteriYoneticisi:
             index: Silinecek sikayetin indeksi
         """
         if self.veri_yoneticisi.sikayetler_df is not None and not self.veri_yoneticisi.sikayetler_df.empty and index >= 0 and index < len(self.veri_yoneticisi.sikayetler_df):
-            self.veri_yoneticisi.sikayetler_df = self.veri_yoneticisi.sikayetler_df.drop(index).reset_index(drop=True)
-            self.repository.save(self.veri_yoneticisi.sikayetler_df, "complaints")
+            with self.kilit.yazma("sikayet_sil"):
+                self.veri_yoneticisi.sikayetler_df = self.veri_yoneticisi.sikayetler_df.drop(index).reset_index(drop=True)
+            self.veri_yoneticisi.cerceveyi_kaydet("sikayetler_df", "complaints")
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "sikayet_sil"})) 
\ No newline at end of file
@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+"""
+Adimli cevrimici yedekleme modulu.
+
+Tek adimli src.backup(dst) tum kopya boyunca okuma islemini acik tutar ve zamanlanmis
+yedekleme sirasinda arayuzun yazmalariyla disk icin yarisir. SteppedBackup kopyayi
+sayfa gruplari halinde yapar ve her adimdan sonra bekler. Bekleme suresi, kaynak
+veritabanindaki eszamanli yazma etkinligine (PRAGMA data_version) gore uyarlanir:
+yazma varken geri cekilir, bostayken hizlanir. Ilerleme EventManager uzerinden
+yayinlanir ve yedekleme her adim arasinda iptal edilebilir.
+
+Not: Kopya sirasinda kaynaga baska bir baglanti yazarsa SQLite kopyayi bastan baslatir.
+WAL modunda kaynak baglantida bir okuma islemi acik tutularak kopya tek bir anlik
+goruntuye sabitlenir; yazicilar engellenmez ve yeniden baslama olmaz. WAL disi
+modlarda okuma kilidi yazicilari bekletecegi icin bu yapilmaz; bitmeyen bir dongu
+olusmamasi icin belirli sayida yeniden baslamadan sonra tek adimli kopyaya gecilir.
+"""
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import closing
+from typing import Optional, Dict, Any
+from events import Event, EVENT_BACKUP_PROGRESS
+from task_scheduler import IptalJetonu
+
+HATA_KODLARI = {
+    "YEDEK_ADIM_001": "Yedekleme kullanici tarafindan iptal edildi"
+}
+
+ADIM_SAYFA = 256
+EN_AZ_BEKLEME = 0.005  # saniye
+EN_COK_BEKLEME = 0.5  # saniye
+EN_COK_YENIDEN_BASLAMA = 5
+OLAY_ARALIGI = 0.5  # Ilerleme olaylari arasindaki en kisa sure (saniye)
+
+
+class YedeklemeIptalEdildi(Exception):
+    """Adimli yedekleme iptal edildiginde firlatilir"""
+
+
+class _YenidenBaslamaSiniri(Exception):
+    """Kopya cok kez bastan basladiginda tek adimli kopyaya gecmek icin kullanilir"""
+
+
+class SteppedBackup:
+    """
+    SQLite cevrimici yedekleme API'sini adimli ve uyarlanir beklemeli calistiran sinif.
+
+    Attributes:
+        adim_sayfa: Her adimda kopyalanan sayfa sayisi
+        en_az_bekleme: Kaynak bostayken adimlar arasi bekleme (saniye)
+        en_cok_bekleme: Yogun yazma altinda adimlar arasi bekleme ust siniri (saniye)
+    """
+
+    def __init__(self, loglayici: Optional[logging.Logger] = None, event_manager=None,
+                 adim_sayfa: int = ADIM_SAYFA, en_az_bekleme: float = EN_AZ_BEKLEME,
+                 en_cok_bekleme: float = EN_COK_BEKLEME, en_cok_yeniden_baslama: int = EN_COK_YENIDEN_BASLAMA):
+        """
+        Args:
+            loglayici: Loglama islemleri icin logger nesnesi
+            event_manager: Ilerleme olaylarini yayinlamak icin EventManager nesnesi
+            adim_sayfa: Adim basina sayfa sayisi
+            en_az_bekleme: En kisa adim arasi bekleme (saniye)
+            en_cok_bekleme: En uzun adim arasi bekleme (saniye)
+            en_cok_yeniden_baslama: Tek adimli kopyaya gecmeden once izin verilen yeniden baslama sayisi
+        """
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.event_manager = event_manager
+        self.adim_sayfa = adim_sayfa
+        self.en_az_bekleme = en_az_bekleme
+        self.en_cok_bekleme = en_cok_bekleme
+        self.en_cok_yeniden_baslama = en_cok_yeniden_baslama
+        self._iptal = threading.Event()
+
+    def iptal_et(self) -> None:
+        """Devam eden yedeklemeyi bir sonraki adimda durdurur"""
+        self._iptal.set()
+
+    def calistir(self, kaynak_yolu: str, hedef_yolu: str, jeton: Optional[IptalJetonu] = None) -> Dict[str, Any]:
+        """
+        Kaynak veritabanini adimli olarak hedef dosyaya yedekler.
+
+        Kopya once gecici dosyaya yazilir; iptal veya hata durumunda yarim dosya kalmaz.
+
+        Args:
+            kaynak_yolu: Yedeklenecek veritabani
+            hedef_yolu: Yedek dosyasi
+            jeton: Verilirse jeton iptal edildiginde iptal_et() cagrilir (ornegin zaman asimi)
+
+        Returns:
+            Dict[str, Any]: adim sayisi, yeniden baslama sayisi, toplam bekleme ve sure
+
+        Raises:
+            YedeklemeIptalEdildi: iptal_et() cagrildiysa
+        """
+        self._iptal.clear()
+        # Kayit temizlemeden sonra yapilir; onceden iptal edilmis jeton kopyayi hemen durdurur
+        jeton_kaydi = jeton.iptal_olunca(self.iptal_et) if jeton is not None else None
+        gecici = f"{hedef_yolu}.part"
+        durum = {"adim": 0, "yeniden_baslama": 0, "bekleme": 0.0, "tek_adim": False,
+                 "_kalan": None, "_surum": None, "_gecikme": self.en_az_bekleme, "_son_olay": 0.0}
+        baslangic = time.monotonic()
+        try:
+            with closing(sqlite3.connect(kaynak_yolu, isolation_level=None)) as kaynak, \
+                    closing(sqlite3.connect(kaynak_yolu)) as izleme, \
+                    closing(sqlite3.connect(gecici)) as hedef:
+
+                if kaynak.execute("PRAGMA journal_mode").fetchone()[0].lower() == "wal":
+                    # Anlik goruntuyu sabitle: kopya boyunca yapilan commitler kopyayi yeniden baslatmaz
+                    kaynak.execute("BEGIN")
+                    kaynak.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()
+
+                def ilerleme(status: int, remaining: int, total: int) -> None:
+                    self._adim_sonrasi(durum, izleme, hedef_yolu, remaining, total)
+
+                try:
+                    kaynak.backup(hedef, pages=self.adim_sayfa, progress=ilerleme)
+                except _YenidenBaslamaSiniri:
+                    self.loglayici.warning(
+                        f"Yedekleme {durum['yeniden_baslama']} kez bastan basladi, tek adimli kopyaya geciliyor")
+                    durum["tek_adim"] = True
+                    kaynak.backup(hedef)
+            os.replace(gecici, hedef_yolu)
+        finally:
+            if jeton_kaydi is not None:
+                jeton_kaydi()
+            if os.path.exists(gecici):
+                os.remove(gecici)
+
+        sonuc = {anahtar: deger for anahtar, deger in durum.items() if not anahtar.startswith("_")}
+        sonuc["bekleme"] = round(sonuc["bekleme"], 3)
+        sonuc["sure"] = round(time.monotonic() - baslangic, 3)
+        self.loglayici.info(f"Adimli yedekleme tamamlandi: {sonuc}")
+        return sonuc
+
+    def _adim_sonrasi(self, durum: Dict[str, Any], izleme: sqlite3.Connection, hedef_yolu: str,
+                      kalan: int, toplam: int) -> None:
+        """Her adimdan sonra iptal, yeniden baslama ve yazma etkinligini kontrol edip bekler"""
+        if self._iptal.is_set():
+            raise YedeklemeIptalEdildi(HATA_KODLARI["YEDEK_ADIM_001"])
+        durum["adim"] += 1
+
+        # Kalan sayfa artiyorsa kaynak degismis ve kopya bastan baslamistir
+        if durum["_kalan"] is not None and kalan > durum["_kalan"]:
+            durum["yeniden_baslama"] += 1
+            if durum["yeniden_baslama"] > self.en_cok_yeniden_baslama:
+                raise _YenidenBaslamaSiniri()
+        durum["_kalan"] = kalan
+
+        # data_version baska bir baglanti commit ettiginde degisir; yazma varken geri cekil
+        surum = izleme.execute("PRAGMA data_version").fetchone()[0]
+        if durum["_surum"] is not None and surum != durum["_surum"]:
+            durum["_gecikme"] = min(durum["_gecikme"] * 2, self.en_cok_bekleme)
+        else:
+            durum["_gecikme"] = max(durum["_gecikme"] / 2, self.en_az_bekleme)
+        durum["_surum"] = surum
+
+        simdi = time.monotonic()
+        if self.event_manager and (kalan == 0 or simdi - durum["_son_olay"] >= OLAY_ARALIGI):
+            durum["_son_olay"] = simdi
+            self.event_manager.emit(Event(EVENT_BACKUP_PROGRESS, {
+                "path": hedef_yolu,
+                "remaining": kalan,
+                "total": toplam,
+                "percent": round(100.0 * (toplam - kalan) / toplam, 1) if toplam else 100.0
+            }))
+
+        if kalan > 0:
+            # Iptal isteginin bekleme sirasinda da hemen fark edilmesi icin Event uzerinde beklenir
+            if self._iptal.wait(durum["_gecikme"]):
+                raise YedeklemeIptalEdildi(HATA_KODLARI["YEDEK_ADIM_001"])
+            durum["bekleme"] += durum["_gecikme"]
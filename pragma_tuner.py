@@ -0,0 +1,279 @@
+# -*- coding: utf-8 -*-
+"""
+SQLite PRAGMA ayar profili modulu.
+
+Baglanti basina sabit cache_size ve mmap_size degerleri yerine veritabani boyutu,
+kullanilabilir bellek ve baglanti havuzu boyutuna gore bir profil hesaplar.
+Istege bagli kalibrasyon calistirmasi tipik okuma/yazma yuklerini olcerek en hizli
+adaylari secer ve sonucu JSON dosyasina kaydeder; sonraki acilislar bu profili kullanir.
+"""
+
+import os
+import sys
+import json
+import time
+import sqlite3
+import logging
+import tempfile
+from datetime import datetime
+from typing import Optional, Dict, Any, List
+
+try:
+    import psutil
+except ImportError:  # psutil istege bagli; yoksa isletim sistemi API'leri kullanilir
+    psutil = None
+
+HATA_KODLARI = {
+    "PRAGMA_001": "PRAGMA profili yuklenemedi",
+    "PRAGMA_002": "PRAGMA kalibrasyon hatasi",
+    "PRAGMA_003": "PRAGMA profili kaydedilemedi"
+}
+
+MB = 1024 * 1024
+VARSAYILAN_BELLEK = 2048 * MB  # Bellek bilgisi alinamazsa varsayilan
+SAYFA_BOYUTU_ADAYLARI = (4096, 8192, 16384)
+
+
+def kullanilabilir_bellek() -> int:
+    """Kullanilabilir fiziksel bellegi bayt cinsinden dondurur"""
+    if psutil is not None:
+        try:
+            return int(psutil.virtual_memory().available)
+        except Exception:
+            pass
+    if sys.platform == "win32":
+        try:
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong), ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong), ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong), ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong), ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("ullAvailExtendedVirtual", ctypes.c_ulonglong)
+                ]
+
+            durum = MEMORYSTATUSEX()
+            durum.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(durum)):
+                return int(durum.ullAvailPhys)
+        except Exception:
+            pass
+    else:
+        try:
+            return int(os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE"))
+        except (ValueError, OSError, AttributeError):
+            pass
+    return VARSAYILAN_BELLEK
+
+
+class PragmaTuner:
+    """
+    Veritabani ve makineye uygun PRAGMA profilini hesaplayan, kalibre eden ve kaydeden sinif.
+
+    Profil su anahtarlari icerir: page_size, cache_size (negatif KiB), mmap_size (bayt),
+    temp_store (MEMORY veya FILE) ve profilin kaynagi.
+    """
+
+    def __init__(self, db_path: str, havuz_boyutu: int = 5, profil_dosyasi: Optional[str] = None,
+                 loglayici: Optional[logging.Logger] = None):
+        """
+        Args:
+            db_path: Veritabani dosyasinin yolu
+            havuz_boyutu: Ayni anda acik tutulacak baglanti sayisi (her baglantinin kendi sayfa onbellegi vardir)
+            profil_dosyasi: Kalibre edilmis profilin kaydedilecegi JSON dosyasi
+            loglayici: Loglama islemleri icin logger nesnesi
+        """
+        self.db_path = db_path
+        self.havuz_boyutu = max(1, havuz_boyutu)
+        self.profil_dosyasi = profil_dosyasi or os.getenv("PRAGMA_PROFIL_DOSYASI", "sqlite_profili.json")
+        self.loglayici = loglayici or logging.getLogger(__name__)
+
+    def veritabani_boyutu(self) -> int:
+        """Veritabani ve WAL dosyasinin toplam boyutunu dondurur"""
+        toplam = 0
+        for yol in (self.db_path, f"{self.db_path}-wal"):
+            try:
+                toplam += os.path.getsize(yol)
+            except OSError:
+                pass
+        return toplam
+
+    def profil_hesapla(self, db_boyutu: Optional[int] = None, bellek: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Veritabani boyutu ve kullanilabilir bellege gore profil hesaplar.
+
+        Onbellek butcesi tum veritabanini alacak kadar, ancak kullanilabilir bellegin
+        %10'undan fazla olmayacak sekilde secilir ve havuzdaki baglantilara bolunur.
+        mmap en fazla bellegin %25'i kadar, veritabaninin iki katina kadar acilir.
+        """
+        db_boyutu = self.veritabani_boyutu() if db_boyutu is None else db_boyutu
+        bellek = kullanilabilir_bellek() if bellek is None else bellek
+
+        onbellek_butcesi = min(int(db_boyutu * 1.25), int(bellek * 0.10))
+        baglanti_basina = onbellek_butcesi // self.havuz_boyutu
+        baglanti_basina = max(2 * MB, min(baglanti_basina, 256 * MB))
+
+        mmap_boyutu = min(max(db_boyutu * 2, 64 * MB), int(bellek * 0.25), 2048 * MB)
+        if bellek < 512 * MB:
+            mmap_boyutu = 0  # Dusuk bellekte sayfa onbellegi ile yarismasin
+
+        return {
+            "page_size": 8192 if bellek >= 8192 * MB else 4096,
+            "cache_size": -(baglanti_basina // 1024),
+            "mmap_size": int(mmap_boyutu),
+            "temp_store": "MEMORY" if bellek >= 1024 * MB else "FILE",
+            "kaynak": "hesaplanan",
+            "db_boyutu": db_boyutu,
+            "bellek": bellek,
+            "havuz_boyutu": self.havuz_boyutu
+        }
+
+    def profil_yukle(self) -> Optional[Dict[str, Any]]:
+        """Kaydedilmis profili yukler; dosya yoksa veya okunamazsa None dondurur"""
+        if not os.path.exists(self.profil_dosyasi):
+            return None
+        try:
+            with open(self.profil_dosyasi, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            self.loglayici.warning(f"PRAGMA profili yuklenemedi: {str(e)} Hata Kodu: PRAGMA_001")
+            return None
+
+    def profil_sec(self) -> Dict[str, Any]:
+        """
+        Kullanilacak profili secer.
+
+        Ayni veritabani icin kaydedilmis kalibrasyon profili varsa ve veritabani o zamandan
+        beri iki kattan fazla buyumemis/kuculmemisse o profil, aksi halde hesaplanan profil kullanilir.
+        """
+        kayitli = self.profil_yukle()
+        if kayitli and kayitli.get("db_path") == os.path.abspath(self.db_path):
+            onceki = max(kayitli.get("db_boyutu", 0), MB)
+            simdiki = max(self.veritabani_boyutu(), MB)
+            if 0.5 <= simdiki / onceki <= 2 and kayitli.get("havuz_boyutu") == self.havuz_boyutu:
+                return kayitli
+            self.loglayici.info("Veritabani boyutu degistigi icin PRAGMA profili yeniden hesaplandi.")
+        return self.profil_hesapla()
+
+    def uygula(self, conn: sqlite3.Connection, profil: Dict[str, Any]) -> None:
+        """
+        Profili baglantiya uygular.
+
+        page_size yalnizca henuz sayfasi olmayan yeni veritabanlarinda ve WAL moduna
+        gecmeden once etkilidir; bu nedenle ilk sirada ayarlanir.
+        """
+        if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+            conn.execute(f"PRAGMA page_size={int(profil['page_size'])}")
+        conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging
+        conn.execute("PRAGMA synchronous=NORMAL")  # Daha hizli yazma
+        conn.execute(f"PRAGMA cache_size={int(profil['cache_size'])}")
+        conn.execute(f"PRAGMA temp_store={'MEMORY' if profil['temp_store'] == 'MEMORY' else 'FILE'}")
+        conn.execute(f"PRAGMA mmap_size={int(profil['mmap_size'])}")
+
+    def _yazma_olc(self, page_size: int, profil: Dict[str, Any], satir_sayisi: int) -> float:
+        """Gecici veritabaninda tipik toplu yazma + gruplama yukunu olcer (saniye)"""
+        gecici_dizin = tempfile.mkdtemp(prefix="pragma_kalibrasyon_")
+        yol = os.path.join(gecici_dizin, "kalibrasyon.db")
+        conn = sqlite3.connect(yol)
+        try:
+            self.uygula(conn, dict(profil, page_size=page_size))
+            conn.execute('CREATE TABLE olcum ("Ana Musteri" TEXT, "Satis Temsilcisi" TEXT, "Ay" TEXT, '
+                         '"Urun Kodu" TEXT, "Miktar" REAL, "Birim Fiyat" REAL, "Notlar" TEXT)')
+            satirlar = [
+                (f"Musteri {i % 500}", f"Temsilci {i % 25}", f"{i % 12 + 1:02d}-2025",
+                 f"URN{i % 300:04d}", float(i % 97), float(i % 13) + 0.5, "not " * (i % 20))
+                for i in range(satir_sayisi)
+            ]
+            baslangic = time.perf_counter()
+            with conn:
+                conn.executemany("INSERT INTO olcum VALUES (?, ?, ?, ?, ?, ?, ?)", satirlar)
+            conn.execute('SELECT "Ana Musteri", SUM("Miktar" * "Birim Fiyat") FROM olcum GROUP BY "Ana Musteri"').fetchall()
+            conn.execute("SELECT * FROM olcum").fetchall()
+            return time.perf_counter() - baslangic
+        finally:
+            conn.close()
+            for ek in ("", "-wal", "-shm"):
+                try:
+                    os.remove(yol + ek)
+                except OSError:
+                    pass
+            try:
+                os.rmdir(gecici_dizin)
+            except OSError:
+                pass
+
+    def _okuma_olc(self, cache_size: int, profil: Dict[str, Any], tablolar: List[str]) -> float:
+        """Gercek veritabaninda salt okunur tam tablo okumalarini olcer (saniye)"""
+        conn = sqlite3.connect(f"file:{os.path.abspath(self.db_path)}?mode=ro", uri=True)
+        try:
+            conn.execute(f"PRAGMA cache_size={int(cache_size)}")
+            conn.execute(f"PRAGMA mmap_size={int(profil['mmap_size'])}")
+            baslangic = time.perf_counter()
+            for _ in range(2):  # Ikinci tur sicak onbellek davranisini olcer
+                for tablo in tablolar:
+                    conn.execute(f'SELECT * FROM "{tablo}"').fetchall()
+            return time.perf_counter() - baslangic
+        finally:
+            conn.close()
+
+    def kalibre_et(self, yazma_satir_sayisi: int = 20000) -> Dict[str, Any]:
+        """
+        Kalibrasyon calistirir, en iyi profili secer ve dosyaya kaydeder.
+
+        Yazma olcumu gecici bir veritabaninda her sayfa boyutu adayi icin, okuma olcumu
+        ise gercek veritabaninda salt okunur modda farkli cache_size adaylari icin yapilir.
+
+        Args:
+            yazma_satir_sayisi: Yazma olcumunde kullanilacak sentetik satir sayisi
+
+        Returns:
+            Dict[str, Any]: Secilen profil ve olcum sonuclari
+        """
+        profil = self.profil_hesapla()
+        olcumler: Dict[str, Any] = {"yazma": {}, "okuma": {}}
+        try:
+            for page_size in SAYFA_BOYUTU_ADAYLARI:
+                olcumler["yazma"][str(page_size)] = round(self._yazma_olc(page_size, profil, yazma_satir_sayisi), 4)
+            en_hizli = min(olcumler["yazma"], key=olcumler["yazma"].get)
+            # Olcum gurultusunu elemek icin yalnizca %5'ten buyuk kazanclarda hesaplanan deger degistirilir
+            if olcumler["yazma"][en_hizli] < olcumler["yazma"][str(profil["page_size"])] * 0.95:
+                profil["page_size"] = int(en_hizli)
+
+            if os.path.exists(self.db_path):
+                conn = sqlite3.connect(f"file:{os.path.abspath(self.db_path)}?mode=ro", uri=True)
+                try:
+                    tablolar = [satir[0] for satir in conn.execute(
+                        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%'")]
+                finally:
+                    conn.close()
+                if tablolar:
+                    temel = profil["cache_size"]
+                    adaylar = sorted({max(temel // 2, -256 * 1024), temel, max(temel * 2, -256 * 1024)})
+                    for aday in adaylar:
+                        olcumler["okuma"][str(aday)] = round(self._okuma_olc(aday, profil, tablolar), 4)
+                    en_iyi = min(olcumler["okuma"], key=olcumler["okuma"].get)
+                    if olcumler["okuma"][en_iyi] < olcumler["okuma"][str(temel)] * 0.95:
+                        profil["cache_size"] = int(en_iyi)
+        except Exception as e:
+            self.loglayici.error(f"PRAGMA kalibrasyon hatasi: {str(e)} Hata Kodu: PRAGMA_002")
+            return profil
+
+        profil.update({
+            "kaynak": "kalibrasyon",
+            "db_path": os.path.abspath(self.db_path),
+            "kalibrasyon_zamani": datetime.now().isoformat(),
+            "olcumler": olcumler
+        })
+        self.profil_kaydet(profil)
+        return profil
+
+    def profil_kaydet(self, profil: Dict[str, Any]) -> None:
+        """Profili JSON dosyasina kaydeder"""
+        try:
+            with open(self.profil_dosyasi, "w", encoding="utf-8") as f:
+                json.dump(profil, f, ensure_ascii=False, indent=2)
+            self.loglayici.info(f"PRAGMA profili kaydedildi: {self.profil_dosyasi}")
+        except OSError as e:
+            self.loglayici.error(f"PRAGMA profili kaydedilemedi: {str(e)} Hata Kodu: PRAGMA_003")
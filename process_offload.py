@@ -0,0 +1,299 @@
+# -*- coding: utf-8 -*-
+"""
+Surec havuzu ile yogun hesaplama modulu.
+
+Kohort analizi ve BOM maliyet toplamlari saf pandas/Python islemidir; is parcaciginda
+calistiklarinda GIL'i tutar ve Qt olay dongusunu dondururlar. ProcessOffload bu
+hesaplari ayri sureclerde calistirir. Veri cerceveleri surece pickle ile degil
+paylasimli bellek (multiprocessing.shared_memory) uzerinden aktarilir:
+
+    - Sayisal, mantiksal ve tarih sutunlari ham NumPy tamponu olarak tek bir paylasimli
+      bloga yazilir; hedef surec bu tamponlari kopyalamadan NumPy dizisi olarak acar.
+    - Metin (object) sutunlari sozluk kodlamasiyla aktarilir: tamsayi kodlar paylasimli
+      bloga, benzersiz degerler kucuk bir listeyle gider.
+    - Diger sutunlar (kategori, uzanti tipleri) ve dizin tanim icinde aktarilir.
+
+Sonuclar ayni yolla geri doner. Kucuk cerceveler icin surec baslatma ve aktarim
+maliyeti hesaptan buyuk oldugundan esik_satir altindaki isler cagiran thread'de calisir.
+Isler surece gonderilebilmesi icin modul seviyesinde tanimli fonksiyonlar olmalidir
+(bkz. analitik.py).
+
+calistir() sonucu bekler ve Qt ana thread'inden cagrilamaz; arayuz kodu gonder() ile
+donen Future'a geri cagri baglar ve sonucu ana_thread_gonder ile ana thread'e tasir.
+"""
+
+import os
+import logging
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import shared_memory
+from typing import Optional, Dict, Any, List, Tuple, Callable
+import numpy as np
+import pandas as pd
+from main_thread import olay_dongusu_thread_mi
+
+HATA_KODLARI = {
+    "SUREC_001": "Surec havuzu kullanilamiyor, hesaplama yerel olarak yapiliyor",
+    "SUREC_002": "calistir() Qt ana thread'inden cagrilamaz, gonder() kullanilmali"
+}
+
+ESIK_SATIR = 20000
+_HIZALAMA = 64
+_PAYLASIMLI_TURLER = "biufcmM"  # bool, int, uint, float, complex, timedelta, datetime
+
+
+def _hizala(boyut: int) -> int:
+    return (boyut + _HIZALAMA - 1) // _HIZALAMA * _HIZALAMA
+
+
+def cerceve_paylas(df: pd.DataFrame) -> Tuple[Dict[str, Any], shared_memory.SharedMemory]:
+    """
+    Veri cercevesini paylasimli bellek bloguna yazar.
+
+    Returns:
+        Tuple[Dict[str, Any], SharedMemory]: Blogu baska bir surecte acmak icin tanim ve
+        blogun kendisi (olusturan taraf isi bitince unlink etmelidir)
+    """
+    tamponlar: List[Tuple[int, np.ndarray]] = []
+    sutunlar = []
+    konum = 0
+    for i in range(df.shape[1]):
+        seri = df.iloc[:, i]
+        if isinstance(seri.dtype, np.dtype) and seri.dtype.kind in _PAYLASIMLI_TURLER:
+            dizi = np.ascontiguousarray(seri.to_numpy())
+            sutunlar.append(("ham", dizi.dtype.str, konum, None))
+        elif seri.dtype == object or isinstance(seri.dtype, pd.StringDtype):
+            # Sozluk kodlamasi: kodlar paylasimli, benzersiz degerler ve metin tipi tanimda
+            kodlar, benzersiz = pd.factorize(seri, use_na_sentinel=True)
+            dizi = kodlar.astype(np.int32 if len(benzersiz) < 2 ** 31 else np.int64)
+            sutunlar.append(("kodlu", dizi.dtype.str, konum, (list(benzersiz), seri.dtype)))
+        else:
+            sutunlar.append(("tanimda", None, None, seri.to_numpy()))
+            continue
+        tamponlar.append((konum, dizi))
+        konum = _hizala(konum + dizi.nbytes)
+
+    blok = shared_memory.SharedMemory(create=True, size=max(konum, 1))
+    for baslangic, dizi in tamponlar:
+        hedef = np.ndarray(dizi.shape, dtype=dizi.dtype, buffer=blok.buf, offset=baslangic)
+        hedef[...] = dizi
+        del hedef
+    tanim = {
+        "ad": blok.name,
+        "satir": len(df),
+        "sutun_adlari": df.columns,
+        "dizin": None if isinstance(df.index, pd.RangeIndex) and df.index.start == 0 and df.index.step == 1 else df.index,
+        "sutunlar": sutunlar
+    }
+    return tanim, blok
+
+
+def cerceve_ac(tanim: Dict[str, Any]) -> Tuple[pd.DataFrame, shared_memory.SharedMemory]:
+    """
+    cerceve_paylas ile yazilmis blogu veri cercevesi olarak acar.
+
+    Ham sutunlar paylasimli tampon uzerinde kopyasiz NumPy dizileridir; blok kapatilmadan
+    once cerceve ve ondan turetilen gorunumler serbest birakilmalidir.
+    """
+    blok = shared_memory.SharedMemory(name=tanim["ad"])
+    satir = tanim["satir"]
+    veriler = {}
+    for i, (tur, dtype, konum, ek) in enumerate(tanim["sutunlar"]):
+        if tur == "tanimda":
+            veriler[i] = ek
+            continue
+        dizi = np.ndarray((satir,), dtype=np.dtype(dtype), buffer=blok.buf, offset=konum)
+        if tur == "kodlu":
+            benzersiz, metin_tipi = ek
+            degerler = np.empty(len(benzersiz) + 1, dtype=object)
+            degerler[:-1] = benzersiz
+            degerler[-1] = np.nan  # -1 kodu (eksik deger) son elemana denk gelir
+            dizi = pd.array(degerler[dizi], dtype=metin_tipi)
+        veriler[i] = dizi
+    df = pd.DataFrame(veriler, copy=False)
+    df.columns = tanim["sutun_adlari"]
+    if tanim["dizin"] is not None:
+        df.index = tanim["dizin"]
+    return df, blok
+
+
+def _blok_kapat(blok: shared_memory.SharedMemory, sil: bool) -> None:
+    try:
+        blok.close()
+    except BufferError:
+        pass  # Disari verilmis gorunumler var; esleme cop toplamada kapanir
+    if sil:
+        try:
+            blok.unlink()
+        except FileNotFoundError:
+            pass
+
+
+def _paketle(deger: Any, bloklar: List[shared_memory.SharedMemory]) -> Any:
+    """Deger icindeki veri cercevelerini (dict/list/tuple icinde olabilir) paylasimli tanimlara cevirir"""
+    if isinstance(deger, pd.DataFrame):
+        tanim, blok = cerceve_paylas(deger)
+        bloklar.append(blok)
+        return ("__cerceve__", tanim)
+    if isinstance(deger, pd.Series):
+        tanim, blok = cerceve_paylas(deger.to_frame(name="__deger__"))
+        tanim["seri_adi"] = deger.name
+        bloklar.append(blok)
+        return ("__seri__", tanim)
+    if isinstance(deger, dict):
+        return {anahtar: _paketle(alt, bloklar) for anahtar, alt in deger.items()}
+    if isinstance(deger, (list, tuple)):
+        return type(deger)(_paketle(alt, bloklar) for alt in deger)
+    return deger
+
+
+def _ac(deger: Any, bloklar: List[shared_memory.SharedMemory], kopyala: bool) -> Any:
+    """_paketle ile paketlenmis degeri geri acar; kopyala=True ise sonuc bloklardan ayrilir"""
+    if isinstance(deger, tuple) and len(deger) == 2 and deger[0] in ("__cerceve__", "__seri__"):
+        df, blok = cerceve_ac(deger[1])
+        bloklar.append(blok)
+        if kopyala:
+            df = df.copy(deep=True)
+        if deger[0] == "__seri__":
+            return df.iloc[:, 0].rename(deger[1]["seri_adi"])
+        return df
+    if isinstance(deger, dict):
+        return {anahtar: _ac(alt, bloklar, kopyala) for anahtar, alt in deger.items()}
+    if isinstance(deger, (list, tuple)):
+        return type(deger)(_ac(alt, bloklar, kopyala) for alt in deger)
+    return deger
+
+
+def _surecte_calistir(islev: Callable, paketli_args: tuple, paketli_kwargs: Dict[str, Any]) -> Any:
+    """Alt surecte calisir: girdileri kopyasiz acar, islevi calistirir, sonucu paylasimli bellege yazar"""
+    girdi_bloklari: List[shared_memory.SharedMemory] = []
+    args = _ac(paketli_args, girdi_bloklari, kopyala=False)
+    kwargs = _ac(paketli_kwargs, girdi_bloklari, kopyala=False)
+    sonuc = islev(*args, **kwargs)
+    sonuc_bloklari: List[shared_memory.SharedMemory] = []
+    paketli = _paketle(sonuc, sonuc_bloklari)
+    del args, kwargs, sonuc
+    for blok in girdi_bloklari:
+        _blok_kapat(blok, sil=False)
+    for blok in sonuc_bloklari:
+        _blok_kapat(blok, sil=False)  # Ana surec okuduktan sonra siler
+    return paketli
+
+
+def _toplam_satir(deger: Any) -> int:
+    if isinstance(deger, (pd.DataFrame, pd.Series)):
+        return len(deger)
+    if isinstance(deger, dict):
+        return sum(_toplam_satir(alt) for alt in deger.values())
+    if isinstance(deger, (list, tuple)):
+        return sum(_toplam_satir(alt) for alt in deger)
+    return 0
+
+
+class ProcessOffload:
+    """
+    Yogun pandas hesaplarini paylasimli bellekli surec havuzunda calistiran sinif.
+
+    Methods:
+        gonder(): Hesabi gonderir ve Future dondurur
+        calistir(): Hesabi calistirip sonucu dondurur (ana thread disindan)
+        kapat(): Surec havuzunu kapatir
+    """
+
+    def __init__(self, loglayici: Optional[logging.Logger] = None, isci_sayisi: Optional[int] = None,
+                 esik_satir: int = ESIK_SATIR):
+        """
+        Args:
+            loglayici: Loglama islemleri icin logger nesnesi
+            isci_sayisi: Surec sayisi; verilmezse islemci sayisi
+            esik_satir: Girdilerdeki toplam satir bu sayinin altindaysa hesap yerel yapilir
+        """
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.isci_sayisi = isci_sayisi or os.cpu_count() or 2
+        self.esik_satir = esik_satir
+        self._havuz: Optional[ProcessPoolExecutor] = None
+        self._kilit = threading.Lock()
+
+    def _havuz_al(self) -> ProcessPoolExecutor:
+        with self._kilit:
+            if self._havuz is None:
+                # Qt ve is parcaciklari olan bir surecten fork guvenli olmadigi icin spawn kullanilir
+                self._havuz = ProcessPoolExecutor(max_workers=self.isci_sayisi,
+                                                  mp_context=multiprocessing.get_context("spawn"))
+            return self._havuz
+
+    def gonder(self, islev: Callable, *args, **kwargs) -> Future:
+        """
+        Hesabi surec havuzuna gonderir.
+
+        Args:
+            islev: Modul seviyesinde tanimli (pickle edilebilir) fonksiyon
+            *args, **kwargs: Fonksiyon argumanlari; veri cerceveleri paylasimli bellekle aktarilir
+
+        Returns:
+            Future: Sonucu (veri cerceveleri ana surece alinmis olarak) tasiyan Future
+        """
+        sonuc: Future = Future()
+        if _toplam_satir((args, kwargs)) < self.esik_satir:
+            self._yerel_calistir(sonuc, islev, args, kwargs)
+            return sonuc
+
+        girdi_bloklari: List[shared_memory.SharedMemory] = []
+        try:
+            paketli_args = _paketle(args, girdi_bloklari)
+            paketli_kwargs = _paketle(kwargs, girdi_bloklari)
+            surec_sonucu = self._havuz_al().submit(_surecte_calistir, islev, paketli_args, paketli_kwargs)
+        except (BrokenProcessPool, RuntimeError, OSError) as e:
+            for blok in girdi_bloklari:
+                _blok_kapat(blok, sil=True)
+            self.loglayici.warning(f"{HATA_KODLARI['SUREC_001']}: {str(e)}")
+            self._yerel_calistir(sonuc, islev, args, kwargs)
+            return sonuc
+
+        def bitti(f: Future) -> None:
+            for blok in girdi_bloklari:
+                _blok_kapat(blok, sil=True)
+            if f.cancelled():
+                sonuc.cancel()
+                return
+            if f.exception() is not None:
+                sonuc.set_exception(f.exception())
+                return
+            sonuc_bloklari: List[shared_memory.SharedMemory] = []
+            try:
+                sonuc.set_result(_ac(f.result(), sonuc_bloklari, kopyala=True))
+            except Exception as e:
+                sonuc.set_exception(e)
+            finally:
+                for blok in sonuc_bloklari:
+                    _blok_kapat(blok, sil=True)
+
+        surec_sonucu.add_done_callback(bitti)
+        return sonuc
+
+    def calistir(self, islev: Callable, *args, **kwargs) -> Any:
+        """
+        Hesabi calistirir ve sonucunu dondurur; bekleme sirasinda GIL serbesttir.
+
+        Raises:
+            RuntimeError: Qt ana thread'inden cagrilirsa (bekleme olay dongusunu dondururdu)
+        """
+        if olay_dongusu_thread_mi():
+            raise RuntimeError(HATA_KODLARI["SUREC_002"])
+        return self.gonder(islev, *args, **kwargs).result()
+
+    @staticmethod
+    def _yerel_calistir(sonuc: Future, islev: Callable, args: tuple, kwargs: Dict[str, Any]) -> None:
+        try:
+            sonuc.set_result(islev(*args, **kwargs))
+        except Exception as e:
+            sonuc.set_exception(e)
+
+    def kapat(self) -> None:
+        """Surec havuzunu kapatir"""
+        with self._kilit:
+            havuz, self._havuz = self._havuz, None
+        if havuz is not None:
+            havuz.shutdown(wait=True, cancel_futures=True)
@@ -2,77 +2,100 @@
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, 
                              QPushButton, QMessageBox, QLabel, QScrollArea, QTextEdit,
                              QDialog, QDateEdit, QFormLayout, QDialogButtonBox, QProgressDialog)
-from PyQt6.QtCore import Qt, QDate, QThread, pyqtSignal
+from PyQt6.QtCore import Qt, QDate, QObject, pyqtSignal
 from PyQt6.QtGui import QIcon
 from events import Event
+from task_scheduler import gorev_zamanlayici, IptalJetonu, GorevIptalEdildi
 from typing import Optional, Dict, Any
 import os
+import threading
 from datetime import datetime
 import concurrent.futures
 
-class RaporlamaWorker(QThread):
+class RaporlamaWorker(QObject):
     """
     Raporlama işlemlerini arka planda ve paralel olarak gerçekleştiren worker sınıfı.
+    
+    Her ayın kohort hesabı paylaşılan görev zamanlayıcısına ayrı görev olarak gönderilir;
+    tüm aylar bitince rapor yine zamanlayıcıda birleştirilir. Hiçbir iş parçacığı başka
+    bir görevi beklemez. iptal_et() kalan ayların hesaplanmasını durdurur.
     """
     tamamlandi = pyqtSignal(dict)
     hata = pyqtSignal(str)
     ilerleme = pyqtSignal(dict)
     
-    def __init__(self, services, baslangic_tarihi=None, bitis_tarihi=None, max_workers=4):
+    def __init__(self, services, baslangic_tarihi=None, bitis_tarihi=None):
         super().__init__()
         self.services = services
         self.baslangic_tarihi = baslangic_tarihi
         self.bitis_tarihi = bitis_tarihi
-        self.max_workers = max_workers  # Paralel iş parçacığı sayısı
+        self.jeton = IptalJetonu()
+        self._kilit = threading.Lock()
+        self._sonuclar = {}
+        self._toplam = 0
     
-    def _paralel_kohort_hesapla(self, ay_listesi):
-        """Kohort analizini ay bazında paralel olarak hesaplar."""
-        def hesapla_ay(ay):
-            try:
-                # Her ay için kohort verisini hesapla (örnek fonksiyon)
-                kohort_veri = self.services.generate_kohort_for_month(
-                    ay=ay,
-                    baslangic_tarihi=self.baslangic_tarihi,
-                    bitis_tarihi=self.bitis_tarihi
-                )
-                return {ay: kohort_veri}
-            except Exception as e:
-                return {ay: {"error": str(e)}}
-        
-        sonuclar = {}
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            future_to_ay = {executor.submit(hesapla_ay, ay): ay for ay in ay_listesi}
-            tamamlanan = 0
-            for future in concurrent.futures.as_completed(future_to_ay):
-                ay = future_to_ay[future]
-                try:
-                    sonuc = future.result()
-                    sonuclar.update(sonuc)
-                except Exception as e:
-                    sonuclar[ay] = {"error": str(e)}
-                
-                tamamlanan += 1
-                yuzde = int((tamamlanan / len(ay_listesi)) * 100)
-                self.ilerleme.emit({"yuzde": yuzde, "mesaj": f"Ay {ay} işlendi"})
-        
-        return sonuclar
+    def _ay_listesi(self):
+        # Örnek: Aylık kohort analizi için tarih aralığını böl
+        baslangic = datetime.strptime(self.baslangic_tarihi, "%Y-%m-%d")
+        bitis = datetime.strptime(self.bitis_tarihi, "%Y-%m-%d")
+        ay_listesi = [(baslangic.year, baslangic.month + i) for i in range((bitis.year - baslangic.year) * 12 + bitis.month - baslangic.month + 1)]
+        return [f"{yil}-{ay:02d}" for yil, ay in ay_listesi]
+    
+    def _ay_hesapla(self, ay):
+        """Tek bir ayın kohort verisini hesaplar (zamanlayıcıda çalışır)."""
+        return self.services.generate_kohort_for_month(
+            ay=ay,
+            baslangic_tarihi=self.baslangic_tarihi,
+            bitis_tarihi=self.bitis_tarihi
+        )
+    
+    def _ay_bitti(self, ay, future):
+        """Ay görevi bittiğinde sonucu toplar; son ay bittiğinde raporu birleştirmeye gönderir."""
+        if future.cancelled() or isinstance(future.exception(), GorevIptalEdildi):
+            sonuc = {"error": "iptal edildi"}
+        elif future.exception() is not None:
+            sonuc = {"error": str(future.exception())}
+        else:
+            sonuc = future.result()
+        with self._kilit:
+            self._sonuclar[ay] = sonuc
+            tamamlanan = len(self._sonuclar)
+        self.ilerleme.emit({"yuzde": int((tamamlanan / self._toplam) * 100), "mesaj": f"Ay {ay} işlendi"})
+        if tamamlanan < self._toplam:
+            return
+        if self.jeton.iptal_edildi:
+            self.hata.emit("Kohort analizi iptal edildi")
+            return
+        gorev_zamanlayici().gonder(self._raporu_tamamla)
     
-    def run(self):
+    def _raporu_tamamla(self):
         try:
-            # Örnek: Aylık kohort analizi için tarih aralığını böl
-            baslangic = datetime.strptime(self.baslangic_tarihi, "%Y-%m-%d")
-            bitis = datetime.strptime(self.bitis_tarihi, "%Y-%m-%d")
-            ay_listesi = [(baslangic.year, baslangic.month + i) for i in range((bitis.year - baslangic.year) * 12 + bitis.month - baslangic.month + 1)]
-            ay_listesi = [f"{yil}-{ay:02d}" for yil, ay in ay_listesi]
-            
-            # Paralel hesaplama
-            kohort_sonuclar = self._paralel_kohort_hesapla(ay_listesi)
-            
             # Sonuçları birleştir ve rapor oluştur
-            rapor = self.services.finalize_kohort_report(kohort_sonuclar)
+            rapor = self.services.finalize_kohort_report(dict(self._sonuclar))
             self.tamamlandi.emit(rapor)
         except Exception as e:
             self.hata.emit(str(e))
+    
+    def start(self):
+        """Ay görevlerini zamanlayıcıya gönderir; çağıran iş parçacığını bekletmez."""
+        try:
+            ay_listesi = self._ay_listesi()
+        except Exception as e:
+            self.hata.emit(str(e))
+            return
+        if not ay_listesi:
+            self.hata.emit("Kohort analizi için geçerli bir tarih aralığı seçilmedi")
+            return
+        self._sonuclar = {}
+        self._toplam = len(ay_listesi)
+        zamanlayici = gorev_zamanlayici()
+        for ay in ay_listesi:
+            gorev = zamanlayici.gonder(self._ay_hesapla, ay, jeton=self.jeton)
+            gorev.future.add_done_callback(lambda future, ay=ay: self._ay_bitti(ay, future))
+    
+    def iptal_et(self):
+        """Henüz hesaplanmamış ayları iptal eder."""
+        self.jeton.iptal_et()
 
 class Raporlama:
     """
@@ -101,19 +124,19 @@ class Raporlama:
             except Exception as e:
                 return {"error": str(e)}
         
-        with concurrent.futures.ThreadPoolExecutor(max_workers=4) as executor:
-            parametreler = parametreler or [{}]
-            future_to_parca = {executor.submit(hesapla_parca, parca): parca for parca in parametreler}
-            sonuclar = []
-            for future in concurrent.futures.as_completed(future_to_parca):
-                try:
-                    sonuc = future.result()
-                    sonuclar.append(sonuc)
-                except Exception as e:
-                    self.loglayici.error(f"{rapor_adi} parça hesaplama hatası: {str(e)}")
-            
-            # Sonuçları birleştir
-            return self._rapor_birlestir(sonuclar, rapor_adi)
+        zamanlayici = gorev_zamanlayici()
+        parametreler = parametreler or [{}]
+        future_to_parca = {zamanlayici.submit(hesapla_parca, parca): parca for parca in parametreler}
+        sonuclar = []
+        for future in concurrent.futures.as_completed(future_to_parca):
+            try:
+                sonuc = future.result()
+                sonuclar.append(sonuc)
+            except Exception as e:
+                self.loglayici.error(f"{rapor_adi} parça hesaplama hatası: {str(e)}")
+        
+        # Sonuçları birleştir
+        return self._rapor_birlestir(sonuclar, rapor_adi)
     
     def _rapor_birlestir(self, sonuclar, rapor_adi):
         """Paralel hesaplanan rapor parçalarını birleştirir."""
@@ -257,14 +280,14 @@ class Raporlama:
             self.worker = RaporlamaWorker(
                 self.services,
                 baslangic_tarihi=baslangic_tarihi,
-                bitis_tarihi=bitis_tarihi,
-                max_workers=4
+                bitis_tarihi=bitis_tarihi
             )
             
             # Sinyalleri ana iş parçacığına güvenli bir şekilde bağla
             self.worker.tamamlandi.connect(lambda sonuc: self._kohort_analizi_tamamlandi(sonuc, ilerleme_dialog))
             self.worker.hata.connect(lambda hata: self._kohort_analizi_hatasi(hata, ilerleme_dialog))
             self.worker.ilerleme.connect(lambda data: ilerleme_dialog.setValue(data.get("yuzde", 0)))
+            ilerleme_dialog.canceled.connect(self.worker.iptal_et)
             
             self.worker.start()
         
@@ -8,8 +8,7 @@ import time
 import queue
 import json
 from datetime import datetime
-from PyQt6.QtCore import QThreadPool
-from thread_worker import Worker, WorkerSignals
+from task_scheduler import gorev_zamanlayici
 from repository_interface import RepositoryInterface
 
 class ConnectionPool:
@@ -72,6 +71,20 @@ class ErrorCode(Enum):
     QUERY_ERROR = "DB004"
     BATCH_UPDATE_ERROR = "DB005"
     OPTIMIZATION_ERROR = "DB006"
+    VERSION_CONFLICT = "DB007"
+
+class SurumCakismasi(RepositoryError):
+    """Kayit okunduktan sonra baska bir islem tarafindan degistirildiginde veya silindiginde firlatilir"""
+    def __init__(self, tablo: str, beklenen_surum: Optional[int], mevcut_surum: Optional[int] = None):
+        self.tablo = tablo
+        self.beklenen_surum = beklenen_surum
+        self.mevcut_surum = mevcut_surum
+        super().__init__(
+            f"Kayit siz islem yaparken baska bir islem tarafindan degistirildi veya silindi ({tablo}). "
+            f"Tabloyu yenileyip tekrar deneyin.",
+            ErrorCode.VERSION_CONFLICT.value,
+            {"table": tablo, "expected_version": beklenen_surum, "current_version": mevcut_surum}
+        )
 
 class QueryCache:
     """Sorgu sonuçlarını önbelleğe alan sınıf
@@ -125,8 +138,7 @@ class SqlRepository(RepositoryInterface):
         self.logger = logger
         self.cache = QueryCache(max_size=100, ttl=300)  # 5 dakikalık TTL
         self._data_version = 0
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(4)
+        self.thread_pool = gorev_zamanlayici(logger)
         self.conn_pool = ConnectionPool(db_path, max_connections=5)
 
     def initialize(self) -> None:
@@ -211,12 +223,8 @@ class SqlRepository(RepositoryInterface):
             finally:
                 self.conn_pool.release_connection(conn)
 
-        worker = Worker(save_task)
-        if callback:
-            worker.signals.result.connect(callback)
-            worker.signals.error.connect(lambda err: self.logger.error(f"Worker hatası: {err[2]}") if self.logger else None)
-            worker.signals.finished.connect(lambda: self.logger.debug("Save işlemi tamamlandı") if self.logger else None)
-        self.thread_pool.start(worker)
+        # Hatalar zamanlayici tarafindan loglanir; sonuc callback'e iletilir
+        self.thread_pool.gonder(save_task, sonuc=callback)
 
     def load(self, table_name: str, page: int = 1, page_size: int = 1000) -> pd.DataFrame:
         """Belirtilen tablodan veriyi yükler ve önbellekten kontrol eder.
@@ -359,7 +367,8 @@ class SqlRepository(RepositoryInterface):
             ErrorCode.INVALID_DATA.value: {"description": "Geçersiz veri"},
             ErrorCode.QUERY_ERROR.value: {"description": "Sorgu hatası"},
             ErrorCode.BATCH_UPDATE_ERROR.value: {"description": "Toplu güncelleme hatası"},
-            ErrorCode.OPTIMIZATION_ERROR.value: {"description": "Optimizasyon hatası"}
+            ErrorCode.OPTIMIZATION_ERROR.value: {"description": "Optimizasyon hatası"},
+            ErrorCode.VERSION_CONFLICT.value: {"description": "Sürüm çakışması"}
         }
         return error_map.get(error_code, {"description": "Bilinmeyen hata"})
 
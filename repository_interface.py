@@ -12,7 +12,7 @@ class RepositoryInterface(ABC):
         pass
 
     @abstractmethod
-    def save(self, df: pd.DataFrame, table_name: str, batch_size: int = 1000) -> None:
+    def save(self, df: pd.DataFrame, table_name: str, batch_size: int = 1000, surum: Optional[int] = None) -> Any:
         pass
 
     @abstractmethod
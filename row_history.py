@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+Satir gecmisi (zaman yolculugu) modulu.
+
+Secili tablolarda her satir surumu gecerlilik araligi (valid_from, valid_to) ile
+satir_gecmisi tablosunda tutulur. Guncel surumlerin valid_to degeri SONSUZ'dur; bu
+sayede "valid_to > t AND valid_from <= t" kosulu tek bir bilesik indeks araligiyla
+cozulur ve gecmis bir andaki tablo, guncel tablo kadar hizli okunur. Satirlarin tablodaki
+sirasi (anahtarin ilk eklenme sirasi) satir_gecmisi_sirasi tablosunda bir kez saklanir;
+okumalar siralama icin tum gecmisi gruplamaz.
+Surumler degisiklik yakalama (ChangeCapture) farklarindan uretilir.
+"""
+
+import json
+import sqlite3
+import logging
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable, Union
+import pandas as pd
+
+HATA_KODLARI = {
+    "GECMIS_001": "Tablo icin satir gecmisi tutulmuyor"
+}
+
+VERSIYONLU_TABLOLAR = ("sales", "pipeline", "hammadde")
+SONSUZ = "9999-12-31T23:59:59"
+
+
+def zaman_damgasi(zaman: Union[str, datetime, pd.Timestamp]) -> str:
+    """Zamani gecmis tablosundaki ISO bicimine cevirir"""
+    if isinstance(zaman, str):
+        return pd.Timestamp(zaman).isoformat()
+    return zaman.isoformat()
+
+
+class RowHistory:
+    """Satir surumlerini gecerlilik araliklariyla saklayan sinif"""
+
+    def __init__(self, tablolar: Iterable[str] = VERSIYONLU_TABLOLAR, loglayici: Optional[logging.Logger] = None):
+        """
+        Args:
+            tablolar: Gecmisi tutulacak tablolar
+            loglayici: Loglama islemleri icin logger nesnesi
+        """
+        self.tablolar = set(tablolar)
+        self.loglayici = loglayici or logging.getLogger(__name__)
+
+    def izleniyor_mu(self, tablo_adi: str) -> bool:
+        return tablo_adi in self.tablolar
+
+    def semayi_olustur(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS satir_gecmisi (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tablo TEXT NOT NULL,
+                anahtar TEXT NOT NULL,
+                valid_from TEXT NOT NULL,
+                valid_to TEXT NOT NULL,
+                veri TEXT NOT NULL
+            )''')
+        # Anahtarin tabloya ilk eklenme sirasi; id artan sira numarasidir, kayit hic silinmez
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS satir_gecmisi_sirasi (
+                id INTEGER PRIMARY KEY,
+                tablo TEXT NOT NULL,
+                anahtar TEXT NOT NULL,
+                UNIQUE (tablo, anahtar)
+            )''')
+        # Nokta-zaman okumalari: tablo esitligi + valid_to araligi, valid_from indeksten suzulur
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_satir_gecmisi_zaman ON satir_gecmisi(tablo, valid_to, valid_from)")
+        # Yakin gecmise yapilan okumalar: valid_from <= t araligi once daraltilir
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_satir_gecmisi_baslangic ON satir_gecmisi(tablo, valid_from, valid_to)")
+        # Acik surumu kapatmak icin anahtar erisimi
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_satir_gecmisi_anahtar ON satir_gecmisi(tablo, anahtar, valid_to)")
+        # Sira tablosundan once olusmus gecmis icin siralar bir kez ilk surum kimliginden doldurulur
+        if cursor.execute("SELECT 1 FROM satir_gecmisi_sirasi LIMIT 1").fetchone() is None:
+            cursor.execute(
+                "INSERT OR IGNORE INTO satir_gecmisi_sirasi (tablo, anahtar) "
+                "SELECT tablo, anahtar FROM satir_gecmisi GROUP BY tablo, anahtar ORDER BY MIN(id)")
+
+    def bos_mu(self, conn: sqlite3.Connection, tablo_adi: str) -> bool:
+        return conn.execute("SELECT 1 FROM satir_gecmisi WHERE tablo = ? LIMIT 1", (tablo_adi,)).fetchone() is None
+
+    def baslat(self, conn: sqlite3.Connection, tablo_adi: str, satirlar: List[tuple], zaman: str) -> None:
+        """
+        Gecmisi olmayan tablo icin mevcut satirlari acik surum olarak ekler.
+
+        Args:
+            satirlar: (anahtar, veri_json) ikilileri
+        """
+        conn.executemany(
+            "INSERT INTO satir_gecmisi (tablo, anahtar, valid_from, valid_to, veri) VALUES (?, ?, ?, ?, ?)",
+            [(tablo_adi, anahtar, zaman, SONSUZ, veri) for anahtar, veri in satirlar])
+        self._siralari_ekle(conn, tablo_adi, [anahtar for anahtar, _ in satirlar])
+        self.loglayici.info(f"{tablo_adi} icin satir gecmisi baslatildi ({len(satirlar)} satir)")
+
+    def isle(self, conn: sqlite3.Connection, tablo_adi: str, kayitlar: List[tuple], zaman: str) -> None:
+        """
+        Degisiklik kayitlarini gecmise isler; commit cagirana aittir.
+
+        Args:
+            kayitlar: ChangeCapture'in cdc_log'a yazdigi (tablo, anahtar, islem, ..., veri, kaynak, zaman) demetleri
+        """
+        kapatilacak = [(zaman, tablo_adi, kayit[1], SONSUZ) for kayit in kayitlar if kayit[2] in ("update", "delete")]
+        eklenecek = [(tablo_adi, kayit[1], zaman, SONSUZ, kayit[6]) for kayit in kayitlar if kayit[2] in ("insert", "update")]
+        conn.executemany(
+            "UPDATE satir_gecmisi SET valid_to = ? WHERE tablo = ? AND anahtar = ? AND valid_to = ?", kapatilacak)
+        conn.executemany(
+            "INSERT INTO satir_gecmisi (tablo, anahtar, valid_from, valid_to, veri) VALUES (?, ?, ?, ?, ?)", eklenecek)
+        self._siralari_ekle(conn, tablo_adi, [kayit[1] for kayit in kayitlar if kayit[2] in ("insert", "update")])
+
+    def _siralari_ekle(self, conn: sqlite3.Connection, tablo_adi: str, anahtarlar: List[str]) -> None:
+        """Ilk kez gorulen anahtarlara sira numarasi verir; silinip yeniden eklenen anahtar eski yerini korur"""
+        conn.executemany(
+            "INSERT OR IGNORE INTO satir_gecmisi_sirasi (tablo, anahtar) VALUES (?, ?)",
+            [(tablo_adi, anahtar) for anahtar in anahtarlar])
+
+    def as_of(self, conn: sqlite3.Connection, tablo_adi: str, zaman: Union[str, datetime, pd.Timestamp]) -> List[Dict[str, Any]]:
+        """
+        Verilen anda gecerli olan satir surumlerini dondurur.
+
+        Satirlar tabloya ilk eklendikleri sirayla (satir_gecmisi_sirasi) dondurulur;
+        guncellenen satir tablodaki yerini korur, sona tasinmaz.
+
+        Returns:
+            List[Dict[str, Any]]: Satir veri yukleri (JSON cozulmus, hassas alanlar sifreli)
+        """
+        if not self.izleniyor_mu(tablo_adi):
+            raise ValueError(f"{HATA_KODLARI['GECMIS_001']}: {tablo_adi}")
+        an = zaman_damgasi(zaman)
+        satirlar = conn.execute(
+            "SELECT g.veri FROM satir_gecmisi g "
+            "JOIN satir_gecmisi_sirasi s ON s.tablo = g.tablo AND s.anahtar = g.anahtar "
+            "WHERE g.tablo = ? AND g.valid_to > ? AND g.valid_from <= ? ORDER BY s.id, g.id",
+            (tablo_adi, an, an)).fetchall()
+        return [json.loads(satir[0]) for satir in satirlar]
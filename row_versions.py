@@ -0,0 +1,105 @@
+# -*- coding: utf-8 -*-
+"""
+Satir surumleri modulu.
+
+Paralel calisan isciler ayni veri cercevesinde satir duzenleyip silebilir. Satirlari
+tablo gorunumundeki sira numarasiyla bulmak, arada baska bir islem satir sildiginde
+yanlis satirin degismesine; tam tablo yeniden yazimlari ise son yazanin sessizce
+kazanmasina yol acar. Surumlu cercevelerde her satir SURUM_SUTUNU'nda tablo bazinda
+artan bir surum tasir: satir eklendiginde veya degistiginde yeni bir numara alir.
+Arayuz satiri okudugu andaki surumu saklar; guncelleme ve silme satiri bu surumle
+bulur (karsilastir-degistir). Satir o arada degismis veya silinmisse SurumCakismasi
+firlatilir ve cagirana bildirilir.
+
+Surum sutunu yalnizca bellekte tutulur; veritabanina ve Excel'e yazilmadan once
+surumsuz() ile cikarilir.
+"""
+
+import threading
+from typing import Optional, Dict, Any, Iterable
+import numpy as np
+import pandas as pd
+from repository import SurumCakismasi
+
+SURUM_SUTUNU = "_surum"
+
+
+def surumsuz(df: Optional[pd.DataFrame]) -> Optional[pd.DataFrame]:
+    """Cercevenin surum sutunu olmayan halini dondurur (sutun yoksa cercevenin kendisini)"""
+    if df is None or SURUM_SUTUNU not in df.columns:
+        return df
+    return df.drop(columns=SURUM_SUTUNU)
+
+
+class RowVersions:
+    """Tablo bazinda satir surum sayaclarini tutan sinif"""
+
+    def __init__(self):
+        self._sayaclar: Dict[str, int] = {}
+        self._kilit = threading.Lock()
+
+    def sonraki(self, tablo: str, adet: int = 1) -> int:
+        """
+        Tablo icin adet kadar ardisik yeni surum ayirir.
+
+        Returns:
+            int: Ayrilan ilk surum
+        """
+        with self._kilit:
+            ilk = self._sayaclar.get(tablo, 0) + 1
+            self._sayaclar[tablo] = ilk + adet - 1
+            return ilk
+
+    def tamamla(self, df: pd.DataFrame, tablo: str) -> pd.DataFrame:
+        """
+        Surumu olmayan satirlara (yeni eklenenler, surumsuz yuklenen cerceveler) surum verir.
+
+        Cerceve yerinde degistirilir; cagiran kendi kopyasini vermelidir.
+        """
+        if SURUM_SUTUNU not in df.columns:
+            ilk = self.sonraki(tablo, len(df))
+            df[SURUM_SUTUNU] = np.arange(ilk, ilk + len(df), dtype="int64")
+            return df
+        eksik = df[SURUM_SUTUNU].isna()
+        sayi = int(eksik.sum())
+        if sayi:
+            df.loc[eksik, SURUM_SUTUNU] = np.arange(sayi) + self.sonraki(tablo, sayi)
+        if df[SURUM_SUTUNU].dtype != "int64":
+            df[SURUM_SUTUNU] = df[SURUM_SUTUNU].astype("int64")
+        return df
+
+    def yenile(self, df: pd.DataFrame, tablo: str, etiketler: Iterable) -> None:
+        """Degisen satirlara yeni surum verir (cerceve yerinde degistirilir)"""
+        etiketler = list(etiketler)
+        if etiketler:
+            df.loc[etiketler, SURUM_SUTUNU] = np.arange(len(etiketler)) + self.sonraki(tablo, len(etiketler))
+
+    @staticmethod
+    def satir_bul(df: Optional[pd.DataFrame], tablo: str, konum: Any, beklenen_surum: Optional[int]) -> Any:
+        """
+        Duzenlenecek satirin etiketini dondurur.
+
+        Args:
+            df: Surumlu cerceve
+            tablo: Tablo adi (hata bildirimi icin)
+            konum: Satirin okundugu andaki indeks etiketi
+            beklenen_surum: Satirin okundugu andaki surumu; None ise satir konumla bulunur (kontrolsuz)
+
+        Returns:
+            Any: Satirin guncel indeks etiketi (arada baska satirlar silindiyse konumdan farkli olabilir)
+
+        Raises:
+            SurumCakismasi: Satir okunduktan sonra degistirilmis veya silinmisse
+        """
+        if beklenen_surum is None:
+            if df is None or konum not in df.index:
+                raise KeyError(konum)
+            return konum
+        if df is not None and SURUM_SUTUNU in df.columns:
+            eslesen = df.index[df[SURUM_SUTUNU].to_numpy() == beklenen_surum]
+            if len(eslesen):
+                return eslesen[0]
+        mevcut = None
+        if df is not None and SURUM_SUTUNU in df.columns and konum in df.index:
+            mevcut = int(df.at[konum, SURUM_SUTUNU])
+        raise SurumCakismasi(tablo, beklenen_surum, mevcut)
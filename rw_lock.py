@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+"""
+Okuyucu/yazar kilidi modulu.
+
+VeriYoneticisi cercevelerini gosterge paneli, raporlar ve tablo doldurma gibi bircok
+okuyucu ayni anda okur; yazarlar ise (ekleme, duzenleme, silme) seyrek ve kisadir.
+Tek bir threading.Lock okuyuculari da birbirine siralar. ReadWriteLock okuyuculari
+paralel calistirir, yazarlara ozel erisim verir ve bekleyen bir yazar varken yeni
+okuyuculari bekletir (yazar aclik cekmez).
+
+Kurallar:
+    - Yazma kilidi ayni thread'de yeniden alinabilir; yazma kilidini tutan thread
+      okuma kilidini de alabilir.
+    - Okuma kilidi ayni thread'de ic ice alinabilir.
+    - Okuma kilidini tutan thread yazma kilidi isteyemez (yukseltme kilitlenmeye yol
+      acar); RuntimeError firlatilir.
+
+Her edinme icin bekleme ve tutma sureleri olculur: cekisme sayilari, en uzun
+beklemeler, ayni anda en cok okuyucu sayisi ve islem bazinda yazma sureleri
+metrikler() ile sorgulanabilir. Esigi asan yazmalar loglanir.
+"""
+
+import time
+import logging
+import functools
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Dict, Any, Iterator, Callable
+
+UZUN_YAZMA_ESIGI = 0.25  # saniye; bu sureden uzun tutulan yazma kilitleri loglanir
+UYARI_ARALIGI = 10.0  # Ayni islem icin uyarilar arasindaki en kisa sure (saniye)
+
+
+class ReadWriteLock:
+    """
+    Yazar oncelikli, olcumlu okuyucu/yazar kilidi.
+
+    Attributes:
+        ad: Kilidin log ve metriklerdeki adi
+        uzun_yazma_esigi: Bu sureyi asan yazma kilitleri icin uyari loglanir (saniye)
+    """
+
+    def __init__(self, ad: str, loglayici: Optional[logging.Logger] = None,
+                 uzun_yazma_esigi: float = UZUN_YAZMA_ESIGI):
+        """
+        Args:
+            ad: Kilidin adi
+            loglayici: Loglama islemleri icin logger nesnesi
+            uzun_yazma_esigi: Uzun yazma uyari esigi (saniye)
+        """
+        self.ad = ad
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.uzun_yazma_esigi = uzun_yazma_esigi
+        self._kosul = threading.Condition(threading.Lock())
+        self._okuyucu_sayisi = 0
+        self._bekleyen_yazar = 0
+        self._yazar: Optional[int] = None
+        self._yerel = threading.local()
+        self.sifirla()
+
+    def sifirla(self) -> None:
+        """Tum sayaclari sifirlar"""
+        with self._kosul:
+            self._baslangic = time.time()
+            self._sayaclar: Dict[str, Dict[str, Any]] = {
+                kip: {"edinme": 0, "cekisme": 0, "toplam_bekleme": 0.0, "en_uzun_bekleme": 0.0,
+                      "toplam_tutma": 0.0, "en_uzun_tutma": 0.0}
+                for kip in ("okuma", "yazma")
+            }
+            self._en_cok_okuyucu = 0
+            self._yazma_islemleri: Dict[str, Dict[str, Any]] = {}
+            self._son_uyari: Dict[str, float] = {}
+
+    def _okuma_derinligi(self) -> int:
+        return getattr(self._yerel, "okuma", 0)
+
+    def _bekleme_kaydet(self, kip: str, bekleme: float, cekisme: bool) -> None:
+        sayac = self._sayaclar[kip]
+        sayac["edinme"] += 1
+        if cekisme:
+            sayac["cekisme"] += 1
+            sayac["toplam_bekleme"] += bekleme
+            sayac["en_uzun_bekleme"] = max(sayac["en_uzun_bekleme"], bekleme)
+
+    def _tutma_kaydet(self, kip: str, sure: float) -> None:
+        sayac = self._sayaclar[kip]
+        sayac["toplam_tutma"] += sure
+        sayac["en_uzun_tutma"] = max(sayac["en_uzun_tutma"], sure)
+
+    @contextmanager
+    def okuma(self) -> Iterator[None]:
+        """Okuma kilidini blok suresince tutar; diger okuyucular ayni anda girebilir."""
+        kimlik = threading.get_ident()
+        derinlik = self._okuma_derinligi()
+        if self._yazar == kimlik or derinlik:
+            # Yazma kilidi veya okuma kilidi zaten bu thread'de; bekleyen yazara takilmadan girilir
+            self._yerel.okuma = derinlik + 1
+            try:
+                yield
+            finally:
+                self._yerel.okuma = derinlik
+            return
+
+        baslangic = time.perf_counter()
+        with self._kosul:
+            cekisme = self._yazar is not None or self._bekleyen_yazar > 0
+            while self._yazar is not None or self._bekleyen_yazar > 0:
+                self._kosul.wait()
+            self._okuyucu_sayisi += 1
+            self._en_cok_okuyucu = max(self._en_cok_okuyucu, self._okuyucu_sayisi)
+            alindi = time.perf_counter()
+            self._bekleme_kaydet("okuma", alindi - baslangic, cekisme)
+        self._yerel.okuma = 1
+        try:
+            yield
+        finally:
+            self._yerel.okuma = 0
+            with self._kosul:
+                self._okuyucu_sayisi -= 1
+                self._tutma_kaydet("okuma", time.perf_counter() - alindi)
+                if self._okuyucu_sayisi == 0:
+                    self._kosul.notify_all()
+
+    @contextmanager
+    def yazma(self, islem: Optional[str] = None) -> Iterator[None]:
+        """
+        Yazma kilidini blok suresince ozel olarak tutar.
+
+        Args:
+            islem: Kilidi alan islemin adi (islem bazinda metrikler ve uzun yazma uyarilari icin)
+
+        Raises:
+            RuntimeError: Thread okuma kilidini tutarken yazma kilidi isterse
+        """
+        kimlik = threading.get_ident()
+        if self._yazar == kimlik:
+            yield  # Ic ice yazma: kilit en distaki blok bitince birakilir
+            return
+        if self._okuma_derinligi():
+            raise RuntimeError(f"{self.ad}: okuma kilidi tutulurken yazma kilidi istenemez ({islem or 'bilinmeyen islem'})")
+
+        islem = islem or "bilinmeyen"
+        baslangic = time.perf_counter()
+        with self._kosul:
+            cekisme = self._yazar is not None or self._okuyucu_sayisi > 0
+            self._bekleyen_yazar += 1
+            try:
+                while self._yazar is not None or self._okuyucu_sayisi > 0:
+                    self._kosul.wait()
+            finally:
+                self._bekleyen_yazar -= 1
+            self._yazar = kimlik
+            alindi = time.perf_counter()
+            self._bekleme_kaydet("yazma", alindi - baslangic, cekisme)
+        try:
+            yield
+        finally:
+            sure = time.perf_counter() - alindi
+            uyar = False
+            with self._kosul:
+                self._yazar = None
+                self._tutma_kaydet("yazma", sure)
+                kayit = self._yazma_islemleri.setdefault(islem, {"sayi": 0, "toplam_sure": 0.0, "en_uzun_sure": 0.0})
+                kayit["sayi"] += 1
+                kayit["toplam_sure"] += sure
+                kayit["en_uzun_sure"] = max(kayit["en_uzun_sure"], sure)
+                if sure >= self.uzun_yazma_esigi:
+                    simdi = time.monotonic()
+                    if simdi - self._son_uyari.get(islem, float("-inf")) >= UYARI_ARALIGI:
+                        self._son_uyari[islem] = simdi
+                        uyar = True
+                self._kosul.notify_all()
+            if uyar:
+                self.loglayici.warning(f"Uzun yazma kilidi: {self.ad} / {islem} {sure * 1000:.1f} ms")
+
+    def metrikler(self) -> Dict[str, Any]:
+        """
+        Kilit metriklerini dondurur.
+
+        Returns:
+            Dict[str, Any]: Okuma/yazma bazinda edinme, cekisme, bekleme ve tutma sureleri;
+            ayni anda en cok okuyucu sayisi ve islem bazinda yazma sureleri
+        """
+        with self._kosul:
+            kipler = {}
+            for kip, sayac in self._sayaclar.items():
+                edinme = sayac["edinme"]
+                kipler[kip] = {
+                    "edinme": edinme,
+                    "cekisme": sayac["cekisme"],
+                    "cekisme_orani": round(sayac["cekisme"] / edinme, 4) if edinme else 0.0,
+                    "toplam_bekleme_ms": round(sayac["toplam_bekleme"] * 1000, 3),
+                    "en_uzun_bekleme_ms": round(sayac["en_uzun_bekleme"] * 1000, 3),
+                    "ortalama_tutma_ms": round(sayac["toplam_tutma"] * 1000 / edinme, 3) if edinme else 0.0,
+                    "en_uzun_tutma_ms": round(sayac["en_uzun_tutma"] * 1000, 3)
+                }
+            return {
+                "ad": self.ad,
+                "baslangic": datetime.fromtimestamp(self._baslangic).isoformat(),
+                "sure": round(time.time() - self._baslangic, 3),
+                "okuma": kipler["okuma"],
+                "yazma": kipler["yazma"],
+                "en_cok_okuyucu": self._en_cok_okuyucu,
+                "aktif_okuyucu": self._okuyucu_sayisi,
+                "bekleyen_yazar": self._bekleyen_yazar,
+                "yazma_islemleri": {
+                    islem: {"sayi": kayit["sayi"],
+                            "ortalama_ms": round(kayit["toplam_sure"] * 1000 / kayit["sayi"], 3),
+                            "en_uzun_ms": round(kayit["en_uzun_sure"] * 1000, 3)}
+                    for islem, kayit in self._yazma_islemleri.items()
+                }
+            }
+
+
+def okuyucu(metot: Callable) -> Callable:
+    """Metot suresince self.kilit'in okuma kilidini tutan dekorator"""
+    @functools.wraps(metot)
+    def sarmalayici(self, *args, **kwargs):
+        with self.kilit.okuma():
+            return metot(self, *args, **kwargs)
+    return sarmalayici
@@ -40,60 +40,64 @@ class ZiyaretEklemeWorker(QRunnable):
 
 
 class SatisSilmeWorker(QRunnable):
-    def __init__(self, services, satis_index):
+    def __init__(self, services, satis_index, beklenen_surum: Optional[int] = None):
         super().__init__()
         self.services = services
         self.satis_index = satis_index
+        self.beklenen_surum = beklenen_surum  # Satır okunurken alınan sürüm; arada değiştiyse işlem reddedilir
         self.signals = WorkerSignals()
 
     def run(self):
         try:
-            self.services.data_manager.delete_sale(self.satis_index)
+            self.services.data_manager.delete_sale(self.satis_index, self.beklenen_surum)
             self.signals.tamamlandi.emit()
         except Exception as e:
             self.signals.hata.emit(f"Satış silme hatası: {str(e)}")
 
 
 class ZiyaretSilmeWorker(QRunnable):
-    def __init__(self, services, ziyaret_index):
+    def __init__(self, services, ziyaret_index, beklenen_surum: Optional[int] = None):
         super().__init__()
         self.services = services
         self.ziyaret_index = ziyaret_index
+        self.beklenen_surum = beklenen_surum
         self.signals = WorkerSignals()
 
     def run(self):
         try:
-            self.services.data_manager.delete_visit(self.ziyaret_index)
+            self.services.data_manager.delete_visit(self.ziyaret_index, self.beklenen_surum)
             self.signals.tamamlandi.emit()
         except Exception as e:
             self.signals.hata.emit(f"Ziyaret silme hatası: {str(e)}")
 
 class ZiyaretDuzenlemeWorker(QRunnable):
-    def __init__(self, services, row, yeni_bilgiler):
+    def __init__(self, services, row, yeni_bilgiler, beklenen_surum: Optional[int] = None):
         super().__init__()
         self.services = services
         self.row = row
         self.yeni_bilgiler = yeni_bilgiler
+        self.beklenen_surum = beklenen_surum
         self.signals = WorkerSignals()
 
     def run(self):
         try:
-            self.services.data_manager.update_visit(self.row, self.yeni_bilgiler)
+            self.services.data_manager.update_visit(self.row, self.yeni_bilgiler, self.beklenen_surum)
             self.signals.tamamlandi.emit()
         except Exception as e:
             self.signals.hata.emit(f"Ziyaret düzenleme hatası: {str(e)}")
 
 class SatisDuzenlemeWorker(QRunnable):
-    def __init__(self, services, row, yeni_bilgiler):
+    def __init__(self, services, row, yeni_bilgiler, beklenen_surum: Optional[int] = None):
         super().__init__()
         self.services = services
         self.row = row
         self.yeni_bilgiler = yeni_bilgiler
+        self.beklenen_surum = beklenen_surum
         self.signals = WorkerSignals()
 
     def run(self):
         try:
-            self.services.data_manager.update_sale(self.row, self.yeni_bilgiler)
+            self.services.data_manager.update_sale(self.row, self.yeni_bilgiler, self.beklenen_surum)
             self.signals.tamamlandi.emit()
         except Exception as e:
             self.signals.hata.emit(f"Satış düzenleme hatası: {str(e)}")
\ No newline at end of file
@@ -4,6 +4,7 @@ from typing import Dict, Any, List, Callable, Optional, Iterator
 from events import Event, EVENT_DATA_UPDATED, EVENT_ERROR_OCCURRED
 from decimal import Decimal, getcontext
 from decimal import InvalidOperation, DivisionByZero
+from frame_snapshots import paylasimli_kopya
 
 # Decimal hassasiyetini ayarla (28 basamak genellikle finansal işlemler için yeterlidir)
 getcontext().prec = 28
@@ -23,6 +24,7 @@ class SatisYoneticisi:
         self.repository = veri_yoneticisi.repository
         self.loglayici = veri_yoneticisi.loglayici
         self.event_manager = veri_yoneticisi.event_manager
+        self.kilit = veri_yoneticisi.kilit  # Cerceveler yazma kilidi altinda degistirilir, kayit kilit disinda yapilir
         
         # Veri tiplerini optimize et (Decimal ile)
         self._optimize_all_dataframes()
@@ -193,23 +195,28 @@ class SatisYoneticisi:
                 lambda row: float(self.hesapla_toplam_tutar(row['Miktar'], row['Birim Fiyat'])), axis=1
             )
         
-        if self._bos_df_kontrol(self.veri_yoneticisi.satislar_df, "Satışlar DataFrame'i boş, yeni veriyle başlatılıyor"):
-            self.veri_yoneticisi.satislar_df = satis_df
+        # Mevcut cerceve yerinde degistirilmez; yeni cerceve iyimser eszamanlilikla yayinlanir
+        self.veri_yoneticisi.cerceve_guncelle("sales", lambda df: self._satislari_birlestir(df, satis_df))
+        self.loglayici.info(f"Toplu satış ekleme tamamlandı: {len(satis_df)} satış eklendi")
+        if self.event_manager:
+            self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"type": "sales", "action": "bulk_add"}))
+
+    def _satislari_birlestir(self, df: Optional[pd.DataFrame], yeni_satislar_df: pd.DataFrame) -> pd.DataFrame:
+        """Yeni satirlari satislar cercevesinin kopyasina ekler (bkz. VeriYoneticisi.cerceve_guncelle)."""
+        if self._bos_df_kontrol(df, "Satışlar DataFrame'i boş, yeni veriyle başlatılıyor"):
+            df = yeni_satislar_df.copy()
         else:
-            self.veri_yoneticisi.satislar_df = pd.concat([self.veri_yoneticisi.satislar_df, satis_df], ignore_index=True)
-        
-        if 'Alt Musteri' not in self.veri_yoneticisi.satislar_df.columns:
-            self.veri_yoneticisi.satislar_df['Alt Musteri'] = pd.Series('', dtype='category')
-        
-        def on_save_finished(result):
-            if result["success"]:
-                self.loglayici.info(f"Toplu satış ekleme tamamlandı: {len(satis_df)} satış eklendi")
-                if self.event_manager:
-                    self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"type": "sales", "action": "bulk_add"}))
-            else:
-                self.loglayici.error(f"Kaydetme başarısız: {result.get('error', 'Bilinmeyen hata')}")
-        
-        self.repository.save(self.veri_yoneticisi.satislar_df, "sales", callback=on_save_finished)
+            # Kategorik sütunlarda yeni değerler için kategorileri güncelle
+            for col in yeni_satislar_df.columns:
+                if col in df.columns and hasattr(df[col], 'cat'):
+                    eksik = pd.Index(yeni_satislar_df[col].dropna().unique()).difference(df[col].cat.categories)
+                    if len(eksik):
+                        df[col] = df[col].cat.add_categories(eksik)
+            df = pd.concat([df, yeni_satislar_df], ignore_index=True)
+
+        if 'Alt Musteri' not in df.columns:
+            df['Alt Musteri'] = pd.Series('', dtype='category')
+        return df
             
 
     def satisci_ekle(self, yeni_satisci: Dict[str, Any]) -> None:
@@ -217,12 +224,13 @@ class SatisYoneticisi:
         yeni_satisci_df = pd.DataFrame([yeni_satisci])
         yeni_satisci_df = self._optimize_dataframe(yeni_satisci_df, 'sales_reps')
         
-        if self._bos_df_kontrol(self.veri_yoneticisi.satiscilar_df, "Satıcılar DataFrame'i boş, yeni veriyle başlatılıyor"):
-            self.veri_yoneticisi.satiscilar_df = yeni_satisci_df
-        else:
-            self.veri_yoneticisi.satiscilar_df = pd.concat([self.veri_yoneticisi.satiscilar_df, yeni_satisci_df], ignore_index=True)
+        with self.kilit.yazma("satisci_ekle"):
+            if self._bos_df_kontrol(self.veri_yoneticisi.satiscilar_df, "Satıcılar DataFrame'i boş, yeni veriyle başlatılıyor"):
+                self.veri_yoneticisi.satiscilar_df = yeni_satisci_df
+            else:
+                self.veri_yoneticisi.satiscilar_df = pd.concat([self.veri_yoneticisi.satiscilar_df, yeni_satisci_df], ignore_index=True)
         
-        self.repository.save(self.veri_yoneticisi.satiscilar_df, "sales_reps")
+        self.veri_yoneticisi.cerceveyi_kaydet("satiscilar_df", "sales_reps")
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "satisci_ekle"}))
 
@@ -230,20 +238,23 @@ class SatisYoneticisi:
         """Satıcıyı vektörel ve optimize şekilde günceller."""
         if 0 <= index < len(self.veri_yoneticisi.satiscilar_df):
             try:
-                # Kategorik sütunları kontrol et ve gerekirse kategorileri güncelle
-                for col, value in guncellenmis_satisci.items():
-                    if col in self.veri_yoneticisi.satiscilar_df.columns and hasattr(self.veri_yoneticisi.satiscilar_df[col], 'cat'):
-                        # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
-                        if value not in self.veri_yoneticisi.satiscilar_df[col].cat.categories:
-                            new_categories = self.veri_yoneticisi.satiscilar_df[col].cat.categories.tolist()
-                            new_categories.append(value)
-                            self.veri_yoneticisi.satiscilar_df[col] = self.veri_yoneticisi.satiscilar_df[col].cat.set_categories(new_categories)
-                            self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
+                with self.kilit.yazma("satisci_duzenle"):
+                    # Kopya duzenlenip yayinlanir; yerinde yazim cerceve surumunu artirmaz
+                    satiscilar_df = paylasimli_kopya(self.veri_yoneticisi.satiscilar_df)
+                    # Kategorik sütunları kontrol et ve gerekirse kategorileri güncelle
+                    for col, value in guncellenmis_satisci.items():
+                        if col in satiscilar_df.columns and hasattr(satiscilar_df[col], 'cat'):
+                            # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
+                            if value not in satiscilar_df[col].cat.categories:
+                                new_categories = satiscilar_df[col].cat.categories.tolist()
+                                new_categories.append(value)
+                                satiscilar_df[col] = satiscilar_df[col].cat.set_categories(new_categories)
+                                self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
                 
-                # Şimdi güncellemeyi yap
-                self.veri_yoneticisi.satiscilar_df.loc[index, list(guncellenmis_satisci.keys())] = list(guncellenmis_satisci.values())
-                self.veri_yoneticisi.satiscilar_df = self._optimize_dataframe(self.veri_yoneticisi.satiscilar_df, 'sales_reps')
-                self.repository.save(self.veri_yoneticisi.satiscilar_df, "sales_reps")
+                    # Şimdi güncellemeyi yap
+                    satiscilar_df.loc[index, list(guncellenmis_satisci.keys())] = list(guncellenmis_satisci.values())
+                    self.veri_yoneticisi.satiscilar_df = self._optimize_dataframe(satiscilar_df, 'sales_reps')
+                self.veri_yoneticisi.cerceveyi_kaydet("satiscilar_df", "sales_reps")
                 if self.event_manager:
                     self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "satisci_duzenle"}))
             except Exception as e:
@@ -255,10 +266,11 @@ class SatisYoneticisi:
     def satisci_sil(self, satisci_isim: str) -> None:
         """Satıcıyı vektörel şekilde siler."""
         if not self._bos_df_kontrol(self.veri_yoneticisi.satiscilar_df, "Satıcılar DataFrame'i boş"):
-            self.veri_yoneticisi.satiscilar_df = self.veri_yoneticisi.satiscilar_df[
-                self.veri_yoneticisi.satiscilar_df["Isim"] != satisci_isim
-            ]
-            self.repository.save(self.veri_yoneticisi.satiscilar_df, "sales_reps")
+            with self.kilit.yazma("satisci_sil"):
+                self.veri_yoneticisi.satiscilar_df = self.veri_yoneticisi.satiscilar_df[
+                    self.veri_yoneticisi.satiscilar_df["Isim"] != satisci_isim
+                    ]
+            self.veri_yoneticisi.cerceveyi_kaydet("satiscilar_df", "sales_reps")
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "satisci_sil"}))
 
@@ -267,23 +279,26 @@ class SatisYoneticisi:
         yeni_hedef_df = pd.DataFrame([yeni_hedef])
         yeni_hedef_df = self._optimize_dataframe(yeni_hedef_df, 'monthly_targets')
         
-        if self._bos_df_kontrol(self.veri_yoneticisi.hedefler_df, "Hedefler DataFrame'i boş, yeni veriyle başlatılıyor"):
-            self.veri_yoneticisi.hedefler_df = yeni_hedef_df
-        else:
-            self.veri_yoneticisi.hedefler_df = pd.concat([self.veri_yoneticisi.hedefler_df, yeni_hedef_df], ignore_index=True)
+        with self.kilit.yazma("satis_hedefi_ekle"):
+            if self._bos_df_kontrol(self.veri_yoneticisi.hedefler_df, "Hedefler DataFrame'i boş, yeni veriyle başlatılıyor"):
+                self.veri_yoneticisi.hedefler_df = yeni_hedef_df
+            else:
+                self.veri_yoneticisi.hedefler_df = pd.concat([self.veri_yoneticisi.hedefler_df, yeni_hedef_df], ignore_index=True)
         
-        self.veri_yoneticisi.aylik_hedefler_df = self.veri_yoneticisi.hedefler_df
-        self.repository.save(self.veri_yoneticisi.hedefler_df, "monthly_targets")
+            self.veri_yoneticisi.aylik_hedefler_df = self.veri_yoneticisi.hedefler_df
+        self.veri_yoneticisi.cerceveyi_kaydet("hedefler_df", "monthly_targets")
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "satis_hedefi_ekle", "table": "monthly_targets"}))
 
     def satis_hedefi_duzenle(self, index: int, yeni_hedef: Dict[str, Any]) -> None:
         """Satış hedefini vektörel ve optimize şekilde günceller (Decimal ile)."""
         if 0 <= index < len(self.veri_yoneticisi.hedefler_df):
-            self.veri_yoneticisi.hedefler_df.loc[index, list(yeni_hedef.keys())] = list(yeni_hedef.values())
-            self.veri_yoneticisi.hedefler_df = self._optimize_dataframe(self.veri_yoneticisi.hedefler_df, 'monthly_targets')
-            self.veri_yoneticisi.aylik_hedefler_df = self.veri_yoneticisi.hedefler_df
-            self.repository.save(self.veri_yoneticisi.hedefler_df, "monthly_targets")
+            with self.kilit.yazma("satis_hedefi_duzenle"):
+                hedefler_df = paylasimli_kopya(self.veri_yoneticisi.hedefler_df)
+                hedefler_df.loc[index, list(yeni_hedef.keys())] = list(yeni_hedef.values())
+                self.veri_yoneticisi.hedefler_df = self._optimize_dataframe(hedefler_df, 'monthly_targets')
+                self.veri_yoneticisi.aylik_hedefler_df = self.veri_yoneticisi.hedefler_df
+            self.veri_yoneticisi.cerceveyi_kaydet("hedefler_df", "monthly_targets")
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "satis_hedefi_duzenle", "table": "monthly_targets"}))
 
@@ -291,11 +306,12 @@ class SatisYoneticisi:
         """Satış hedefini vektörel şekilde siler."""
         if not self._bos_df_kontrol(self.veri_yoneticisi.hedefler_df, "Hedefler DataFrame'i boş"):
             ay = f"{int(ay.split('-')[0]):02d}-{ay.split('-')[1]}" if '-' in ay else ay
-            self.veri_yoneticisi.hedefler_df = self.veri_yoneticisi.hedefler_df[
-                self.veri_yoneticisi.hedefler_df["Ay"] != ay
-            ]
-            self.veri_yoneticisi.aylik_hedefler_df = self.veri_yoneticisi.hedefler_df
-            self.repository.save(self.veri_yoneticisi.hedefler_df, "monthly_targets")
+            with self.kilit.yazma("satis_hedefi_sil"):
+                self.veri_yoneticisi.hedefler_df = self.veri_yoneticisi.hedefler_df[
+                    self.veri_yoneticisi.hedefler_df["Ay"] != ay
+                ]
+                self.veri_yoneticisi.aylik_hedefler_df = self.veri_yoneticisi.hedefler_df
+            self.veri_yoneticisi.cerceveyi_kaydet("hedefler_df", "monthly_targets")
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "satis_hedefi_sil", "table": "monthly_targets"}))
 
@@ -308,26 +324,6 @@ class SatisYoneticisi:
             # DataFrame oluştur
             yeni_satis_df = pd.DataFrame([yeni_satis])
             
-            # Kategorik sütunları kontrol et ve gerekirse kategorileri güncelle
-            if not self._bos_df_kontrol(self.veri_yoneticisi.satislar_df, "Satışlar DataFrame'i boş, yeni veriyle başlatılıyor"):
-                for col, value in yeni_satis.items():
-                    if col in self.veri_yoneticisi.satislar_df.columns and hasattr(self.veri_yoneticisi.satislar_df[col], 'cat'):
-                        try:
-                            # None veya NaN değerleri kontrol et
-                            if pd.isna(value):
-                                continue
-                                
-                            # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
-                            if value not in self.veri_yoneticisi.satislar_df[col].cat.categories:
-                                new_categories = self.veri_yoneticisi.satislar_df[col].cat.categories.tolist()
-                                new_categories.append(value)
-                                self.veri_yoneticisi.satislar_df[col] = self.veri_yoneticisi.satislar_df[col].cat.set_categories(new_categories)
-                                self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
-                        except Exception as cat_error:
-                            self.loglayici.error(f"Kategori güncelleme hatası ({col}): {str(cat_error)}")
-                            if self.event_manager:
-                                self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": f"Kategori güncelleme hatası ({col}): {str(cat_error)}"}))
-            
             # DataFrame'i optimize et
             try:
                 yeni_satis_df = self._optimize_dataframe(yeni_satis_df, 'sales')
@@ -349,25 +345,9 @@ class SatisYoneticisi:
                     self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": f"Toplam tutar hesaplama hatası: {str(calc_error)}"}))
                 # Toplam tutar hesaplanamasa bile devam et
             
-            # DataFrame'i birleştir veya yeni oluştur
-            if self._bos_df_kontrol(self.veri_yoneticisi.satislar_df, "Satışlar DataFrame'i boş, yeni veriyle başlatılıyor"):
-                self.veri_yoneticisi.satislar_df = yeni_satis_df
-            else:
-                try:
-                    self.veri_yoneticisi.satislar_df = pd.concat([self.veri_yoneticisi.satislar_df, yeni_satis_df], ignore_index=True)
-                except Exception as concat_error:
-                    self.loglayici.error(f"DataFrame birleştirme hatası: {str(concat_error)}")
-                    if self.event_manager:
-                        self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": f"DataFrame birleştirme hatası: {str(concat_error)}"}))
-                    raise
-            
-            # Alt Müşteri sütunu kontrolü
-            if 'Alt Musteri' not in self.veri_yoneticisi.satislar_df.columns:
-                self.veri_yoneticisi.satislar_df['Alt Musteri'] = pd.Series('', dtype='category')
-            
-            # Veritabanına kaydet
+            # DataFrame'i birleştir ve veritabanına kaydet; kategoriler mevcut cercevenin kopyasinda guncellenir
             try:
-                self.repository.save(self.veri_yoneticisi.satislar_df, "sales")
+                self.veri_yoneticisi.cerceve_guncelle("sales", lambda df: self._satislari_birlestir(df, yeni_satis_df))
                 self.loglayici.info(f"Satış başarıyla kaydedildi: {yeni_satis.get('Ana Musteri', 'Bilinmeyen')} - {yeni_satis.get('Ay', 'Bilinmeyen')}")
             except Exception as save_error:
                 self.loglayici.error(f"Veritabanına kaydetme hatası: {str(save_error)}")
@@ -390,22 +370,25 @@ class SatisYoneticisi:
         yeni_firsat_df = pd.DataFrame([yeni_firsat])
         yeni_firsat_df = self._optimize_dataframe(yeni_firsat_df, 'pipeline')
         
-        if self._bos_df_kontrol(self.veri_yoneticisi.pipeline_df, "Pipeline DataFrame'i boş, yeni veriyle başlatılıyor"):
-            self.veri_yoneticisi.pipeline_df = yeni_firsat_df
-        else:
-            self.veri_yoneticisi.pipeline_df = pd.concat([self.veri_yoneticisi.pipeline_df, yeni_firsat_df], ignore_index=True)
+        with self.kilit.yazma("pipeline_firsati_ekle"):
+            if self._bos_df_kontrol(self.veri_yoneticisi.pipeline_df, "Pipeline DataFrame'i boş, yeni veriyle başlatılıyor"):
+                self.veri_yoneticisi.pipeline_df = yeni_firsat_df
+            else:
+                self.veri_yoneticisi.pipeline_df = pd.concat([self.veri_yoneticisi.pipeline_df, yeni_firsat_df], ignore_index=True)
         
-        self.repository.save(self.veri_yoneticisi.pipeline_df, "pipeline")
+        self.veri_yoneticisi.cerceveyi_kaydet("pipeline_df", "pipeline")
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "pipeline_firsati_ekle"}))
 
     def pipeline_firsati_sil(self, musteri_adi: str) -> None:
         """Pipeline fırsatını vektörel şekilde siler."""
         if not self._bos_df_kontrol(self.veri_yoneticisi.pipeline_df, "Pipeline DataFrame'i boş"):
-            self.veri_yoneticisi.pipeline_df = self.veri_yoneticisi.pipeline_df[
-                self.veri_yoneticisi.pipeline_df["Musteri Adi"] != musteri_adi
-            ]
-            self.repository.save(self.veri_yoneticisi.pipeline_df, "pipeline")
+            with self.kilit.yazma("pipeline_firsati_sil"):
+                # Indeks sifirlanir; duzenleme indeksleri tablodaki satir sirasiyla eslesir
+                self.veri_yoneticisi.pipeline_df = self.veri_yoneticisi.pipeline_df[
+                    self.veri_yoneticisi.pipeline_df["Musteri Adi"] != musteri_adi
+                ].reset_index(drop=True)
+            self.veri_yoneticisi.cerceveyi_kaydet("pipeline_df", "pipeline")
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "pipeline_firsati_sil"}))
 
@@ -413,20 +396,23 @@ class SatisYoneticisi:
         """Pipeline fırsatını vektörel ve optimize şekilde günceller (Decimal ile)."""
         if 0 <= index < len(self.veri_yoneticisi.pipeline_df):
             try:
-                # Kategorik sütunları kontrol et ve gerekirse kategorileri güncelle
-                for col, value in guncellenmis_firsat.items():
-                    if col in self.veri_yoneticisi.pipeline_df.columns and hasattr(self.veri_yoneticisi.pipeline_df[col], 'cat'):
-                        # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
-                        if value not in self.veri_yoneticisi.pipeline_df[col].cat.categories:
-                            new_categories = self.veri_yoneticisi.pipeline_df[col].cat.categories.tolist()
-                            new_categories.append(value)
-                            self.veri_yoneticisi.pipeline_df[col] = self.veri_yoneticisi.pipeline_df[col].cat.set_categories(new_categories)
-                            self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
+                with self.kilit.yazma("pipeline_firsati_duzenle"):
+                    # Kopya duzenlenip yayinlanir; yerinde yazim cerceve surumunu artirmaz
+                    pipeline_df = paylasimli_kopya(self.veri_yoneticisi.pipeline_df)
+                    # Kategorik sütunları kontrol et ve gerekirse kategorileri güncelle
+                    for col, value in guncellenmis_firsat.items():
+                        if col in pipeline_df.columns and hasattr(pipeline_df[col], 'cat'):
+                            # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
+                            if value not in pipeline_df[col].cat.categories:
+                                new_categories = pipeline_df[col].cat.categories.tolist()
+                                new_categories.append(value)
+                                pipeline_df[col] = pipeline_df[col].cat.set_categories(new_categories)
+                                self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
                 
-                # Şimdi güncellemeyi yap
-                self.veri_yoneticisi.pipeline_df.loc[index, list(guncellenmis_firsat.keys())] = list(guncellenmis_firsat.values())
-                self.veri_yoneticisi.pipeline_df = self._optimize_dataframe(self.veri_yoneticisi.pipeline_df, 'pipeline')
-                self.repository.save(self.veri_yoneticisi.pipeline_df, "pipeline")
+                    # Şimdi güncellemeyi yap
+                    pipeline_df.loc[index, list(guncellenmis_firsat.keys())] = list(guncellenmis_firsat.values())
+                    self.veri_yoneticisi.pipeline_df = self._optimize_dataframe(pipeline_df, 'pipeline')
+                self.veri_yoneticisi.cerceveyi_kaydet("pipeline_df", "pipeline")
                 if self.event_manager:
                     self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "pipeline_firsati_duzenle"}))
             except Exception as e:
@@ -1,5 +1,6 @@
 ﻿# -*- coding: utf-8 -*-
 from typing import Dict, Optional, List
+from concurrent.futures import Future
 import pandas as pd
 from datetime import datetime
 import matplotlib.pyplot as plt
@@ -125,7 +126,40 @@ class ServiceInterface:
                 baslangic_tarihi=baslangic_tarihi,
                 bitis_tarihi=bitis_tarihi
             )
+            return self._kohort_raporunu_kaydet(kohort_analizi)
             
+        except Exception as e:
+            return self._kohort_raporu_hatasi(e)
+
+    def submit_kohort_report(self, baslangic_tarihi=None, bitis_tarihi=None) -> Future:
+        """
+        Kohort analizi raporunu beklemeden olusturur (Qt ana thread'inden cagrilabilir).
+        
+        Args:
+            baslangic_tarihi (str, optional): 'YYYY-MM-DD' formatinda baslangic tarihi
+            bitis_tarihi (str, optional): 'YYYY-MM-DD' formatinda bitis tarihi
+            
+        Returns:
+            Future: generate_kohort_report ile ayni sozlugu tasiyan Future; geri cagrilar
+            hesabi bitiren thread'de calisir, arayuz isleri ana_thread_gonder ile tasinmalidir
+        """
+        rapor: Future = Future()
+        
+        def bitti(f: Future) -> None:
+            try:
+                rapor.set_result(self._kohort_raporunu_kaydet(f.result()))
+            except Exception as e:
+                rapor.set_result(self._kohort_raporu_hatasi(e))
+        
+        self.data_manager.kohort_analizi_gonder(
+            baslangic_tarihi=baslangic_tarihi,
+            bitis_tarihi=bitis_tarihi
+        ).add_done_callback(bitti)
+        return rapor
+
+    def _kohort_raporunu_kaydet(self, kohort_analizi: Dict) -> Dict:
+        """Kohort analizi sonucundan HTML rapor dosyasini yazar ve rapor sozlugunu dondurur"""
+        try:
             if not kohort_analizi.get("success", False):
                 self.logger.error(f"Kohort analizi olusturulamadi: {kohort_analizi.get('message', 'Bilinmeyen hata')}")
                 return {"success": False, "message": kohort_analizi.get("message", "Kohort analizi olusturulamadi.")}
@@ -150,10 +184,13 @@ class ServiceInterface:
             }
             
         except Exception as e:
-            self.logger.error(f"Kohort raporu olusturulurken hata: {str(e)}")
-            import traceback
-            self.logger.error(traceback.format_exc())
-            return {"success": False, "message": f"Kohort raporu olusturulurken hata: {str(e)}"}
+            return self._kohort_raporu_hatasi(e)
+
+    def _kohort_raporu_hatasi(self, e: Exception) -> Dict:
+        self.logger.error(f"Kohort raporu olusturulurken hata: {str(e)}")
+        import traceback
+        self.logger.error(traceback.format_exc())
+        return {"success": False, "message": f"Kohort raporu olusturulurken hata: {str(e)}"}
 
     def calculate_all_product_weights(self) -> None:
         """Tum urunlerin agirliklarini hesaplar (sadece oluklu mukavva hammaddeler)"""
@@ -171,8 +208,8 @@ class ServiceInterface:
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"table": "urun_bom"}))
 
-    def update_sale(self, row: int, sale: Dict) -> None:
-        """Bir satışı günceller"""
+    def update_sale(self, row: int, sale: Dict, beklenen_surum: Optional[int] = None) -> None:
+        """Bir satışı günceller (beklenen_surum: satirin okundugu andaki surumu, bkz. VeriYoneticisi.satir_surumu)"""
         errors = []
         required_fields = ["Ana Musteri", "Satis Temsilcisi", "Ay", "Satis Miktari", "Para Birimi"]
         for field in required_fields:
@@ -182,11 +219,11 @@ class ServiceInterface:
         if errors:
             raise ValueError("; ".join(errors))
         
-        self.data_manager.update_sale(row, sale)
+        self.data_manager.update_sale(row, sale, beklenen_surum)
         self.logger.info(f"Satis guncellendi: {sale['Ana Musteri']} - {sale.get('Ay', 'Bilinmiyor')}")
     
-    def update_visit(self, row: int, visit: Dict) -> None:
-        """Bir ziyareti günceller"""
+    def update_visit(self, row: int, visit: Dict, beklenen_surum: Optional[int] = None) -> None:
+        """Bir ziyareti günceller (beklenen_surum icin bkz. update_sale)"""
         errors = []
         required_fields = ["Musteri Adi", "Satis Temsilcisi", "Tarih", "Ziyaret Konusu"]
         for field in required_fields:
@@ -196,7 +233,7 @@ class ServiceInterface:
         if errors:
             raise ValueError("; ".join(errors))
         
-        self.data_manager.update_visit(row, visit)
+        self.data_manager.update_visit(row, visit, beklenen_surum)
         self.logger.info(f"Ziyaret guncellendi: {visit['Musteri Adi']} - {visit.get('Tarih', 'Bilinmiyor')}")
 
 class CRMServices(ServiceInterface):
@@ -483,8 +520,8 @@ class CRMServices(ServiceInterface):
         """Bir pipeline firsatini gunceller"""
         try:
             if self.data_manager.pipeline_df is not None and not self.data_manager.pipeline_df.empty and index < len(self.data_manager.pipeline_df):
-                self.data_manager.pipeline_df.iloc[index] = pd.Series(opportunity)
-                self.data_manager.repository.save(self.data_manager.pipeline_df, "pipeline")
+                # Cerceve yazma kilidi altinda degistirilir ve kilit disinda kaydedilir
+                self.data_manager.pipeline_firsati_duzenle(index, opportunity)
                 self.logger.info(f"Pipeline firsati guncellendi: {opportunity['Musteri Adi']}")
             else:
                 raise ValueError("Pipeline verisi bos veya indeks gecersiz")
@@ -492,6 +529,12 @@ class CRMServices(ServiceInterface):
             self.logger.error(f"Pipeline guncelleme hatasi: {str(e)}")
             raise
 
+    def rename_dimension(self, boyut: str, eski: str, yeni: str) -> int:
+        """Musteri, temsilci, urun veya hammadde adini tum tablolarda ve cercevelerde degistirir"""
+        guncellenen = self.data_manager.boyut_yeniden_adlandir(boyut, eski, yeni)
+        self.logger.info(f"{boyut} adi degistirildi: {eski} -> {yeni}")
+        return guncellenen
+
     def add_complaint(self, complaint: Dict) -> None:
         """Yeni bir sikayet ekler"""
         self.data_manager.sikayet_ekle(complaint)
@@ -1,12 +1,17 @@
 ﻿import os
 from typing import Dict, Any, Optional
-from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 from dotenv import load_dotenv
 import logging
+import pandas as pd
 from events import Event, EventManager
+from batch_crypto import BatchCryptoEngine
+from blind_index import BlindIndex, kor_sutun
+from key_rotation import AnahtarHalkasi
+from backup_stream import BackupStreamCipher
+from change_capture import KAYIT_ANAHTARLARI
 
 class SifrelemeYoneticisi:
     """
@@ -17,13 +22,16 @@ class SifrelemeYoneticisi:
     
     Attributes:
         HASSAS_ALANLAR (Dict): Hangi tablolardaki hangi alanlarin sifrelenmesi gerektigini belirtir
+            (repository tablo adi -> sutun adlari)
     """
     
+    # Kisisel iletisim bilgisi tasiyan sutunlar. customers ve sales tablolarinda kisisel veri
+    # sutunu yoktur; kayit anahtari ve boyut sutunlari (Musteri Adi, Isim...) esitlik ve
+    # birlestirme icin acik kalir. Uzun not sutunlari (Sikayet Detayi, Notlar) text_compression
+    # ile sikistirilir; sifreli metin sikismadigi icin bu listeye alinmaz.
     HASSAS_ALANLAR = {
-        "musteriler": ["tc_kimlik", "vergi_no", "telefon", "email"],
-        "satislar": ["kredi_karti_no", "musteri_notu"],
-        "sikayetler": ["musteri_bilgileri"],
-        "ziyaretler": ["gorusme_notlari"]
+        "sales_reps": ["E-posta", "Telefon"],
+        "pipeline": ["Iletisim Kisi", "Telefon", "E-posta"]
     }
     
     def __init__(self, loglayici: Optional[logging.Logger] = None, event_manager: Optional[EventManager] = None):
@@ -37,9 +45,23 @@ class SifrelemeYoneticisi:
         self.loglayici = loglayici or logging.getLogger(__name__)
         self.event_manager = event_manager
         
-        # Sifreleme anahtarini olustur veya yukle
-        self.anahtar = self._anahtar_yukle_veya_olustur()
-        self.fernet = Fernet(self.anahtar)
+        # Sifreleme anahtarini olustur veya yukle; anahtarlar surumlu halkada tutulur
+        anahtar_dosyasi = os.getenv("SIFRELEME_ANAHTAR_DOSYASI", "sifreleme.key")
+        self.anahtarlik = AnahtarHalkasi(
+            os.getenv("SIFRELEME_ANAHTARLIK_DOSYASI", f"{os.path.splitext(anahtar_dosyasi)[0]}_anahtarlik.json"),
+            self._anahtar_yukle_veya_olustur(), self.loglayici)
+        # Kor indeks gibi dondurmeden etkilenmemesi gereken turetmeler ilk anahtari kullanir
+        self.anahtar = self.anahtarlik.ilk_anahtar
+        self.fernet = self.anahtarlik
+        
+        # Yedekler bellege alinmadan parca parca sikistirilip sifrelenir
+        self.yedek_akisi = BackupStreamCipher(self.fernet, self.loglayici)
+        
+        # Sutunlari parcalar halinde paralel sifreleyen ve degismeyen satirlari atlayan motor
+        self.toplu_motor = BatchCryptoEngine(self.fernet, self.loglayici, anahtar_sutunlari=KAYIT_ANAHTARLARI)
+        
+        # Sifreli alanlarda indeksli esitlik aramasi icin anahtarli HMAC ozetleri
+        self.kor_indeks = BlindIndex(self.anahtar, self.loglayici)
         
     def _anahtar_yukle_veya_olustur(self) -> bytes:
         """Sifreleme anahtarini yukler veya yeni bir anahtar olusturur"""
@@ -65,6 +87,16 @@ class SifrelemeYoneticisi:
         
         return anahtar
     
+    def anahtar_dondur(self) -> int:
+        """
+        Yeni anahtar uretip aktif yapar. Yeni yazmalar hemen yeni anahtarla sifrelenir;
+        eski metinler okunabilir kalir ve KeyRotationJob ile arka planda tasinir.
+        
+        Returns:
+            int: Yeni anahtarin kimligi
+        """
+        return self.anahtarlik.yeni_anahtar()
+    
     def sifrele(self, veri: str) -> str:
         """Veriyi sifreler"""
         try:
@@ -91,34 +123,82 @@ class SifrelemeYoneticisi:
                 }))
             raise
     
+    def sifreli_mi(self, deger: Any) -> bool:
+        """Degerin anahtar halkasindaki bir anahtarla cozulebilen sifreli metin olup olmadigini dondurur"""
+        try:
+            self.fernet.decrypt(str(deger).encode())
+            return True
+        except Exception:
+            return False
+    
     def veri_cercevesi_sifrele(self, df, tablo_adi: str):
-        """Veri cercevesindeki hassas alanlari sifreler"""
-        if tablo_adi in self.HASSAS_ALANLAR:
-            for alan in self.HASSAS_ALANLAR[tablo_adi]:
-                if alan in df.columns:
-                    df[alan] = df[alan].apply(lambda x: self.sifrele(str(x)) if pd.notna(x) else x)
-        return df
+        """Veri cercevesindeki hassas alanlari toplu olarak sifreler ve kor indekslerini ekler"""
+        alanlar = [alan for alan in self.HASSAS_ALANLAR.get(tablo_adi, []) if alan in df.columns]
+        if not alanlar:
+            return df
+        try:
+            # Kor indeks acik degerden hesaplanir; tembel hucreler bir kopyada toplu cozulur,
+            # SifreliMetin hucreleri ise degismeyen satir atlamasi icin yerinde kalir
+            acik_df = self.kor_indeks.cerceve_indeksle(self.toplu_motor.tembel_hucreleri_ac(df, alanlar), alanlar)
+            for alan in alanlar:
+                df[kor_sutun(alan)] = acik_df[kor_sutun(alan)]
+            return self.toplu_motor.cerceve_sifrele(df, tablo_adi, alanlar)
+        except Exception as e:
+            self.loglayici.error(f"Sifreleme hatasi: {str(e)}")
+            if self.event_manager:
+                self.event_manager.emit(Event("error_occurred", {
+                    "error": "ENCRYPTION_001",
+                    "message": "Veri sifreleme hatasi"
+                }))
+            raise
     
     def veri_cercevesi_sifre_coz(self, df, tablo_adi: str):
-        """Veri cercevesindeki sifreli alanlarin sifresini cozer"""
-        if tablo_adi in self.HASSAS_ALANLAR:
-            for alan in self.HASSAS_ALANLAR[tablo_adi]:
-                if alan in df.columns:
-                    df[alan] = df[alan].apply(lambda x: self.sifre_coz(str(x)) if pd.notna(x) else x)
-        return df
+        """Veri cercevesindeki sifreli alanlarin sifresini toplu olarak cozer"""
+        alanlar = [alan for alan in self.HASSAS_ALANLAR.get(tablo_adi, []) if alan in df.columns]
+        if not alanlar:
+            return df
+        df = self.kor_indeks.sutunlari_ayikla(df)
+        try:
+            return self.toplu_motor.cerceve_sifre_coz(df, tablo_adi, alanlar)
+        except Exception as e:
+            self.loglayici.error(f"Sifre cozme hatasi: {str(e)}")
+            if self.event_manager:
+                self.event_manager.emit(Event("error_occurred", {
+                    "error": "ENCRYPTION_002",
+                    "message": "Sifre cozme hatasi"
+                }))
+            raise
+    
+    def veri_cercevesi_tembel_coz(self, df, tablo_adi: str):
+        """Hassas alanlari SifreliMetin nesnelerine cevirir; sifre hucre okundugunda cozulur"""
+        alanlar = [alan for alan in self.HASSAS_ALANLAR.get(tablo_adi, []) if alan in df.columns]
+        if not alanlar:
+            return df
+        df = self.kor_indeks.sutunlari_ayikla(df)
+        return self.toplu_motor.cerceve_tembel_coz(df, alanlar)
+    
+    def tembel_hucreleri_ac(self, df, tablo_adi: str):
+        """Cercevedeki SifreliMetin hucreleri toplu cozulmus bir kopya dondurur; girdi degismez"""
+        alanlar = [alan for alan in self.HASSAS_ALANLAR.get(tablo_adi, []) if alan in df.columns]
+        if not alanlar:
+            return df
+        return self.toplu_motor.tembel_hucreleri_ac(df, alanlar)
+    
+    def guncelleme_sifrele(self, guncellemeler: Dict[str, Any], tablo_adi: str) -> Dict[str, Any]:
+        """Tekil guncellemelerdeki hassas alanlari sifreler ve kor indekslerini ekler"""
+        sonuc = dict(guncellemeler)
+        for alan in self.HASSAS_ALANLAR.get(tablo_adi, []):
+            if alan in guncellemeler:
+                deger = guncellemeler[alan]
+                sonuc[kor_sutun(alan)] = self.kor_indeks.ozet(deger)
+                sonuc[alan] = self.sifrele(str(deger)) if pd.notna(deger) else deger
+        return sonuc
     
     def yedekleme_sifrele(self, dosya_yolu: str) -> str:
-        """Yedekleme dosyasini sifreler"""
+        """Yedekleme dosyasini sabit bellekle (akisli) sikistirip sifreler"""
         try:
-            with open(dosya_yolu, 'rb') as f:
-                veri = f.read()
-            
-            sifreli_veri = self.fernet.encrypt(veri)
             sifreli_dosya = f"{dosya_yolu}.encrypted"
-            
-            with open(sifreli_dosya, 'wb') as f:
-                f.write(sifreli_veri)
-                
+            self.yedek_akisi.sifrele(dosya_yolu, sifreli_dosya)
             return sifreli_dosya
         except Exception as e:
             self.loglayici.error(f"Yedekleme sifreleme hatasi: {str(e)}")
@@ -132,11 +212,16 @@ class SifrelemeYoneticisi:
     def yedekleme_sifre_coz(self, sifreli_dosya: str) -> str:
         """Sifreli yedekleme dosyasinin sifresini cozer"""
         try:
+            cozulmus_dosya = sifreli_dosya.replace('.encrypted', '')
+            if self.yedek_akisi.akisli_mi(sifreli_dosya):
+                self.yedek_akisi.coz(sifreli_dosya, cozulmus_dosya)
+                return cozulmus_dosya
+            
+            # Akisli bicimden onceki yedekler tek Fernet jetonudur
             with open(sifreli_dosya, 'rb') as f:
                 sifreli_veri = f.read()
             
             veri = self.fernet.decrypt(sifreli_veri)
-            cozulmus_dosya = sifreli_dosya.replace('.encrypted', '')
             
             with open(cozulmus_dosya, 'wb') as f:
                 f.write(veri)
@@ -6,6 +6,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout,
 from PyQt6.QtCore import Qt, QDate
 from PyQt6.QtGui import QIcon
 from events import Event
+from main_thread import ana_thread_gonder
 import pandas as pd
 from typing import Optional, List, Dict, Any
 
@@ -75,7 +76,7 @@ class SikayetYonetimi:
     def sikayet_tablosu_guncelle(self):
         """Sikayet tablosunu gunceller"""
         try:
-            sikayet_df = self.services.data_manager.sikayetler_df
+            sikayet_df = self.services.data_manager.goruntu_al().sikayetler_df  # Tablo kilit tutmadan goruntuden doldurulur
             
             self.sikayet_tablosu.setRowCount(0)
             
@@ -247,8 +248,7 @@ class SikayetYonetimi:
                     else:
                         # Thread pool yoksa normal sekilde guncelle
                         # Sikayet guncelleme islemi
-                        self.services.data_manager.sikayetler_df.iloc[row] = pd.Series(guncellenmis_sikayet)
-                        self.services.data_manager.repository.save(self.services.data_manager.sikayetler_df, "complaints")
+                        self.services.data_manager.sikayet_duzenle(row, guncellenmis_sikayet)
                         
                         self.sikayet_tablosu_guncelle()
                         dialog.accept()
@@ -294,8 +294,7 @@ class SikayetYonetimi:
                 else:
                     # Thread pool yoksa normal sekilde sil
                     # Sikayet silme islemi
-                    self.services.data_manager.sikayetler_df = self.services.data_manager.sikayetler_df.drop(row).reset_index(drop=True)
-                    self.services.data_manager.repository.save(self.services.data_manager.sikayetler_df, "complaints")
+                    self.services.data_manager.sikayet_sil(row)
                     
                     self.sikayet_tablosu_guncelle()
                     
@@ -317,20 +316,11 @@ class SikayetYonetimi:
             self.services.add_complaint(yeni_sikayet)
             
             # UI guncellemesi icin ana thread'e geri don
-            from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-            QMetaObject.invokeMethod(self, "_sikayet_ekleme_tamamlandi", 
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(bool, True),
-                                    Q_ARG(object, dialog))
+            ana_thread_gonder(self._sikayet_ekleme_tamamlandi, True, dialog)
         except Exception as e:
             self.loglayici.error(f"Sikayet ekleme thread hatasi: {str(e)}")
             # Hata durumunda ana thread'e geri don
-            from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-            QMetaObject.invokeMethod(self, "_sikayet_ekleme_tamamlandi", 
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(bool, False),
-                                    Q_ARG(object, dialog),
-                                    Q_ARG(str, str(e)))
+            ana_thread_gonder(self._sikayet_ekleme_tamamlandi, False, dialog, hata_mesaji=str(e))
     
     def _sikayet_ekleme_tamamlandi(self, basarili, dialog, hata_mesaji=None):
         """
@@ -357,26 +347,15 @@ class SikayetYonetimi:
             dialog: Kapatilacak dialog
         """
         try:
-            # Sikayet guncelleme islemi
-            self.services.data_manager.sikayetler_df.iloc[row] = pd.Series(guncellenmis_sikayet)
-            self.services.data_manager.repository.save(self.services.data_manager.sikayetler_df, "complaints")
+            # Sikayet guncelleme islemi (yazma kilidi altinda, bkz. MusteriYoneticisi.sikayet_duzenle)
+            self.services.data_manager.sikayet_duzenle(row, guncellenmis_sikayet)
             
             # UI guncellemesi icin ana thread'e geri don
-            from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-            QMetaObject.invokeMethod(self, "_sikayet_guncelleme_tamamlandi", 
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(bool, True),
-                                    Q_ARG(object, dialog),
-                                    Q_ARG(dict, guncellenmis_sikayet))
+            ana_thread_gonder(self._sikayet_guncelleme_tamamlandi, True, dialog, guncellenmis_sikayet)
         except Exception as e:
             self.loglayici.error(f"Sikayet guncelleme thread hatasi: {str(e)}")
             # Hata durumunda ana thread'e geri don
-            from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-            QMetaObject.invokeMethod(self, "_sikayet_guncelleme_tamamlandi", 
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(bool, False),
-                                    Q_ARG(object, dialog),
-                                    Q_ARG(str, str(e)))
+            ana_thread_gonder(self._sikayet_guncelleme_tamamlandi, False, dialog, hata_mesaji=str(e))
     
     def _sikayet_guncelleme_tamamlandi(self, basarili, dialog, guncellenmis_sikayet=None, hata_mesaji=None):
         """
@@ -406,25 +385,15 @@ class SikayetYonetimi:
             sikayet_turu: Silinecek sikayetin turu
         """
         try:
-            # Sikayet silme islemi
-            self.services.data_manager.sikayetler_df = self.services.data_manager.sikayetler_df.drop(row).reset_index(drop=True)
-            self.services.data_manager.repository.save(self.services.data_manager.sikayetler_df, "complaints")
+            # Sikayet silme islemi (yazma kilidi altinda, bkz. MusteriYoneticisi.sikayet_sil)
+            self.services.data_manager.sikayet_sil(row)
             
             # UI guncellemesi icin ana thread'e geri don
-            from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-            QMetaObject.invokeMethod(self, "_sikayet_silme_tamamlandi", 
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(bool, True),
-                                    Q_ARG(str, musteri_adi),
-                                    Q_ARG(str, sikayet_turu))
+            ana_thread_gonder(self._sikayet_silme_tamamlandi, True, musteri_adi, sikayet_turu)
         except Exception as e:
             self.loglayici.error(f"Sikayet silme thread hatasi: {str(e)}")
             # Hata durumunda ana thread'e geri don
-            from PyQt6.QtCore import QMetaObject, Qt, Q_ARG
-            QMetaObject.invokeMethod(self, "_sikayet_silme_tamamlandi", 
-                                    Qt.ConnectionType.QueuedConnection,
-                                    Q_ARG(bool, False),
-                                    Q_ARG(str, str(e)))
+            ana_thread_gonder(self._sikayet_silme_tamamlandi, False, hata_mesaji=str(e))
     
     def _sikayet_silme_tamamlandi(self, basarili, musteri_adi=None, sikayet_turu=None, hata_mesaji=None):
         """
@@ -0,0 +1,297 @@
+# -*- coding: utf-8 -*-
+"""
+Subeler arasi senkronizasyon modulu.
+
+Her sube kendi SQLite dosyasinda calisir. SyncEngine yerel cdc_log kayitlarini paketler
+halinde disa aktarir, diger subelerin paketlerini uygular ve cakismalari kaydeder.
+Paketler ortak bir klasor (SharedFolderTransport) veya ileride bir sunucunun yerini
+alacak yerel uc nokta (LocalEndpoint) uzerinden tasinir; yalnizca degisen satirlar aktarilir.
+
+Cakisma: uzak degisikligin dayandigi satir ozeti (onceki_ozet) yereldeki guncel ozetle
+eslesmiyorsa, yerel satir zaten uzak sonuca esit degilse ve uzak sonuc yerelde daha once
+gorulmus (asilmis) bir surum degilse degisiklik cakisma sayilir.
+"""
+
+import os
+import gzip
+import json
+import uuid
+import logging
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Iterable
+import pandas as pd
+from events import Event, EVENT_DATA_UPDATED, EVENT_ERROR_OCCURRED
+from change_capture import satirlari_hazirla, sayisal_turleri_uygula, cerceve_turleri, ISLEM_SIL
+from task_scheduler import IptalJetonu, gecerli_jeton
+
+HATA_KODLARI = {
+    "SYNC_001": "Degisiklik paketi gonderilemedi",
+    "SYNC_002": "Degisiklik paketi uygulanamadi",
+    "SYNC_003": "Gecersiz cakisma politikasi"
+}
+
+EVENT_SYNC_CONFLICT = "sync_conflict"
+
+CAKISMA_POLITIKALARI = ("yerel_kazanir", "uzak_kazanir")
+
+
+class SyncTransport:
+    """Degisiklik paketlerini tasiyan aktarim katmani arayuzu"""
+
+    def gonder(self, paket: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def paketleri_al(self, dugum_id: str) -> Iterable[Dict[str, Any]]:
+        """dugum_id disindaki dugumlerin paketlerini olusturulma sirasiyla dondurur"""
+        raise NotImplementedError
+
+
+class SharedFolderTransport(SyncTransport):
+    """
+    Ortak klasor uzerinden aktarim.
+
+    Her dugum kendi alt klasorune gzip'li JSON paketleri yazar; dosyalar once gecici adla
+    yazilip yeniden adlandirildigi icin okuyucular yarim paket gormez.
+    """
+
+    def __init__(self, klasor: str):
+        self.klasor = klasor
+        os.makedirs(self.klasor, exist_ok=True)
+
+    def gonder(self, paket: Dict[str, Any]) -> None:
+        dugum_klasoru = os.path.join(self.klasor, paket["kaynak"])
+        os.makedirs(dugum_klasoru, exist_ok=True)
+        dosya_adi = f"{paket['son_id']:012d}_{paket['paket_id']}.json.gz"
+        gecici = os.path.join(dugum_klasoru, f".{dosya_adi}.tmp")
+        with gzip.open(gecici, "wt", encoding="utf-8") as f:
+            json.dump(paket, f, ensure_ascii=False)
+        os.replace(gecici, os.path.join(dugum_klasoru, dosya_adi))
+
+    def paketleri_al(self, dugum_id: str) -> Iterable[Dict[str, Any]]:
+        for dugum in sorted(os.listdir(self.klasor)):
+            dugum_klasoru = os.path.join(self.klasor, dugum)
+            if dugum == dugum_id or not os.path.isdir(dugum_klasoru):
+                continue
+            for dosya_adi in sorted(os.listdir(dugum_klasoru)):
+                if not dosya_adi.endswith(".json.gz"):
+                    continue
+                with gzip.open(os.path.join(dugum_klasoru, dosya_adi), "rt", encoding="utf-8") as f:
+                    yield json.load(f)
+
+
+class LocalEndpoint(SyncTransport):
+    """Sunucu yerine gecen, ayni surecteki dugumlerin paylastigi bellek ici uc nokta"""
+
+    def __init__(self):
+        self._paketler: List[Dict[str, Any]] = []
+        self._kilit = threading.Lock()
+
+    def gonder(self, paket: Dict[str, Any]) -> None:
+        # Gercek bir uc noktadaki gibi serilestirilmis kopya saklanir
+        with self._kilit:
+            self._paketler.append(json.loads(json.dumps(paket, ensure_ascii=False)))
+
+    def paketleri_al(self, dugum_id: str) -> Iterable[Dict[str, Any]]:
+        with self._kilit:
+            paketler = list(self._paketler)
+        return [paket for paket in paketler if paket["kaynak"] != dugum_id]
+
+
+class SyncEngine:
+    """
+    CDC kayitlarini disa aktaran ve uzak paketleri uygulayan senkronizasyon motoru.
+
+    Attributes:
+        cakisma_politikasi: "yerel_kazanir" (cakisan uzak degisiklik uygulanmaz) veya
+            "uzak_kazanir" (uygulanir); her iki durumda da cakisma cdc_cakismalar'a yazilir
+    """
+
+    def __init__(self, repository, transport: SyncTransport, loglayici: Optional[logging.Logger] = None,
+                 event_manager=None, cakisma_politikasi: str = "yerel_kazanir", paket_boyutu: int = 5000,
+                 veri_yoneticisi=None):
+        """
+        Args:
+            repository: degisiklik_kaydi ozelligi olan SQLiteRepository
+            transport: Paket aktarim katmani
+            loglayici: Loglama islemleri icin logger nesnesi
+            event_manager: Olay yoneticisi
+            cakisma_politikasi: Cakisma durumunda uygulanacak politika
+            paket_boyutu: Bir pakette en fazla degisiklik sayisi
+            veri_yoneticisi: Uygulama ayni veritabanini bellekte tutuyorsa VeriYoneticisi; uzak
+                degisiklikler cercevelere de yuklenir (bkz. VeriYoneticisi.dis_degisiklik)
+        """
+        if cakisma_politikasi not in CAKISMA_POLITIKALARI:
+            raise ValueError(f"{HATA_KODLARI['SYNC_003']}: {cakisma_politikasi}")
+        self.repository = repository
+        self.kayit = repository.degisiklik_kaydi
+        self.transport = transport
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.event_manager = event_manager
+        self.cakisma_politikasi = cakisma_politikasi
+        self.paket_boyutu = paket_boyutu
+        self.veri_yoneticisi = veri_yoneticisi
+        self._kilit = threading.Lock()
+
+    def disa_aktar(self) -> int:
+        """
+        Son gonderimden bu yana bu dugumde olusan degisiklikleri paketleyip gonderir.
+
+        Returns:
+            int: Gonderilen degisiklik sayisi
+        """
+        gonderilen = 0
+        son_id = int(self.kayit.ayar_al("son_gonderilen", "0"))
+        while True:
+            degisiklikler = self.kayit.degisiklikleri_getir(son_id, kaynak=self.kayit.dugum_id, limit=self.paket_boyutu)
+            if not degisiklikler:
+                break
+            paket = {
+                "paket_id": uuid.uuid4().hex,
+                "kaynak": self.kayit.dugum_id,
+                "ilk_id": degisiklikler[0]["id"],
+                "son_id": degisiklikler[-1]["id"],
+                "olusturma": datetime.now().isoformat(),
+                "degisiklikler": [
+                    {alan: degisiklik[alan] for alan in ("tablo", "anahtar", "islem", "surum", "onceki_ozet", "ozet", "veri")}
+                    for degisiklik in degisiklikler
+                ]
+            }
+            try:
+                self.transport.gonder(paket)
+            except Exception as e:
+                hata_mesaji = f"Degisiklik paketi gonderilemedi: {str(e)} Hata Kodu: SYNC_001"
+                self.loglayici.error(hata_mesaji)
+                if self.event_manager:
+                    self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": "SYNC_001", "message": hata_mesaji}))
+                break
+            son_id = paket["son_id"]
+            self.kayit.ayar_yaz("son_gonderilen", str(son_id))
+            gonderilen += len(degisiklikler)
+        return gonderilen
+
+    def ice_aktar(self, jeton: Optional[IptalJetonu] = None) -> Dict[str, Any]:
+        """
+        Diger dugumlerin henuz uygulanmamis paketlerini uygular.
+
+        Args:
+            jeton: Paketler arasinda denetlenir; iptal edildiyse kalan paketler bir sonraki
+                senkronizasyona birakilir. Verilmezse zamanlayicida calisan gorevin jetonu kullanilir
+
+        Returns:
+            Dict[str, Any]: Uygulanan paket/degisiklik ve cakisma sayilari
+        """
+        jeton = jeton or gecerli_jeton()
+        ozet = {"paket": 0, "uygulanan": 0, "atlanan": 0, "cakisma": 0, "tablolar": set()}
+        for paket in self.transport.paketleri_al(self.kayit.dugum_id):
+            if self.kayit.paket_uygulandi_mi(paket["paket_id"]):
+                continue
+            if jeton is not None and jeton.iptal_edildi:
+                self.loglayici.warning("Senkronizasyon iptal edildi, kalan paketler sonraki calismada uygulanacak")
+                break
+            try:
+                sonuc = self._paketi_uygula(paket)
+            except Exception as e:
+                hata_mesaji = f"Degisiklik paketi uygulanamadi ({paket['paket_id']}): {str(e)} Hata Kodu: SYNC_002"
+                self.loglayici.error(hata_mesaji)
+                if self.event_manager:
+                    self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": "SYNC_002", "message": hata_mesaji}))
+                break  # Sira korunmali; sonraki paketler bir sonraki senkronizasyonda denenir
+            ozet["paket"] += 1
+            for alan in ("uygulanan", "atlanan", "cakisma"):
+                ozet[alan] += sonuc[alan]
+            ozet["tablolar"].update(sonuc["tablolar"])
+
+        ozet["tablolar"] = sorted(ozet["tablolar"])
+        if ozet["tablolar"] and self.event_manager:
+            self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"operation": "sync", "tables": ozet["tablolar"]}))
+        return ozet
+
+    def senkronize_et(self, jeton: Optional[IptalJetonu] = None) -> Dict[str, Any]:
+        """Once yerel degisiklikleri gonderir, sonra uzak paketleri uygular (bkz. ice_aktar jeton)"""
+        with self._kilit:
+            gonderilen = self.disa_aktar()
+            sonuc = self.ice_aktar(jeton)
+            sonuc["gonderilen"] = gonderilen
+            self.loglayici.info(
+                f"Senkronizasyon: {gonderilen} gonderildi, {sonuc['uygulanan']} uygulandi, {sonuc['cakisma']} cakisma"
+            )
+            return sonuc
+
+    @contextmanager
+    def _tablo_yazimi(self, tablo_adi: str, kaynak: str):
+        """Uzak degisikliklerin uygulandigi blok; tabloyu uzak kaynak adina kaydeden fonksiyonu verir"""
+        if self.veri_yoneticisi is None:
+            def kaydet(df: pd.DataFrame) -> None:
+                with self.kayit.uzak_kaynak(kaynak):
+                    self.repository.save(df, tablo_adi)
+            yield kaydet
+            return
+        with self.veri_yoneticisi.dis_degisiklik(tablo_adi) as yonetici_kaydet:
+            def kaydet(df: pd.DataFrame) -> None:
+                with self.kayit.uzak_kaynak(kaynak):
+                    yonetici_kaydet(df)
+            yield kaydet
+
+    def _tabloyu_yukle(self, tablo_adi: str) -> pd.DataFrame:
+        parcalar = list(self.repository.lazy_load_iterator(tablo_adi, chunk_size=10000))
+        return pd.concat(parcalar, ignore_index=True) if parcalar else pd.DataFrame()
+
+    def _paketi_uygula(self, paket: Dict[str, Any]) -> Dict[str, Any]:
+        """Paketteki degisiklikleri tablo tablo uygular; her tablo tek kayitla yeniden yazilir"""
+        tablo_degisiklikleri: Dict[str, List[Dict[str, Any]]] = OrderedDict()
+        for degisiklik in paket["degisiklikler"]:
+            tablo_degisiklikleri.setdefault(degisiklik["tablo"], []).append(degisiklik)
+
+        sonuc = {"uygulanan": 0, "atlanan": 0, "cakisma": 0, "tablolar": []}
+        cakismalar = []
+        for tablo_adi, degisiklikler in tablo_degisiklikleri.items():
+            # Uygulama acikken tablo yazma kilidi altinda okunur, yazilir ve cercevelere yuklenir
+            with self._tablo_yazimi(tablo_adi, paket["kaynak"]) as kaydet:
+                df = self._tabloyu_yukle(tablo_adi)
+                sutunlar = [str(sutun) for sutun in df.columns]
+                satirlar = OrderedDict((anahtar, (ozet, veri)) for anahtar, ozet, veri
+                                       in satirlari_hazirla(df, tablo_adi, self.kayit.yerel_ozetler(tablo_adi)))
+
+                degisti = False
+                for degisiklik in degisiklikler:
+                    anahtar = degisiklik["anahtar"]
+                    yerel_ozet = satirlar[anahtar][0] if anahtar in satirlar else None
+                    if yerel_ozet == degisiklik["ozet"]:
+                        sonuc["atlanan"] += 1  # Zaten ayni durumda (tekrar uygulama veya ayni duzenleme)
+                        continue
+                    if yerel_ozet != degisiklik["onceki_ozet"]:
+                        if self.kayit.gecmiste_var_mi(tablo_adi, anahtar, degisiklik["ozet"]):
+                            sonuc["atlanan"] += 1  # Yerel satir bu surumu zaten gecmis
+                            continue
+                        cakismalar.append({"tablo": tablo_adi, "anahtar": anahtar, "yerel_ozet": yerel_ozet, "degisiklik": degisiklik})
+                        sonuc["cakisma"] += 1
+                        if self.cakisma_politikasi == "yerel_kazanir":
+                            continue
+
+                    if degisiklik["islem"] == ISLEM_SIL:
+                        satirlar.pop(anahtar, None)
+                    else:
+                        veri = self.kayit.veri_yukunu_coz(degisiklik["veri"], tablo_adi)
+                        sutunlar.extend(sutun for sutun in veri if sutun not in sutunlar)
+                        satirlar[anahtar] = (degisiklik["ozet"], veri)
+                    sonuc["uygulanan"] += 1
+                    degisti = True
+
+                if degisti:
+                    yeni_df = pd.DataFrame([veri for _, veri in satirlar.values()], columns=sutunlar)
+                    # Sutun turleri gonderenin JSON'undan degil yerel tablodan gelir (REAL sutun int olmaz)
+                    kaydet(sayisal_turleri_uygula(yeni_df, cerceve_turleri(df)))
+                    sonuc["tablolar"].append(tablo_adi)
+
+        self.kayit.paket_uygulandi(paket["paket_id"], paket["kaynak"], cakismalar)
+        if cakismalar:
+            self.loglayici.warning(f"{paket['kaynak']} paketinde {len(cakismalar)} cakisma kaydedildi")
+            if self.event_manager:
+                self.event_manager.emit(Event(EVENT_SYNC_CONFLICT, {
+                    "source": paket["kaynak"],
+                    "conflicts": [(c["tablo"], c["anahtar"]) for c in cakismalar]
+                }))
+        return sonuc
@@ -0,0 +1,474 @@
+# -*- coding: utf-8 -*-
+"""
+Birlesik oncelikli gorev zamanlayici modulu.
+
+Arka plan isleri eskiden birbirinden habersiz havuzlarda calisiyordu (ana pencerenin
+QThreadPool'u, SqlRepository'nin QThreadPool'u, RaporlamaWorker'in ThreadPoolExecutor'u,
+VeriYuklemeWorker'in kendi QThread'i); toplam is parcacigi sayisi islemci sayisini
+asiyor, isler onceliklendirilemiyor ve iptal edilemiyordu. TaskScheduler tek bir is
+parcacigi havuzunu oncelik seritleriyle paylastirir:
+
+    - SERIT_ETKILESIMLI: kullanicinin bekledigi isler (kayit, ice aktarma, rapor)
+    - SERIT_YENILEME: gosterge/tablo yenilemeleri
+    - SERIT_BAKIM: yedekleme, optimizasyon gibi bakim isleri
+
+Bos bir is parcacigi her zaman en yuksek oncelikli seritteki en eski gorevi alir.
+Bakim seridinin ayni anda kullanabilecegi is parcacigi sayisi sinirlidir; uzun bakim
+isleri etkilesimli islere yer birakir. Ayni anahtarla gonderilen ve henuz baslamamis
+gorevler tekillestirilir. Gorevler IptalJetonu ile isbirlikci olarak iptal edilir ve
+gecerli_gorev() uzerinden ilerleme bildirebilir.
+"""
+
+import os
+import threading
+import logging
+from collections import deque
+from concurrent.futures import Future
+from typing import Optional, Dict, Any, Callable, Deque, List
+
+try:
+    from PyQt6.QtCore import QObject, QCoreApplication, pyqtSignal, pyqtSlot
+except ImportError:  # Qt olmadan gorevler yalnizca Future ile izlenir
+    QObject = None
+
+HATA_KODLARI = {
+    "GOREV_001": "Gorev iptal edildi",
+    "GOREV_002": "Zamanlayici kapatildi",
+    "GOREV_003": "Gecersiz gorev seridi"
+}
+
+SERIT_ETKILESIMLI = "etkilesimli"
+SERIT_YENILEME = "yenileme"
+SERIT_BAKIM = "bakim"
+SERITLER = (SERIT_ETKILESIMLI, SERIT_YENILEME, SERIT_BAKIM)  # Oncelik sirasiyla
+
+
+class GorevIptalEdildi(Exception):
+    """Iptal edilen gorev IptalJetonu.kontrol() cagirdiginda firlatilir"""
+
+
+class IptalJetonu:
+    """Gorev ile onu baslatan kod arasinda paylasilan isbirlikci iptal isareti"""
+
+    def __init__(self):
+        self._olay = threading.Event()
+        self._kilit = threading.Lock()
+        self._geri_cagrilar: List[Callable[[], None]] = []
+
+    def iptal_et(self) -> None:
+        with self._kilit:
+            if self._olay.is_set():
+                return
+            self._olay.set()
+            geri_cagrilar, self._geri_cagrilar = self._geri_cagrilar, []
+        for islev in geri_cagrilar:
+            islev()
+
+    def iptal_olunca(self, islev: Callable[[], None]) -> Callable[[], None]:
+        """
+        Iptal istendiginde cagrilacak fonksiyonu kaydeder; jeton zaten iptal edildiyse hemen cagirir.
+
+        Fonksiyon iptal_et() cagiran thread'de calisir; kisa ve bloklamayan olmalidir
+        (ornegin baska bir nesnenin iptal isaretini kaldirmak).
+
+        Returns:
+            Callable[[], None]: Kaydi geri alan fonksiyon
+        """
+        with self._kilit:
+            if not self._olay.is_set():
+                self._geri_cagrilar.append(islev)
+                return lambda: self._geri_cagri_kaldir(islev)
+        islev()
+        return lambda: None
+
+    def _geri_cagri_kaldir(self, islev: Callable[[], None]) -> None:
+        with self._kilit:
+            if islev in self._geri_cagrilar:
+                self._geri_cagrilar.remove(islev)
+
+    @property
+    def iptal_edildi(self) -> bool:
+        return self._olay.is_set()
+
+    def kontrol(self) -> None:
+        """Iptal istenmisse GorevIptalEdildi firlatir; uzun islerde adim aralarinda cagrilir"""
+        if self._olay.is_set():
+            raise GorevIptalEdildi(HATA_KODLARI["GOREV_001"])
+
+    def bekle(self, sure: float) -> bool:
+        """Iptal istenene veya sure dolana kadar bekler; iptal istendiyse True dondurur"""
+        return self._olay.wait(sure)
+
+
+if QObject is not None:
+    class GorevSinyalleri(QObject):
+        """
+        Gorev sinyalleri.
+
+        Nesne goreve ilk dinleyici baglandiginda olusturulur ve Qt ana thread'ine tasinir;
+        gorev hangi thread'den gonderilirse gonderilsin sinyaller kuyruklu baglanti ile ana
+        thread'in olay dongusunde islenir. Dinleyiciler sinyallere dogrudan degil nesnenin
+        kendi slotlari uzerinden baglanir: PyQt bir Python fonksiyonu icin vekil nesneyi
+        connect() cagiran thread'de olusturur ve olay dongusu olmayan bir thread'den yapilan
+        baglanti hic teslim edilmezdi.
+        """
+        ilerleme = pyqtSignal(object)
+        sonuc = pyqtSignal(object)
+        hata = pyqtSignal(str)
+        tamamlandi = pyqtSignal()
+
+        def __init__(self):
+            super().__init__()
+            self._dinleyiciler: Dict[str, List[Callable]] = {}
+            self.ilerleme.connect(self._ilerleme_ilet)
+            self.sonuc.connect(self._sonuc_ilet)
+            self.hata.connect(self._hata_ilet)
+            self.tamamlandi.connect(self._tamamlandi_ilet)
+
+        def dinle(self, ad: str, dinleyici: Callable) -> None:
+            """Sinyal adina (ilerleme, sonuc, hata, tamamlandi) ana thread'de cagrilacak dinleyici ekler"""
+            self._dinleyiciler.setdefault(ad, []).append(dinleyici)
+
+        def _ilet(self, ad: str, *degerler) -> None:
+            for dinleyici in list(self._dinleyiciler.get(ad, ())):
+                dinleyici(*degerler)
+
+        @pyqtSlot(object)
+        def _ilerleme_ilet(self, deger: Any) -> None:
+            self._ilet("ilerleme", deger)
+
+        @pyqtSlot(object)
+        def _sonuc_ilet(self, deger: Any) -> None:
+            self._ilet("sonuc", deger)
+
+        @pyqtSlot(str)
+        def _hata_ilet(self, mesaj: str) -> None:
+            self._ilet("hata", mesaj)
+
+        @pyqtSlot()
+        def _tamamlandi_ilet(self) -> None:
+            try:
+                self._ilet("tamamlandi")
+            finally:
+                self.deleteLater()  # Son sinyal; nesne uygulamadan ayrilip silinir
+
+
+class Gorev:
+    """
+    Zamanlayiciya gonderilmis tek bir isin tutamaci.
+
+    Attributes:
+        future: Gorevin sonucunu tasiyan concurrent.futures.Future
+        jeton: Isbirlikci iptal icin IptalJetonu
+        sinyaller: Qt uygulamasi varken dinleyici baglandiysa GorevSinyalleri (tamamlandi
+            teslim edildikten sonra silinir), yoksa None
+        serit: Gorevin oncelik seridi
+        anahtar: Tekillestirme anahtari
+        son_ilerleme: En son bildirilen ilerleme degeri
+    """
+
+    def __init__(self, islev: Callable, args: tuple, kwargs: Dict[str, Any], serit: str,
+                 anahtar: Optional[str], jeton: Optional[IptalJetonu] = None):
+        self.islev = islev
+        self.args = args
+        self.kwargs = kwargs
+        self.serit = serit
+        self.anahtar = anahtar
+        self.jeton = jeton or IptalJetonu()
+        self.future: Future = Future()
+        # Sinyaller dinleyici baglanana kadar olusturulmaz; cogu gorevin dinleyicisi yoktur
+        self.sinyaller: Optional["GorevSinyalleri"] = None
+        self.son_ilerleme: Any = None
+        self._dinleyiciler: Dict[str, Callable] = {}
+
+    def baglan(self, sonuc: Optional[Callable] = None, hata: Optional[Callable] = None,
+               ilerleme: Optional[Callable] = None, tamamlandi: Optional[Callable] = None) -> None:
+        """
+        Gorev olaylarina dinleyici baglar.
+
+        Qt uygulamasi varsa dinleyiciler sinyallere baglanir (Qt ana thread'inde calisir);
+        yoksa gorevin calistigi is parcaciginda dogrudan cagrilir.
+        """
+        for ad, dinleyici in (("sonuc", sonuc), ("hata", hata), ("ilerleme", ilerleme), ("tamamlandi", tamamlandi)):
+            if dinleyici is None:
+                continue
+            sinyaller = self._sinyaller_al()
+            if sinyaller is not None:
+                sinyaller.dinle(ad, dinleyici)
+            else:
+                self._dinleyiciler[ad] = dinleyici
+
+    def _sinyaller_al(self) -> Optional["GorevSinyalleri"]:
+        """Sinyal nesnesini gerekirse olusturup ana thread'e tasir (Qt uygulamasi yoksa None)"""
+        if self.sinyaller is None and QObject is not None:
+            uygulama = QCoreApplication.instance()
+            if uygulama is not None:
+                sinyaller = GorevSinyalleri()
+                if sinyaller.thread() != uygulama.thread():
+                    # Arka plan thread'lerinin olay dongusu yoktur; kuyruklu sinyaller ana thread'de islenir
+                    sinyaller.moveToThread(uygulama.thread())
+                # Uygulama sahiplenir: Gorev tutamaci birakilsa da kuyruktaki sinyaller teslim edilir.
+                # Nesne tamamlandi teslim edilince veya gorev baslamadan iptal edilince silinir
+                sinyaller.setParent(uygulama)
+                self.future.add_done_callback(lambda f: sinyaller.deleteLater() if f.cancelled() else None)
+                self.sinyaller = sinyaller
+        return self.sinyaller
+
+    def _bildir(self, ad: str, *degerler) -> None:
+        if self.sinyaller is not None:
+            getattr(self.sinyaller, ad).emit(*degerler)
+        elif ad in self._dinleyiciler:
+            self._dinleyiciler[ad](*degerler)
+
+    def iptal_et(self) -> bool:
+        """
+        Gorevi iptal eder.
+
+        Returns:
+            bool: Gorev henuz baslamamissa ve hic calismayacaksa True; calisiyorsa iptal
+            jetonu isaretlenir ve gorevin kontrol() cagrisiyla durmasi beklenir
+        """
+        self.jeton.iptal_et()
+        return self.future.cancel()
+
+    def ilerleme_bildir(self, deger: Any) -> None:
+        """Gorevin ilerlemesini kaydeder ve sinyal olarak yayinlar"""
+        self.son_ilerleme = deger
+        self._bildir("ilerleme", deger)
+
+    def calisiyor_mu(self) -> bool:
+        """Gorev beklemede veya calisir durumdaysa True dondurur"""
+        return not self.future.done()
+
+    def bekle(self, zaman_asimi: Optional[float] = None) -> bool:
+        """Gorev bitene kadar (en fazla zaman_asimi saniye) bekler; bittiyse True dondurur"""
+        try:
+            self.future.exception(timeout=zaman_asimi)
+        except Exception:  # CancelledError veya TimeoutError
+            pass
+        return self.future.done()
+
+
+_yerel = threading.local()
+
+
+def gecerli_gorev() -> Optional[Gorev]:
+    """Zamanlayicida calisan kod icin o anki Gorev'i dondurur (zamanlayici disinda None)"""
+    return getattr(_yerel, "gorev", None)
+
+
+def gecerli_jeton() -> Optional[IptalJetonu]:
+    """Zamanlayicida calisan kod icin o anki gorevin iptal jetonunu dondurur (zamanlayici disinda None)"""
+    gorev = gecerli_gorev()
+    return gorev.jeton if gorev is not None else None
+
+
+class TaskScheduler:
+    """
+    Tum arka plan islerini oncelik seritleriyle tek havuzda calistiran sinif.
+
+    Methods:
+        gonder(): Gorev gonderir ve Gorev tutamacini dondurur
+        submit(): concurrent.futures uyumlu gonderim (Future dondurur)
+        yenile(): Yenileme isini en son istekle tekillestirerek gonderir
+        bekleyen_sayisi(): Seritlere gore bekleyen gorev sayilarini dondurur
+        kapat(): Is parcaciklarini durdurur
+    """
+
+    def __init__(self, loglayici: Optional[logging.Logger] = None, isci_sayisi: Optional[int] = None,
+                 bakim_siniri: Optional[int] = None):
+        """
+        Args:
+            loglayici: Loglama islemleri icin logger nesnesi
+            isci_sayisi: Is parcacigi sayisi; verilmezse islemci sayisi (2-8 arasi)
+            bakim_siniri: Bakim seridinin ayni anda kullanabilecegi is parcacigi sayisi
+        """
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.isci_sayisi = isci_sayisi or max(2, min(os.cpu_count() or 2, 8))
+        self._sinirlar = {SERIT_ETKILESIMLI: self.isci_sayisi, SERIT_YENILEME: self.isci_sayisi,
+                          SERIT_BAKIM: bakim_siniri or max(1, self.isci_sayisi // 4)}
+        self._kuyruklar: Dict[str, Deque[Gorev]] = {serit: deque() for serit in SERITLER}
+        self._calisan: Dict[str, int] = {serit: 0 for serit in SERITLER}
+        self._bekleyen_anahtarlar: Dict[str, Gorev] = {}
+        self._yenileme_istekleri: Dict[str, tuple] = {}
+        self._kosul = threading.Condition()
+        self._kapaniyor = False
+        self._isciler = []
+        for i in range(self.isci_sayisi):
+            isci = threading.Thread(target=self._isci_dongusu, name=f"Gorev-{i}", daemon=True)
+            isci.start()
+            self._isciler.append(isci)
+
+    def gonder(self, islev: Callable, *args, serit: str = SERIT_ETKILESIMLI, anahtar: Optional[str] = None,
+               jeton: Optional[IptalJetonu] = None, sonuc: Optional[Callable] = None,
+               hata: Optional[Callable] = None, ilerleme: Optional[Callable] = None, **kwargs) -> Gorev:
+        """
+        Gorevi ilgili seride ekler.
+
+        Args:
+            islev: Calistirilacak fonksiyon
+            *args, **kwargs: Fonksiyon argumanlari
+            serit: Oncelik seridi (SERIT_ETKILESIMLI, SERIT_YENILEME, SERIT_BAKIM)
+            anahtar: Tekillestirme anahtari; ayni anahtarli bekleyen gorev varsa o dondurulur
+            jeton: Paylasilan iptal jetonu; verilmezse gorev icin yenisi olusturulur
+            sonuc, hata, ilerleme: Gorev kuyruga girmeden baglanan dinleyiciler (bkz. Gorev.baglan)
+
+        Returns:
+            Gorev: Gorev tutamaci
+        """
+        if serit not in self._kuyruklar:
+            raise ValueError(f"{HATA_KODLARI['GOREV_003']}: {serit}")
+        with self._kosul:
+            if self._kapaniyor:
+                raise RuntimeError(HATA_KODLARI["GOREV_002"])
+            if anahtar is not None:
+                mevcut = self._bekleyen_anahtarlar.get(anahtar)
+                if mevcut is not None and not mevcut.future.done():
+                    mevcut.baglan(sonuc=sonuc, hata=hata, ilerleme=ilerleme)
+                    return mevcut
+            gorev = Gorev(islev, args, kwargs, serit, anahtar, jeton)
+            gorev.baglan(sonuc=sonuc, hata=hata, ilerleme=ilerleme)
+            if anahtar is not None:
+                self._bekleyen_anahtarlar[anahtar] = gorev
+            self._kuyruklar[serit].append(gorev)
+            self._kosul.notify()
+        return gorev
+
+    def submit(self, islev: Callable, *args, **kwargs) -> Future:
+        """concurrent.futures.Executor.submit ile uyumlu gonderim; etkilesimli seritte calisir"""
+        return self.gonder(islev, *args, **kwargs).future
+
+    def yenile(self, anahtar: str, hesapla: Callable[[], Any], uygula: Callable[[Any], None],
+               hata: Callable[[str], None]) -> Gorev:
+        """
+        Gosterge/tablo yenilemesini SERIT_YENILEME'de anahtarla tekillestirerek calistirir.
+
+        Ayni anahtarli gorev kuyrukta beklerken gelen istekler yeni gorev acmaz, yalnizca
+        bekleyen istegi degistirir; gorev calismaya basladiginda en son istenen
+        hesapla/uygula/hata uclusunu kullanir. Boylece art arda gelen filtre degisiklikleri
+        tek hesaplamaya iner ve eski filtrelerle hesaplanmis sonuc ekrana uygulanmaz.
+
+        Args:
+            anahtar: Yenilenen bilesenin anahtari (orn. "gosterge_paneli:pipeline")
+            hesapla: Arka planda calisacak fonksiyon; Qt nesnelerine dokunmamalidir
+            uygula: hesapla sonucunu alan fonksiyon (Qt ana thread'inde cagrilir)
+            hata: Hata mesajini alan fonksiyon (Qt ana thread'inde cagrilir)
+
+        Returns:
+            Gorev: Istegi calistiracak (yeni veya bekleyen) gorev
+        """
+        with self._kosul:
+            self._yenileme_istekleri[anahtar] = (hesapla, uygula, hata)
+            mevcut = self._bekleyen_anahtarlar.get(anahtar)
+            if mevcut is not None and not mevcut.future.done():
+                return mevcut  # Henuz baslamadi; calistiginda yeni istegi okur
+            return self.gonder(self._yenileme_calistir, anahtar, serit=SERIT_YENILEME, anahtar=anahtar,
+                               sonuc=_yenileme_sonucunu_uygula)
+
+    def _yenileme_calistir(self, anahtar: str) -> tuple:
+        """Anahtarin en son yenileme istegini calistirir; (geri_cagri, deger) cifti dondurur"""
+        with self._kosul:
+            hesapla, uygula, hata = self._yenileme_istekleri.pop(anahtar)
+        try:
+            return uygula, hesapla()
+        except GorevIptalEdildi:
+            raise
+        except Exception as e:
+            self.loglayici.error(f"Yenileme hatasi ({anahtar}): {str(e)}")
+            return hata, str(e)
+
+    def bekleyen_sayisi(self) -> Dict[str, int]:
+        """Seritlere gore bekleyen gorev sayilarini dondurur"""
+        with self._kosul:
+            return {serit: len(kuyruk) for serit, kuyruk in self._kuyruklar.items()}
+
+    def _siradaki(self) -> Optional[Gorev]:
+        """Sinirini asmamis en yuksek oncelikli seritten siradaki gorevi alir (kilit altinda)"""
+        for serit in SERITLER:
+            kuyruk = self._kuyruklar[serit]
+            if kuyruk and self._calisan[serit] < self._sinirlar[serit]:
+                gorev = kuyruk.popleft()
+                if gorev.anahtar is not None and self._bekleyen_anahtarlar.get(gorev.anahtar) is gorev:
+                    del self._bekleyen_anahtarlar[gorev.anahtar]
+                return gorev
+        return None
+
+    def _isci_dongusu(self) -> None:
+        while True:
+            with self._kosul:
+                gorev = self._siradaki()
+                while gorev is None:
+                    if self._kapaniyor:
+                        return
+                    self._kosul.wait()
+                    gorev = self._siradaki()
+                self._calisan[gorev.serit] += 1
+            try:
+                self._calistir(gorev)
+            finally:
+                with self._kosul:
+                    self._calisan[gorev.serit] -= 1
+                    self._kosul.notify()
+
+    def _calistir(self, gorev: Gorev) -> None:
+        if not gorev.future.set_running_or_notify_cancel():
+            return  # Baslamadan iptal edildi
+        _yerel.gorev = gorev
+        try:
+            gorev.jeton.kontrol()
+            sonuc = gorev.islev(*gorev.args, **gorev.kwargs)
+        except GorevIptalEdildi as e:
+            gorev.future.set_exception(e)
+        except Exception as e:
+            self.loglayici.error(f"Gorev hatasi ({getattr(gorev.islev, '__qualname__', gorev.islev)}): {str(e)}")
+            gorev.future.set_exception(e)
+            gorev._bildir("hata", str(e))
+        else:
+            gorev.future.set_result(sonuc)
+            gorev._bildir("sonuc", sonuc)
+        finally:
+            _yerel.gorev = None
+            gorev._bildir("tamamlandi")
+
+    def kapat(self, bekle: bool = True) -> None:
+        """
+        Zamanlayiciyi kapatir; bekleyen gorevler iptal edilir.
+
+        Args:
+            bekle: True ise calisan gorevlerin bitmesi beklenir
+        """
+        with self._kosul:
+            self._kapaniyor = True
+            for kuyruk in self._kuyruklar.values():
+                while kuyruk:
+                    kuyruk.popleft().iptal_et()
+            self._bekleyen_anahtarlar.clear()
+            self._yenileme_istekleri.clear()
+            self._kosul.notify_all()
+        if bekle:
+            for isci in self._isciler:
+                isci.join()
+
+
+def _yenileme_sonucunu_uygula(cift: tuple) -> None:
+    """TaskScheduler.yenile gorevinin sonucunu ilgili geri cagriya iletir"""
+    geri_cagri, deger = cift
+    geri_cagri(deger)
+
+
+_varsayilan: Optional[TaskScheduler] = None
+_varsayilan_kilit = threading.Lock()
+
+
+def gorev_zamanlayici(loglayici: Optional[logging.Logger] = None) -> TaskScheduler:
+    """
+    Uygulama genelinde paylasilan TaskScheduler nesnesini dondurur.
+
+    Args:
+        loglayici: Yalnizca ilk cagrida (zamanlayici olusturulurken) kullanilir
+    """
+    global _varsayilan
+    with _varsayilan_kilit:
+        if _varsayilan is None:
+            _varsayilan = TaskScheduler(loglayici)
+        return _varsayilan
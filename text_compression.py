@@ -0,0 +1,263 @@
+# -*- coding: utf-8 -*-
+"""
+Uzun metin sutunlari icin sikistirma modulu.
+
+Sikayet detaylari, ziyaret ve pipeline notlari veritabani sayfalarinin cogunu kaplar
+ancak liste gorunumlerinde nadiren okunur. Belirlenen sutunlar kayit sirasinda ortak
+(egitilmis) bir sozlukle sikistirilarak BLOB olarak saklanir. zstandard paketi kuruluysa
+zstd egitilmis sozlugu, degilse zlib on-ayar sozlugu kullanilir. Yuklemede hucreler
+SikistirilmisMetin nesnesi olarak gelir ve yalnizca metin istendiginde (str) acilir.
+"""
+
+import zlib
+import struct
+import sqlite3
+import logging
+import threading
+from collections import Counter
+from datetime import datetime
+from typing import Optional, Dict, Any, List, Tuple
+import pandas as pd
+
+try:
+    import zstandard as zstd
+except ImportError:  # zstd istege bagli; yoksa zlib kullanilir
+    zstd = None
+
+HATA_KODLARI = {
+    "SIKISTIRMA_001": "Sikistirma sozlugu egitilemedi",
+    "SIKISTIRMA_002": "Sikistirilmis metin acilamadi"
+}
+
+# Tablo -> sikistirilacak uzun metin sutunlari
+SIKISTIRILAN_SUTUNLAR = {
+    "complaints": ["Sikayet Detayi"],
+    "visits": ["Notlar"],
+    "pipeline": ["Notlar"],
+    "interactions": ["Notlar"]
+}
+
+BASLIK = b"\x1fS"  # Sikistirilmis hucre isareti
+ALGORITMA_ZLIB = b"z"
+ALGORITMA_ZSTD = b"s"
+SOZLUK_YOK = 0
+MIN_UZUNLUK = 80  # Bu uzunlugun altindaki metinler sikistirilmaz (bayt)
+MIN_ORNEK = 50  # Sozluk egitimi icin gereken en az ornek sayisi
+SOZLUK_BOYUTU = 16 * 1024
+
+
+class SikistirilmisMetin:
+    """
+    Sikistirilmis hucre icin tembel metin nesnesi.
+
+    Metin ilk kez istendiginde acilir ve onbellege alinir. Tekrar kaydedilirken ham
+    bayt dizisi oldugu gibi yazilir, yeniden sikistirma yapilmaz.
+
+    Nesne str degildir: pandas .str islemleri (contains, len, lower...) bu hucrelerde NaN
+    dondurur. Aranacak cerceveler once metinleri_ac() ile acilmali ya da sutun
+    astype(str) ile cevrilmelidir.
+    """
+
+    __slots__ = ("ham", "_sikistirici", "_metin")
+
+    def __init__(self, ham: bytes, sikistirici: "TextCompressor"):
+        self.ham = ham
+        self._sikistirici = sikistirici
+        self._metin: Optional[str] = None
+
+    @property
+    def metin(self) -> str:
+        if self._metin is None:
+            self._metin = self._sikistirici.coz(self.ham)
+        return self._metin
+
+    def __str__(self) -> str:
+        return self.metin
+
+    def __repr__(self) -> str:
+        return repr(self.metin)
+
+    def __len__(self) -> int:
+        return len(self.metin)
+
+    def __eq__(self, diger) -> bool:
+        if isinstance(diger, SikistirilmisMetin):
+            return self.ham == diger.ham or self.metin == diger.metin
+        return self.metin == diger
+
+    def __hash__(self) -> int:
+        return hash(self.metin)
+
+
+def metinleri_ac(df: pd.DataFrame, tablo_adi: str) -> pd.DataFrame:
+    """
+    Tablonun sikistirilan sutunlarindaki tembel hucreleri str'ye cevirir (cerceve yerinde degisir).
+
+    Bellekte tutulup aranan cerceveler (VeriYoneticisi) icin kullanilir; bkz. SikistirilmisMetin.
+    """
+    for sutun in SIKISTIRILAN_SUTUNLAR.get(tablo_adi, []):
+        if sutun in df.columns and df[sutun].dtype == object:
+            df[sutun] = [deger.metin if isinstance(deger, SikistirilmisMetin) else deger for deger in df[sutun]]
+    return df
+
+
+class TextCompressor:
+    """Belirlenen metin sutunlarini ortak sozlukle sikistiran ve tembel acan sinif"""
+
+    def __init__(self, loglayici: Optional[logging.Logger] = None, sutunlar: Optional[Dict[str, List[str]]] = None):
+        """
+        Args:
+            loglayici: Loglama islemleri icin logger nesnesi
+            sutunlar: Tablo -> sikistirilacak sutunlar eslesmesi
+        """
+        self.loglayici = loglayici or logging.getLogger(__name__)
+        self.sutunlar = sutunlar if sutunlar is not None else SIKISTIRILAN_SUTUNLAR
+        self._sozlukler: Dict[int, Tuple[bytes, bytes]] = {}  # id -> (algoritma, sozluk)
+        self._aktif_sozluk = SOZLUK_YOK
+        self._zstd_nesneleri: Dict[int, Any] = {}
+        self._kilit = threading.Lock()
+
+    def semayi_olustur(self, cursor: sqlite3.Cursor) -> None:
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS sikistirma_sozlukleri (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                algoritma TEXT NOT NULL,
+                sozluk BLOB NOT NULL,
+                ornek_sayisi INTEGER,
+                olusturma TEXT NOT NULL
+            )''')
+        cursor.execute("SELECT id, algoritma, sozluk FROM sikistirma_sozlukleri ORDER BY id")
+        for sozluk_id, algoritma, sozluk in cursor.fetchall():
+            self._sozlukler[sozluk_id] = (algoritma.encode("ascii"), bytes(sozluk))
+            if algoritma.encode("ascii") == ALGORITMA_ZLIB or zstd is not None:
+                self._aktif_sozluk = sozluk_id
+
+    def _varsayilan_algoritma(self) -> bytes:
+        return ALGORITMA_ZSTD if zstd is not None else ALGORITMA_ZLIB
+
+    def _zlib_sozlugu_olustur(self, ornekler: List[str]) -> bytes:
+        """
+        zlib on-ayar sozlugu olusturur: ornekteki en sik kelime gruplari birlestirilir.
+
+        zlib sozlugun sonundaki dizilere daha kisa mesafe kodu verdigi icin en sik
+        gecenler sona yerlestirilir.
+        """
+        sayac: Counter = Counter()
+        for ornek in ornekler:
+            kelimeler = ornek.split()
+            sayac.update(kelimeler)
+            sayac.update(" ".join(kelimeler[i:i + 3]) for i in range(len(kelimeler) - 2))
+        parcalar, boyut = [], 0
+        for parca, adet in sayac.most_common():
+            if adet < 2:
+                break
+            kodlanmis = (parca + " ").encode("utf-8")
+            if boyut + len(kodlanmis) > SOZLUK_BOYUTU:
+                break
+            parcalar.append(kodlanmis)
+            boyut += len(kodlanmis)
+        return b"".join(reversed(parcalar))
+
+    def sozluk_egit(self, conn: sqlite3.Connection, ornekler: List[str]) -> int:
+        """
+        Orneklerden ortak sozluk egitir, kaydeder ve yeni yazmalar icin aktif yapar.
+
+        Eski sozlukler silinmez; onlarla sikistirilmis hucreler acilmaya devam eder.
+
+        Returns:
+            int: Yeni sozlugun kimligi (egitilemezse mevcut aktif sozluk)
+        """
+        algoritma = self._varsayilan_algoritma()
+        try:
+            if algoritma == ALGORITMA_ZSTD:
+                sozluk = zstd.train_dictionary(SOZLUK_BOYUTU, [o.encode("utf-8") for o in ornekler]).as_bytes()
+            else:
+                sozluk = self._zlib_sozlugu_olustur(ornekler)
+        except Exception as e:
+            self.loglayici.warning(f"Sikistirma sozlugu egitilemedi: {str(e)} Hata Kodu: SIKISTIRMA_001")
+            return self._aktif_sozluk
+        if not sozluk:
+            return self._aktif_sozluk
+
+        cursor = conn.execute(
+            "INSERT INTO sikistirma_sozlukleri (algoritma, sozluk, ornek_sayisi, olusturma) VALUES (?, ?, ?, ?)",
+            (algoritma.decode("ascii"), sozluk, len(ornekler), datetime.now().isoformat()))
+        conn.commit()
+        with self._kilit:
+            self._sozlukler[cursor.lastrowid] = (algoritma, sozluk)
+            self._aktif_sozluk = cursor.lastrowid
+        self.loglayici.info(f"Sikistirma sozlugu egitildi ({algoritma.decode('ascii')}, {len(sozluk)} bayt, {len(ornekler)} ornek)")
+        return cursor.lastrowid
+
+    def _zstd_sozlugu(self, sozluk_id: int):
+        if sozluk_id not in self._zstd_nesneleri:
+            self._zstd_nesneleri[sozluk_id] = zstd.ZstdCompressionDict(self._sozlukler[sozluk_id][1])
+        return self._zstd_nesneleri[sozluk_id]
+
+    def sikistir(self, metin: Any) -> Any:
+        """Metni sikistirir; kisa veya sikismayan metinler oldugu gibi dondurulur"""
+        if not isinstance(metin, str):
+            return metin
+        ham = metin.encode("utf-8")
+        if len(ham) < MIN_UZUNLUK:
+            return metin
+        sozluk_id = self._aktif_sozluk
+        algoritma = self._sozlukler[sozluk_id][0] if sozluk_id != SOZLUK_YOK else self._varsayilan_algoritma()
+        if algoritma == ALGORITMA_ZSTD:
+            ayarlar = {"dict_data": self._zstd_sozlugu(sozluk_id)} if sozluk_id != SOZLUK_YOK else {}
+            veri = zstd.ZstdCompressor(level=6, **ayarlar).compress(ham)
+        else:
+            sikistirici = (zlib.compressobj(6, zlib.DEFLATED, -15, zdict=self._sozlukler[sozluk_id][1])
+                           if sozluk_id != SOZLUK_YOK else zlib.compressobj(6, zlib.DEFLATED, -15))
+            veri = sikistirici.compress(ham) + sikistirici.flush()
+        paket = BASLIK + algoritma + struct.pack(">I", sozluk_id) + veri
+        return paket if len(paket) < len(ham) else metin
+
+    def coz(self, paket: bytes) -> str:
+        """Sikistirilmis hucreyi metne acar"""
+        algoritma = paket[2:3]
+        sozluk_id = struct.unpack(">I", paket[3:7])[0]
+        veri = paket[7:]
+        try:
+            if algoritma == ALGORITMA_ZSTD:
+                ayarlar = {"dict_data": self._zstd_sozlugu(sozluk_id)} if sozluk_id != SOZLUK_YOK else {}
+                return zstd.ZstdDecompressor(**ayarlar).decompress(veri).decode("utf-8")
+            acici = (zlib.decompressobj(-15, zdict=self._sozlukler[sozluk_id][1])
+                     if sozluk_id != SOZLUK_YOK else zlib.decompressobj(-15))
+            return (acici.decompress(veri) + acici.flush()).decode("utf-8")
+        except Exception as e:
+            self.loglayici.error(f"Sikistirilmis metin acilamadi: {str(e)} Hata Kodu: SIKISTIRMA_002")
+            raise
+
+    @staticmethod
+    def sikistirilmis_mi(deger: Any) -> bool:
+        return isinstance(deger, (bytes, memoryview)) and bytes(deger[:2]) == BASLIK
+
+    def cerceve_sikistir(self, conn: sqlite3.Connection, df: pd.DataFrame, tablo_adi: str) -> pd.DataFrame:
+        """
+        Tablonun belirlenen sutunlarini kayit icin sikistirir.
+
+        Henuz sozluk yoksa ve yeterli ornek varsa once sozluk egitilir. Yuklemeden gelen
+        SikistirilmisMetin hucreleri ham baytlariyla yazilir.
+        """
+        sutunlar = [sutun for sutun in self.sutunlar.get(tablo_adi, []) if sutun in df.columns]
+        if not sutunlar:
+            return df
+        if self._aktif_sozluk == SOZLUK_YOK:
+            ornekler = [str(deger) for sutun in sutunlar for deger in df[sutun].dropna()
+                        if isinstance(deger, (str, SikistirilmisMetin))][:5000]
+            if len(ornekler) >= MIN_ORNEK:
+                self.sozluk_egit(conn, ornekler)
+
+        for sutun in sutunlar:
+            df[sutun] = [deger.ham if isinstance(deger, SikistirilmisMetin) else self.sikistir(deger)
+                         for deger in df[sutun]]
+        return df
+
+    def cerceve_ac(self, df: pd.DataFrame, tablo_adi: str) -> pd.DataFrame:
+        """Sikistirilmis hucreleri tembel SikistirilmisMetin nesnelerine cevirir (acma yapilmaz)"""
+        for sutun in self.sutunlar.get(tablo_adi, []):
+            if sutun in df.columns:
+                df[sutun] = [SikistirilmisMetin(bytes(deger), self) if self.sikistirilmis_mi(deger) else deger
+                             for deger in df[sutun]]
+        return df
@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTa
                              QToolButton)
 from PyQt6.QtCore import QDate, pyqtSignal, QThread, Qt, QTimer
 from PyQt6.QtGui import QColor, QIcon, QAction, QFont
-from events import Event, EventManager, EVENT_DATA_UPDATED, EVENT_UI_UPDATED, EVENT_ERROR_OCCURRED
+from events import Event, EventManager, EVENT_DATA_UPDATED, EVENT_UI_UPDATED, EVENT_ERROR_OCCURRED, TESLIMAT_ANA_THREAD
 from veri_yukleme_worker import VeriYuklemeWorker
 from ui_interface import UIInterface
 import pandas as pd
@@ -19,8 +19,8 @@ class AnaPencere(QMainWindow, UIInterface):
         super().__init__(*args, **kwargs)
         # Event aboneligi
         if hasattr(self, 'event_manager') and self.event_manager:
-            self.event_manager.subscribe(EVENT_DATA_UPDATED, self.tum_sekmeleri_guncelle)
-            self.event_manager.subscribe(EVENT_UI_UPDATED, self._on_ui_updated)
+            self.event_manager.subscribe(EVENT_DATA_UPDATED, self.tum_sekmeleri_guncelle, teslimat=TESLIMAT_ANA_THREAD)
+            self.event_manager.subscribe(EVENT_UI_UPDATED, self._on_ui_updated, teslimat=TESLIMAT_ANA_THREAD)
         
         # Eksik veri uyarı sistemi için timer
         self.uyari_timer = QTimer(self)
@@ -171,7 +171,7 @@ class AnaPencere(QMainWindow, UIInterface):
     def hammadde_tablosu_guncelle(self):
         """Hammadde tablosunu gunceller"""
         try:
-            hammadde_df = self.services.data_manager.hammadde_df
+            hammadde_df = self.services.data_manager.goruntu_al().hammadde_df  # Tablo kilit tutmadan goruntuden doldurulur
             
             self.hammadde_tablosu.setRowCount(0)
             
@@ -573,7 +573,7 @@ class AnaPencere(QMainWindow, UIInterface):
     def urun_bom_tablosu_guncelle(self):
         """Urun BOM tablosunu gunceller"""
         try:
-            urun_bom_df = self.services.data_manager.urun_bom_df
+            urun_bom_df = self.services.data_manager.goruntu_al().urun_bom_df
             
             self.urun_bom_tablosu.setRowCount(0)
             
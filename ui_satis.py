@@ -5,12 +5,13 @@
     QDialogButtonBox, QDateEdit, QProgressBar, QLabel, QFileDialog, QListWidget,
     QProgressDialog
 )
-from PyQt6.QtCore import QDate, pyqtSignal, QThreadPool, Qt
+from PyQt6.QtCore import QDate, pyqtSignal, Qt
 from PyQt6.QtGui import QColor, QIcon, QAction
 import pandas as pd
 import re
-from events import Event, EventManager, EVENT_DATA_UPDATED, EVENT_UI_UPDATED, EVENT_ERROR_OCCURRED
+from events import Event, EventManager, EVENT_DATA_UPDATED, EVENT_UI_UPDATED, EVENT_ERROR_OCCURRED, TESLIMAT_ANA_THREAD
 from veri_yukleme_worker import VeriYuklemeWorker
+from task_scheduler import gorev_zamanlayici, SERIT_ETKILESIMLI
 from satis_worker import SatisEklemeWorker, ZiyaretEklemeWorker, SatisSilmeWorker, ZiyaretSilmeWorker, SatisDuzenlemeWorker, ZiyaretDuzenlemeWorker
 from ui_interface import UIInterface
 from thread_worker import Worker  # Varsayıyorum ki bu dosya mevcut
@@ -20,12 +21,11 @@ class AnaPencere(QMainWindow, UIInterface):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.thread_pool = QThreadPool()
-        self.thread_pool.setMaxThreadCount(4)  # Maksimum 4 thread
+        self.thread_pool = gorev_zamanlayici()  # Paylasilan oncelikli gorev zamanlayicisi
         # Event aboneligi
         if hasattr(self, 'event_manager') and self.event_manager:
-            self.event_manager.subscribe(EVENT_DATA_UPDATED, self.tum_sekmeleri_guncelle)
-            self.event_manager.subscribe(EVENT_UI_UPDATED, self._on_ui_updated)
+            self.event_manager.subscribe(EVENT_DATA_UPDATED, self.tum_sekmeleri_guncelle, teslimat=TESLIMAT_ANA_THREAD)
+            self.event_manager.subscribe(EVENT_UI_UPDATED, self._on_ui_updated, teslimat=TESLIMAT_ANA_THREAD)
     
     def create_action(self, text, slot=None, shortcut=None, icon=None, tip=None, checkable=False):
         """
@@ -172,7 +172,7 @@ class AnaPencere(QMainWindow, UIInterface):
     def satisci_tablosu_guncelle(self):
         """Satisci tablosunu gunceller"""
         try:
-            satiscilar_df = self.services.data_manager.satiscilar_df
+            satiscilar_df = self.services.data_manager.goruntu_al().satiscilar_df  # Tablo kilit tutmadan goruntuden doldurulur
             
             self.satisci_tablosu.setRowCount(0)
             
@@ -464,8 +464,8 @@ class AnaPencere(QMainWindow, UIInterface):
             QMessageBox.warning(self, "Uyari", "Lutfen duzenlemek istediginiz hedefi secin.")
 
     def satis_hedefleri_tablosu_guncelle(self):
-        if self.services.data_manager.aylik_hedefler_df is not None and not self.services.data_manager.aylik_hedefler_df.empty:
-            df = self.services.data_manager.aylik_hedefler_df.copy()
+        df = self.services.data_manager.goruntu_al().aylik_hedefler_df
+        if df is not None and not df.empty:
             
             # Ay formatini kontrol et ve logla
             if 'Ay' in df.columns:
@@ -1345,22 +1345,29 @@ class AnaPencere(QMainWindow, UIInterface):
         self.musteri_tablosu_guncelle()  # Ilk acilista tabloyu guncelle
 
     def musteri_tablosu_guncelle(self):
-        if self.services.data_manager.musteriler_df is not None and not self.services.data_manager.musteriler_df.empty:
-            df = self.services.data_manager.musteriler_df
-            self.musteri_tablosu.setRowCount(len(df))
-            
+        """Musteri tablosunu gunceller; satirlar yenileme seridinde hazirlanir."""
+        sutunlar = ["Musteri Adi", "Sektor", "Bolge", "Global/Lokal", "Musteri Turu", "Ana Musteri", "Son Satin Alma Tarihi"]
+        goruntu = self.services.data_manager.goruntu_al()
+
+        def satirlari_hazirla():
+            df = goruntu.musteriler_df
+            if df is None or df.empty:
+                return []
+            return [[str(musteri.get(sutun, "")) for sutun in sutunlar] for _, musteri in df.iterrows()]
+
+        def tabloyu_doldur(satirlar):
             # Sutun sayisi ve basliklar zaten ayarlandi, sadece verileri ekle
-            for i, (_, musteri) in enumerate(df.iterrows()):
-                self.musteri_tablosu.setItem(i, 0, QTableWidgetItem(str(musteri.get("Musteri Adi", ""))))
-                self.musteri_tablosu.setItem(i, 1, QTableWidgetItem(str(musteri.get("Sektor", ""))))
-                self.musteri_tablosu.setItem(i, 2, QTableWidgetItem(str(musteri.get("Bolge", ""))))
-                self.musteri_tablosu.setItem(i, 3, QTableWidgetItem(str(musteri.get("Global/Lokal", ""))))
-                self.musteri_tablosu.setItem(i, 4, QTableWidgetItem(str(musteri.get("Musteri Turu", ""))))
-                self.musteri_tablosu.setItem(i, 5, QTableWidgetItem(str(musteri.get("Ana Musteri", ""))))
-                self.musteri_tablosu.setItem(i, 6, QTableWidgetItem(str(musteri.get("Son Satin Alma Tarihi", ""))))
-        else:
+            self.musteri_tablosu.setRowCount(len(satirlar))
+            for i, satir in enumerate(satirlar):
+                for j, deger in enumerate(satir):
+                    self.musteri_tablosu.setItem(i, j, QTableWidgetItem(deger))
+
+        def hata(mesaj):
+            self.loglayici.error(f"Musteri tablosu guncellenirken hata: {mesaj}")
             self.musteri_tablosu.setRowCount(0)
 
+        self.thread_pool.yenile("tablo:musteriler", satirlari_hazirla, tabloyu_doldur, hata)
+
     def musteri_ekle(self):
         dialog = QDialog(self)
         dialog.setWindowTitle("Yeni Musteri Ekle")
@@ -1486,9 +1493,8 @@ class AnaPencere(QMainWindow, UIInterface):
                     if not yeni_bilgiler["Musteri Adi"]:
                         QMessageBox.warning(self, "Uyari", "Musteri adi bos birakilamaz.")
                         return
-                    # Duzeltme: Dogrudan DataFrame guncellemesi ve repository.save yerine services kullaniyoruz
-                    self.services.data_manager.musteriler_df.iloc[row] = pd.Series(yeni_bilgiler)
-                    self.services.data_manager.repository.save(self.services.data_manager.musteriler_df, "customers")  # Servis uzerinden kaydetme
+                    # Cerceve yazma kilidi altinda degistirilir ve kilit disinda kaydedilir
+                    self.services.data_manager.musteri_duzenle(row, yeni_bilgiler)
                     self.musteri_tablosu_guncelle()
                     dialog.accept()
                     self.loglayici.info(f"Musteri guncellendi: {yeni_bilgiler['Musteri Adi']} ({yeni_bilgiler['Musteri Turu']})")
@@ -1513,11 +1519,8 @@ class AnaPencere(QMainWindow, UIInterface):
             onay = QMessageBox.question(self, "Onay", f"{musteri_adi} musterisini silmek istediginize emin misiniz?",
                                         QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No)
             if onay == QMessageBox.StandardButton.Yes:
-                # Duzeltme: self.veri_yoneticisi ve self.repository.save kaldirildi
-                self.services.data_manager.musteriler_df = self.services.data_manager.musteriler_df[
-                    self.services.data_manager.musteriler_df["Musteri Adi"] != musteri_adi
-                ]
-                self.services.data_manager.repository.save(self.services.data_manager.musteriler_df, "customers")  # Servis uzerinden kaydetme
+                # Cerceve yazma kilidi altinda degistirilir ve kilit disinda kaydedilir
+                self.services.data_manager.musteri_sil(musteri_adi)
                 self.musteri_tablosu.removeRow(row)
                 self.loglayici.info(f"Musteri silindi: {musteri_adi}")
         else:
@@ -1566,46 +1569,45 @@ class AnaPencere(QMainWindow, UIInterface):
         self.satis_tablosu_guncelle()
 
     def satis_tablosu_guncelle(self):
-        """Satış tablosunu günceller."""
-        try:
-            # Satışlar DataFrame'ini al
-            satislar_df = self.services.data_manager.satislar_df
-            
-            # DataFrame boş veya None ise erken dön
+        """Satış tablosunu günceller; satırlar yenileme şeridinde hazırlanır."""
+        # Sütun bilgilerini tanımla
+        columns = ["Ana Musteri", "Alt Musteri", "Satis Temsilcisi", "Ay", 
+                  "Urun Kodu", "Urun Adi", "Miktar", "Birim Fiyat", 
+                  "Satis Miktari", "Para Birimi"]
+        # Satışlar DataFrame'ini tutarlı görüntüden al (doldurma sırasında yazarlar beklemez)
+        goruntu = self.services.data_manager.goruntu_al()
+
+        def satirlari_hazirla():
+            satislar_df = goruntu.satislar_df
             if satislar_df is None or satislar_df.empty:
-                self.satis_tablosu.setRowCount(0)
+                return []
+            satirlar = []
+            for _, row in satislar_df.iterrows():
+                satir = []
+                for col in columns:
+                    value = row.get(col, "")
+                    satir.append(str(value) if not pd.isna(value) else "Yok" if col == "Alt Musteri" else "")
+                satirlar.append(satir)
+            return satirlar
+
+        def tabloyu_doldur(satirlar):
+            self.satis_tablosu.setRowCount(len(satirlar))
+            if not satirlar:
                 return
-            
-            # Tablo satır sayısını ayarla
-            self.satis_tablosu.setRowCount(len(satislar_df))
-            
-            # Sütun bilgilerini tanımla
-            columns = ["Ana Musteri", "Alt Musteri", "Satis Temsilcisi", "Ay", 
-                      "Urun Kodu", "Urun Adi", "Miktar", "Birim Fiyat", 
-                      "Satis Miktari", "Para Birimi"]
-            
-            # Tablo başlıklarını ayarla
             self.satis_tablosu.setHorizontalHeaderLabels(columns)
-            
-            # DataFrame'i dolaş ve tabloyu doldur
-            for i, row in satislar_df.iterrows():
-                try:
-                    for j, col in enumerate(columns):
-                        value = str(row.get(col, "")) if not pd.isna(row.get(col, "")) else "Yok" if col == "Alt Musteri" else ""
-                        self.satis_tablosu.setItem(i, j, QTableWidgetItem(value))
-                except Exception as row_error:
-                    self.loglayici.error(f"Satir {i} islenirken hata: {str(row_error)}")
-                    # Hatali satiri atla ve devam et
-            
+            for i, satir in enumerate(satirlar):
+                for j, value in enumerate(satir):
+                    self.satis_tablosu.setItem(i, j, QTableWidgetItem(value))
             # Sütun genişliklerini ayarla
             self.satis_tablosu.resizeColumnsToContents()
-            
-        except Exception as e:
-            self.loglayici.error(f"Satis tablosu guncellenirken hata: {str(e)}")
-            QMessageBox.critical(self, "Hata", f"Satış tablosu güncellenirken hata oluştu: {str(e)}")
+
+        def hata(mesaj):
+            QMessageBox.critical(self, "Hata", f"Satış tablosu güncellenirken hata oluştu: {mesaj}")
             # Tabloyu temizle
             self.satis_tablosu.setRowCount(0)
 
+        self.thread_pool.yenile("tablo:satislar", satirlari_hazirla, tabloyu_doldur, hata)
+
     def satis_ekle(self):
         """Yeni satış ekleme işlemini thread-safe şekilde gerçekleştirir."""
         if not hasattr(self.services.data_manager, 'musteriler_df') or self.services.data_manager.musteriler_df is None or self.services.data_manager.musteriler_df.empty:
@@ -1714,7 +1716,7 @@ class AnaPencere(QMainWindow, UIInterface):
                 worker = SatisEklemeWorker(self.services, yeni_satis)
                 worker.signals.tamamlandi.connect(lambda: self._satis_ekle_tamamlandi(dialog, progress_dialog, yeni_satis["Ana Musteri"], ay_str))
                 worker.signals.hata.connect(lambda hata: self._islem_hata(hata, progress_dialog))
-                self.thread_pool.start(worker)
+                self.thread_pool.gonder(worker.run, serit=SERIT_ETKILESIMLI)
 
             except ValueError as ve:
                 QMessageBox.warning(self, "Uyarı", str(ve))
@@ -1767,6 +1769,7 @@ class AnaPencere(QMainWindow, UIInterface):
             yerlesim = QFormLayout()
 
             satis = self.services.data_manager.satislar_df.iloc[row]  # self.veri_yoneticisi -> self.services.data_manager
+            surum = self.services.data_manager.satir_surumu("sales", row)  # Kayit arada degisirse duzenleme reddedilir
             ana_musteri_giris = QComboBox()
             ana_musteriler = self.services.data_manager.musteriler_df[  # self.veri_yoneticisi -> self.services.data_manager
                 self.services.data_manager.musteriler_df["Musteri Turu"] == "Ana Musteri"
@@ -1934,19 +1937,14 @@ class AnaPencere(QMainWindow, UIInterface):
                     progress_dialog.show()
 
                     # Worker oluştur
-                    worker = SatisDuzenlemeWorker(self.services, row, yeni_bilgiler)
+                    worker = SatisDuzenlemeWorker(self.services, row, yeni_bilgiler, surum)
                     worker.signals.tamamlandi.connect(lambda: self._satis_duzenle_tamamlandi(dialog, progress_dialog, yeni_bilgiler["Ana Musteri"], ay_str))
                     worker.signals.hata.connect(lambda hata: self._islem_hata(hata, progress_dialog))
-                    self.thread_pool.start(worker)
+                    self.thread_pool.gonder(worker.run, serit=SERIT_ETKILESIMLI)
                     
                     
                     # Musterinin son satin alma tarihini guncelle
-                    musteri_adi = yeni_bilgiler["Ana Musteri"]
-                    self.services.data_manager.musteriler_df.loc[
-                        self.services.data_manager.musteriler_df["Musteri Adi"] == musteri_adi,
-                        "Son Satin Alma Tarihi"
-                    ] = ay_str
-                    self.services.data_manager.repository.save(self.services.data_manager.musteriler_df, "customers")  # Musterileri kaydetme
+                    self.services.data_manager.son_satin_alma_guncelle(yeni_bilgiler["Ana Musteri"], ay_str)
                     self.satis_tablosu_guncelle()
                     self.musteri_tablosu_guncelle()
                     
@@ -1989,6 +1987,7 @@ class AnaPencere(QMainWindow, UIInterface):
         selected_items = self.satis_tablosu.selectedItems()
         if selected_items:
             row = selected_items[0].row()
+            surum = self.services.data_manager.satir_surumu("sales", row)
             musteri_adi = self.satis_tablosu.item(row, 0).text()
             ay = self.satis_tablosu.item(row, 3).text()
             onay = QMessageBox.question(self, "Onay", f"{musteri_adi} - {ay} satış kaydını silmek istediğinize emin misiniz?",
@@ -1998,10 +1997,10 @@ class AnaPencere(QMainWindow, UIInterface):
                 progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
                 progress_dialog.show()
 
-                worker = SatisSilmeWorker(self.services, row)
+                worker = SatisSilmeWorker(self.services, row, surum)
                 worker.signals.tamamlandi.connect(lambda: self._satis_sil_tamamlandi(row, progress_dialog))
                 worker.signals.hata.connect(lambda hata: self._islem_hata(hata, progress_dialog))
-                self.thread_pool.start(worker)
+                self.thread_pool.gonder(worker.run, serit=SERIT_ETKILESIMLI)
         else:
             QMessageBox.warning(self, "Uyarı", "Lütfen silmek için bir satış seçin.")
 
@@ -2078,77 +2077,72 @@ class AnaPencere(QMainWindow, UIInterface):
         return ziyaret_tab
 
     def ziyaret_tablosu_guncelle(self):
-        try:
-            # Ziyaret tablosu nesnesinin var olup olmadigini kontrol et
-            if not hasattr(self, 'ziyaret_tablosu') or self.ziyaret_tablosu is None:
-                return
-                
-            if self.services.data_manager.ziyaretler_df is None or self.services.data_manager.ziyaretler_df.empty:
+        # Ziyaret tablosu nesnesinin var olup olmadigini kontrol et
+        if not hasattr(self, 'ziyaret_tablosu') or self.ziyaret_tablosu is None:
+            return
+
+        sutunlar = ["Musteri Adi", "Satis Temsilcisi", "Tarih", "Saat", "Ziyaret Konusu", "Notlar", "Durum"]
+        durum_renkleri = {
+            "Tamamlandi": QColor(200, 255, 200),  # Acik yesil
+            "Iptal Edildi": QColor(255, 200, 200),  # Acik kirmizi
+            "Ertelendi": QColor(255, 255, 200)  # Acik sari
+        }
+        goruntu = self.services.data_manager.goruntu_al()
+
+        def satirlari_hazirla():
+            ziyaretler_df = goruntu.ziyaretler_df
+            if ziyaretler_df is None or ziyaretler_df.empty:
+                return []
+            satirlar = []
+            for _, ziyaret in ziyaretler_df.iterrows():
+                # Tarih - Eski "Ziyaret Tarihi" alanini da kontrol et
+                tarih = ziyaret.get("Tarih", ziyaret.get("Ziyaret Tarihi", ""))
+                notlar = str(ziyaret.get("Notlar", ""))
+                # Notlar cok uzunsa kisalt
+                if len(notlar) > 50:
+                    notlar = notlar[:47] + "..."
+                satirlar.append([
+                    str(ziyaret.get("Musteri Adi", "")),
+                    str(ziyaret.get("Satis Temsilcisi", "")),
+                    str(tarih),
+                    str(ziyaret.get("Saat", "")),
+                    str(ziyaret.get("Ziyaret Konusu", "")),
+                    notlar,
+                    str(ziyaret.get("Durum", "Planlanmis"))
+                ])
+            return satirlar
+
+        def tabloyu_doldur(satirlar):
+            if not satirlar:
                 self.ziyaret_tablosu.setRowCount(0)
                 self.ziyaret_tablosu.setColumnCount(0)
                 return
-            
+
             # Sutun basliklarini ayarla
-            sutunlar = ["Musteri Adi", "Satis Temsilcisi", "Tarih", "Saat", "Ziyaret Konusu", "Notlar", "Durum"]
             self.ziyaret_tablosu.setColumnCount(len(sutunlar))
             self.ziyaret_tablosu.setHorizontalHeaderLabels(sutunlar)
-            
+
             # Verileri tabloya ekle
-            self.ziyaret_tablosu.setRowCount(len(self.services.data_manager.ziyaretler_df))
-            for i, (_, ziyaret) in enumerate(self.services.data_manager.ziyaretler_df.iterrows()):
-                # Musteri Adi
-                self.ziyaret_tablosu.setItem(i, 0, QTableWidgetItem(str(ziyaret.get("Musteri Adi", ""))))
-                
-                # Satis Temsilcisi
-                self.ziyaret_tablosu.setItem(i, 1, QTableWidgetItem(str(ziyaret.get("Satis Temsilcisi", ""))))
-                
-                # Tarih - Eski "Ziyaret Tarihi" alanini da kontrol et
-                tarih = ziyaret.get("Tarih", ziyaret.get("Ziyaret Tarihi", ""))
-                self.ziyaret_tablosu.setItem(i, 2, QTableWidgetItem(str(tarih)))
-                
-                # Saat
-                self.ziyaret_tablosu.setItem(i, 3, QTableWidgetItem(str(ziyaret.get("Saat", ""))))
-                
-                # Ziyaret Konusu
-                self.ziyaret_tablosu.setItem(i, 4, QTableWidgetItem(str(ziyaret.get("Ziyaret Konusu", ""))))
-                
-                # Notlar
-                notlar = str(ziyaret.get("Notlar", ""))
-                # Notlar cok uzunsa kisalt
-                if len(notlar) > 50:
-                    notlar = notlar[:47] + "..."
-                self.ziyaret_tablosu.setItem(i, 5, QTableWidgetItem(notlar))
-                
-                # Durum
-                self.ziyaret_tablosu.setItem(i, 6, QTableWidgetItem(str(ziyaret.get("Durum", "Planlanmis"))))
-                
+            self.ziyaret_tablosu.setRowCount(len(satirlar))
+            for i, satir in enumerate(satirlar):
                 # Durum sutununa gore renklendirme
-                durum = str(ziyaret.get("Durum", "Planlanmis"))
-                if durum == "Tamamlandi":
-                    for j in range(self.ziyaret_tablosu.columnCount()):
-                        item = self.ziyaret_tablosu.item(i, j)
-                        if item:
-                            item.setBackground(QColor(200, 255, 200))  # Acik yesil
-                elif durum == "Iptal Edildi":
-                    for j in range(self.ziyaret_tablosu.columnCount()):
-                        item = self.ziyaret_tablosu.item(i, j)
-                        if item:
-                            item.setBackground(QColor(255, 200, 200))  # Acik kirmizi
-                elif durum == "Ertelendi":
-                    for j in range(self.ziyaret_tablosu.columnCount()):
-                        item = self.ziyaret_tablosu.item(i, j)
-                        if item:
-                            item.setBackground(QColor(255, 255, 200))  # Acik sari
-            
+                renk = durum_renkleri.get(satir[6])
+                for j, deger in enumerate(satir):
+                    item = QTableWidgetItem(deger)
+                    if renk is not None:
+                        item.setBackground(renk)
+                    self.ziyaret_tablosu.setItem(i, j, item)
+
             # Sutunlari otomatik genislige ayarla
             self.ziyaret_tablosu.resizeColumnsToContents()
             
             # Notlar sutununu biraz daha genis yap
             self.ziyaret_tablosu.setColumnWidth(5, 150)
-            
-        except Exception as e:
-            self.loglayici.error(f"Ziyaret tablosu guncellenirken hata: {str(e)}")
-            # QMessageBox.critical(self, "Hata", f"Ziyaret tablosu guncellenirken hata: {str(e)}")
+
+        def hata(mesaj):
+            self.loglayici.error(f"Ziyaret tablosu guncellenirken hata: {mesaj}")
+
+        self.thread_pool.yenile("tablo:ziyaretler", satirlari_hazirla, tabloyu_doldur, hata)
 
     def ziyaret_ekle(self):
         """Yeni ziyaret ekleme işlemini thread-safe şekilde gerçekleştirir."""
@@ -2221,7 +2215,7 @@ class AnaPencere(QMainWindow, UIInterface):
                 worker = ZiyaretEklemeWorker(self.services, yeni_ziyaret)
                 worker.signals.tamamlandi.connect(lambda: self._ziyaret_ekle_tamamlandi(dialog, progress_dialog))
                 worker.signals.hata.connect(lambda hata: self._islem_hata(hata, progress_dialog))
-                self.thread_pool.start(worker)
+                self.thread_pool.gonder(worker.run, serit=SERIT_ETKILESIMLI)
 
             except ValueError as ve:
                 QMessageBox.warning(self, "Uyarı", str(ve))
@@ -2245,6 +2239,7 @@ class AnaPencere(QMainWindow, UIInterface):
         selected_items = self.ziyaret_tablosu.selectedItems()
         if selected_items:
             row = selected_items[0].row()
+            surum = self.services.data_manager.satir_surumu("visits", row)
             musteri_adi = self.ziyaret_tablosu.item(row, 0).text()
             tarih = self.ziyaret_tablosu.item(row, 2).text()
             onay = QMessageBox.question(self, "Onay", f"{musteri_adi} - {tarih} ziyaretini silmek istediğinize emin misiniz?",
@@ -2254,10 +2249,10 @@ class AnaPencere(QMainWindow, UIInterface):
                 progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
                 progress_dialog.show()
 
-                worker = ZiyaretSilmeWorker(self.services, row)
+                worker = ZiyaretSilmeWorker(self.services, row, surum)
                 worker.signals.tamamlandi.connect(lambda: self._ziyaret_sil_tamamlandi(row, progress_dialog))
                 worker.signals.hata.connect(lambda hata: self._islem_hata(hata, progress_dialog))
-                self.thread_pool.start(worker)
+                self.thread_pool.gonder(worker.run, serit=SERIT_ETKILESIMLI)
         else:
             QMessageBox.warning(self, "Uyarı", "Lütfen silmek için bir ziyaret seçin.")
 
@@ -2302,6 +2297,7 @@ class AnaPencere(QMainWindow, UIInterface):
         yerlesim = QFormLayout()
 
         ziyaret = self.services.data_manager.ziyaretler_df.iloc[row]  # self.veri_yoneticisi -> self.services.data_manager
+        surum = self.services.data_manager.satir_surumu("visits", row)
         musteri_giris = QComboBox()
         musteri_giris.addItems(self.services.data_manager.musteriler_df["Musteri Adi"].astype(str).tolist())  # self.veri_yoneticisi -> self.services.data_manager
         musteri_giris.setCurrentText(str(ziyaret["Musteri Adi"]))
@@ -2398,10 +2394,10 @@ class AnaPencere(QMainWindow, UIInterface):
                 progress_dialog.show()
 
                 # Worker oluştur
-                worker = ZiyaretDuzenlemeWorker(self.services, row, yeni_bilgiler)
+                worker = ZiyaretDuzenlemeWorker(self.services, row, yeni_bilgiler, surum)
                 worker.signals.tamamlandi.connect(lambda: self._ziyaret_duzenle_tamamlandi(dialog, progress_dialog, yeni_bilgiler["Musteri Adi"]))
                 worker.signals.hata.connect(lambda hata: self._islem_hata(hata, progress_dialog))
-                self.thread_pool.start(worker)
+                self.thread_pool.gonder(worker.run, serit=SERIT_ETKILESIMLI)
                 
             except ValueError as ve:
                 QMessageBox.warning(self, "Uyari", str(ve))
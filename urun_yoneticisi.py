@@ -2,6 +2,7 @@
 import pandas as pd
 from typing import Dict, Any
 from events import Event, EVENT_DATA_UPDATED
+from frame_snapshots import paylasimli_kopya
 
 class UrunYoneticisi:
     """
@@ -22,6 +23,7 @@ class UrunYoneticisi:
         self.loglayici = veri_yoneticisi.loglayici
         self.event_manager = veri_yoneticisi.event_manager
         self.urun_hesaplayici = veri_yoneticisi.urun_hesaplayici
+        self.kilit = veri_yoneticisi.kilit  # Cerceveler yazma kilidi altinda degistirilir, kayit kilit disinda yapilir
     
     def hammadde_ekle(self, yeni_hammadde: Dict[str, Any]) -> None:
         """
@@ -31,11 +33,12 @@ class UrunYoneticisi:
             yeni_hammadde: Yeni hammadde bilgilerini iceren sozluk
         """
         yeni_hammadde_df = pd.DataFrame([yeni_hammadde])
-        if self.veri_yoneticisi.hammadde_df is None or self.veri_yoneticisi.hammadde_df.empty:
-            self.veri_yoneticisi.hammadde_df = yeni_hammadde_df
-        else:
-            self.veri_yoneticisi.hammadde_df = pd.concat([self.veri_yoneticisi.hammadde_df, yeni_hammadde_df], ignore_index=True)
-        self.repository.save(self.veri_yoneticisi.hammadde_df, "hammadde")
+        with self.kilit.yazma("hammadde_ekle"):
+            if self.veri_yoneticisi.hammadde_df is None or self.veri_yoneticisi.hammadde_df.empty:
+                self.veri_yoneticisi.hammadde_df = yeni_hammadde_df
+            else:
+                self.veri_yoneticisi.hammadde_df = pd.concat([self.veri_yoneticisi.hammadde_df, yeni_hammadde_df], ignore_index=True)
+        self.veri_yoneticisi.cerceveyi_kaydet("hammadde_df", "hammadde")
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "hammadde_ekle"}))
@@ -49,9 +52,13 @@ class UrunYoneticisi:
             yeni_hammadde: Guncel hammadde bilgilerini iceren sozluk
         """
         if index >= 0 and index < len(self.veri_yoneticisi.hammadde_df):
-            for key, value in yeni_hammadde.items():
-                self.veri_yoneticisi.hammadde_df.at[index, key] = value
-            self.repository.save(self.veri_yoneticisi.hammadde_df, "hammadde")
+            with self.kilit.yazma("hammadde_duzenle"):
+                # Kopya duzenlenip yayinlanir; yerinde yazim cerceve surumunu artirmaz
+                hammadde_df = paylasimli_kopya(self.veri_yoneticisi.hammadde_df)
+                for key, value in yeni_hammadde.items():
+                    hammadde_df.at[index, key] = value
+                self.veri_yoneticisi.hammadde_df = hammadde_df
+            self.veri_yoneticisi.cerceveyi_kaydet("hammadde_df", "hammadde")
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "hammadde_duzenle"}))
@@ -64,8 +71,9 @@ class UrunYoneticisi:
             hammadde_kodu: Silinecek hammaddenin kodu
         """
         if self.veri_yoneticisi.hammadde_df is not None and not self.veri_yoneticisi.hammadde_df.empty:
-            self.veri_yoneticisi.hammadde_df = self.veri_yoneticisi.hammadde_df[self.veri_yoneticisi.hammadde_df["Hammadde Kodu"] != hammadde_kodu]
-            self.repository.save(self.veri_yoneticisi.hammadde_df, "hammadde")
+            with self.kilit.yazma("hammadde_sil"):
+                self.veri_yoneticisi.hammadde_df = self.veri_yoneticisi.hammadde_df[self.veri_yoneticisi.hammadde_df["Hammadde Kodu"] != hammadde_kodu]
+            self.veri_yoneticisi.cerceveyi_kaydet("hammadde_df", "hammadde")
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "hammadde_sil"}))
@@ -77,45 +85,46 @@ class UrunYoneticisi:
         Args:
             yeni_urun_bom: Yeni urun BOM bilgilerini iceren sozluk
         """
-        # Hammadde Adi kontrolu
-        if self.veri_yoneticisi.hammadde_df is not None and not self.veri_yoneticisi.hammadde_df.empty:
-            hammadde_kodu = yeni_urun_bom.get("Hammadde Kodu")
-            if hammadde_kodu:
-                hammadde_df = self.veri_yoneticisi.hammadde_df
-                hammadde_adi = hammadde_df[hammadde_df["Hammadde Kodu"] == hammadde_kodu]["Hammadde Adi"].values
-                if len(hammadde_adi) > 0:
-                    yeni_urun_bom["Hammadde Adi"] = hammadde_adi[0]
+        with self.kilit.yazma("urun_bom_ekle"):
+            # Hammadde Adi kontrolu
+            if self.veri_yoneticisi.hammadde_df is not None and not self.veri_yoneticisi.hammadde_df.empty:
+                hammadde_kodu = yeni_urun_bom.get("Hammadde Kodu")
+                if hammadde_kodu:
+                    hammadde_df = self.veri_yoneticisi.hammadde_df
+                    hammadde_adi = hammadde_df[hammadde_df["Hammadde Kodu"] == hammadde_kodu]["Hammadde Adi"].values
+                    if len(hammadde_adi) > 0:
+                        yeni_urun_bom["Hammadde Adi"] = hammadde_adi[0]
         
-        # Urun Agirligi hesapla
-        urun_kodu = yeni_urun_bom.get("Urun Kodu")
-        if urun_kodu:
-            self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
+            # Urun Agirligi hesapla
+            urun_kodu = yeni_urun_bom.get("Urun Kodu")
+            if urun_kodu:
+                self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
             
-            # Yeni BOM'u gecici olarak ekle
-            temp_df = pd.DataFrame([yeni_urun_bom])
-            if self.veri_yoneticisi.urun_bom_df is None or self.veri_yoneticisi.urun_bom_df.empty:
-                temp_urun_bom_df = temp_df
-            else:
-                temp_urun_bom_df = pd.concat([self.veri_yoneticisi.urun_bom_df, temp_df], ignore_index=True)
+                # Yeni BOM'u gecici olarak ekle
+                temp_df = pd.DataFrame([yeni_urun_bom])
+                if self.veri_yoneticisi.urun_bom_df is None or self.veri_yoneticisi.urun_bom_df.empty:
+                    temp_urun_bom_df = temp_df
+                else:
+                    temp_urun_bom_df = pd.concat([self.veri_yoneticisi.urun_bom_df, temp_df], ignore_index=True)
             
-            # Urun agirligini hesapla
-            self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, temp_urun_bom_df)
-            urun_agirligi = self.urun_hesaplayici.urun_agirligi_hesapla(urun_kodu)
-            yeni_urun_bom["Urun Agirligi"] = urun_agirligi
+                # Urun agirligini hesapla
+                self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, temp_urun_bom_df)
+                urun_agirligi = self.urun_hesaplayici.urun_agirligi_hesapla(urun_kodu)
+                yeni_urun_bom["Urun Agirligi"] = urun_agirligi
             
-            # Urun maliyetini hesapla
-            urun_maliyeti = self.urun_hesaplayici.urun_maliyeti_hesapla(urun_kodu)
-            yeni_urun_bom["Urun Maliyeti"] = urun_maliyeti
+                # Urun maliyetini hesapla
+                urun_maliyeti = self.urun_hesaplayici.urun_maliyeti_hesapla(urun_kodu)
+                yeni_urun_bom["Urun Maliyeti"] = urun_maliyeti
         
-        # Veri cercevesine ekle
-        yeni_urun_bom_df = pd.DataFrame([yeni_urun_bom])
-        if self.veri_yoneticisi.urun_bom_df is None or self.veri_yoneticisi.urun_bom_df.empty:
-            self.veri_yoneticisi.urun_bom_df = yeni_urun_bom_df
-        else:
-            self.veri_yoneticisi.urun_bom_df = pd.concat([self.veri_yoneticisi.urun_bom_df, yeni_urun_bom_df], ignore_index=True)
+            # Veri cercevesine ekle
+            yeni_urun_bom_df = pd.DataFrame([yeni_urun_bom])
+            if self.veri_yoneticisi.urun_bom_df is None or self.veri_yoneticisi.urun_bom_df.empty:
+                self.veri_yoneticisi.urun_bom_df = yeni_urun_bom_df
+            else:
+                self.veri_yoneticisi.urun_bom_df = pd.concat([self.veri_yoneticisi.urun_bom_df, yeni_urun_bom_df], ignore_index=True)
         
         # Veritabanina kaydet
-        self.repository.save(self.veri_yoneticisi.urun_bom_df, "urun_bom")
+        self.veri_yoneticisi.cerceveyi_kaydet("urun_bom_df", "urun_bom")
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "urun_bom_ekle"}))
@@ -128,38 +137,44 @@ class UrunYoneticisi:
             index: Guncellenecek urun BOM'un indeksi
             yeni_urun_bom: Guncel urun BOM bilgilerini iceren sozluk
         """
-        # Eski urun kodunu al (agirlik guncellemesi icin)
-        eski_urun_kodu = None
-        if index >= 0 and index < len(self.veri_yoneticisi.urun_bom_df):
-            eski_urun_kodu = self.veri_yoneticisi.urun_bom_df.at[index, "Urun Kodu"]
+        with self.kilit.yazma("urun_bom_duzenle"):
+            # Eski urun kodunu al (agirlik guncellemesi icin)
+            eski_urun_kodu = None
+            guncellendi = False
+            if index >= 0 and index < len(self.veri_yoneticisi.urun_bom_df):
+                eski_urun_kodu = self.veri_yoneticisi.urun_bom_df.at[index, "Urun Kodu"]
         
-        # Hammadde Adi kontrolu
-        if self.veri_yoneticisi.hammadde_df is not None and not self.veri_yoneticisi.hammadde_df.empty:
-            hammadde_kodu = yeni_urun_bom.get("Hammadde Kodu")
-            if hammadde_kodu:
-                hammadde_df = self.veri_yoneticisi.hammadde_df
-                hammadde_adi = hammadde_df[hammadde_df["Hammadde Kodu"] == hammadde_kodu]["Hammadde Adi"].values
-                if len(hammadde_adi) > 0:
-                    yeni_urun_bom["Hammadde Adi"] = hammadde_adi[0]
+            # Hammadde Adi kontrolu
+            if self.veri_yoneticisi.hammadde_df is not None and not self.veri_yoneticisi.hammadde_df.empty:
+                hammadde_kodu = yeni_urun_bom.get("Hammadde Kodu")
+                if hammadde_kodu:
+                    hammadde_df = self.veri_yoneticisi.hammadde_df
+                    hammadde_adi = hammadde_df[hammadde_df["Hammadde Kodu"] == hammadde_kodu]["Hammadde Adi"].values
+                    if len(hammadde_adi) > 0:
+                        yeni_urun_bom["Hammadde Adi"] = hammadde_adi[0]
         
-        # Guncelleme yap
-        if index >= 0 and index < len(self.veri_yoneticisi.urun_bom_df):
-            for key, value in yeni_urun_bom.items():
-                self.veri_yoneticisi.urun_bom_df.at[index, key] = value
+            # Guncelleme yap
+            if index >= 0 and index < len(self.veri_yoneticisi.urun_bom_df):
+                urun_bom_df = paylasimli_kopya(self.veri_yoneticisi.urun_bom_df)
+                for key, value in yeni_urun_bom.items():
+                    urun_bom_df.at[index, key] = value
+                self.veri_yoneticisi.urun_bom_df = urun_bom_df
             
-            # Urun Agirligi ve Maliyeti guncelle
-            urun_kodu = yeni_urun_bom.get("Urun Kodu", eski_urun_kodu)
-            if urun_kodu:
-                self.urun_agirligi_guncelle(urun_kodu)
-                self.urun_maliyeti_guncelle(urun_kodu)
-            
-            # Eski urun kodu farkli ise, eski urun kodunun agirligini da guncelle
-            if eski_urun_kodu and eski_urun_kodu != urun_kodu:
-                self.urun_agirligi_guncelle(eski_urun_kodu)
-                self.urun_maliyeti_guncelle(eski_urun_kodu)
+                # Urun Agirligi ve Maliyeti guncelle
+                urun_kodu = yeni_urun_bom.get("Urun Kodu", eski_urun_kodu)
+                if urun_kodu:
+                    self.urun_agirligi_guncelle(urun_kodu)
+                    self.urun_maliyeti_guncelle(urun_kodu)
             
+                # Eski urun kodu farkli ise, eski urun kodunun agirligini da guncelle
+                if eski_urun_kodu and eski_urun_kodu != urun_kodu:
+                    self.urun_agirligi_guncelle(eski_urun_kodu)
+                    self.urun_maliyeti_guncelle(eski_urun_kodu)
+                guncellendi = True
+        
+        if guncellendi:
             # Veritabanina kaydet
-            self.repository.save(self.veri_yoneticisi.urun_bom_df, "urun_bom")
+            self.veri_yoneticisi.cerceveyi_kaydet("urun_bom_df", "urun_bom")
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "urun_bom_duzenle"}))
@@ -173,18 +188,19 @@ class UrunYoneticisi:
             hammadde_kodu: Silinecek urun BOM'un hammadde kodu
         """
         if self.veri_yoneticisi.urun_bom_df is not None and not self.veri_yoneticisi.urun_bom_df.empty:
-            # Filtreleme yap
-            self.veri_yoneticisi.urun_bom_df = self.veri_yoneticisi.urun_bom_df[
-                ~((self.veri_yoneticisi.urun_bom_df["Urun Kodu"] == urun_kodu) & 
-                  (self.veri_yoneticisi.urun_bom_df["Hammadde Kodu"] == hammadde_kodu))
-            ]
+            with self.kilit.yazma("urun_bom_sil"):
+                # Filtreleme yap
+                self.veri_yoneticisi.urun_bom_df = self.veri_yoneticisi.urun_bom_df[
+                    ~((self.veri_yoneticisi.urun_bom_df["Urun Kodu"] == urun_kodu) & 
+                      (self.veri_yoneticisi.urun_bom_df["Hammadde Kodu"] == hammadde_kodu))
+                ]
+                
+                # Urun agirligini guncelle
+                self.urun_agirligi_guncelle(urun_kodu)
+                self.urun_maliyeti_guncelle(urun_kodu)
             
             # Veritabanina kaydet
-            self.repository.save(self.veri_yoneticisi.urun_bom_df, "urun_bom")
-            
-            # Urun agirligini guncelle
-            self.urun_agirligi_guncelle(urun_kodu)
-            self.urun_maliyeti_guncelle(urun_kodu)
+            self.veri_yoneticisi.cerceveyi_kaydet("urun_bom_df", "urun_bom")
             
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "urun_bom_sil"}))
@@ -199,11 +215,14 @@ class UrunYoneticisi:
         Returns:
             Urunun guncel agirligi
         """
-        self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
-        urun_agirligi = self.urun_hesaplayici.urun_agirligi_hesapla(urun_kodu)
+        with self.kilit.yazma("urun_agirligi_guncelle"):
+            self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
+            urun_agirligi = self.urun_hesaplayici.urun_agirligi_hesapla(urun_kodu)
         
-        # Urun BOM tablosunda ilgili urunun agirligini guncelle
-        self.veri_yoneticisi.urun_bom_df.loc[self.veri_yoneticisi.urun_bom_df["Urun Kodu"] == urun_kodu, "Urun Agirligi"] = urun_agirligi
+            # Urun BOM tablosunda ilgili urunun agirligini guncelle
+            urun_bom_df = paylasimli_kopya(self.veri_yoneticisi.urun_bom_df)
+            urun_bom_df.loc[urun_bom_df["Urun Kodu"] == urun_kodu, "Urun Agirligi"] = urun_agirligi
+            self.veri_yoneticisi.urun_bom_df = urun_bom_df
         
         return urun_agirligi
     
@@ -217,11 +236,12 @@ class UrunYoneticisi:
             return
         
         # Urun hesaplayici ile tum agirliklari guncelle
-        self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
-        self.veri_yoneticisi.urun_bom_df = self.urun_hesaplayici.tum_urun_agirliklarini_guncelle(self.veri_yoneticisi.urun_bom_df)
+        with self.kilit.yazma("tum_urun_agirliklarini_guncelle"):
+            self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
+            self.veri_yoneticisi.urun_bom_df = self.urun_hesaplayici.tum_urun_agirliklarini_guncelle(self.veri_yoneticisi.urun_bom_df)
         
         # Veritabanina kaydet
-        self.repository.save(self.veri_yoneticisi.urun_bom_df, "urun_bom")
+        self.veri_yoneticisi.cerceveyi_kaydet("urun_bom_df", "urun_bom")
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"table": "urun_bom"}))
@@ -236,11 +256,14 @@ class UrunYoneticisi:
         Returns:
             Urunun guncel maliyeti
         """
-        self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
-        urun_maliyeti = self.urun_hesaplayici.urun_maliyeti_hesapla(urun_kodu)
+        with self.kilit.yazma("urun_maliyeti_guncelle"):
+            self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
+            urun_maliyeti = self.urun_hesaplayici.urun_maliyeti_hesapla(urun_kodu)
         
-        # Urun BOM tablosunda ilgili urunun maliyetini guncelle
-        self.veri_yoneticisi.urun_bom_df.loc[self.veri_yoneticisi.urun_bom_df["Urun Kodu"] == urun_kodu, "Urun Maliyeti"] = urun_maliyeti
+            # Urun BOM tablosunda ilgili urunun maliyetini guncelle
+            urun_bom_df = paylasimli_kopya(self.veri_yoneticisi.urun_bom_df)
+            urun_bom_df.loc[urun_bom_df["Urun Kodu"] == urun_kodu, "Urun Maliyeti"] = urun_maliyeti
+            self.veri_yoneticisi.urun_bom_df = urun_bom_df
         
         return urun_maliyeti
     
@@ -254,11 +277,12 @@ class UrunYoneticisi:
             return
         
         # Urun hesaplayici ile tum maliyetleri guncelle
-        self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
-        self.veri_yoneticisi.urun_bom_df = self.urun_hesaplayici.tum_urun_maliyetlerini_guncelle(self.veri_yoneticisi.urun_bom_df)
+        with self.kilit.yazma("tum_urun_maliyetlerini_guncelle"):
+            self.urun_hesaplayici.set_data_frames(self.veri_yoneticisi.hammadde_df, self.veri_yoneticisi.urun_bom_df)
+            self.veri_yoneticisi.urun_bom_df = self.urun_hesaplayici.tum_urun_maliyetlerini_guncelle(self.veri_yoneticisi.urun_bom_df)
         
         # Veritabanina kaydet
-        self.repository.save(self.veri_yoneticisi.urun_bom_df, "urun_bom")
+        self.veri_yoneticisi.cerceveyi_kaydet("urun_bom_df", "urun_bom")
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"table": "urun_bom"})) 
\ No newline at end of file
@@ -3,7 +3,8 @@ import pandas as pd
 import numpy as np
 import os
 import logging
-import threading  # self._lock için gerekli import eklendi
+from contextlib import contextmanager
+from concurrent.futures import Future
 from typing import Dict, Optional, List, Tuple, Iterator, Callable, Any
 from repository import RepositoryInterface
 from io import BytesIO  # Yeni eklenen import
@@ -11,6 +12,14 @@ import base64  # Raporlarda kullanilan base64 icin
 from datetime import datetime  # musteri_raporu_olustur icin gerekli
 from events import Event, EventManager, EVENT_DATA_UPDATED, EVENT_ERROR_OCCURRED, EVENT_LOADING_PROGRESS, EVENT_LOADING_COMPLETED, EVENT_LOADING_ERROR, EVENT_BACKUP_COMPLETED  # Event ve olay sabitleri eklendi
 from urun_hesaplayici import UrunHesaplayici  # Yeni modul import edildi
+from process_offload import ProcessOffload
+from analitik import kohort_hesapla, bom_maliyetleri_hesapla
+from row_versions import RowVersions, SURUM_SUTUNU
+from frame_snapshots import YayinlananCerceve, FrameSnapshot, paylasimli_kopya
+from rw_lock import ReadWriteLock, okuyucu
+from text_compression import metinleri_ac
+from change_capture import sayisal_turleri_uygula, cerceve_turleri
+from dimension_tables import NORMALIZE_TABLOLAR
 
 # Yeni yonetici siniflari import edildi
 from veri_yukleyici import VeriYukleyici
@@ -18,12 +27,47 @@ from satis_yoneticisi import SatisYoneticisi
 from musteri_yoneticisi import MusteriYoneticisi
 from urun_yoneticisi import UrunYoneticisi
 
+# Paralel iscilerin satir duzenleyip sildigi, satir surumu tutulan cerceveler (tablo -> ozellik)
+SURUMLU_CERCEVELER = {"sales": "satislar_df", "visits": "ziyaretler_df"}
+CAS_DENEME_SAYISI = 5  # Son deneme iyimser degil, yazma kilidi altinda yapilir
+# Veritabani tablosu -> cerceve ozellikleri; ilk ozellik tablonun kaydedildigi cercevedir
+TABLO_CERCEVELERI = {
+    "customers": ("musteriler_df",),
+    "sales_reps": ("satiscilar_df",),
+    "monthly_targets": ("hedefler_df", "aylik_hedefler_df"),
+    "sales": ("satislar_df",),
+    "visits": ("ziyaretler_df",),
+    "complaints": ("sikayetler_df",),
+    "pipeline": ("pipeline_df",),
+    "hammadde": ("hammadde_df",),
+    "urun_bom": ("urun_bom_df",)
+}
+
 class VeriYoneticisi:
+    # Cerceve atamalari yayindir: surum artar, onceden alinan goruntuler eski cerceveyi gormeye devam eder (bkz. goruntu_al)
+    satislar_df = YayinlananCerceve()
+    ziyaretler_df = YayinlananCerceve()
+    pipeline_df = YayinlananCerceve()
+    musteriler_df = YayinlananCerceve()
+    sikayetler_df = YayinlananCerceve()
+    hammadde_df = YayinlananCerceve()
+    urun_bom_df = YayinlananCerceve()
+    hedefler_df = YayinlananCerceve()
+    aylik_hedefler_df = YayinlananCerceve()
+    satiscilar_df = YayinlananCerceve()
+    YAYINLANAN_CERCEVELER = ("satislar_df", "ziyaretler_df", "pipeline_df", "musteriler_df", "sikayetler_df",
+                             "hammadde_df", "urun_bom_df", "hedefler_df", "aylik_hedefler_df", "satiscilar_df")
+
     def __init__(self, repository, loglayici=None, event_manager=None):
         self.repository = repository
         self.event_manager = event_manager
         self.loglayici = loglayici
-        self._lock = threading.Lock()
+        # Veri katmani kilidi: okuyucular (analizler, goruntu alma) paralel, yazarlar (cerceve
+        # atamalari ve yerinde degisiklikler) ozel ve kisa; kayit ve olay bildirimi kilit disinda yapilir
+        self.kilit = ReadWriteLock("veri_katmani", loglayici)
+        self._yayin_surumu = 0
+        self._cerceve_surumleri: Dict[str, int] = {}
+        self.satir_surumleri = RowVersions()
         self.satislar_df = None
         self.ziyaretler_df = None
         self.pipeline_df = None
@@ -38,6 +82,9 @@ class VeriYoneticisi:
         # Urun hesaplayici olustur
         self.urun_hesaplayici = UrunHesaplayici(self.loglayici, event_manager)
         
+        # Yogun analitik hesaplar icin surec havuzu (ilk buyuk hesapta baslatilir)
+        self.analitik = ProcessOffload(self.loglayici)
+        
         # Yonetici siniflari olustur
         self.veri_yukleyici = VeriYukleyici(self)
         self.satis_yoneticisi = SatisYoneticisi(self)
@@ -100,6 +147,124 @@ class VeriYoneticisi:
     def monthly_targets_df(self, value):
         self.aylik_hedefler_df = value
 
+    def goruntu_al(self) -> FrameSnapshot:
+        """
+        Tum cercevelerin ayni anda alinmis, degistirilemez goruntusunu dondurur.
+
+        Goruntu veri kopyalamaz (bkz. frame_snapshots) ve okuma kilidini yalnizca alinirken
+        tutar; tablo doldurma gibi uzun okuyucular kilit tutmadan tutarli bir veri seti
+        uzerinde calisir. Goruntu alindiktan sonra yayinlanan veya yerinde degistirilen
+        cerceveler goruntuye yansimaz.
+
+        Returns:
+            FrameSnapshot: surum alaninda yayin sayaci, surumler alaninda cerceve bazinda son yayin bulunan goruntu
+        """
+        with self.kilit.okuma():
+            cerceveler = {ad: paylasimli_kopya(self.__dict__.get(ad)) for ad in self.YAYINLANAN_CERCEVELER}
+            return FrameSnapshot(cerceveler, self._yayin_surumu, self._cerceve_surumleri)
+
+    def cerceveyi_kaydet(self, ozellik: str, tablo: str) -> None:
+        """
+        Cercevenin guncel halini yazma kilidi disinda veritabanina kaydeder.
+
+        Yazarlar cerceveyi yazma kilidi altinda degistirir, kaydi kilidi biraktiktan sonra
+        bu metotla yapar. Cercevenin okuma kilidi altinda alinan goruntusu yazilir ve
+        kayitlar siralanir; arada baska bir yazar daha yeni halini kaydettiyse eskisi
+        repository tarafindan atlanir.
+
+        Args:
+            ozellik: Cerceve ozelliginin adi (orn. satiscilar_df)
+            tablo: Veritabani tablo adi
+        """
+        with self.kilit.okuma():
+            df = paylasimli_kopya(getattr(self, ozellik))
+            surum = self.satir_surumleri.sonraki(tablo)
+        self.repository.save(df, tablo, surum=surum)
+
+    @contextmanager
+    def dis_degisiklik(self, tablo: str) -> Iterator[Callable[[pd.DataFrame], None]]:
+        """
+        Tabloyu veritabaninda dogrudan degistiren (orn. senkronizasyon) blok.
+
+        Blok suresince yazma kilidi tutulur. Blok basinda cercevenin guncel hali kaydedilir;
+        kilit disinda bekleyen yerel kayitlar boylece dis degisiklikten once veritabanina
+        ulasir, gec kalirlarsa daha eski surumlu olduklari icin atlanir. Tablo blok icinde
+        dondurulen fonksiyonla kaydedilir ve blok sonunda veritabanindan yeniden yuklenip
+        yayinlanir; sonraki yerel kayit eski cerceveyle dis degisiklikleri silmez.
+
+        Args:
+            tablo: Tablo adi; TABLO_CERCEVELERI'de olmayan tablolar kilitsiz kaydedilir
+
+        Yields:
+            Callable[[pd.DataFrame], None]: Tabloyu guncel surumle kaydeden fonksiyon
+        """
+        ozellikler = TABLO_CERCEVELERI.get(tablo)
+        kaydedildi = False
+
+        def kaydet(df: pd.DataFrame) -> None:
+            nonlocal kaydedildi
+            self.repository.save(df, tablo, surum=self.satir_surumleri.sonraki(tablo))
+            kaydedildi = True
+
+        if ozellikler is None:
+            yield kaydet
+            return
+        with self.kilit.yazma(f"dis_degisiklik:{tablo}"):
+            yerel = getattr(self, ozellikler[0])
+            if yerel is not None:
+                self.repository.save(paylasimli_kopya(yerel), tablo, surum=self.satir_surumleri.sonraki(tablo))
+            yield kaydet
+            if kaydedildi:
+                self._tabloyu_yeniden_yayinla(tablo, yerel)
+
+    def _tabloyu_yeniden_yayinla(self, tablo: str, yerel: Optional[pd.DataFrame]) -> None:
+        """Tabloyu veritabanindan yeniden yukleyip cercevelerine yayinlar; yazma kilidi cagirana aittir"""
+        parcalar = list(self.repository.lazy_load_iterator(tablo, chunk_size=10000))
+        df = pd.concat(parcalar, ignore_index=True) if parcalar else pd.DataFrame()
+        # Cerceveler .str ile aranir; sikistirilmis notlar yayinlanmadan once acilir
+        df = metinleri_ac(df, tablo)
+        if yerel is not None:
+            # Yayinlanan cerceve yerel cercevenin sayisal turlerini korur
+            df = sayisal_turleri_uygula(df, cerceve_turleri(yerel))
+        if tablo in SURUMLU_CERCEVELER:
+            df = self.satir_surumleri.tamamla(df, tablo)
+        for sira, ozellik in enumerate(TABLO_CERCEVELERI[tablo]):
+            setattr(self, ozellik, df if sira == 0 else df.copy())
+
+    def boyut_yeniden_adlandir(self, boyut: str, eski: Any, yeni: Any) -> int:
+        """
+        Musteri, temsilci, urun veya hammadde adini veritabaninda ve cercevelerde degistirir.
+
+        Ad yalnizca boyut tablosunda degistigi icin yuklu cerceveler eski adi tasir ve
+        sonraki kayit eski adi geri yazardi. Islem dis_degisiklik ile ayni sekilde yapilir:
+        yazma kilidi altinda etkilenen cerceveler once kaydedilir (kilit disinda bekleyen
+        eski kayitlar boylece atlanir), ad degistirilir ve tablolar yeniden yuklenip yayinlanir.
+
+        Args:
+            boyut: "musteri", "temsilci", "urun" veya "hammadde"
+            eski: Mevcut ad/kod
+            yeni: Yeni ad/kod (mevcutsa iki kayit birlestirilir)
+
+        Returns:
+            int: Birlestirme sirasinda guncellenen satir sayisi
+
+        Raises:
+            RepositoryError: Boyut veya ad bulunamazsa ya da veritabani hatasinda
+        """
+        tablolar = [tablo for tablo, eslesme in NORMALIZE_TABLOLAR.items()
+                    if boyut in eslesme.values() and tablo in TABLO_CERCEVELERI]
+        with self.kilit.yazma(f"boyut_yeniden_adlandir:{boyut}"):
+            yereller = {tablo: getattr(self, TABLO_CERCEVELERI[tablo][0]) for tablo in tablolar}
+            for tablo, yerel in yereller.items():
+                if yerel is not None:
+                    self.repository.save(paylasimli_kopya(yerel), tablo, surum=self.satir_surumleri.sonraki(tablo))
+            guncellenen = self.repository.boyut_yeniden_adlandir(boyut, eski, yeni)
+            for tablo, yerel in yereller.items():
+                self._tabloyu_yeniden_yayinla(tablo, yerel)
+        if self.loglayici:
+            self.loglayici.info(f"{boyut} yeniden adlandirildi: {eski} -> {yeni}")
+        return guncellenen
+
     def tum_verileri_yukle(self, dosya_yolu: str) -> None:
         return self.veri_yukleyici.tum_verileri_yukle(dosya_yolu)
 
@@ -136,15 +301,33 @@ class VeriYoneticisi:
     def pipeline_firsati_sil(self, musteri_adi):
         return self.satis_yoneticisi.pipeline_firsati_sil(musteri_adi)
 
+    def pipeline_firsati_duzenle(self, index, guncellenmis_firsat):
+        return self.satis_yoneticisi.pipeline_firsati_duzenle(index, guncellenmis_firsat)
+
     def musteri_ekle(self, yeni_musteri):
         return self.musteri_yoneticisi.musteri_ekle(yeni_musteri)
 
+    def musteri_duzenle(self, index, guncellenmis_musteri):
+        return self.musteri_yoneticisi.musteri_duzenle(index, guncellenmis_musteri)
+
+    def musteri_sil(self, musteri_adi):
+        return self.musteri_yoneticisi.musteri_sil(musteri_adi)
+
+    def son_satin_alma_guncelle(self, musteri_adi, tarih):
+        return self.musteri_yoneticisi.son_satin_alma_guncelle(musteri_adi, tarih)
+
     def ziyaret_ekle(self, yeni_ziyaret):
         return self.musteri_yoneticisi.ziyaret_ekle(yeni_ziyaret)
 
     def sikayet_ekle(self, yeni_sikayet):
         return self.musteri_yoneticisi.sikayet_ekle(yeni_sikayet)
 
+    def sikayet_duzenle(self, index, guncellenmis_sikayet):
+        return self.musteri_yoneticisi.sikayet_duzenle(index, guncellenmis_sikayet)
+
+    def sikayet_sil(self, index):
+        return self.musteri_yoneticisi.sikayet_sil(index)
+
     def hammadde_ekle(self, yeni_hammadde):
         return self.urun_yoneticisi.hammadde_ekle(yeni_hammadde)
 
@@ -168,12 +351,14 @@ class VeriYoneticisi:
         if self.urun_bom_df.empty:
             return 0
         
-        # Urun hesaplayici ile agirlik hesapla
-        self.urun_hesaplayici.set_data_frames(self.hammadde_df, self.urun_bom_df)
-        toplam_agirlik = self.urun_hesaplayici.urun_agirligi_hesapla(urun_kodu)
-        
-        # Urun agirligini guncelle
-        self.urun_bom_df.loc[self.urun_bom_df["Urun Kodu"] == urun_kodu, "Urun Agirligi"] = toplam_agirlik
+        # Hesaplayicinin paylasilan cerceveleri ve onbellegi yazma kilidi altinda degisir
+        with self.kilit.yazma("urun_agirligi_guncelle"):
+            self.urun_hesaplayici.set_data_frames(self.hammadde_df, self.urun_bom_df)
+            toplam_agirlik = self.urun_hesaplayici.urun_agirligi_hesapla(urun_kodu)
+            # Kopya duzenlenip yayinlanir; yerinde yazim cerceve surumunu artirmaz
+            urun_bom_df = paylasimli_kopya(self.urun_bom_df)
+            urun_bom_df.loc[urun_bom_df["Urun Kodu"] == urun_kodu, "Urun Agirligi"] = toplam_agirlik
+            self.urun_bom_df = urun_bom_df
         
         return toplam_agirlik
     
@@ -185,11 +370,12 @@ class VeriYoneticisi:
             return
         
         # Urun hesaplayici ile tum agirliklari guncelle
-        self.urun_hesaplayici.set_data_frames(self.hammadde_df, self.urun_bom_df)
-        self.urun_bom_df = self.urun_hesaplayici.tum_urun_agirliklarini_guncelle(self.urun_bom_df)
+        with self.kilit.yazma("tum_urun_agirliklarini_guncelle"):
+            self.urun_hesaplayici.set_data_frames(self.hammadde_df, self.urun_bom_df)
+            self.urun_bom_df = self.urun_hesaplayici.tum_urun_agirliklarini_guncelle(self.urun_bom_df)
         
         # Veritabanina kaydet
-        self.repository.save(self.urun_bom_df, "urun_bom")
+        self.cerceveyi_kaydet("urun_bom_df", "urun_bom")
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"table": "urun_bom"}))
@@ -199,12 +385,13 @@ class VeriYoneticisi:
         if self.urun_bom_df.empty:
             return 0
         
-        # Urun hesaplayici ile maliyet hesapla
-        self.urun_hesaplayici.set_data_frames(self.hammadde_df, self.urun_bom_df)
-        toplam_maliyet = self.urun_hesaplayici.urun_maliyeti_hesapla(urun_kodu)
-        
-        # Urun maliyetini guncelle
-        self.urun_bom_df.loc[self.urun_bom_df["Urun Kodu"] == urun_kodu, "Urun Maliyeti"] = toplam_maliyet
+        # Hesaplayicinin paylasilan cerceveleri ve onbellegi yazma kilidi altinda degisir
+        with self.kilit.yazma("urun_maliyeti_guncelle"):
+            self.urun_hesaplayici.set_data_frames(self.hammadde_df, self.urun_bom_df)
+            toplam_maliyet = self.urun_hesaplayici.urun_maliyeti_hesapla(urun_kodu)
+            urun_bom_df = paylasimli_kopya(self.urun_bom_df)
+            urun_bom_df.loc[urun_bom_df["Urun Kodu"] == urun_kodu, "Urun Maliyeti"] = toplam_maliyet
+            self.urun_bom_df = urun_bom_df
         
         return toplam_maliyet
         
@@ -215,70 +402,83 @@ class VeriYoneticisi:
                 self.loglayici.warning("Urun BOM verisi bos, maliyet hesaplanamadi")
             return
         
-        # Urun hesaplayici ile tum maliyetleri guncelle
-        self.urun_hesaplayici.set_data_frames(self.hammadde_df, self.urun_bom_df)
-        self.urun_bom_df = self.urun_hesaplayici.tum_urun_maliyetlerini_guncelle(self.urun_bom_df)
+        # Urun bazinda maliyet toplamlari (buyuk BOM'larda ayri surecte) hesaplanir
+        with self.kilit.okuma():
+            sutunlar = [sutun for sutun in ("Urun Kodu", "Toplam Maliyet") if sutun in self.urun_bom_df.columns]
+            bom = self.urun_bom_df[sutunlar]
+        maliyetler = self.analitik.calistir(bom_maliyetleri_hesapla, bom)
+        with self.kilit.yazma("tum_urun_maliyetlerini_guncelle"):
+            self.urun_bom_df = self.urun_bom_df.assign(**{"Urun Maliyeti": self.urun_bom_df["Urun Kodu"].map(maliyetler).fillna(0.0)})
+        if self.loglayici:
+            self.loglayici.info(f"Toplam {len(maliyetler)} urunun maliyeti guncellendi")
         
         # Veritabanina kaydet
-        self.repository.save(self.urun_bom_df, "urun_bom")
+        self.cerceveyi_kaydet("urun_bom_df", "urun_bom")
         
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"table": "urun_bom"}))
 
     def kohort_analizi_olustur(self, baslangic_tarihi=None, bitis_tarihi=None):
-        """Kohort analizi olusturur"""
+        """Kohort analizi olusturur (sonucu bekler; Qt ana thread'inden kohort_analizi_gonder kullanilir)"""
         try:
-            if self.satislar_df is None or self.satislar_df.empty:
+            satislar = self._kohort_satislari()
+            if satislar is None:
                 return {"success": False, "message": "Henuz satis verisi bulunmamaktadir."}
-            
-            # Veri cercevesini kopyala
-            df = self.satislar_df.copy()
-            
-            # Tarih sutununu olustur
-            df['Tarih'] = pd.to_datetime(df['Ay'], format='%m-%Y', errors='coerce')
-            
-            # Tarih filtreleme
-            if baslangic_tarihi and bitis_tarihi:
-                baslangic = pd.to_datetime(baslangic_tarihi)
-                bitis = pd.to_datetime(bitis_tarihi)
-                df = df[(df['Tarih'] >= baslangic) & (df['Tarih'] <= bitis)]
-            
-            # Kohort analizi icin gerekli sutunlari olustur
-            df['Kohort Ay'] = df['Tarih'].dt.to_period('M')
-            df['Ay Indeksi'] = (df['Tarih'].dt.year - df['Kohort Ay'].dt.year) * 12 + (df['Tarih'].dt.month - df['Kohort Ay'].dt.month)
-            
-            # Musteri bazinda kohort analizi
-            kohort_musteri = df.groupby(['Kohort Ay', 'Ay Indeksi'])['Ana Musteri'].nunique().reset_index()
-            kohort_musteri_pivot = kohort_musteri.pivot(index='Kohort Ay', columns='Ay Indeksi', values='Ana Musteri')
-            
-            # Ilk ay musteri sayilari
-            ilk_ay_musteriler = kohort_musteri_pivot[0]
-            
-            # Tutma orani hesapla
-            kohort_musteri_oran = kohort_musteri_pivot.divide(ilk_ay_musteriler, axis=0)
-            
-            # Ortalama siparis degeri (AOV) analizi
-            kohort_aov = df.groupby(['Kohort Ay', 'Ay Indeksi'])['Satis Miktari'].mean().reset_index()
-            kohort_aov_pivot = kohort_aov.pivot(index='Kohort Ay', columns='Ay Indeksi', values='Satis Miktari')
-            
-            # Toplam satis analizi
-            kohort_satis = df.groupby(['Kohort Ay', 'Ay Indeksi'])['Satis Miktari'].sum().reset_index()
-            kohort_satis_pivot = kohort_satis.pivot(index='Kohort Ay', columns='Ay Indeksi', values='Satis Miktari')
-            
-            # Sonuclari dondur
-            return {
-                "success": True,
-                "kohort_musteri_oran": kohort_musteri_oran,
-                "kohort_aov_pivot": kohort_aov_pivot,
-                "kohort_satis_pivot": kohort_satis_pivot,
-                "donem": f"{baslangic_tarihi} - {bitis_tarihi}" if baslangic_tarihi and bitis_tarihi else "Tum Zamanlar"
-            }
+            kohort = self.analitik.calistir(kohort_hesapla, satislar, baslangic_tarihi, bitis_tarihi)
+            return self._kohort_sonucu(kohort, baslangic_tarihi, bitis_tarihi)
             
         except Exception as e:
-            self.loglayici.error(f"Kohort analizi olusturulurken hata: {str(e)}")
-            import traceback
-            self.loglayici.error(traceback.format_exc())
-            return {"success": False, "message": f"Kohort analizi olusturulurken hata: {str(e)}"}
+            return self._kohort_hatasi(e)
+
+    def kohort_analizi_gonder(self, baslangic_tarihi=None, bitis_tarihi=None) -> Future:
+        """
+        Kohort analizini beklemeden baslatir.
+
+        Returns:
+            Future: kohort_analizi_olustur ile ayni sozlugu tasiyan Future; hatalar da istisna
+            yerine success=False sozlugu olarak doner. Geri cagrilar hesabi bitiren thread'de calisir.
+        """
+        sonuc: Future = Future()
+        try:
+            satislar = self._kohort_satislari()
+            if satislar is None:
+                sonuc.set_result({"success": False, "message": "Henuz satis verisi bulunmamaktadir."})
+                return sonuc
+            hesap = self.analitik.gonder(kohort_hesapla, satislar, baslangic_tarihi, bitis_tarihi)
+        except Exception as e:
+            sonuc.set_result(self._kohort_hatasi(e))
+            return sonuc
+
+        def bitti(f: Future) -> None:
+            try:
+                sonuc.set_result(self._kohort_sonucu(f.result(), baslangic_tarihi, bitis_tarihi))
+            except Exception as e:
+                sonuc.set_result(self._kohort_hatasi(e))
+
+        hesap.add_done_callback(bitti)
+        return sonuc
+
+    def _kohort_satislari(self) -> Optional[pd.DataFrame]:
+        # Hesap yalnizca gerekli sutunlarla (buyuk veride ayri surecte) ve kilit disinda yapilir
+        sutunlar = ['Ay', 'Ana Musteri', 'Satis Miktari']
+        with self.kilit.okuma():
+            if self.satislar_df is None or self.satislar_df.empty:
+                return None
+            return self.satislar_df[sutunlar]
+
+    @staticmethod
+    def _kohort_sonucu(kohort: Dict[str, Any], baslangic_tarihi, bitis_tarihi) -> Dict[str, Any]:
+        return {
+            "success": True,
+            **kohort,
+            "donem": f"{baslangic_tarihi} - {bitis_tarihi}" if baslangic_tarihi and bitis_tarihi else "Tum Zamanlar"
+        }
+
+    def _kohort_hatasi(self, e: Exception) -> Dict[str, Any]:
+        self.loglayici.error(f"Kohort analizi olusturulurken hata: {str(e)}")
+        import traceback
+        self.loglayici.error(traceback.format_exc())
+        return {"success": False, "message": f"Kohort analizi olusturulurken hata: {str(e)}"}
 
     def oluklu_bilgilerini_getir(self, dalga_tipi=None, grup=None):
         """
@@ -370,6 +570,7 @@ class VeriYoneticisi:
             self.loglayici.error(f"Oluklu m2 hesaplama hatasi: {str(e)}")
             return 0.0
 
+    @okuyucu
     def musteri_grubu_analizi(self) -> pd.DataFrame:
         """
         Musterileri ZER ve Diger olarak gruplandirip analiz yapar.
@@ -478,6 +679,7 @@ class VeriYoneticisi:
                 self.loglayici.error(f"Grup analizi sirasinda hata: {str(e)}")
             return pd.DataFrame()
 
+    @okuyucu
     def toplam_maliyet_hesapla(self, baslangic_tarihi: str = None, bitis_tarihi: str = None) -> Dict[str, Any]:
         """
         Belirtilen tarih araligindaki toplam maliyeti hesaplar.
@@ -567,6 +769,7 @@ class VeriYoneticisi:
                 "donem": f"{baslangic_tarihi} - {bitis_tarihi}" if baslangic_tarihi and bitis_tarihi else "Tum Zamanlar"
             }
 
+    @okuyucu
     def ortalama_av_hesapla(self, baslangic_tarihi: str = None, bitis_tarihi: str = None) -> Dict[str, Any]:
         """
         Belirtilen tarih araligindaki ortalama AV (Arti Value - Katma Deger) oranini hesaplar.
@@ -641,6 +844,7 @@ class VeriYoneticisi:
                 "donem": f"{baslangic_tarihi} - {bitis_tarihi}" if baslangic_tarihi and bitis_tarihi else "Tum Zamanlar"
             }
 
+    @okuyucu
     def toplam_agirlik_hesapla(self, baslangic_tarihi: str = None, bitis_tarihi: str = None) -> Dict[str, Any]:
         """
         Belirtilen tarih araligindaki toplam agirligi hesaplar.
@@ -795,40 +999,119 @@ class VeriYoneticisi:
         """
         return self.veri_yukleyici.parcali_veri_yukle(dosya_yolu, tablo_adi, parca_boyutu, islem_fonksiyonu)
     
+    def kategorileri_genislet(self, df: pd.DataFrame, bilgiler: Dict[str, Any]) -> None:
+        """Yeni degerleri kategorik sutunlarin kategorilerine ekler (cerceve yerinde degistirilir)."""
+        for col, value in bilgiler.items():
+            if col in df.columns and hasattr(df[col], 'cat'):
+                try:
+                    # None veya NaN değerleri kontrol et
+                    if pd.isna(value):
+                        continue
+
+                    # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
+                    if value not in df[col].cat.categories:
+                        df[col] = df[col].cat.add_categories([value])
+                        if self.loglayici:
+                            self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
+                except Exception as cat_error:
+                    if self.loglayici:
+                        self.loglayici.error(f"Kategori güncelleme hatası ({col}): {str(cat_error)}")
+                    if self.event_manager:
+                        self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": f"Kategori güncelleme hatası ({col}): {str(cat_error)}"}))
+
+    def cerceve_guncelle(self, tablo: str, degistir: Callable[[Optional[pd.DataFrame]], pd.DataFrame],
+                         kaydet: bool = True) -> pd.DataFrame:
+        """
+        Surumlu cerceveyi iyimser eszamanlilikla (karsilastir-degistir) gunceller.
+
+        degistir guncel cercevenin satir surumleri tamamlanmis bir kopyasini (cerceve yoksa
+        None) alir ve yeni cerceveyi dondurur. Yeni cerceve yalnizca o arada baska bir yazar
+        cerceveyi degistirmediyse yayinlanir; degistirdiyse degistir guncel cerceve uzerinde
+        yeniden calisir. Farkli satirlara yapilan es zamanli yazimlar boylece birbirini
+        ezmez; ayni satira yapilanlar satir surumu tutmadigi icin SurumCakismasi ile
+        bildirilir. Yazma kilidi yalnizca yayin aninda tutulur, kayit kilit disinda yapilir
+        ve repository daha yeni bir surum yazilmissa eski cerceveyi yazmaz. Cerceve
+        CAS_DENEME_SAYISI - 1 denemede de baska yazarlarca degistirildiyse son deneme yazma
+        kilidi altinda yapilir; yogun eklemeler cakisma hatasi almaz.
+
+        Args:
+            tablo: SURUMLU_CERCEVELER'deki tablo adi
+            degistir: Kopyayi degistirip yeni cerceveyi donduren fonksiyon
+            kaydet: False ise cerceve yalnizca bellekte yayinlanir
+
+        Returns:
+            pd.DataFrame: Yayinlanan cerceve
+
+        Raises:
+            SurumCakismasi: Duzenlenen satirin surumu tutmadiysa (degistir icinden)
+        """
+        ozellik = SURUMLU_CERCEVELER[tablo]
+        for _ in range(CAS_DENEME_SAYISI - 1):
+            with self.kilit.okuma():
+                taban = getattr(self, ozellik)
+                kopya = paylasimli_kopya(taban)
+            yeni = self._kopyayi_degistir(kopya, tablo, degistir)
+            with self.kilit.yazma(f"cerceve_guncelle:{tablo}"):
+                if getattr(self, ozellik) is not taban:
+                    continue  # Baska bir yazar once yayinladi; degisiklik guncel cerceveye yeniden uygulanir
+                setattr(self, ozellik, yeni)
+                kayit = paylasimli_kopya(yeni)
+                surum = self.satir_surumleri.sonraki(tablo)
+            break
+        else:
+            # Yarislar art arda kaybedildi; degisiklik yazma kilidi altinda uygulanir ve yayinlanir
+            with self.kilit.yazma(f"cerceve_guncelle:{tablo}"):
+                yeni = self._kopyayi_degistir(paylasimli_kopya(getattr(self, ozellik)), tablo, degistir)
+                setattr(self, ozellik, yeni)
+                kayit = paylasimli_kopya(yeni)
+                surum = self.satir_surumleri.sonraki(tablo)
+        if kaydet:
+            self.repository.save(kayit, tablo, surum=surum)
+        return yeni
+
+    def _kopyayi_degistir(self, kopya: Optional[pd.DataFrame], tablo: str,
+                          degistir: Callable[[Optional[pd.DataFrame]], pd.DataFrame]) -> pd.DataFrame:
+        kopya = self.satir_surumleri.tamamla(kopya, tablo) if kopya is not None else None
+        return self.satir_surumleri.tamamla(degistir(kopya), tablo)
+
+    def satir_surumu(self, tablo: str, konum: int) -> Optional[int]:
+        """
+        Tablodaki sirasi verilen satirin guncel surumunu dondurur.
+
+        Arayuz satiri okurken surumu alir ve duzenleme/silme cagrisina beklenen_surum olarak
+        verir; satir o arada degismisse cagri SurumCakismasi ile reddedilir.
+        """
+        df = getattr(self, SURUMLU_CERCEVELER[tablo])
+        if df is None or not 0 <= konum < len(df):
+            return None
+        if SURUM_SUTUNU not in df.columns or pd.isna(df[SURUM_SUTUNU].iloc[konum]):
+            df = self.cerceve_guncelle(tablo, lambda kopya: kopya, kaydet=False)
+        return int(df[SURUM_SUTUNU].iloc[konum])
+
+    def _satiri_guncelle(self, df: pd.DataFrame, tablo: str, konum, bilgiler: Dict[str, Any],
+                         beklenen_surum: Optional[int]) -> pd.DataFrame:
+        etiket = self.satir_surumleri.satir_bul(df, tablo, konum, beklenen_surum)
+        self.kategorileri_genislet(df, bilgiler)
+        for col, value in bilgiler.items():
+            if col in df.columns:
+                df.at[etiket, col] = value
+        self.satir_surumleri.yenile(df, tablo, [etiket])
+        return df
+
+    def _satiri_sil(self, df: pd.DataFrame, tablo: str, konum, beklenen_surum: Optional[int]) -> pd.DataFrame:
+        etiket = self.satir_surumleri.satir_bul(df, tablo, konum, beklenen_surum)
+        return df.drop(etiket).reset_index(drop=True)
+
+    def _satir_ekle(self, df: Optional[pd.DataFrame], veri: Dict[str, Any]) -> pd.DataFrame:
+        if df is None or df.empty:
+            return pd.DataFrame([veri])
+        self.kategorileri_genislet(df, veri)
+        return pd.concat([df, pd.DataFrame([veri])], ignore_index=True)
+
     def add_sale(self, sale_data):
         """Yeni satış ekler ve kategorik sütunları günceller."""
         try:
-            with self._lock:
-                # Kategorik sütunları kontrol et ve gerekirse güncelle
-                if self.satislar_df is not None and not self.satislar_df.empty:
-                    for col, value in sale_data.items():
-                        if col in self.satislar_df.columns and hasattr(self.satislar_df[col], 'cat'):
-                            try:
-                                # None veya NaN değerleri kontrol et
-                                if pd.isna(value):
-                                    continue
-                                    
-                                # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
-                                if value not in self.satislar_df[col].cat.categories:
-                                    new_categories = self.satislar_df[col].cat.categories.tolist()
-                                    new_categories.append(value)
-                                    self.satislar_df[col] = self.satislar_df[col].cat.set_categories(new_categories)
-                                    if self.loglayici:
-                                        self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
-                            except Exception as cat_error:
-                                if self.loglayici:
-                                    self.loglayici.error(f"Kategori güncelleme hatası ({col}): {str(cat_error)}")
-                                if self.event_manager:
-                                    self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": f"Kategori güncelleme hatası ({col}): {str(cat_error)}"}))
-                
-                # Yeni satış verisini ekle
-                if self.satislar_df is None or self.satislar_df.empty:
-                    self.satislar_df = pd.DataFrame([sale_data])
-                else:
-                    self.satislar_df = pd.concat([self.satislar_df, pd.DataFrame([sale_data])], ignore_index=True)
-                
-                # Veritabanına kaydet
-                self.repository.save(self.satislar_df, "sales")
+            self.cerceve_guncelle("sales", lambda df: self._satir_ekle(df, sale_data))
                 
             # Olay bildir
             if self.event_manager:
@@ -842,73 +1125,46 @@ class VeriYoneticisi:
             raise
 
     def add_visit(self, visit_data):
-        with self._lock:
-            if self.ziyaretler_df is None or self.ziyaretler_df.empty:
-                self.ziyaretler_df = pd.DataFrame([visit_data])
-            else:
-                self.ziyaretler_df = pd.concat([self.ziyaretler_df, pd.DataFrame([visit_data])], ignore_index=True)
-            self.repository.save(self.ziyaretler_df, "visits")
+        self.cerceve_guncelle("visits", lambda df: self._satir_ekle(df, visit_data))
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "add_visit"}))
 
-    def delete_sale(self, index):
-        with self._lock:
-            if self.satislar_df is not None and not self.satislar_df.empty:
-                self.satislar_df = self.satislar_df.drop(index).reset_index(drop=True)
-                self.repository.save(self.satislar_df, "sales")
+    def delete_sale(self, index, beklenen_surum: Optional[int] = None):
+        """
+        Satisi siler.
+
+        Args:
+            index: Satirin okundugu andaki indeksi
+            beklenen_surum: Satirin okundugu andaki surumu (bkz. satir_surumu); verilirse satir
+                surumuyle bulunur, o arada degismis veya silinmisse SurumCakismasi firlatilir
+        """
+        if self.satislar_df is not None and not self.satislar_df.empty:
+            self.cerceve_guncelle("sales", lambda df: self._satiri_sil(df, "sales", index, beklenen_surum))
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "delete_sale"}))
 
-    def delete_visit(self, index):
-        with self._lock:
-            if self.ziyaretler_df is not None and not self.ziyaretler_df.empty:
-                self.ziyaretler_df = self.ziyaretler_df.drop(index).reset_index(drop=True)
-                self.repository.save(self.ziyaretler_df, "visits")
+    def delete_visit(self, index, beklenen_surum: Optional[int] = None):
+        """Ziyareti siler (beklenen_surum icin bkz. delete_sale)"""
+        if self.ziyaretler_df is not None and not self.ziyaretler_df.empty:
+            self.cerceve_guncelle("visits", lambda df: self._satiri_sil(df, "visits", index, beklenen_surum))
         if self.event_manager:
             self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "delete_visit"}))
 
-    def update_sale(self, row, yeni_bilgiler):
-        """Satış bilgilerini günceller ve kategorik sütunları kontrol eder."""
+    def update_sale(self, row, yeni_bilgiler, beklenen_surum: Optional[int] = None):
+        """Satış bilgilerini günceller ve kategorik sütunları kontrol eder (beklenen_surum icin bkz. delete_sale)."""
         try:
-            with self._lock:
-                if self.satislar_df is not None and not self.satislar_df.empty:
-                    # Kategorik sütunları kontrol et ve gerekirse güncelle
-                    for col, value in yeni_bilgiler.items():
-                        if col in self.satislar_df.columns and hasattr(self.satislar_df[col], 'cat'):
-                            try:
-                                # None veya NaN değerleri kontrol et
-                                if pd.isna(value):
-                                    continue
-                                    
-                                # Eğer yeni değer mevcut kategorilerde yoksa, kategorileri güncelle
-                                if value not in self.satislar_df[col].cat.categories:
-                                    new_categories = self.satislar_df[col].cat.categories.tolist()
-                                    new_categories.append(value)
-                                    self.satislar_df[col] = self.satislar_df[col].cat.set_categories(new_categories)
-                                    if self.loglayici:
-                                        self.loglayici.debug(f"'{col}' sütunu için yeni kategori eklendi: {value}")
-                            except Exception as cat_error:
-                                if self.loglayici:
-                                    self.loglayici.error(f"Kategori güncelleme hatası ({col}): {str(cat_error)}")
-                                if self.event_manager:
-                                    self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": f"Kategori güncelleme hatası ({col}): {str(cat_error)}"}))
-                    
-                    # Satış bilgilerini güncelle
-                    for col, value in yeni_bilgiler.items():
-                        if col in self.satislar_df.columns:
-                            self.satislar_df.at[row, col] = value
-                    
-                    # Veritabanına kaydet
-                    self.repository.save(self.satislar_df, "sales")
-                    
-                    # Olay bildir
-                    if self.event_manager:
-                        self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "update_sale"}))
-                else:
-                    if self.loglayici:
-                        self.loglayici.warning("Satislar DataFrame'i bos veya None, guncelleme yapilamadi")
-                    if self.event_manager:
-                        self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": "Satislar DataFrame'i bos veya None, guncelleme yapilamadi"}))
+            if self.satislar_df is not None and not self.satislar_df.empty:
+                self.cerceve_guncelle(
+                    "sales", lambda df: self._satiri_guncelle(df, "sales", row, yeni_bilgiler, beklenen_surum))
+
+                # Olay bildir
+                if self.event_manager:
+                    self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "update_sale"}))
+            else:
+                if self.loglayici:
+                    self.loglayici.warning("Satislar DataFrame'i bos veya None, guncelleme yapilamadi")
+                if self.event_manager:
+                    self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": "Satislar DataFrame'i bos veya None, guncelleme yapilamadi"}))
         except Exception as e:
             if self.loglayici:
                 self.loglayici.error(f"Satis guncelleme hatasi: {str(e)}")
@@ -916,12 +1172,10 @@ class VeriYoneticisi:
                 self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"error": f"Satis guncelleme hatasi: {str(e)}"}))
             raise
 
-    def update_visit(self, row, yeni_bilgiler):
-        with self._lock:
-            if self.ziyaretler_df is not None and not self.ziyaretler_df.empty:
-                for col, value in yeni_bilgiler.items():
-                    if col in self.ziyaretler_df.columns:
-                        self.ziyaretler_df.at[row, col] = value
-                self.repository.save(self.ziyaretler_df, "visits")
+    def update_visit(self, row, yeni_bilgiler, beklenen_surum: Optional[int] = None):
+        """Ziyareti gunceller (beklenen_surum icin bkz. delete_sale)"""
+        if self.ziyaretler_df is not None and not self.ziyaretler_df.empty:
+            self.cerceve_guncelle(
+                "visits", lambda df: self._satiri_guncelle(df, "visits", row, yeni_bilgiler, beklenen_surum))
         if self.event_manager:
-            self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "update_visit"}))
\ No newline at end of file
+            self.event_manager.emit(Event(EVENT_DATA_UPDATED, {"source": "update_visit"}))
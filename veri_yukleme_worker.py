@@ -1,13 +1,15 @@
 ﻿# -*- coding: utf-8 -*-
-from PyQt6.QtCore import QThread, pyqtSignal
+from PyQt6.QtCore import QObject, pyqtSignal
 from events import Event
+from task_scheduler import gorev_zamanlayici, gecerli_gorev, GorevIptalEdildi, SERIT_ETKILESIMLI
 
-class VeriYuklemeWorker(QThread):
+class VeriYuklemeWorker(QObject):
     """
     Veri yukleme islemlerini arka planda gerceklestiren worker sinifi.
     
     Bu sinif, Excel dosyalarindan veri yukleme islemlerini arka planda
-    gerceklestirerek kullanici arayuzunun donmasini engeller.
+    gerceklestirerek kullanici arayuzunun donmasini engeller. Is, paylasilan gorev
+    zamanlayicisinin etkilesimli seridinde calisir ve sayfa aralarinda iptal edilebilir.
     
     Attributes:
         tamamlandi (pyqtSignal): Yukleme tamamlandiginda tetiklenen sinyal
@@ -35,6 +37,26 @@ class VeriYuklemeWorker(QThread):
         self.dosya_yolu = dosya_yolu
         # Ana thread'de kullanilacak veri_yoneticisi referansini sakla
         self._veri_yoneticisi = veri_yoneticisi
+        self.gorev = None
+
+    def start(self):
+        """Yuklemeyi gorev zamanlayicisina gonderir."""
+        self.gorev = gorev_zamanlayici().gonder(self.run, serit=SERIT_ETKILESIMLI)
+
+    def isRunning(self) -> bool:
+        """Yukleme beklemede veya calisiyorsa True dondurur."""
+        return self.gorev is not None and self.gorev.calisiyor_mu()
+
+    def iptal_et(self):
+        """Yuklemeyi iptal eder; calisan yukleme siradaki sayfadan once durur."""
+        if self.gorev is not None:
+            self.gorev.iptal_et()
+
+    def wait(self, zaman_asimi_ms: int = None) -> bool:
+        """Yukleme bitene kadar (en fazla zaman_asimi_ms) bekler; bittiyse True dondurur."""
+        if self.gorev is None:
+            return True
+        return self.gorev.bekle(None if zaman_asimi_ms is None else zaman_asimi_ms / 1000)
 
     def run(self):
         """
@@ -44,6 +66,8 @@ class VeriYuklemeWorker(QThread):
             # Ozel bir yukleme metodu kullanacagiz
             self._thread_safe_yukle(self.dosya_yolu)
             self.tamamlandi.emit()
+        except GorevIptalEdildi:
+            self.hata.emit(f"Veri yukleme iptal edildi. Dosya: {self.dosya_yolu}")
         except Exception as e:
             hata_mesaji = f"Arka plan veri yukleme hatasi. Dosya: {self.dosya_yolu}, Hata: {str(e)}, Hata Kodu: VERI_YUKLEME_003"
             self.hata.emit(hata_mesaji)
@@ -76,7 +100,10 @@ class VeriYuklemeWorker(QThread):
             toplam_tablo = len(tablolar)
             yuklenen_tablo = 0
             
+            gorev = gecerli_gorev()
             for sheet, attr, table in tablolar:
+                if gorev is not None:
+                    gorev.jeton.kontrol()
                 try:
                     # Veriyi oku
                     df = pd.read_excel(excel, sheet)
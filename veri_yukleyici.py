@@ -1,6 +1,9 @@
 ﻿# -*- coding: utf-8 -*-
 import pandas as pd
 from typing import Dict, Optional, List, Tuple, Any
+from batch_crypto import SifreliMetin
+from text_compression import SikistirilmisMetin
+from row_versions import surumsuz
 from events import Event, EVENT_DATA_UPDATED, EVENT_LOADING_PROGRESS, EVENT_LOADING_ERROR, EVENT_LOADING_COMPLETED, EVENT_ERROR_OCCURRED
 
 class VeriYukleyici:
@@ -59,6 +62,8 @@ class VeriYukleyici:
                         # Ay sutununu kontrol et ve duzelt
                         if 'Ay' in df.columns:
                             try:
+                                # Duzeltmeler kopyada yapilip yayinlanir; yerinde yazim cerceve surumunu artirmaz
+                                df = df.copy()
                                 # Her bir ay degerini kontrol et ve duzelt
                                 for i, ay in enumerate(df['Ay']):
                                     try:
@@ -72,18 +77,17 @@ class VeriYukleyici:
                                                 # Ay numarasini 2 haneli, yili 4 haneli yap
                                                 yeni_ay = f"{int(ay_no):02d}-{yil}"
                                                 df.at[i, 'Ay'] = yeni_ay
-                                                self.veri_yoneticisi.aylik_hedefler_df.at[i, 'Ay'] = yeni_ay
                                         elif len(ay_str) == 6:  # YYYYMM formati
                                             yil = ay_str[:4]
                                             ay_no = ay_str[4:]
                                             yeni_ay = f"{int(ay_no):02d}-{yil}"
                                             df.at[i, 'Ay'] = yeni_ay
-                                            self.veri_yoneticisi.aylik_hedefler_df.at[i, 'Ay'] = yeni_ay
                                     except Exception as e:
                                         self.loglayici.error(f"Hedefler icin ay formati donusturme hatasi: {str(e)}")
                                 
                                 # Degisiklikleri kaydet
                                 self.veri_yoneticisi.hedefler_df = df
+                                self.veri_yoneticisi.aylik_hedefler_df = df.copy()
                                 self.repository.save(df, table)
                                 self.loglayici.info("Aylik hedefler formati duzeltildi ve kaydedildi.")
                             except Exception as e:
@@ -110,32 +114,34 @@ class VeriYukleyici:
             
             # satislar_df'e gerekli ozellikleri ekle
             if self.veri_yoneticisi.satislar_df is not None:
+                # Duzeltmeler kopyada yapilip yayinlanir; yerinde yazim cerceve surumunu artirmaz
+                satislar_df = self.veri_yoneticisi.satislar_df.copy()
                 # Alt Musteri kolonu ekle
-                if 'Alt Musteri' not in self.veri_yoneticisi.satislar_df.columns:
-                    self.veri_yoneticisi.satislar_df['Alt Musteri'] = ''
+                if 'Alt Musteri' not in satislar_df.columns:
+                    satislar_df['Alt Musteri'] = ''
 
                 # Ay formatini kontrol et ve MM-YYYY formatina donustur
-                if 'Ay' in self.veri_yoneticisi.satislar_df.columns:
-                    self.veri_yoneticisi.satislar_df['Ay'] = self.veri_yoneticisi.satislar_df['Ay'].astype(str)
+                if 'Ay' in satislar_df.columns:
+                    satislar_df['Ay'] = satislar_df['Ay'].astype(str)
                     
-                    self.loglayici.info(f"Satislar veri cercevesi Ay sutunu: {self.veri_yoneticisi.satislar_df['Ay'].tolist()}")
+                    self.loglayici.info(f"Satislar veri cercevesi Ay sutunu: {satislar_df['Ay'].tolist()}")
                     
-                    for i, ay in enumerate(self.veri_yoneticisi.satislar_df['Ay']):
+                    for i, ay in enumerate(satislar_df['Ay']):
                         try:
                             if len(ay) == 6:  # YYYYMM formati
                                 yil = ay[:4]
                                 ay_no = ay[4:]
                                 yeni_ay = f"{ay_no}-{yil}"
-                                self.veri_yoneticisi.satislar_df.at[i, 'Ay'] = yeni_ay
+                                satislar_df.at[i, 'Ay'] = yeni_ay
                         except Exception as e:
                             self.loglayici.error(f"Ay formati donusturme hatasi: {str(e)}")
 
-                    if any('-' in str(ay) for ay in self.veri_yoneticisi.satislar_df['Ay']):
+                    if any('-' in str(ay) for ay in satislar_df['Ay']):
                         # MM-YYYY formatina donustur
-                        if not self.veri_yoneticisi.satislar_df.empty:
+                        if not satislar_df.empty:
                             try:
                                 # Her bir ay degerini kontrol et ve duzelt
-                                for i, ay in enumerate(self.veri_yoneticisi.satislar_df['Ay']):
+                                for i, ay in enumerate(satislar_df['Ay']):
                                     try:
                                         ay_parcalari = ay.split('-')
                                         if len(ay_parcalari) == 2:
@@ -144,7 +150,7 @@ class VeriYukleyici:
                                             yil = ay_parcalari[1].strip()
                                             # Ay numarasini 2 haneli, yili 4 haneli yap
                                             yeni_ay = f"{int(ay_no):02d}-{yil}"
-                                            self.veri_yoneticisi.satislar_df.at[i, 'Ay'] = yeni_ay
+                                            satislar_df.at[i, 'Ay'] = yeni_ay
                                         else:
                                             self.loglayici.warning(f"Satislar icin ay formati taninamadi: {ay}")
                                     except Exception as e:
@@ -152,8 +158,9 @@ class VeriYukleyici:
                             except Exception as e:
                                 self.loglayici.error(f"Ay formati donusturme hatasi: {str(e)}")
 
-                self.repository.save(self.veri_yoneticisi.satislar_df, "sales")
-                self.loglayici.info(f"Satislar tablosu guncellendi ve kaydedildi. Satır sayısı: {len(self.veri_yoneticisi.satislar_df)}")
+                self.veri_yoneticisi.satislar_df = satislar_df
+                self.repository.save(satislar_df, "sales")
+                self.loglayici.info(f"Satislar tablosu guncellendi ve kaydedildi. Satır sayısı: {len(satislar_df)}")
             else:
                 self.loglayici.warning("satislar_df boş olduğu için güncellenemedi")
             
@@ -191,12 +198,8 @@ class VeriYukleyici:
         try:
             # Aylik Hedefler tablosunu yukle
             hedefler_df = pd.read_excel(excel, 'Aylik Hedefler', nrows=sayfa_boyutu, skiprows=(sayfa-1)*sayfa_boyutu)
-            self.veri_yoneticisi.hedefler_df = hedefler_df
             
-            # aylik_hedefler_df'e de kopyala
-            self.veri_yoneticisi.aylik_hedefler_df = hedefler_df.copy()
-            
-            # Ay sutununu kontrol et ve duzelt
+            # Ay sutununu yayindan once kontrol et ve duzelt; yerinde yazim cerceve surumunu artirmaz
             if 'Ay' in hedefler_df.columns:
                 try:
                     # Her bir ay degerini kontrol et ve duzelt
@@ -212,26 +215,38 @@ class VeriYukleyici:
                                     # Ay numarasini 2 haneli, yili 4 haneli yap
                                     yeni_ay = f"{int(ay_no):02d}-{yil}"
                                     hedefler_df.at[i, 'Ay'] = yeni_ay
-                                    self.veri_yoneticisi.aylik_hedefler_df.at[i, 'Ay'] = yeni_ay
                                 elif len(ay_str) == 6:  # YYYYMM formati
                                     yil = ay_str[:4]
                                     ay_no = ay_str[4:]
                                     yeni_ay = f"{int(ay_no):02d}-{yil}"
                                     hedefler_df.at[i, 'Ay'] = yeni_ay
-                                    self.veri_yoneticisi.aylik_hedefler_df.at[i, 'Ay'] = yeni_ay
                         except Exception as e:
                             self.loglayici.error(f"Hedefler icin ay formati donusturme hatasi: {str(e)}")
                     
-                    # Degisiklikleri kaydet
-                    self.veri_yoneticisi.hedefler_df = hedefler_df
                 except Exception as e:
                     self.loglayici.error(f"Hedefler icin ay formati donusturme hatasi: {str(e)}")
             
+            self.veri_yoneticisi.hedefler_df = hedefler_df
+            # aylik_hedefler_df'e de kopyala
+            self.veri_yoneticisi.aylik_hedefler_df = hedefler_df.copy()
             self.repository.save(hedefler_df, "monthly_targets")
             self.loglayici.info(f"Aylik Hedefler tablosu yuklendi ve kopyalandi: Sayfa {sayfa}, Boyut {sayfa_boyutu}")
         except Exception as e:
             self.loglayici.error(f"Aylik Hedefler tablosu yuklenemedi: {str(e)}")
 
+    @staticmethod
+    def _disa_aktarim_cercevesi(df: pd.DataFrame) -> pd.DataFrame:
+        """Tembel (sifreli/sikistirilmis) hucreleri Excel'e yazilabilir metne cevirir; satir surumleri yazilmaz"""
+        df = surumsuz(df)
+        tembel_sutunlar = [sutun for sutun in df.columns if df[sutun].dtype == object
+                           and any(isinstance(deger, (SifreliMetin, SikistirilmisMetin)) for deger in df[sutun])]
+        if not tembel_sutunlar:
+            return df
+        df = df.copy()
+        for sutun in tembel_sutunlar:
+            df[sutun] = [str(deger) if isinstance(deger, (SifreliMetin, SikistirilmisMetin)) else deger for deger in df[sutun]]
+        return df
+
     def tum_verileri_kaydet(self, dosya_yolu):
         """
         Tum verileri Excel dosyasina kaydeder.
@@ -243,31 +258,31 @@ class VeriYukleyici:
             with pd.ExcelWriter(dosya_yolu) as writer:
                 # Her DataFrame icin None kontrolu yap
                 if self.veri_yoneticisi.satiscilar_df is not None:
-                    self.veri_yoneticisi.satiscilar_df.to_excel(writer, sheet_name='Satiscilar', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.satiscilar_df).to_excel(writer, sheet_name='Satiscilar', index=False)
                 
                 if self.veri_yoneticisi.hedefler_df is not None:
-                    self.veri_yoneticisi.hedefler_df.to_excel(writer, sheet_name='Aylik Hedefler', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.hedefler_df).to_excel(writer, sheet_name='Aylik Hedefler', index=False)
                 
                 if self.veri_yoneticisi.satislar_df is not None:
-                    self.veri_yoneticisi.satislar_df.to_excel(writer, sheet_name='Aylik Satislar Takibi', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.satislar_df).to_excel(writer, sheet_name='Aylik Satislar Takibi', index=False)
                 
                 if self.veri_yoneticisi.pipeline_df is not None:
-                    self.veri_yoneticisi.pipeline_df.to_excel(writer, sheet_name='Pipeline', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.pipeline_df).to_excel(writer, sheet_name='Pipeline', index=False)
                 
                 if self.veri_yoneticisi.musteriler_df is not None:
-                    self.veri_yoneticisi.musteriler_df.to_excel(writer, sheet_name='Musteriler', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.musteriler_df).to_excel(writer, sheet_name='Musteriler', index=False)
                 
                 if self.veri_yoneticisi.ziyaretler_df is not None:
-                    self.veri_yoneticisi.ziyaretler_df.to_excel(writer, sheet_name='Ziyaretler', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.ziyaretler_df).to_excel(writer, sheet_name='Ziyaretler', index=False)
                 
                 if self.veri_yoneticisi.sikayetler_df is not None:
-                    self.veri_yoneticisi.sikayetler_df.to_excel(writer, sheet_name='Sikayetler', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.sikayetler_df).to_excel(writer, sheet_name='Sikayetler', index=False)
                 
                 if self.veri_yoneticisi.hammadde_df is not None:
-                    self.veri_yoneticisi.hammadde_df.to_excel(writer, sheet_name='Hammadde Maliyetleri', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.hammadde_df).to_excel(writer, sheet_name='Hammadde Maliyetleri', index=False)
                 
                 if self.veri_yoneticisi.urun_bom_df is not None:
-                    self.veri_yoneticisi.urun_bom_df.to_excel(writer, sheet_name='Urun BOM', index=False)
+                    self._disa_aktarim_cercevesi(self.veri_yoneticisi.urun_bom_df).to_excel(writer, sheet_name='Urun BOM', index=False)
                 
             self.loglayici.info("Tum veriler basariyla Excel dosyasina kaydedildi.")
             
@@ -403,13 +418,12 @@ class VeriYukleyici:
             self.veri_yoneticisi.satiscilar_df = df
             self.repository.save(df, "sales_reps")
         elif tablo_adi == 'Aylik Hedefler':
+            # Ay sutunu yayindan once duzeltilir; yerinde yazim cerceve surumunu artirmaz
+            if 'Ay' in df.columns:
+                self._ay_formatini_duzenle(df, "hedefler_df")
             self.veri_yoneticisi.hedefler_df = df
             self.veri_yoneticisi.aylik_hedefler_df = df.copy()
             self.repository.save(df, "monthly_targets")
-            
-            # Ay sutununu kontrol et ve duzelt
-            if 'Ay' in df.columns:
-                self._ay_formatini_duzenle(df, "hedefler_df")
                 
         elif tablo_adi == 'Pipeline':
             self.veri_yoneticisi.pipeline_df = df
@@ -424,17 +438,16 @@ class VeriYukleyici:
             self.veri_yoneticisi.sikayetler_df = df
             self.repository.save(df, "complaints")
         elif tablo_adi == 'Aylik Satislar Takibi':
-            self.veri_yoneticisi.satislar_df = df
-            
             # Alt Musteri kolonu ekle
             if 'Alt Musteri' not in df.columns:
-                self.veri_yoneticisi.satislar_df['Alt Musteri'] = ''
+                df['Alt Musteri'] = ''
                 
-            # Ay formatini kontrol et ve duzelt
+            # Ay formatini yayindan once kontrol et ve duzelt
             if 'Ay' in df.columns:
                 self._ay_formatini_duzenle(df, "satislar_df")
                 
-            self.repository.save(self.veri_yoneticisi.satislar_df, "sales")
+            self.veri_yoneticisi.satislar_df = df
+            self.repository.save(df, "sales")
         elif tablo_adi == 'Hammadde Maliyetleri':
             self.veri_yoneticisi.hammadde_df = df
             self.repository.save(df, "hammadde")
@@ -466,19 +479,11 @@ class VeriYukleyici:
                             # Ay numarasini 2 haneli, yili 4 haneli yap
                             yeni_ay = f"{int(ay_no):02d}-{yil}"
                             df.at[i, 'Ay'] = yeni_ay
-                            
-                            # Hedefler icin aylik_hedefler_df'i de guncelle
-                            if df_adi == "hedefler_df":
-                                self.veri_yoneticisi.aylik_hedefler_df.at[i, 'Ay'] = yeni_ay
                     elif len(ay_str) == 6:  # YYYYMM formati
                         yil = ay_str[:4]
                         ay_no = ay_str[4:]
                         yeni_ay = f"{int(ay_no):02d}-{yil}"
                         df.at[i, 'Ay'] = yeni_ay
-                        
-                        # Hedefler icin aylik_hedefler_df'i de guncelle
-                        if df_adi == "hedefler_df":
-                            self.veri_yoneticisi.aylik_hedefler_df.at[i, 'Ay'] = yeni_ay
                 except Exception as e:
                     self.loglayici.error(f"{df_adi} icin ay formati donusturme hatasi: {str(e)}")
         except Exception as e:
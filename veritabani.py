@@ -3,16 +3,31 @@ import sqlite3
 import pandas as pd
 from functools import lru_cache
 import shutil
+from contextlib import closing, contextmanager
 from datetime import datetime, timedelta
 import os
 import logging
 from sqlite3 import Connection, Cursor
 from typing import List, Optional, Tuple, Dict, Any, Iterator
 from repository import RepositoryInterface, RepositoryError, ErrorCode
-from events import Event, EVENT_DATA_UPDATED, EVENT_ERROR_OCCURRED, EVENT_BACKUP_COMPLETED
+from events import Event, EVENT_DATA_UPDATED, EVENT_ERROR_OCCURRED, EVENT_BACKUP_COMPLETED, EVENT_BACKUP_CANCELLED
 import json
 import threading
+import time
 from sifreleme import SifrelemeYoneticisi  # Yeni import
+from checkpoint_manager import CheckpointManager
+from pragma_tuner import PragmaTuner
+from dimension_tables import DimensionManager, NORMALIZE_TABLOLAR, FIZIKSEL_EK, BOYUTLAR, fiziksel_tablo
+from change_capture import ChangeCapture, sayisal_turleri_uygula
+from row_history import RowHistory, VERSIYONLU_TABLOLAR
+from text_compression import TextCompressor
+from blind_index import kor_sutun, KOR_EK
+from key_rotation import KeyRotationJob
+from online_backup import SteppedBackup, YedeklemeIptalEdildi
+from task_scheduler import IptalJetonu, gecerli_jeton
+from backup_store import DedupBackupStore, MANIFEST_EK
+from main_thread import ana_thread_cagir
+from row_versions import surumsuz
 
 
 HATA_KODLARI = {
@@ -26,11 +41,54 @@ HATA_KODLARI = {
     "RESTORE_001": "Yedek geri yukleme hatasi"
 }
 
+# Saglik ozetinde satir sayaci tutulmayan yardimci tablolar (degisiklik kaydi, satir gecmisi,
+# sikistirma sozlukleri, anahtar dondurme durumu ve boyut tablolari); bunlar save() disindaki
+# yollarla yazildigi icin sayaclari eskir
+DAHILI_TABLO_ONEKLERI = ("sqlite_", "cdc_", "satir_gecmisi", "sikistirma_", "anahtar_dondurme_")
+DAHILI_TABLOLAR = frozenset(BOYUTLAR.values())
+
 logging.basicConfig(filename='crm_database.log', level=logging.INFO, 
                     format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
 
+class IslemBaglantisi(sqlite3.Connection):
+    """
+    commit() cagrilarini tek_islem() blogu bitene kadar erteleyen baglanti.
+
+    Tablo yeniden yazimi pandas to_sql, boyut tablolari, kor indeksler ve degisiklik
+    kaydi gibi her biri kendi commit'ini yapan adimlardan olusur. Blok icinde bu
+    adimlarin hepsi tek bir islemde kalir: arada cokme olursa ne tablo ne de CDC kaydi
+    yarim yazilir.
+    """
+
+    _islem_derinligi = 0
+
+    @contextmanager
+    def tek_islem(self) -> Iterator["IslemBaglantisi"]:
+        """Blok icindeki tum yazimlari tek islemde yapar; hata olursa hepsini geri alir"""
+        if self._islem_derinligi:
+            yield self  # Ic ice bloklar distaki isleme katilir
+            return
+        if self.in_transaction:
+            super().commit()
+        # DDL (DROP/CREATE TABLE) ortuk islem baslatmadigi icin islem acikca baslatilir
+        self.execute("BEGIN IMMEDIATE")
+        self._islem_derinligi = 1
+        try:
+            yield self
+        except BaseException:
+            self._islem_derinligi = 0
+            super().rollback()
+            raise
+        self._islem_derinligi = 0
+        super().commit()
+
+    def commit(self) -> None:
+        if not self._islem_derinligi:
+            super().commit()
+
+
 class DatabaseInterface:
     def veri_kaydet(self, df: pd.DataFrame, tablo_adi: str, batch_size: int) -> None:
         raise NotImplementedError("Bu metod alt siniflar tarafindan uygulanmalidir.")
@@ -42,28 +100,61 @@ class DatabaseInterface:
         raise NotImplementedError("Bu metod alt siniflar tarafindan uygulanmalidir.")
 
 class BackupManager:
-    def __init__(self, backup_dir: str = "backups", event_manager=None, sifreleme_yoneticisi=None):
+    def __init__(self, backup_dir: str = "backups", event_manager=None, sifreleme_yoneticisi=None,
+                 tekillestirme: bool = False, saklanacak_yedek: int = 0):
+        """
+        Args:
+            backup_dir: Yedek dizini
+            event_manager: Olay yonetimi icin EventManager nesnesi
+            sifreleme_yoneticisi: Yedekleri sifrelemek icin SifrelemeYoneticisi nesnesi
+            tekillestirme: True ise yedekler tam kopya yerine tekillestirmeli depoya yazilir
+                (parcalar sifrelendigi icin sifreleme yoneticisi gerekir)
+            saklanacak_yedek: Tekillestirmeli depoda tutulacak en yeni yedek sayisi (0: hepsi)
+        """
         self.backup_dir = backup_dir
         self.event_manager = event_manager
         self.sifreleme = sifreleme_yoneticisi
         self.loglayici = logging.getLogger(__name__)
+        self.saklanacak_yedek = saklanacak_yedek
+        
+        # Kopya sayfa gruplari halinde, yazma etkinligine gore beklenerek yapilir
+        self.adimli_yedek = SteppedBackup(self.loglayici, event_manager)
         
         # Yedekleme dizinini olustur
         os.makedirs(backup_dir, exist_ok=True)
         
-    def create_backup(self, database_path: str) -> Tuple[bool, str]:
-        """Veritabani yedegi olusturur ve sifreler"""
+        self.depo = None
+        if tekillestirme:
+            if self.sifreleme:
+                self.depo = DedupBackupStore(os.path.join(backup_dir, "depo"), self.sifreleme.fernet,
+                                             self.sifreleme.anahtar, self.loglayici)
+            else:
+                self.loglayici.warning("Tekillestirmeli yedekleme sifreleme yoneticisi olmadan kullanilamaz, tam kopya aliniyor")
+        
+    def create_backup(self, database_path: str, jeton: Optional[IptalJetonu] = None) -> Tuple[bool, str]:
+        """
+        Veritabani yedegi olusturur ve sifreler.
+        
+        Args:
+            database_path: Yedeklenecek veritabani
+            jeton: Iptal edildiginde adimli kopya durdurulur; verilmezse zamanlayicida
+                calisan gorevin jetonu kullanilir (zamanlanmis isin zaman asimi)
+        """
         try:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_path = os.path.join(self.backup_dir, f"backup_{timestamp}.db")
             
-            # Veritabanini yedekle
-            with sqlite3.connect(database_path) as src, sqlite3.connect(backup_path) as dst:
-                src.backup(dst)
+            # Veritabanini adimli olarak yedekle (kullanicinin yazmalarini bekletmez)
+            self.adimli_yedek.calistir(database_path, backup_path, jeton=jeton or gecerli_jeton())
             
-            # Yedegi sifrele
+            if self.depo:
+                return self._depoya_yedekle(backup_path, f"backup_{timestamp}")
+            
+            # Yedegi sifrele; sifreli kopya yazildiktan sonra acik kopya silinir
             if self.sifreleme:
-                backup_path = self.sifreleme.yedekleme_sifrele(backup_path)
+                acik_yedek = backup_path
+                backup_path = self.sifreleme.yedekleme_sifrele(acik_yedek)
+                os.remove(acik_yedek)
                 self.loglayici.info(f"Yedekleme sifrelendi: {backup_path}")
             
             if self.event_manager:
@@ -74,6 +165,11 @@ class BackupManager:
             
             return True, backup_path
             
+        except YedeklemeIptalEdildi as e:
+            self.loglayici.info(str(e))
+            if self.event_manager:
+                self.event_manager.emit(Event(EVENT_BACKUP_CANCELLED, {"path": backup_path}))
+            return False, str(e)
         except Exception as e:
             error_msg = f"Yedekleme olusturma hatasi: {str(e)}"
             self.loglayici.error(error_msg)
@@ -84,17 +180,49 @@ class BackupManager:
                 }))
             return False, error_msg
     
+    def _depoya_yedekle(self, goruntu_yolu: str, ad: str) -> Tuple[bool, str]:
+        """Tutarli goruntuyu tekillestirmeli depoya ekler, eski yedekleri ve sahipsiz parcalari temizler"""
+        try:
+            sonuc = self.depo.yedekle(goruntu_yolu, ad)
+        finally:
+            os.remove(goruntu_yolu)
+        
+        if self.saklanacak_yedek > 0 and self.depo.eski_yedekleri_sil(self.saklanacak_yedek):
+            self.depo.cop_topla()
+        
+        if self.event_manager:
+            self.event_manager.emit(Event("backup_created", {
+                "path": sonuc["manifest"],
+                "encrypted": True,
+                "dedup": {anahtar: deger for anahtar, deger in sonuc.items() if anahtar != "manifest"}
+            }))
+        return True, sonuc["manifest"]
+    
+    def cancel_backup(self) -> None:
+        """Devam eden yedeklemeyi iptal eder"""
+        self.adimli_yedek.iptal_et()
+    
     def restore_backup(self, backup_path: str, database_path: str) -> Tuple[bool, str]:
         """Yedekten geri yukleme yapar"""
         try:
-            # Eger sifrelenmis yedek ise once sifresini coz
-            if backup_path.endswith('.encrypted') and self.sifreleme:
-                backup_path = self.sifreleme.yedekleme_sifre_coz(backup_path)
+            # Eger sifrelenmis yedek ise once sifresini coz (gecici acik kopya geri yuklemeden sonra silinir)
+            gecici_yedek = None
+            if backup_path.endswith(MANIFEST_EK) and self.depo:
+                gecici_yedek = os.path.join(self.backup_dir, f"geri_yukleme_{os.getpid()}.db")
+                self.depo.geri_yukle(os.path.basename(backup_path)[:-len(MANIFEST_EK)], gecici_yedek)
+                backup_path = gecici_yedek
+                self.loglayici.info(f"Yedek depodan birlestirildi: {backup_path}")
+            elif backup_path.endswith('.encrypted') and self.sifreleme:
+                backup_path = gecici_yedek = self.sifreleme.yedekleme_sifre_coz(backup_path)
                 self.loglayici.info(f"Yedekleme sifresi cozuldu: {backup_path}")
             
             # Yedegi geri yukle
-            with sqlite3.connect(backup_path) as src, sqlite3.connect(database_path) as dst:
-                src.backup(dst)
+            try:
+                with closing(sqlite3.connect(backup_path)) as src, closing(sqlite3.connect(database_path)) as dst:
+                    src.backup(dst)
+            finally:
+                if gecici_yedek and os.path.exists(gecici_yedek):
+                    os.remove(gecici_yedek)
             
             if self.event_manager:
                 self.event_manager.emit(Event("backup_restored", {
@@ -236,23 +364,94 @@ class SQLiteRepository(RepositoryInterface):
                 self.loglayici.debug(f"Thread {threading.get_ident()} için bağlantı havuzu kapatıldı.")
 
     # Diğer metodlar (save, load, vb.) aynı kalabilir, sadece _get_connection ve _release_connection kullanılır.
-    def __init__(self, db_path: str = "crm_database.db", event_manager=None, max_connections: int = 5):  # Baglanti havuzu icin max_connections eklendi
+    def __init__(self, db_path: str = "crm_database.db", event_manager=None, max_connections: int = 5, backup_dir: str = "backups",
+                 checkpoint_yonetimi: bool = True, sifreleme_yoneticisi: Optional[SifrelemeYoneticisi] = None):  # Baglanti havuzu icin max_connections eklendi
         self.db_path = db_path
         self.event_manager = event_manager
         self.max_connections = max_connections
+        self.backup_dir = backup_dir
         self._lock = threading.Lock()  # Thread guvenli erisim icin
         self.loglayici = logging.getLogger(__name__)
-        
+
         # Thread-local baglanti havuzu olustur
         self._thread_local = threading.local()
         self._thread_local.connection_pool = []  # Her thread icin ayri baglanti havuzu
         self._thread_local.available_connections = []  # Her thread icin ayri musait baglantilar
-        
-        # Sifreleme yoneticisini olustur
-        self.sifreleme = SifrelemeYoneticisi(self.loglayici, self.event_manager)
-        
+
+        # Saglik kontrolu icin yazma yolunda guncellenen satir sayaclari
+        self._sayac_kilidi = threading.Lock()
+        self._satir_sayaclari: Dict[str, Dict[str, Any]] = {}
+        self._sayaclar_hazir = False
+        self._son_yedekleme: Optional[str] = None
+        self._yedekleme_tarandi = False
+        self._tablo_boyutlari: Dict[str, float] = {}
+        self._tablo_boyutlari_zamani = 0.0
+
+        # Tam tablo yazimlari tablo bazinda siralanir; surumlu yazimlar eskiyi yeninin uzerine yazmaz (bkz. save)
+        self._tablo_kilitleri: Dict[str, threading.Lock] = {}
+        self._tablo_surumleri: Dict[str, int] = {}
+
+        # Sifreleme yoneticisi BackupManager ile paylasilir; anahtar dondurme yedeklere de hemen yansir
+        self.sifreleme = sifreleme_yoneticisi or SifrelemeYoneticisi(self.loglayici, self.event_manager)
+
+        # Veritabani boyutu ve bellege gore secilen PRAGMA profili
+        self.pragma_ayarlayici = PragmaTuner(self.db_path, self.max_connections, loglayici=self.loglayici)
+        self.pragma_profili = self.pragma_ayarlayici.profil_sec()
+        self.loglayici.info(
+            f"PRAGMA profili ({self.pragma_profili['kaynak']}): cache_size={self.pragma_profili['cache_size']}, "
+            f"mmap_size={self.pragma_profili['mmap_size']}, temp_store={self.pragma_profili['temp_store']}"
+        )
+
+        # Musteri/temsilci/urun/hammadde adlarini tamsayi anahtarli boyut tablolarinda tutar
+        self.boyutlar = DimensionManager(self.loglayici)
+
+        # Uzun metin sutunlari ortak sozlukle sikistirilir, yuklemede tembel acilir
+        self.sikistirici = TextCompressor(self.loglayici)
+
+        # Yazma yolundaki satir degisikliklerini subeler arasi senkronizasyon icin kaydeder;
+        # sales/pipeline/hammadde satir surumleri valid_from/valid_to ile saklanir (as_of okumalari icin)
+        self.degisiklik_kaydi = ChangeCapture(self._get_connection, self._release_connection, self.sifreleme, self.loglayici,
+                                              gecmis=RowHistory(VERSIYONLU_TABLOLAR, self.loglayici))
+
+        # Anahtar dondurmeden sonra eski anahtarli hucreleri arka planda yeniden sifreleyen is
+        self.anahtar_dondurme = KeyRotationJob(self._get_connection, self._release_connection, self.sifreleme,
+                                               self._sifreli_tablolar, self.loglayici, self.event_manager)
+
+        if self.event_manager:
+            self.event_manager.subscribe("backup_created", self._on_backup_created)
+
         self.initialize()
+        self._anahtar_dondurmeyi_surdur()
+
+        # WAL dosyasini izleyen ve bostayken checkpoint calistiran yonetici
+        self.checkpoint_yoneticisi = None
+        if checkpoint_yonetimi:
+            self.checkpoint_yoneticisi = CheckpointManager(self.db_path, self.loglayici, self.event_manager)
+            self.checkpoint_yoneticisi.baslat()
         
+    def _yeni_baglanti(self) -> sqlite3.Connection:
+        """Yeni bir baglanti acar ve secili PRAGMA profilini uygular"""
+        conn = sqlite3.connect(self.db_path, factory=IslemBaglantisi)
+        conn.row_factory = sqlite3.Row
+        self.pragma_ayarlayici.uygula(conn, self.pragma_profili)
+        return conn
+
+    def pragma_kalibrasyonu(self, yazma_satir_sayisi: int = 20000) -> Dict[str, Any]:
+        """
+        PRAGMA kalibrasyonunu calistirir, profili kaydeder ve bu thread'in musait baglantilarina uygular.
+
+        Args:
+            yazma_satir_sayisi: Yazma olcumunde kullanilacak sentetik satir sayisi
+
+        Returns:
+            Dict[str, Any]: Secilen profil ve olcum sonuclari
+        """
+        self.pragma_profili = self.pragma_ayarlayici.kalibre_et(yazma_satir_sayisi)
+        with self._lock:
+            for conn in getattr(self._thread_local, 'available_connections', []):
+                self.pragma_ayarlayici.uygula(conn, self.pragma_profili)
+        return self.pragma_profili
+
     def _initialize_pool_for_thread(self) -> None:
         """Mevcut thread icin baglanti havuzunu baslat"""
         # Thread icin baglanti havuzu yoksa olustur
@@ -263,16 +462,7 @@ class SQLiteRepository(RepositoryInterface):
         # Havuz bossa doldur
         if not self._thread_local.connection_pool:
             for _ in range(self.max_connections):
-                conn = sqlite3.connect(self.db_path)
-                conn.row_factory = sqlite3.Row
-                
-                # Performans optimizasyonlari
-                conn.execute("PRAGMA journal_mode=WAL")  # Write-Ahead Logging
-                conn.execute("PRAGMA synchronous=NORMAL")  # Daha hizli yazma
-                conn.execute("PRAGMA cache_size=-2000")  # Cache boyutunu 2MB yap
-                conn.execute("PRAGMA temp_store=MEMORY")  # Gecici tablolari RAM'de tut
-                conn.execute("PRAGMA mmap_size=2147483648")  # Memory-mapped I/O icin 2GB ayir
-                
+                conn = self._yeni_baglanti()
                 self._thread_local.connection_pool.append(conn)
                 self._thread_local.available_connections.append(conn)
             
@@ -298,16 +488,7 @@ class SQLiteRepository(RepositoryInterface):
             
             # Tum baglantilar kullaniliyorsa ve havuz limitine ulasilmadiysa
             if len(self._thread_local.connection_pool) < self.max_connections:
-                conn = sqlite3.connect(self.db_path)
-                conn.row_factory = sqlite3.Row
-                
-                # Yeni baglanti icin performans ayarlari
-                conn.execute("PRAGMA journal_mode=WAL")
-                conn.execute("PRAGMA synchronous=NORMAL")
-                conn.execute("PRAGMA cache_size=-2000")
-                conn.execute("PRAGMA temp_store=MEMORY")
-                conn.execute("PRAGMA mmap_size=2147483648")
-                
+                conn = self._yeni_baglanti()
                 self._thread_local.connection_pool.append(conn)
                 return conn
             
@@ -333,8 +514,7 @@ class SQLiteRepository(RepositoryInterface):
                     # Baglanti bozuksa havuzdan cikar ve yenisini olustur
                     self._thread_local.connection_pool.remove(conn)
                     conn.close()
-                    new_conn = sqlite3.connect(self.db_path)
-                    new_conn.row_factory = sqlite3.Row
+                    new_conn = self._yeni_baglanti()
                     self._thread_local.connection_pool.append(new_conn)
                     self._thread_local.available_connections.append(new_conn)
 
@@ -357,6 +537,61 @@ class SQLiteRepository(RepositoryInterface):
                 
                 self.loglayici.debug(f"Thread {threading.get_ident()} icin baglanti havuzu kapatildi")
 
+        if getattr(self, 'anahtar_dondurme', None):
+            self.anahtar_dondurme.durdur()
+
+        if getattr(self, 'checkpoint_yoneticisi', None):
+            self.checkpoint_yoneticisi.durdur()
+            self.checkpoint_yoneticisi = None
+
+    def _sifreli_tablolar(self, conn: sqlite3.Connection) -> List[Tuple[str, str, List[str]]]:
+        """Mevcut tablolardan sifreli alan iceren (tablo, fiziksel tablo, alanlar) listesini dondurur"""
+        hedefler = []
+        for table_name, alanlar in self.sifreleme.HASSAS_ALANLAR.items():
+            hedef = fiziksel_tablo(table_name) if self.boyutlar.normalize_mi(conn, table_name) else table_name
+            sutunlar = {satir[1] for satir in conn.execute(f'PRAGMA table_info("{hedef}")')}
+            mevcut = [alan for alan in alanlar if alan in sutunlar]
+            if mevcut:
+                hedefler.append((table_name, hedef, mevcut))
+        return hedefler
+
+    def _anahtar_dondurmeyi_surdur(self) -> None:
+        """Yarida kalmis yeniden sifreleme varsa arka planda kaldigi yerden devam ettirir"""
+        conn = self._get_connection()
+        try:
+            bekleyen = self.anahtar_dondurme.bekleyen_var_mi(conn)
+        finally:
+            self._release_connection(conn)
+        if bekleyen:
+            self.loglayici.info("Tamamlanmamis anahtar dondurme bulundu, arka planda devam ediliyor")
+            self.anahtar_dondurme.baslat()
+
+    def anahtar_dondur(self) -> int:
+        """
+        Yeni sifreleme anahtari uretir ve eski hucreleri arka planda yeniden sifrelemeye baslar.
+
+        Uygulama bu sirada calismaya devam eder; okumalar eski ve yeni anahtarli metinleri
+        birlikte cozebilir. Ilerleme anahtar_dondurme.ilerleme() ile izlenebilir.
+
+        Returns:
+            int: Yeni aktif anahtarin kimligi
+        """
+        self.anahtar_dondurme.durdur()
+        kimlik = self.sifreleme.anahtar_dondur()
+        self.anahtar_dondurme.baslat()
+        return kimlik
+
+    def _yazma_bildir(self) -> None:
+        """Yazma yolunu izleyen yardimci bilesenleri bilgilendirir"""
+        if getattr(self, 'checkpoint_yoneticisi', None):
+            self.checkpoint_yoneticisi.yazma_bildir()
+
+    def wal_metrikleri(self) -> Dict[str, Any]:
+        """WAL boyutu ve checkpoint gecikme metriklerini dondurur"""
+        if not getattr(self, 'checkpoint_yoneticisi', None):
+            return {}
+        return self.checkpoint_yoneticisi.metrikler()
+
     def _execute_in_main_thread(self, func, *args, **kwargs):
         """
         Fonksiyonu ana thread'de calistirir.
@@ -369,68 +604,80 @@ class SQLiteRepository(RepositoryInterface):
         Returns:
             Fonksiyonun donüs degeri
         """
-        # Ana thread ID'sini kontrol et (UI thread genellikle ana thread'dir)
-        from PyQt6.QtCore import QThread, QCoreApplication
-        
-        # Mevcut thread'in ID'sini al
-        current_thread_id = threading.get_ident()
-        
-        # Ana thread'in ID'sini al (QApplication'in thread'i)
-        main_thread_id = QCoreApplication.instance().thread().currentThreadId()
-        
-        # Eger zaten ana thread'deyse, dogrudan calistir
-        if QThread.currentThread() == QCoreApplication.instance().thread():
-            return func(*args, **kwargs)
-        
-        # Ana thread'de degilse, QTimer.singleShot ile ana thread'de calistir
-        from PyQt6.QtCore import QTimer, QEventLoop
-        
-        result = None
-        error = None
-        completed = False
-        
-        def run_in_main_thread():
-            nonlocal result, error, completed
-            try:
-                result = func(*args, **kwargs)
-            except Exception as e:
-                error = e
-            finally:
-                completed = True
-                
-        # Ana thread'de calistir ve tamamlanmasini bekle
-        QTimer.singleShot(0, run_in_main_thread)
-        
-        # Tamamlanana kadar bekle
-        loop = QEventLoop()
-        
-        def check_completed():
-            if completed:
-                loop.quit()
-                
-        timer = QTimer()
-        timer.timeout.connect(check_completed)
-        timer.start(10)  # 10 ms'de bir kontrol et
-        
-        loop.exec()
-        
-        if error:
-            raise error
-            
-        return result
+        return ana_thread_cagir(func, *args, **kwargs)
+
+    def _tablo_kilidi(self, table_name: str) -> threading.Lock:
+        with self._lock:
+            kilit = self._tablo_kilitleri.get(table_name)
+            if kilit is None:
+                kilit = self._tablo_kilitleri[table_name] = threading.Lock()
+            return kilit
+
+    def tablo_surumu(self, table_name: str) -> int:
+        """Tabloya en son yazilan cercevenin surumunu dondurur (surumsuz yazimlar sayilmaz)"""
+        return self._tablo_surumleri.get(table_name, 0)
+
+    def save(self, df: pd.DataFrame, table_name: str, batch_size: int = 1000, surum: Optional[int] = None) -> bool:
+        """
+        Veri cercevesini veritabanina kaydeder.
 
-    def save(self, df: pd.DataFrame, table_name: str, batch_size: int = 1000) -> None:
-        """Veri cercevesini veritabanina kaydeder"""
+        Ayni tablonun tam yazimlari birbirini beklemeden ic ice gecmez. surum verilirse
+        yazim karsilastir-degistir ile yapilir: tabloya daha yeni surumlu bir cerceve
+        yazilmissa bu (eski) cerceve yazilmaz, boylece gec kalan bir yazim yeni veriyi ezmez.
+
+        Args:
+            df: Kaydedilecek cerceve (surum sutunu yazilmaz)
+            table_name: Tablo adi
+            batch_size: Toplu yazim boyutu
+            surum: Cercevenin surumu (VeriYoneticisi her yayinladigi cerceve icin artirir)
+
+        Returns:
+            bool: Cerceve yazildiysa True, daha yeni bir surum zaten yazildigi icin atlandiysa False
+        """
+        with self._tablo_kilidi(table_name):
+            if surum is not None and surum <= self._tablo_surumleri.get(table_name, 0):
+                self.loglayici.debug(f"{table_name} icin eski surum yazimi atlandi ({surum})")
+                return False
+            self._tabloyu_yaz(surumsuz(df), table_name, batch_size)
+            if surum is not None:
+                self._tablo_surumleri[table_name] = surum
+            return True
+
+    def _tabloyu_yaz(self, df: pd.DataFrame, table_name: str, batch_size: int) -> None:
+        """Veri cercevesini tablonun yerine yazar"""
         try:
+            # Degisiklik kaydi sifrelenmemis icerik uzerinden hesaplanir; yuklemeden gelen
+            # tembel hucreler tek tek degil toplu, cagiranin cercevesine dokunmadan cozulur
+            duz_df = df
+            if self.degisiklik_kaydi.izleniyor_mu(table_name):
+                duz_df = self.sifreleme.tembel_hucreleri_ac(df, table_name)
+
             # Hassas verileri sifrele
             df = self.sifreleme.veri_cercevesi_sifrele(df.copy(), table_name)
             
             # Thread-local baglanti al ve verileri kaydet
             conn = self._get_connection()
             try:
-                df.to_sql(table_name, conn, if_exists='replace', index=False, chunksize=batch_size)
+                df = self.sikistirici.cerceve_sikistir(conn, df, table_name)
+                # Tablo ve degisiklik kaydi ayni islemde yazilir; arada cokme degisiklik kaybettirmez
+                with conn.tek_islem():
+                    if table_name in NORMALIZE_TABLOLAR:
+                        # Sifrelenmis alanlar rastgele oldugu icin boyut tablosuna alinmaz
+                        self.boyutlar.kaydet(conn, df, table_name, batch_size,
+                                             haric=self.sifreleme.HASSAS_ALANLAR.get(table_name, []))
+                    else:
+                        df.to_sql(table_name, conn, if_exists='replace', index=False, chunksize=batch_size)
+                    self._kor_indeksleri_olustur(conn, table_name)
+                    self.degisiklik_kaydi.yakala(conn, duz_df, table_name)
+            except Exception:
+                self.degisiklik_kaydi.durumu_unut(table_name)
+                raise
             finally:
                 self._release_connection(conn)
+
+            # Tablo tamamen yeniden yazildigi icin satir sayisi kesin olarak bilinir
+            self._sayac_ayarla(table_name, len(df))
+            self._yazma_bildir()
             
             if self.event_manager:
                 self.event_manager.emit(Event("data_saved", {
@@ -460,10 +707,9 @@ class SQLiteRepository(RepositoryInterface):
             finally:
                 self._release_connection(conn)
             
-            # Sifreli verileri coz
-            df = self.sifreleme.veri_cercevesi_sifre_coz(df, table_name)
-            
-            return df
+            # Sifreli ve sikistirilmis metinler yalnizca okunduklarinda acilir
+            df = self.sifreleme.veri_cercevesi_tembel_coz(df, table_name)
+            return self.sikistirici.cerceve_ac(df, table_name)
             
         except Exception as e:
             self.loglayici.error(f"Veri yukleme hatasi: {str(e)}")
@@ -481,16 +727,29 @@ class SQLiteRepository(RepositoryInterface):
             conn = self._get_connection()
             try:
                 cursor = conn.cursor()
+                normalize = self.boyutlar.normalize_mi(conn, table_name)
                 
-                for update_dict, param_tuple in zip(updates, params):
-                    set_clause = ", ".join([f"{k} = ?" for k in update_dict.keys()])
-                    query = f"UPDATE {table_name} SET {set_clause} WHERE {condition}"
-                    values = list(update_dict.values()) + list(param_tuple)
-                    cursor.execute(query, values)
-                
-                conn.commit()
+                # Guncellemeler ve degisiklik kaydi ayni islemde yazilir
+                with conn.tek_islem():
+                    for update_dict, param_tuple in zip(updates, params):
+                        # Hassas alanlar sifrelenir, kor indeksleri birlikte guncellenir
+                        update_dict = self.sifreleme.guncelleme_sifrele(update_dict, table_name)
+                        if normalize:
+                            # Gorunum guncellenemez; guncelleme fiziksel tabloya ve boyut anahtarlarina cevrilir
+                            query, values = self.boyutlar.guncelleme_sorgusu(conn, table_name, update_dict, condition)
+                            values += list(param_tuple)
+                        else:
+                            set_clause = ", ".join([f"{k} = ?" for k in update_dict.keys()])
+                            query = f"UPDATE {table_name} SET {set_clause} WHERE {condition}"
+                            values = list(update_dict.values()) + list(param_tuple)
+                        cursor.execute(query, values)
+                    self._tablo_degisikliklerini_yakala(conn, table_name)
+            except Exception:
+                self.degisiklik_kaydi.durumu_unut(table_name)
+                raise
             finally:
                 self._release_connection(conn)
+            self._yazma_bildir()
             
             if self.event_manager:
                 self.event_manager.emit(Event(
@@ -507,6 +766,157 @@ class SQLiteRepository(RepositoryInterface):
                 ))
             raise RepositoryError(error_msg, ErrorCode.BATCH_UPDATE_ERROR.value)
 
+    def _kor_indeksleri_olustur(self, conn: sqlite3.Connection, table_name: str) -> None:
+        """Tablonun hassas alanlarina ait kor indeks sutunlarini SQLite'ta indeksler"""
+        alanlar = self.sifreleme.HASSAS_ALANLAR.get(table_name)
+        if not alanlar:
+            return
+        hedef = fiziksel_tablo(table_name) if self.boyutlar.normalize_mi(conn, table_name) else table_name
+        self.sifreleme.kor_indeks.indeksleri_olustur(conn, hedef, alanlar)
+        conn.commit()
+
+    def _duz_hassas_alanlari_sifrele(self, conn: sqlite3.Connection) -> None:
+        """
+        HASSAS_ALANLAR'a sonradan eklenmis sutunlarda duz kalmis hucreleri yerinde sifreler.
+
+        Sifreli metin anahtar onekiyle (k<n>:) ya da Fernet surum bayti (gAAAAA) ile baslar;
+        yalnizca bu bicime uymayan ve cozulemeyen hucreler sifrelenir. Tabloda duz hucre
+        bulunduysa ayni tablonun cdc_log veri yukleri de sifrelenir.
+        """
+        for table_name, hedef, alanlar in self._sifreli_tablolar(conn):
+            sifrelenen = 0
+            for alan in alanlar:
+                satirlar = conn.execute(
+                    f'SELECT rowid, "{alan}" FROM "{hedef}" WHERE "{alan}" IS NOT NULL '
+                    f'AND "{alan}" NOT GLOB \'k[0-9]*:*\' AND "{alan}" NOT GLOB \'gAAAAA*\'').fetchall()
+                guncellemeler = [(self.sifreleme.sifrele(str(deger)), rowid) for rowid, deger in satirlar
+                                 if not self.sifreleme.sifreli_mi(deger)]
+                conn.executemany(f'UPDATE "{hedef}" SET "{alan}" = ? WHERE rowid = ?', guncellemeler)
+                sifrelenen += len(guncellemeler)
+            if sifrelenen:
+                yukler = self.degisiklik_kaydi.duz_veri_yuklerini_sifrele(conn, table_name)
+                conn.commit()
+                self.loglayici.info(f"{table_name} icin {sifrelenen} duz hassas hucre ve {yukler} degisiklik kaydi sifrelendi")
+
+    def _kor_indeksleri_tamamla(self, conn: sqlite3.Connection) -> None:
+        """Kor indeks sutunu olmayan mevcut sifreli tablolar icin sutunu ekleyip doldurur"""
+        for table_name, alanlar in self.sifreleme.HASSAS_ALANLAR.items():
+            normalize = self.boyutlar.normalize_mi(conn, table_name)
+            hedef = fiziksel_tablo(table_name) if normalize else table_name
+            sutunlar = {satir[1] for satir in conn.execute(f'PRAGMA table_info("{hedef}")')}
+            eksikler = [alan for alan in alanlar if alan in sutunlar and kor_sutun(alan) not in sutunlar]
+            for alan in eksikler:
+                conn.execute(f'ALTER TABLE "{hedef}" ADD COLUMN "{kor_sutun(alan)}" TEXT')
+                satirlar = conn.execute(f'SELECT rowid, "{alan}" FROM "{hedef}" WHERE "{alan}" IS NOT NULL').fetchall()
+                conn.executemany(
+                    f'UPDATE "{hedef}" SET "{kor_sutun(alan)}" = ? WHERE rowid = ?',
+                    [(self.sifreleme.kor_indeks.ozet(self.sifreleme.sifre_coz(str(deger))), rowid) for rowid, deger in satirlar])
+                self.loglayici.info(f"{table_name}.{alan} icin kor indeks olusturuldu ({len(satirlar)} satir)")
+            if eksikler:
+                if normalize:
+                    self.boyutlar._gorunumu_olustur(conn, table_name)
+                conn.commit()
+                self._kor_indeksleri_olustur(conn, table_name)
+
+    def sifreli_alanda_ara(self, table_name: str, alan: str, deger: Any) -> pd.DataFrame:
+        """
+        Sifreli alanda esitlik aramasini kor indeks uzerinden yapar (toplu sifre cozme yoktur).
+
+        Args:
+            table_name: Tablo adi
+            alan: HASSAS_ALANLAR'da tanimli alan
+            deger: Aranan acik deger (buyuk/kucuk harf ve bosluk farklari onemsizdir)
+
+        Returns:
+            pd.DataFrame: Eslesen satirlar (hassas alanlar tembel cozulur)
+        """
+        if alan not in self.sifreleme.HASSAS_ALANLAR.get(table_name, []):
+            raise RepositoryError(f"{table_name}.{alan} sifreli bir alan degil", ErrorCode.INVALID_DATA.value)
+        conn = self._get_connection()
+        try:
+            df = pd.read_sql_query(f'SELECT * FROM "{table_name}" WHERE "{kor_sutun(alan)}" = ?', conn,
+                                   params=(self.sifreleme.kor_indeks.ozet(deger),))
+        finally:
+            self._release_connection(conn)
+        df = self.sifreleme.veri_cercevesi_tembel_coz(df, table_name)
+        return self.sikistirici.cerceve_ac(df, table_name)
+
+    def sifreli_deger_var_mi(self, table_name: str, alan: str, deger: Any) -> bool:
+        """Sifreli alanda ayni degerin (or. e-posta) kayitli olup olmadigini indeksli olarak kontrol eder"""
+        conn = self._get_connection()
+        try:
+            return conn.execute(f'SELECT 1 FROM "{table_name}" WHERE "{kor_sutun(alan)}" = ? LIMIT 1',
+                                (self.sifreleme.kor_indeks.ozet(deger),)).fetchone() is not None
+        finally:
+            self._release_connection(conn)
+
+    def sifreli_alan_tekrarlari(self, table_name: str, alan: str) -> pd.DataFrame:
+        """Sifreli alanda ayni degeri paylasan satirlari dondurur (kor indeks gruplamasiyla)"""
+        kor = kor_sutun(alan)
+        conn = self._get_connection()
+        try:
+            df = pd.read_sql_query(
+                f'SELECT * FROM "{table_name}" WHERE "{kor}" IN '
+                f'(SELECT "{kor}" FROM "{table_name}" WHERE "{kor}" IS NOT NULL GROUP BY "{kor}" HAVING COUNT(*) > 1) '
+                f'ORDER BY "{kor}"', conn)
+        finally:
+            self._release_connection(conn)
+        df = self.sifreleme.veri_cercevesi_tembel_coz(df, table_name)
+        return self.sikistirici.cerceve_ac(df, table_name)
+
+    def _tablo_degisikliklerini_yakala(self, conn: sqlite3.Connection, table_name: str) -> None:
+        """SQL ile yerinde degisen tablonun guncel icerigini degisiklik kaydina isler"""
+        if not self.degisiklik_kaydi.izleniyor_mu(table_name):
+            return
+        df = pd.read_sql_query(f'SELECT * FROM "{table_name}"', conn)
+        df = self.sifreleme.veri_cercevesi_sifre_coz(df, table_name)
+        df = self.sikistirici.cerceve_ac(df, table_name)
+        self.degisiklik_kaydi.yakala(conn, df, table_name)
+
+    def boyut_yeniden_adlandir(self, boyut: str, eski: Any, yeni: Any) -> int:
+        """
+        Musteri, temsilci, urun veya hammadde adini tum tablolarda tek seferde degistirir.
+
+        Yalnizca veritabanini degistirir; cerceveleri yuklu uygulamada
+        VeriYoneticisi.boyut_yeniden_adlandir kullanilir, aksi halde cercevelerdeki eski ad
+        sonraki kayitta geri yazilir.
+
+        Args:
+            boyut: "musteri", "temsilci", "urun" veya "hammadde"
+            eski: Mevcut ad/kod
+            yeni: Yeni ad/kod (mevcutsa iki kayit birlestirilir)
+
+        Returns:
+            int: Birlestirme sirasinda guncellenen satir sayisi
+        """
+        try:
+            conn = self._get_connection()
+            try:
+                guncellenen = self.boyutlar.yeniden_adlandir(conn, boyut, eski, yeni)
+                # Ad degisikligi dogal anahtarlari da degistirir
+                for table_name in NORMALIZE_TABLOLAR:
+                    if self.boyutlar.normalize_mi(conn, table_name):
+                        self._tablo_degisikliklerini_yakala(conn, table_name)
+            finally:
+                self._release_connection(conn)
+            self._yazma_bildir()
+
+            if self.event_manager:
+                self.event_manager.emit(Event(
+                    EVENT_DATA_UPDATED,
+                    {"operation": "rename", "dimension": boyut, "old": eski, "new": yeni}
+                ))
+            return guncellenen
+
+        except (sqlite3.Error, KeyError, ValueError) as e:
+            error_msg = f"Yeniden adlandirma hatasi: {str(e)}"
+            if self.event_manager:
+                self.event_manager.emit(Event(
+                    EVENT_ERROR_OCCURRED,
+                    {"error": error_msg}
+                ))
+            raise RepositoryError(error_msg, ErrorCode.BATCH_UPDATE_ERROR.value)
+
     def initialize(self) -> None:
         """Veritabanini baslatir ve gerekli tablolari olusturur"""
         # Thread-local baglanti al
@@ -623,11 +1033,28 @@ class SQLiteRepository(RepositoryInterface):
                         "Aciklama" TEXT,
                         FOREIGN KEY ("Urun Kodu") REFERENCES sales("Urun Kodu"),
                         FOREIGN KEY ("Hammadde Kodu") REFERENCES hammadde("Hammadde Kodu")
+                    )''',
+                'error_logs': '''
+                    CREATE TABLE IF NOT EXISTS error_logs (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        timestamp TEXT,
+                        error_code TEXT,
+                        message TEXT,
+                        details TEXT,
+                        error_info TEXT
                     )'''
             }
             for table_name, create_query in tables.items():
                 cursor.execute(create_query)
                 logger.info(f"Tablo olusturuldu: {table_name}")
+            self.boyutlar.semayi_olustur(cursor)
+            self.degisiklik_kaydi.semayi_olustur(cursor)
+            self.sikistirici.semayi_olustur(cursor)
+            self.anahtar_dondurme.semayi_olustur(cursor)
+
+            # Normalize edilmis tablolar gorunumdur; ALTER yalnizca duz tablolara uygulanir
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            duz_tablolar = {row[0] for row in cursor.fetchall()}
 
             # Mevcut tablolari guncelle
             cursor.execute("PRAGMA table_info(customers)")
@@ -637,7 +1064,7 @@ class SQLiteRepository(RepositoryInterface):
                 ("Ana Musteri", 'ALTER TABLE customers ADD COLUMN "Ana Musteri" TEXT')
             ]
             for col_name, alter_query in alterations:
-                if col_name not in columns:
+                if col_name not in columns and 'customers' in duz_tablolar:
                     cursor.execute(alter_query)
                     logger.info(f"customers tablosuna '{col_name}' sutunu eklendi")
 
@@ -652,15 +1079,30 @@ class SQLiteRepository(RepositoryInterface):
                 ("Birim Fiyat", 'ALTER TABLE sales ADD COLUMN "Birim Fiyat" REAL')
             ]
             for col_name, alter_query in sales_columns_to_add:
-                if col_name not in columns:
+                if col_name not in columns and 'sales' in duz_tablolar:
                     cursor.execute(alter_query)
                     logger.info(f"sales tablosuna '{col_name}' sutunu eklendi")
             
-            if "Ana Musteri" not in columns:
+            if "Ana Musteri" not in columns and 'sales' in duz_tablolar:
                 cursor.execute('UPDATE sales SET "Ana Musteri" = "Musteri Adi" WHERE "Ana Musteri" IS NULL')
                 logger.info("sales tablosuna 'Ana Musteri' ve 'Alt Musteri' sutunlari eklendi")
 
             conn.commit()
+
+            # Duz tablolari boyut anahtarli fiziksel tablo + uyumluluk gorunumune tasi
+            for table_name in NORMALIZE_TABLOLAR:
+                self.boyutlar.tasi(conn, table_name, haric=self.sifreleme.HASSAS_ALANLAR.get(table_name, []))
+
+            self._duz_hassas_alanlari_sifrele(conn)
+            self._kor_indeksleri_tamamla(conn)
+
+            # Gecmisi olmayan versiyonlu tablolar icin mevcut satirlari ilk surum olarak kaydet
+            for table_name in VERSIYONLU_TABLOLAR:
+                if self.degisiklik_kaydi.gecmis.bos_mu(conn, table_name):
+                    df = pd.read_sql_query(f'SELECT * FROM "{table_name}"', conn)
+                    df = self.sifreleme.veri_cercevesi_sifre_coz(df, table_name)
+                    df = self.sikistirici.cerceve_ac(df, table_name)
+                    self.degisiklik_kaydi.gecmisi_baslat(conn, df, table_name)
         finally:
             self._release_connection(conn)
 
@@ -670,29 +1112,29 @@ class SQLiteRepository(RepositoryInterface):
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
+            # Normalize edilmis tablolarin indeksleri gorunum yerine fiziksel tablolara (_veri) kurulur;
+            # musteri/temsilci sutunlarinin yabanci anahtar indeksleri kayit sirasinda olusturulur.
             index_queries = [
                 # Mevcut indeksler
-                "CREATE INDEX IF NOT EXISTS idx_customers_name ON customers([Musteri Adi])",
-                "CREATE INDEX IF NOT EXISTS idx_sales_date ON sales([Ay])",
-                "CREATE INDEX IF NOT EXISTS idx_pipeline_stage ON pipeline([Pipeline Asamasi])",
-                "CREATE INDEX IF NOT EXISTS idx_visits_date ON visits([Ziyaret Tarihi])",
-                "CREATE INDEX IF NOT EXISTS idx_sales_rep ON sales([Satis Temsilcisi])",
-                "CREATE INDEX IF NOT EXISTS idx_pipeline_date ON pipeline([Tahmini Kapanis Tarihi])",
-                "CREATE INDEX IF NOT EXISTS idx_customers_region ON customers([Bolge])",
+                "CREATE INDEX IF NOT EXISTS idx_sales_date ON sales_veri([Ay])",
+                "CREATE INDEX IF NOT EXISTS idx_pipeline_stage ON pipeline_veri([Pipeline Asamasi])",
+                "CREATE INDEX IF NOT EXISTS idx_visits_date ON visits_veri([Ziyaret Tarihi])",
+                "CREATE INDEX IF NOT EXISTS idx_pipeline_date ON pipeline_veri([Tahmini Kapanis Tarihi])",
+                "CREATE INDEX IF NOT EXISTS idx_customers_region ON customers_veri([Bolge])",
                 
                 # Yeni eklenen indeksler
-                "CREATE INDEX IF NOT EXISTS idx_customers_sector ON customers([Sektor])",
-                "CREATE INDEX IF NOT EXISTS idx_customers_size ON customers([Global/Lokal])",
-                "CREATE INDEX IF NOT EXISTS idx_customers_type ON customers([Musteri Turu])",
-                "CREATE INDEX IF NOT EXISTS idx_sales_amount ON sales([Satis Miktari])",
-                "CREATE INDEX IF NOT EXISTS idx_pipeline_revenue ON pipeline([Potansiyel Ciro])",
-                "CREATE INDEX IF NOT EXISTS idx_complaints_type ON complaints([Sikayet Turu])",
-                "CREATE INDEX IF NOT EXISTS idx_complaints_status ON complaints([Durum])",
+                "CREATE INDEX IF NOT EXISTS idx_customers_sector ON customers_veri([Sektor])",
+                "CREATE INDEX IF NOT EXISTS idx_customers_size ON customers_veri([Global/Lokal])",
+                "CREATE INDEX IF NOT EXISTS idx_customers_type ON customers_veri([Musteri Turu])",
+                "CREATE INDEX IF NOT EXISTS idx_sales_amount ON sales_veri([Satis Miktari])",
+                "CREATE INDEX IF NOT EXISTS idx_pipeline_revenue ON pipeline_veri([Potansiyel Ciro])",
+                "CREATE INDEX IF NOT EXISTS idx_complaints_type ON complaints_veri([Sikayet Turu])",
+                "CREATE INDEX IF NOT EXISTS idx_complaints_status ON complaints_veri([Durum])",
                 
                 # BileÅŸik indeksler
-                "CREATE INDEX IF NOT EXISTS idx_sales_rep_date ON sales([Satis Temsilcisi], [Ay])",
-                "CREATE INDEX IF NOT EXISTS idx_customer_region_sector ON customers([Bolge], [Sektor])",
-                "CREATE INDEX IF NOT EXISTS idx_pipeline_stage_date ON pipeline([Pipeline Asamasi], [Tahmini Kapanis Tarihi])"
+                "CREATE INDEX IF NOT EXISTS idx_sales_rep_date ON sales_veri([Satis Temsilcisi_id], [Ay])",
+                "CREATE INDEX IF NOT EXISTS idx_customer_region_sector ON customers_veri([Bolge], [Sektor])",
+                "CREATE INDEX IF NOT EXISTS idx_pipeline_stage_date ON pipeline_veri([Pipeline Asamasi], [Tahmini Kapanis Tarihi])"
             ]
             for query in index_queries:
                 cursor.execute(query)
@@ -709,6 +1151,45 @@ class SQLiteRepository(RepositoryInterface):
         finally:
             self._release_connection(conn)
 
+    def as_of(self, table_name: str, timestamp) -> pd.DataFrame:
+        """
+        Tablonun verilen andaki icerigini dondurur.
+
+        Args:
+            table_name: Versiyonlu tablo adi (sales, pipeline, hammadde)
+            timestamp: datetime, pandas Timestamp veya ISO bicimli metin
+
+        Returns:
+            pd.DataFrame: O anda gecerli olan satirlar; sutun sirasi ve sayisal turler load() ile aynidir
+        """
+        try:
+            conn = self._get_connection()
+            try:
+                satirlar = self.degisiklik_kaydi.gecmis.as_of(conn, table_name, timestamp)
+                turler = {satir[1]: (satir[2] or "").upper()
+                          for satir in conn.execute(f'PRAGMA table_info("{table_name}")').fetchall()}
+            finally:
+                self._release_connection(conn)
+
+            # Sutunlar guncel tablodaki sirayla, sonradan kaldirilanlar sonda
+            sutunlar: List[str] = [sutun for sutun in turler if not sutun.endswith(KOR_EK)]
+            for satir in satirlar:
+                sutunlar.extend(sutun for sutun in satir if sutun not in sutunlar)
+            df = pd.DataFrame(satirlar, columns=sutunlar)
+
+            # Eski kayitlarda tam sayiya cevrilmis REAL degerleri ve bos hucreler load()'daki turlere dondurulur
+            sayisal_turleri_uygula(df, turler)
+            return self.sifreleme.veri_cercevesi_tembel_coz(df, table_name)
+
+        except Exception as e:
+            self.loglayici.error(f"Gecmis veri yukleme hatasi: {str(e)}")
+            if self.event_manager:
+                self.event_manager.emit(Event("error_occurred", {
+                    "error": "DB_LOAD_ERROR",
+                    "message": f"Gecmis veri yukleme hatasi: {str(e)}"
+                }))
+            raise
+
     def lazy_load_iterator(self, table_name: str, chunk_size: int = 1000) -> Iterator[pd.DataFrame]:
         """Veriyi chunk_size buyuklugunde parcalar halinde lazy olarak yukler"""
         try:
@@ -723,8 +1204,9 @@ class SQLiteRepository(RepositoryInterface):
                     if chunk.empty:
                         break
                         
-                    # Sifreli verileri coz
-                    chunk = self.sifreleme.veri_cercevesi_sifre_coz(chunk, table_name)
+                    # Sifreli verileri okunduklarinda coz
+                    chunk = self.sifreleme.veri_cercevesi_tembel_coz(chunk, table_name)
+                    chunk = self.sikistirici.cerceve_ac(chunk, table_name)
                     
                     yield chunk
                     offset += chunk_size
@@ -771,6 +1253,11 @@ class SQLiteRepository(RepositoryInterface):
                 "description": "Optimizasyon hatasi",
                 "possible_causes": ["Yetersiz disk alani", "Indeks olusturma hatasi"],
                 "suggested_actions": ["Disk alanini kontrol et", "Indeksleri yeniden olustur"]
+            },
+            "DB007": {
+                "description": "Surum cakismasi",
+                "possible_causes": ["Kayit okunduktan sonra baska bir islem tarafindan degistirildi veya silindi"],
+                "suggested_actions": ["Tabloyu yenile", "Islemi guncel kayit uzerinde tekrarla"]
             }
         }
         return error_details.get(error_code, {"description": "Bilinmeyen hata kodu"})
@@ -793,16 +1280,7 @@ class SQLiteRepository(RepositoryInterface):
         conn = self._get_connection()
         try:
             cursor = conn.cursor()
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS error_logs (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT,
-                    error_code TEXT,
-                    message TEXT,
-                    details TEXT,
-                    error_info TEXT
-                )
-            """)
+            # error_logs tablosu initialize() icinde olusturulur
             cursor.execute(
                 "INSERT INTO error_logs (timestamp, error_code, message, details, error_info) VALUES (?, ?, ?, ?, ?)",
                 (error_log["timestamp"], error_log["error_code"], error_log["message"],
@@ -812,6 +1290,9 @@ class SQLiteRepository(RepositoryInterface):
         finally:
             self._release_connection(conn)
 
+        self._sayac_artir("error_logs", 1)
+        self._yazma_bildir()
+
     def validate_data(self, df: pd.DataFrame, table_name: str) -> Tuple[bool, Optional[List[str]]]:
         """Veri dogrulamasi yapar ve hatalari dondurur"""
         errors = []
@@ -855,73 +1336,199 @@ class SQLiteRepository(RepositoryInterface):
         
         return len(errors) == 0, errors if errors else None
 
-    def health_check(self) -> Dict[str, Any]:
-        """Veritabani saglik kontrolu yapar"""
-        health_status = {
+    def _sayac_ayarla(self, tablo_adi: str, satir_sayisi: int) -> None:
+        """Tablonun satir sayacini kesin deger ile gunceller"""
+        with self._sayac_kilidi:
+            self._satir_sayaclari[tablo_adi] = {"row_count": int(satir_sayisi), "kaynak": "sayac"}
+
+    def _sayac_artir(self, tablo_adi: str, fark: int) -> None:
+        """Bilinen bir satir sayacini artirir veya azaltir"""
+        with self._sayac_kilidi:
+            sayac = self._satir_sayaclari.get(tablo_adi)
+            if sayac is not None:
+                sayac["row_count"] = max(0, sayac["row_count"] + fark)
+
+    @staticmethod
+    def _mantiksal_tablo(tablo_adi: str) -> str:
+        """Normalize edilmis tablolarin fiziksel adini ("<tablo>_veri") uyumluluk gorunumunun adina cevirir"""
+        if tablo_adi.endswith(FIZIKSEL_EK) and tablo_adi[:-len(FIZIKSEL_EK)] in NORMALIZE_TABLOLAR:
+            return tablo_adi[:-len(FIZIKSEL_EK)]
+        return tablo_adi
+
+    def _sayaclari_baslat(self, cursor: Cursor) -> None:
+        """
+        Sayaci olmayan tablolar icin baslangic tahminlerini yukler.
+
+        Oncelik sirasi sqlite_stat1 (ANALYZE ciktisi), ardindan MAX(rowid) tahminidir.
+        Her ikisi de tablo verisini taramaz. rowid'si olmayan (WITHOUT ROWID) tablolar
+        sqlite_stat1'de yoksa "rowid_yok" kaynagi ve bos sayacla acikca isaretlenir.
+        Normalize edilmis tablolar fiziksel tablodan sayilir ama gorunum adiyla (save'in
+        kullandigi adla) raporlanir. Yardimci tablolar (DAHILI_TABLOLAR) sayilmaz.
+        """
+        cursor.execute("SELECT name, sql FROM sqlite_master WHERE type='table'")
+        tablolar = {ad: (sql or "").upper() for ad, sql in cursor.fetchall()
+                    if not ad.startswith(DAHILI_TABLO_ONEKLERI) and ad not in DAHILI_TABLOLAR}
+
+        istatistikler = {}
+        try:
+            cursor.execute("SELECT tbl, stat FROM sqlite_stat1")
+            for tbl, stat in cursor.fetchall():
+                if stat:
+                    # stat sutununun ilk sayisi tablodaki yaklasik satir sayisidir
+                    istatistikler[tbl] = max(istatistikler.get(tbl, 0), int(str(stat).split()[0]))
+        except sqlite3.Error:
+            pass  # ANALYZE hic calistirilmamis
+
+        tahminler = {}
+        for tablo_adi, sql in tablolar.items():
+            if tablo_adi in istatistikler:
+                tahminler[tablo_adi] = {"row_count": istatistikler[tablo_adi], "kaynak": "sqlite_stat1"}
+                continue
+            if "WITHOUT ROWID" in sql:
+                tahminler[tablo_adi] = {"row_count": None, "kaynak": "rowid_yok"}
+                continue
+            try:
+                cursor.execute(f'SELECT MAX(rowid) FROM "{tablo_adi}"')
+                en_buyuk = cursor.fetchone()[0]
+                tahminler[tablo_adi] = {"row_count": int(en_buyuk or 0), "kaynak": "rowid_tahmini"}
+            except sqlite3.Error:
+                tahminler[tablo_adi] = {"row_count": None, "kaynak": "bilinmiyor"}
+
+        with self._sayac_kilidi:
+            for tablo_adi, tahmin in tahminler.items():
+                self._satir_sayaclari.setdefault(self._mantiksal_tablo(tablo_adi), tahmin)
+            self._sayaclar_hazir = True
+
+    def _on_backup_created(self, event: Event) -> None:
+        """Yeni yedek olustugunda son yedekleme zamanini gunceller"""
+        self._son_yedekleme = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._yedekleme_tarandi = True
+
+    def _son_yedeklemeyi_bul(self) -> Optional[str]:
+        """Yedekleme dizinini yalnizca ilk cagrida tarar, sonrasinda olaylarla guncellenir"""
+        if not self._yedekleme_tarandi:
+            self._yedekleme_tarandi = True
+            if os.path.exists(self.backup_dir):
+                backup_files = os.listdir(self.backup_dir)
+                if backup_files:
+                    latest_backup = max(backup_files, key=lambda x: os.path.getctime(os.path.join(self.backup_dir, x)))
+                    self._son_yedekleme = datetime.fromtimestamp(
+                        os.path.getctime(os.path.join(self.backup_dir, latest_backup))
+                    ).strftime("%Y-%m-%d %H:%M:%S")
+        return self._son_yedekleme
+
+    def health_snapshot(self) -> Dict[str, Any]:
+        """
+        Sik sorgulanabilecek hafif saglik ozeti dondurur.
+
+        Tablo verisine dokunmaz: satir sayilari yazma yolunda tutulan sayaclardan,
+        boyut bilgisi ise yalnizca veritabani basligini okuyan PRAGMA'lardan gelir.
+        Sayaclar uygulama tablolari icindir; yardimci tablolar (DAHILI_TABLOLAR) listelenmez.
+
+        Returns:
+            Dict[str, Any]: Durum, satir sayaclari, disk alani ve son yedekleme bilgisi
+        """
+        snapshot = {
             "status": "healthy",
             "connection": True,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
             "tables": {},
             "disk_space": {},
-            "indexes": {},
             "last_backup": None,
             "errors": []
         }
-        
+
         try:
-            # Thread-local baglanti al
             conn = self._get_connection()
             try:
                 cursor = conn.cursor()
-                
-                # Tablo durumlarini kontrol et
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = cursor.fetchall()
-                
-                for table in tables:
-                    table_name = table[0]
-                    cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-                    row_count = cursor.fetchone()[0]
-                    cursor.execute(f"PRAGMA table_info({table_name})")
-                    columns = cursor.fetchall()
-                    
-                    health_status["tables"][table_name] = {
-                        "row_count": row_count,
-                        "column_count": len(columns),
-                        "status": "ok"
-                    }
-                
-                # Indeksleri kontrol et
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
-                indexes = cursor.fetchall()
-                for index in indexes:
-                    index_name = index[0]
-                    health_status["indexes"][index_name] = "ok"
-                
-                # Disk alani kontrolu
+                if not self._sayaclar_hazir:
+                    self._sayaclari_baslat(cursor)
+
                 cursor.execute("PRAGMA page_size")
                 page_size = cursor.fetchone()[0]
                 cursor.execute("PRAGMA page_count")
                 page_count = cursor.fetchone()[0]
-                total_size = page_size * page_count / (1024 * 1024)  # MB cinsinden
-                
-                health_status["disk_space"] = {
-                    "total_size_mb": round(total_size, 2),
-                    "status": "ok" if total_size < 1000 else "warning"  # 1GB'dan buyukse uyari ver
+                cursor.execute("PRAGMA freelist_count")
+                freelist_count = cursor.fetchone()[0]
+            finally:
+                self._release_connection(conn)
+
+            with self._sayac_kilidi:
+                snapshot["tables"] = {ad: dict(sayac) for ad, sayac in self._satir_sayaclari.items()}
+
+            total_size = page_size * page_count / (1024 * 1024)  # MB cinsinden
+            snapshot["disk_space"] = {
+                "total_size_mb": round(total_size, 2),
+                "free_pages": freelist_count,
+                "status": "ok" if total_size < 1000 else "warning"  # 1GB'dan buyukse uyari ver
+            }
+            snapshot["last_backup"] = self._son_yedeklemeyi_bul()
+            if getattr(self, 'checkpoint_yoneticisi', None):
+                snapshot["wal"] = {
+                    "size_mb": round(self.checkpoint_yoneticisi.wal_boyutu() / (1024 * 1024), 2),
+                    "last_checkpoint": self.checkpoint_yoneticisi.metrikler()["son_checkpoint"]
                 }
-                
-                # Son yedekleme zamanini kontrol et
-                if os.path.exists("backups"):
-                    backup_files = os.listdir("backups")
-                    if backup_files:
-                        latest_backup = max(backup_files, key=lambda x: os.path.getctime(os.path.join("backups", x)))
-                        health_status["last_backup"] = datetime.fromtimestamp(
-                            os.path.getctime(os.path.join("backups", latest_backup))
-                        ).strftime("%Y-%m-%d %H:%M:%S")
+            return snapshot
+
+        except Exception as e:
+            snapshot["status"] = "unhealthy"
+            snapshot["connection"] = False
+            snapshot["errors"].append(str(e))
+            return snapshot
+
+    def _tablo_boyutlarini_getir(self, cursor: Cursor, yenileme_suresi: int = 600) -> Dict[str, float]:
+        """
+        dbstat sanal tablosundan tablo boyutlarini (MB) getirir.
+
+        dbstat tum sayfalari dolastigi icin sonuc yenileme_suresi saniye boyunca
+        onbellekte tutulur. SQLite dbstat destegi olmadan derlenmisse bos dondurur.
+        """
+        if self._tablo_boyutlari and time.monotonic() - self._tablo_boyutlari_zamani < yenileme_suresi:
+            return self._tablo_boyutlari
+        try:
+            cursor.execute("SELECT name, SUM(pgsize) FROM dbstat GROUP BY name")
+            self._tablo_boyutlari = {
+                ad: round(boyut / (1024 * 1024), 3) for ad, boyut in cursor.fetchall()
+            }
+            self._tablo_boyutlari_zamani = time.monotonic()
+        except sqlite3.Error:
+            self._tablo_boyutlari = {}
+        return self._tablo_boyutlari
+
+    def health_check(self) -> Dict[str, Any]:
+        """Veritabani saglik kontrolu yapar"""
+        health_status = self.health_snapshot()
+        health_status["indexes"] = {}
+        if health_status["status"] != "healthy":
+            return health_status
+
+        try:
+            # Thread-local baglanti al
+            conn = self._get_connection()
+            try:
+                cursor = conn.cursor()
+
+                # Sutun sayilari yalnizca sema bilgisinden okunur
+                for table_name, tablo_durumu in health_status["tables"].items():
+                    cursor.execute(f'PRAGMA table_info("{table_name}")')
+                    tablo_durumu["column_count"] = len(cursor.fetchall())
+                    tablo_durumu["status"] = "ok"
+
+                for table_name, boyut in self._tablo_boyutlarini_getir(cursor).items():
+                    table_name = self._mantiksal_tablo(table_name)
+                    if table_name in health_status["tables"]:
+                        health_status["tables"][table_name]["size_mb"] = boyut
+
+                # Indeksleri kontrol et
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='index'")
+                for index in cursor.fetchall():
+                    health_status["indexes"][index[0]] = "ok"
             finally:
                 self._release_connection(conn)
-            
+
             return health_status
-            
+
         except Exception as e:
             health_status["status"] = "unhealthy"
             health_status["errors"].append(str(e))
@@ -1,38 +1,231 @@
 ﻿# -*- coding: utf-8 -*-
-import schedule
+"""
+Zamanlanmis is modulu.
+
+Zamanlayici eskiden schedule kutuphanesinin global zamanlayicisini saniyede bir
+yokluyordu. Artik isler bir son tarih yigininda (heap) tutulur: zamanlayici thread'i
+en yakin son tarihe kadar uyur, is eklenince veya kaldirilinca uyandirilir. Isler
+sabit aralikla (is_ekle) veya cron ifadesiyle (cron_ekle) zamanlanir ve paylasilan
+gorev zamanlayicisinin bakim seridinde calisir; boylece ayni anda calisan bakim isi
+sayisi sinirlidir ve etkilesimli isleri bekletmez.
+
+Son tarihler duvar saatine gore tutulur ve uyku MAKS_UYKU ile sinirlidir; bilgisayar
+uyku modundan donunce kacirilan calismalar fark edilir ve tek bir calismada telafi
+edilir. Son calisma zamanlari ve sure gecmisi durum dosyasina yazilir, uygulama
+kapaliyken kacirilan isler acilista telafi edilir. Zaman asimini asan islerin iptal
+jetonu isaretlenir; onceki calismasi suren is yeniden baslatilmaz.
+"""
+
+import os
+import json
 import time
+import heapq
+import itertools
 import threading
 import logging  # Logging modulu eklendi
-from typing import Optional  # Type hints icin
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional, Callable, Dict, Any, List, Tuple, Set  # Type hints icin
+from events import Event, EVENT_ERROR_OCCURRED
+from task_scheduler import gorev_zamanlayici, gecerli_jeton, IptalJetonu, SERIT_BAKIM
 
 HATA_KODLARI = {  # zamanlayici.py icin ozel hata kodlari
-    "ZAMANLAYICI_001": "Zamanlayici calisma hatasi"
+    "ZAMANLAYICI_001": "Zamanlayici calisma hatasi",
+    "ZAMANLAYICI_002": "Gecersiz cron ifadesi",
+    "ZAMANLAYICI_003": "Zamanlanmis is zaman asimina ugradi",
+    "ZAMANLAYICI_004": "Bu adla zamanlanmis is zaten var (degistir=True verilmeli)"
+}
+
+MAKS_UYKU = 30.0  # Uyku modu sonrasi kacirilan isler en gec bu surede fark edilir (saniye)
+VARSAYILAN_ZAMAN_ASIMI = 3600.0  # saniye
+GECMIS_UZUNLUGU = 20  # Is basina saklanan calisma sayisi
+
+_CRON_KISALTMALARI = {
+    "@hourly": "0 * * * *",
+    "@daily": "0 0 * * *",
+    "@midnight": "0 0 * * *",
+    "@weekly": "0 0 * * 0",
+    "@monthly": "0 0 1 * *",
+    "@yearly": "0 0 1 1 *"
 }
+_CRON_SINIRLARI = ((0, 59), (0, 23), (1, 31), (1, 12), (0, 7))  # dakika saat gun ay haftanin-gunu
+
+
+class CronIfadesi:
+    """
+    Bes alanli cron ifadesi (dakika saat gun ay haftanin-gunu).
+
+    Alanlarda '*', '5', '1-5', '*/15', '10-40/10' ve virgulle ayrilmis listeler
+    desteklenir; haftanin gununde 0 ve 7 pazardir. Gun ve haftanin gunu birlikte
+    kisitlanmissa cron'daki gibi ikisinden birinin tutmasi yeterlidir. @hourly,
+    @daily, @weekly, @monthly ve @yearly kisaltmalari kabul edilir.
+    """
+
+    def __init__(self, ifade: str):
+        self.ifade = ifade.strip()
+        alanlar = _CRON_KISALTMALARI.get(self.ifade, self.ifade).split()
+        if len(alanlar) != 5:
+            raise ValueError(f"{HATA_KODLARI['ZAMANLAYICI_002']}: {ifade}")
+        self.dakikalar, self.saatler, self.gunler, self.aylar, haftanin_gunleri = (
+            self._alan_coz(alan, alt, ust) for alan, (alt, ust) in zip(alanlar, _CRON_SINIRLARI))
+        self.haftanin_gunleri = {gun % 7 for gun in haftanin_gunleri}
+        self._gun_kisitli = not alanlar[2].startswith("*")
+        self._hafta_kisitli = not alanlar[4].startswith("*")
+
+    def _alan_coz(self, alan: str, alt: int, ust: int) -> Set[int]:
+        degerler = set()
+        for parca in alan.split(","):
+            aralik, bolu, adim = parca.partition("/")
+            try:
+                adim = int(adim) if bolu else 1
+                if aralik == "*":
+                    bas, son = alt, ust
+                elif "-" in aralik:
+                    bas, son = (int(x) for x in aralik.split("-", 1))
+                else:
+                    bas = int(aralik)
+                    son = ust if bolu else bas  # '5/15': 5'ten baslayarak 15'er
+            except ValueError:
+                raise ValueError(f"{HATA_KODLARI['ZAMANLAYICI_002']}: {self.ifade}") from None
+            if adim < 1 or bas < alt or son > ust or bas > son:
+                raise ValueError(f"{HATA_KODLARI['ZAMANLAYICI_002']}: {self.ifade}")
+            degerler.update(range(bas, son + 1, adim))
+        return degerler
+
+    def _gun_uyar(self, zaman: datetime) -> bool:
+        gun = zaman.day in self.gunler
+        hafta = (zaman.weekday() + 1) % 7 in self.haftanin_gunleri  # Python'da pazartesi 0, cron'da 1
+        if self._gun_kisitli and self._hafta_kisitli:
+            return gun or hafta
+        return gun and hafta
+
+    def sonraki(self, zaman: datetime) -> datetime:
+        """
+        Verilen zamandan sonraki ilk eslesen dakikayi dondurur.
+
+        Args:
+            zaman: Baslangic zamani (yerel saat)
+
+        Returns:
+            datetime: Sonraki calisma zamani
+        """
+        aday = zaman.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        sinir = aday + timedelta(days=366 * 5)
+        while aday <= sinir:
+            if aday.month not in self.aylar:
+                aday = (aday.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._gun_uyar(aday):
+                aday = aday.replace(hour=0, minute=0) + timedelta(days=1)
+            elif aday.hour not in self.saatler:
+                aday = aday.replace(minute=0) + timedelta(hours=1)
+            elif aday.minute not in self.dakikalar:
+                aday += timedelta(minutes=1)
+            else:
+                return aday
+        raise ValueError(f"{HATA_KODLARI['ZAMANLAYICI_002']}: {self.ifade} hic eslesmiyor")
+
+
+class _Is:
+    """Zamanlanmis bir isin tanimi, durumu ve calisma gecmisi"""
+
+    __slots__ = ("ad", "islem", "aralik", "cron", "zaman_asimi", "sonraki", "surum", "calisiyor", "jeton",
+                 "baslangic", "zaman_asti", "son_calisma", "calisma", "hata", "kacirilan", "atlanan", "gecmis")
+
+    def __init__(self, ad: str, islem: Callable, aralik: Optional[float], cron: Optional[CronIfadesi],
+                 zaman_asimi: Optional[float]):
+        self.ad = ad
+        self.islem = islem
+        self.aralik = aralik
+        self.cron = cron
+        self.zaman_asimi = zaman_asimi
+        self.sonraki = 0.0
+        self.surum = 0  # Yigindaki eski kayitlari ayirt etmek icin
+        self.calisiyor = False  # Gorev zamanlayicisinda bekliyor veya calisiyor
+        self.jeton: Optional[IptalJetonu] = None
+        self.baslangic: Optional[float] = None  # Calismaya basladigi an (time.monotonic)
+        self.zaman_asti = False
+        self.son_calisma: Optional[float] = None
+        self.calisma = 0
+        self.hata = 0
+        self.kacirilan = 0
+        self.atlanan = 0
+        self.gecmis: deque = deque(maxlen=GECMIS_UZUNLUGU)
+
+    def sonraki_zaman(self, zaman: float) -> float:
+        """Verilen andan sonraki son tarihi dondurur"""
+        if self.cron is not None:
+            return self.cron.sonraki(datetime.fromtimestamp(zaman)).timestamp()
+        return zaman + self.aralik
+
+    def kacirilan_say(self, simdi: float) -> int:
+        """Son tarih ile simdi arasinda atlanan ek calisma sayisini dondurur"""
+        if self.cron is None:
+            return int((simdi - self.sonraki) // self.aralik)
+        sayi = 0
+        zaman = self.cron.sonraki(datetime.fromtimestamp(self.sonraki))
+        while zaman.timestamp() <= simdi and sayi < 10000:
+            sayi += 1
+            zaman = self.cron.sonraki(zaman)
+        return sayi
+
+
+def _zaman_yazi(zaman: Optional[float]) -> Optional[str]:
+    return datetime.fromtimestamp(zaman).isoformat(timespec="seconds") if zaman is not None else None
+
 
 class Zamanlayici:
-    def __init__(self, loglayici: Optional[logging.Logger] = None, event_manager=None):  # EventManager eklendi
+    """
+    Son tarih yigini ile calisan zamanlanmis is yoneticisi.
+
+    Methods:
+        is_ekle(): Isi sabit aralikla zamanlar
+        cron_ekle(): Isi cron ifadesiyle zamanlar
+        is_kaldir(): Zamanlanmis isi kaldirir
+        durum(): Islerin sonraki calisma zamanlarini ve sure gecmisini dondurur
+    """
+
+    def __init__(self, loglayici: Optional[logging.Logger] = None, event_manager=None,  # EventManager eklendi
+                 durum_dosyasi: Optional[str] = None):
+        """
+        Args:
+            loglayici: Loglama islemleri icin logger nesnesi
+            event_manager: Olay yoneticisi
+            durum_dosyasi: Son calisma zamanlarinin saklandigi JSON dosyasi; verilmezse saklanmaz
+        """
         self.stop_flag = threading.Event()
         self.loglayici = loglayici
         self.event_manager = event_manager  # Olay yoneticisi eklendi
         self.thread = None
+        self.durum_dosyasi = durum_dosyasi
+        self._kosul = threading.Condition()
+        self._dosya_kilit = threading.Lock()
+        self._isler: Dict[str, _Is] = {}
+        self._yigin: List[Tuple[float, int, str, int]] = []  # (son tarih, sira, is adi, surum)
+        self._sira = itertools.count()
+        self._kalici = self._durum_yukle()
 
     def baslat(self):
-        self.thread = threading.Thread(target=self.zamanlayici_calistir)  # Thread'i nesneye ata # Thread kontrolu icin
+        if self.thread and self.thread.is_alive():
+            return
+        self.stop_flag.clear()
+        self.thread = threading.Thread(target=self.zamanlayici_calistir, name="Zamanlayici", daemon=True)  # Thread'i nesneye ata # Thread kontrolu icin
         self.thread.start()
 
     def durdur(self):
         self.stop_flag.set()
+        with self._kosul:
+            self._kosul.notify_all()
         if self.thread and self.thread.is_alive():  # Thread'in kapanmasini bekle
             self.thread.join(timeout=5)  # 5 saniye bekle
             if self.loglayici:
                 self.loglayici.info("Zamanlayici thread'i durduruldu.")
+        self._durum_kaydet()
 
     def zamanlayici_calistir(self) -> None:
         hata_sayaci = 0
         while not self.stop_flag.is_set():
             try:
-                schedule.run_pending()
-                time.sleep(1)
+                self._tur()
                 hata_sayaci = 0
             except Exception as e:
                 hata_sayaci += 1
@@ -44,30 +237,263 @@ class Zamanlayici:
                         self.loglayici.critical("Zamanlayici tekrarlanan hatalar nedeniyle durduruluyor.")
                     self.stop_flag.set()  # Durduruldugunu bildir
                     break
-                time.sleep(5)
+                self.stop_flag.wait(5)
 
-    def is_ekle(self, islem, interval):
-        schedule.every(interval).seconds.do(islem)
+    def _tur(self) -> None:
+        """Zamani gelen isleri baslatir, zaman asimlarini denetler ve sonraki son tarihe kadar uyur"""
+        baslatilacak: List[_Is] = []
+        asimlar: List[str] = []
+        with self._kosul:
+            simdi = time.time()
+            while self._yigin and self._yigin[0][0] <= simdi:
+                _, _, ad, surum = heapq.heappop(self._yigin)
+                is_ = self._isler.get(ad)
+                if is_ is None or is_.surum != surum:
+                    continue  # Kaldirilmis veya yeniden zamanlanmis
+                kacirilan = is_.kacirilan_say(simdi)
+                if kacirilan > 0:
+                    is_.kacirilan += kacirilan
+                    if self.loglayici:
+                        self.loglayici.info(f"Zamanlanmis is {kacirilan} calismayi kacirdi, bir kez telafi ediliyor: {ad}")
+                self._planla(is_, is_.sonraki_zaman(simdi))
+                if is_.calisiyor:
+                    is_.atlanan += 1
+                    if self.loglayici:
+                        self.loglayici.warning(f"Onceki calisma surdugu icin zamanlanmis is atlandi: {ad}")
+                    continue
+                is_.calisiyor = True
+                is_.jeton = IptalJetonu()
+                is_.zaman_asti = False
+                baslatilacak.append(is_)
+            monoton = time.monotonic()
+            for is_ in self._isler.values():
+                if (is_.baslangic is not None and is_.zaman_asimi and not is_.zaman_asti
+                        and monoton - is_.baslangic > is_.zaman_asimi):
+                    is_.zaman_asti = True
+                    is_.jeton.iptal_et()
+                    asimlar.append(f"{HATA_KODLARI['ZAMANLAYICI_003']}: {is_.ad} ({is_.zaman_asimi:g} sn)")
+
+        for is_ in baslatilacak:
+            self._baslat(is_)
+        for mesaj in asimlar:
+            if self.loglayici:
+                self.loglayici.warning(mesaj)
+            if self.event_manager:
+                self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"message": mesaj}))
+
+        with self._kosul:
+            if not self.stop_flag.is_set():
+                self._kosul.wait(self._bekleme_suresi())
+
+    def _bekleme_suresi(self) -> float:
+        """En yakin son tarihe veya zaman asimina kalan sure (kilit altinda)"""
+        bekleme = MAKS_UYKU
+        if self._yigin:
+            bekleme = min(bekleme, self._yigin[0][0] - time.time())
+        monoton = time.monotonic()
+        for is_ in self._isler.values():
+            if is_.baslangic is not None and is_.zaman_asimi and not is_.zaman_asti:
+                bekleme = min(bekleme, is_.zaman_asimi - (monoton - is_.baslangic))
+        return max(bekleme, 0.0)
+
+    def _planla(self, is_: _Is, zaman: float) -> None:
+        """Isi yeni son tarihiyle yigina ekler; onceki kaydi gecersiz kalir (kilit altinda)"""
+        is_.sonraki = zaman
+        is_.surum += 1
+        heapq.heappush(self._yigin, (zaman, next(self._sira), is_.ad, is_.surum))
+
+    def _baslat(self, is_: _Is) -> None:
+        """Isi gorev zamanlayicisinin bakim seridine gonderir"""
+        try:
+            gorev = gorev_zamanlayici().gonder(self._is_calistir, is_, serit=SERIT_BAKIM, jeton=is_.jeton)
+        except Exception:
+            self._gorev_bitti(is_)
+            raise
+        # Baslamadan iptal edilen (kapanista) gorevler de burada serbest birakilir
+        gorev.future.add_done_callback(lambda _: self._gorev_bitti(is_))
+
+    def _gorev_bitti(self, is_: _Is) -> None:
+        with self._kosul:
+            is_.calisiyor = False
+            is_.baslangic = None
+
+    def _is_calistir(self, is_: _Is) -> None:
+        """Isi calistirir ve suresini gecmise kaydeder (gorev zamanlayicisi thread'inde)"""
+        baslangic_zamani = time.time()
+        with self._kosul:
+            is_.baslangic = time.monotonic()
+            self._kosul.notify()  # Zaman asimi denetimi icin uyku suresi yeniden hesaplanir
+        sonuc = "basarili"
+        try:
+            is_.islem()
+        except Exception as e:
+            sonuc = "hata"
+            if self.loglayici:
+                self.loglayici.error(f"Zamanlanmis is hatasi ({is_.ad}): {str(e)} Hata Kodu: ZAMANLAYICI_001")
+        finally:
+            with self._kosul:
+                sure = time.monotonic() - is_.baslangic
+                if is_.zaman_asti:
+                    sonuc = "zaman_asimi"
+                is_.calisma += 1
+                is_.hata += int(sonuc != "basarili")
+                is_.son_calisma = baslangic_zamani
+                is_.gecmis.append({"baslangic": _zaman_yazi(baslangic_zamani), "sure": round(sure, 3),
+                                   "sonuc": sonuc})
+                is_.baslangic = None
+            self._durum_kaydet()
+
+    def _ekle(self, is_: _Is, degistir: bool) -> str:
+        with self._kosul:
+            eski = self._isler.get(is_.ad)
+            if eski is not None and not degistir:
+                raise ValueError(f"{HATA_KODLARI['ZAMANLAYICI_004']}: {is_.ad}")
+            kalici = self._kalici.get(is_.ad, {})
+            is_.son_calisma = kalici.get("son_calisma")
+            is_.gecmis.extend(kalici.get("gecmis", []))
+            # Son calisma biliniyorsa son tarih ondan hesaplanir; uygulama kapaliyken
+            # kacirilan is hemen calisir
+            baz = is_.son_calisma if is_.son_calisma is not None else time.time()
+            if eski is not None:
+                is_.surum = eski.surum
+            self._isler[is_.ad] = is_
+            self._planla(is_, is_.sonraki_zaman(baz))
+            self._kosul.notify()
+        if self.loglayici:
+            self.loglayici.info(f"Zamanlanmis is eklendi: {is_.ad} (sonraki: {_zaman_yazi(is_.sonraki)})")
+        return is_.ad
+
+    def is_ekle(self, islem: Callable, interval: float, ad: Optional[str] = None,
+                zaman_asimi: Optional[float] = VARSAYILAN_ZAMAN_ASIMI, degistir: bool = False) -> str:
+        """
+        Isi sabit aralikla zamanlar.
+
+        Args:
+            islem: Argumansiz cagrilacak fonksiyon
+            interval: Calismalar arasi sure (saniye)
+            ad: Is adi; verilmezse fonksiyon adi kullanilir
+            zaman_asimi: Bu sureyi asan calismanin iptal jetonu isaretlenir (saniye); None ise sinirsiz
+            degistir: True ise ayni adli is varsa onun yerini alir
+
+        Returns:
+            str: Is adi
+
+        Raises:
+            ValueError: Ayni adla is zaten varsa ve degistir False ise
+        """
+        if not isinstance(interval, (int, float)) or interval <= 0:
+            raise ValueError("Interval pozitif bir sayi olmali")
+        ad = ad or getattr(islem, "__qualname__", repr(islem))
+        return self._ekle(_Is(ad, islem, float(interval), None, zaman_asimi), degistir)
+
+    def cron_ekle(self, islem: Callable, ifade: str, ad: Optional[str] = None,
+                  zaman_asimi: Optional[float] = VARSAYILAN_ZAMAN_ASIMI, degistir: bool = False) -> str:
+        """
+        Isi cron ifadesiyle zamanlar (ornegin "30 2 * * *" her gece 02:30).
+
+        Args:
+            islem: Argumansiz cagrilacak fonksiyon
+            ifade: Bes alanli cron ifadesi (bkz. CronIfadesi)
+            ad: Is adi; verilmezse fonksiyon adi kullanilir
+            zaman_asimi: Bu sureyi asan calismanin iptal jetonu isaretlenir (saniye); None ise sinirsiz
+            degistir: True ise ayni adli is varsa onun yerini alir
+
+        Returns:
+            str: Is adi
+
+        Raises:
+            ValueError: Ayni adla is zaten varsa ve degistir False ise
+        """
+        ad = ad or getattr(islem, "__qualname__", repr(islem))
+        return self._ekle(_Is(ad, islem, None, CronIfadesi(ifade), zaman_asimi), degistir)
+
+    def is_kaldir(self, ad: str) -> bool:
+        """Zamanlanmis isi kaldirir; calisan calisma kesilmez. Is bulunduysa True dondurur"""
+        with self._kosul:
+            is_ = self._isler.pop(ad, None)
+            self._kosul.notify()
+        return is_ is not None
+
+    def durum(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Zamanlanmis islerin durumunu dondurur.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Is adi -> tanim, sonraki ve son calisma zamani, sayaclar ve sure gecmisi
+        """
+        with self._kosul:
+            durum = {}
+            for ad, is_ in self._isler.items():
+                sureler = [kayit["sure"] for kayit in is_.gecmis]
+                durum[ad] = {
+                    "tanim": is_.cron.ifade if is_.cron is not None else f"{is_.aralik:g} sn",
+                    "sonraki": _zaman_yazi(is_.sonraki),
+                    "son_calisma": _zaman_yazi(is_.son_calisma),
+                    "calisiyor": is_.calisiyor,
+                    "calisma": is_.calisma,
+                    "hata": is_.hata,
+                    "kacirilan": is_.kacirilan,
+                    "atlanan": is_.atlanan,
+                    "ortalama_sure": round(sum(sureler) / len(sureler), 3) if sureler else None,
+                    "gecmis": list(is_.gecmis)
+                }
+            return durum
+
+    def _durum_yukle(self) -> Dict[str, Dict[str, Any]]:
+        if not self.durum_dosyasi or not os.path.exists(self.durum_dosyasi):
+            return {}
+        try:
+            with open(self.durum_dosyasi, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            if self.loglayici:
+                self.loglayici.warning(f"Zamanlayici durum dosyasi okunamadi: {str(e)}")
+            return {}
+
+    def _durum_kaydet(self) -> None:
+        """Son calisma zamanlarini ve sure gecmisini durum dosyasina yazar"""
+        if not self.durum_dosyasi:
+            return
+        with self._kosul:
+            for ad, is_ in self._isler.items():
+                self._kalici[ad] = {"son_calisma": is_.son_calisma, "gecmis": list(is_.gecmis)}
+            veri = json.dumps(self._kalici, ensure_ascii=False, indent=2)
+        gecici = f"{self.durum_dosyasi}.tmp"
+        try:
+            with self._dosya_kilit:
+                with open(gecici, "w", encoding="utf-8") as f:
+                    f.write(veri)
+                os.replace(gecici, self.durum_dosyasi)
+        except OSError as e:
+            if self.loglayici:
+                self.loglayici.warning(f"Zamanlayici durum dosyasi yazilamadi: {str(e)}")
 
     # zamanlayici.py icine eklenecek burasi yeni eklendi
 
-    def yedekleme_zamanla(self, backup_manager, database_path, interval_hours=24):
-        if not isinstance(interval_hours, (int, float)) or interval_hours <= 0:
+    def yedekleme_zamanla(self, backup_manager, database_path, interval_hours=24, cron: Optional[str] = None,
+                          zaman_asimi: Optional[float] = VARSAYILAN_ZAMAN_ASIMI):
+        if cron is None and (not isinstance(interval_hours, (int, float)) or interval_hours <= 0):
             hata_mesaji = "Interval saat pozitif bir sayi olmali"
             if self.loglayici:
                 self.loglayici.error(hata_mesaji)
             if self.event_manager:
                 self.event_manager.emit(Event(EVENT_ERROR_OCCURRED, {"message": hata_mesaji}))
             raise ValueError(hata_mesaji)
-        
+
         def yedekleme_yap():
-            success, result = backup_manager.create_backup(database_path)
+            # Zaman asiminda isin jetonu iptal edilir; create_backup adimli kopyayi durdurur
+            success, result = backup_manager.create_backup(database_path, jeton=gecerli_jeton())
             if success and self.loglayici:
                 self.loglayici.info(f"Otomatik yedekleme basarili: {result}")
             elif self.loglayici:
                 self.loglayici.error(f"Otomatik yedekleme hatasi: {result}")
             # Yedekleme tamamlandi olayi zaten BackupManagerda tetikleniyor
-        
-        self.is_ekle(yedekleme_yap, interval_hours * 3600)
+
+        if cron:
+            # Yeniden zamanlama onceki yedekleme planinin yerini alir
+            self.cron_ekle(yedekleme_yap, cron, ad="yedekleme", zaman_asimi=zaman_asimi, degistir=True)
+        else:
+            self.is_ekle(yedekleme_yap, interval_hours * 3600, ad="yedekleme", zaman_asimi=zaman_asimi,
+                         degistir=True)
 
     #burasi yeni eklendi